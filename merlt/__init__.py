@@ -36,13 +36,42 @@ Docs: https://github.com/your-org/merlt
 __version__ = "0.1.0"
 __author__ = "MERL-T Team"
 
-# Core API
-from merlt.core import LegalKnowledgeGraph, MerltConfig
-from merlt.core.legal_knowledge_graph import InterpretationResult
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Gli export sono caricati on-demand (PEP 562): `import merlt` non importa
+# torch, sentence-transformers, FalkorDB o Qdrant finché non servono.
+_LAZY_ATTRS = {
+    # Core API
+    "LegalKnowledgeGraph": "merlt.core.legal_knowledge_graph",
+    "MerltConfig": "merlt.core.legal_knowledge_graph",
+    "InterpretationResult": "merlt.core.legal_knowledge_graph",
+    # Convenience exports
+    "NormattivaScraper": "merlt.sources.normattiva",
+    "BrocardiScraper": "merlt.sources.brocardi",
+    "FalkorDBClient": "merlt.storage.graph.client",
+    "EmbeddingService": "merlt.storage.vectors.embeddings",
+}
+
+if TYPE_CHECKING:
+    from merlt.core import LegalKnowledgeGraph, MerltConfig
+    from merlt.core.legal_knowledge_graph import InterpretationResult
+    from merlt.sources import NormattivaScraper, BrocardiScraper
+    from merlt.storage import FalkorDBClient, EmbeddingService
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_ATTRS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value  # cache: i lookup successivi non passano da __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
-# Convenience exports
-from merlt.sources import NormattivaScraper, BrocardiScraper
-from merlt.storage import FalkorDBClient, EmbeddingService
 
 __all__ = [
     # Core
@@ -49,6 +49,7 @@ Usage:
 
 import structlog
 from dataclasses import dataclass, field
+from importlib.util import find_spec
 from typing import Dict, List, Optional, Any, Tuple
 from uuid import UUID
 
@@ -87,24 +88,28 @@ from merlt.sources.utils.norma import NormaVisitata, Norma
 from merlt.sources.utils.urn import generate_urn
 from merlt.sources.utils.tree import (
     NormTree,
+    NormTreeStore,
     get_article_position,
+    get_cached_hierarchical_tree,
     get_hierarchical_tree,
 )
 
-# Embeddings (optional, loaded lazily)
-try:
-    from merlt.storage.vectors.embeddings import EmbeddingService
-    HAS_EMBEDDING_SERVICE = True
-except ImportError:
-    HAS_EMBEDDING_SERVICE = False
-
-# Qdrant (optional, loaded lazily)
-try:
-    from qdrant_client import QdrantClient
-    from qdrant_client.models import PointStruct, VectorParams, Distance
-    HAS_QDRANT = True
-except ImportError:
-    HAS_QDRANT = False
+from merlt.storage.vectors.collections import (
+    QdrantCollectionProfile,
+    ensure_collection,
+    get_collection_profile,
+)
+from merlt.storage.vectors.content_store import ChunkContentStore
+from merlt.storage.vectors.points import build_article_points, upsert_changed_points
+
+# Embeddings (optional, loaded lazily: torch is imported only on first use)
+from merlt.storage.vectors.embeddings import (
+    EmbeddingService,
+    HAS_SENTENCE_TRANSFORMERS as HAS_EMBEDDING_SERVICE,
+)
+
+# Qdrant (optional, imported on connect: qdrant_client costs ~1s at import)
+HAS_QDRANT = find_spec("qdrant_client") is not None
 
 log = structlog.get_logger()
 
@@ -125,6 +130,15 @@ class MerltConfig:
     qdrant_host: str = "localhost"
     qdrant_port: int = 6333
     qdrant_collection: Optional[str] = None  # Defaults to graph_name
+    # Profilo collection (vedi merlt.storage.vectors.collections.COLLECTION_PROFILES):
+    # "default", "quantized", "on_disk", "quantized_on_disk"
+    qdrant_profile: str = "default"
+    # Slim payload: in Qdrant solo id e campi di filtro, testo nel content store locale
+    qdrant_slim_payload: bool = False
+    content_store_path: Optional[str] = None  # Default: data/content_store/{qdrant_collection}.sqlite
+
+    # NormTree persistiti su disco tra run (None = solo cache in memoria)
+    norm_tree_cache_dir: Optional[str] = "data/cache/norm_trees"
 
     # PostgreSQL Bridge Table
     postgres_host: str = "localhost"
@@ -136,6 +150,10 @@ class MerltConfig:
     # Embedding model
     embedding_model: str = "intfloat/multilingual-e5-large"
     embedding_dimension: int = 1024
+    embedding_workers: int = 1  # Worker del pool di encoding dedicato
+    embedding_threads_per_worker: Optional[int] = None  # torch.set_num_threads per worker
+    embedding_max_pending: int = 64  # Job di encoding in volo prima della backpressure
+    embedding_max_batch_tokens: int = 8192  # Budget token (con padding) per batch, 0 = disabilitato
 
     # Rate limiting for scrapers
     delay_between_articles: float = 1.0
@@ -146,6 +164,15 @@ class MerltConfig:
         if self.qdrant_collection is None:
             # Convention: qdrant collection is {graph_name}_chunks
             self.qdrant_collection = f"{self.graph_name}_chunks"
+        if self.content_store_path is None:
+            self.content_store_path = f"data/content_store/{self.qdrant_collection}.sqlite"
+        # Valida subito il nome del profilo
+        get_collection_profile(self.qdrant_profile)
+
+    @property
+    def collection_profile(self) -> QdrantCollectionProfile:
+        """Profilo Qdrant risolto da qdrant_profile."""
+        return get_collection_profile(self.qdrant_profile)
 
 
 @dataclass
@@ -299,6 +326,7 @@ class LegalKnowledgeGraph:
         # Storage clients (initialized in connect())
         self._falkordb: Optional[FalkorDBClient] = None
         self._qdrant: Optional[Any] = None  # QdrantClient
+        self._content_store: Optional[ChunkContentStore] = None  # Slim payload mode
         self._bridge_table: Optional[BridgeTable] = None
 
         # Pipelines (initialized in connect())
@@ -317,8 +345,12 @@ class LegalKnowledgeGraph:
         # Expert System (lazy initialized)
         self._orchestrator: Optional[Any] = None  # MultiExpertOrchestrator
 
-        # Hierarchies cache
+        # Hierarchies cache (memoria + store su disco)
         self._norm_trees: Dict[str, NormTree] = {}
+        self._norm_tree_store: Optional[NormTreeStore] = (
+            NormTreeStore(self.config.norm_tree_cache_dir)
+            if self.config.norm_tree_cache_dir else None
+        )
 
         self._connected = False
 
@@ -349,6 +381,8 @@ class LegalKnowledgeGraph:
         # Qdrant (optional)
         if HAS_QDRANT:
             try:
+                from qdrant_client import QdrantClient
+
                 self._qdrant = QdrantClient(
                     host=self.config.qdrant_host,
                     port=self.config.qdrant_port,
@@ -356,6 +390,10 @@ class LegalKnowledgeGraph:
                 # Ensure collection exists
                 await self._ensure_qdrant_collection()
                 log.info(f"Qdrant connected: {self.config.qdrant_collection}")
+
+                if self.config.qdrant_slim_payload:
+                    self._content_store = ChunkContentStore(self.config.content_store_path)
+                    log.info(f"Slim payload mode: content store {self.config.content_store_path}")
             except Exception as e:
                 log.warning(f"Qdrant connection failed: {e}")
                 self._qdrant = None
@@ -397,7 +435,11 @@ class LegalKnowledgeGraph:
         if HAS_EMBEDDING_SERVICE:
             try:
                 self._embedding_service = EmbeddingService.get_instance(
-                    model_name=self.config.embedding_model
+                    model_name=self.config.embedding_model,
+                    encode_workers=self.config.embedding_workers,
+                    threads_per_worker=self.config.embedding_threads_per_worker,
+                    max_pending_encodes=self.config.embedding_max_pending,
+                    max_batch_tokens=self.config.embedding_max_batch_tokens,
                 )
             except Exception as e:
                 log.warning(f"Embedding service initialization failed: {e}")
@@ -413,28 +455,63 @@ class LegalKnowledgeGraph:
             await self._bridge_table.close()
         if self._qdrant:
             self._qdrant.close()
+        if self._content_store:
+            self._content_store.close()
+            self._content_store = None
 
         self._connected = False
         log.info("LegalKnowledgeGraph connections closed")
 
     async def _ensure_qdrant_collection(self) -> None:
-        """Ensure Qdrant collection exists with correct parameters."""
+        """
+        Ensure Qdrant collection exists with the configured profile.
+
+        The profile (quantization, on-disk storage, HNSW params) only applies
+        when the collection is created; to change the profile of an existing
+        collection use scripts/migrate_qdrant_profile.py.
+        """
         if not self._qdrant:
             return
 
-        collection_name = self.config.qdrant_collection
-        collections = self._qdrant.get_collections().collections
-        exists = any(c.name == collection_name for c in collections)
-
-        if not exists:
-            self._qdrant.create_collection(
-                collection_name=collection_name,
-                vectors_config=VectorParams(
-                    size=self.config.embedding_dimension,
-                    distance=Distance.COSINE,
-                ),
-            )
-            log.info(f"Created Qdrant collection: {collection_name}")
+        ensure_collection(
+            self._qdrant,
+            self.config.qdrant_collection,
+            self.config.embedding_dimension,
+            self.config.collection_profile,
+        )
+
+    def _store_point_texts(self, points: List[Any]) -> None:
+        """
+        Slim payload mode: move point texts from the Qdrant payload to the content store.
+
+        No-op when slim payload is disabled. Must be called before upsert.
+        """
+        if self._content_store is None:
+            return
+
+        texts = {
+            str(point.id): point.payload.pop("text")
+            for point in points
+            if point.payload and "text" in point.payload
+        }
+        self._content_store.put_many(texts)
+
+    def _resolve_point_texts(self, hits: List[Any]) -> Dict[str, str]:
+        """
+        Text of each search hit, from payload or (slim mode) from the content store.
+
+        Returns:
+            Dict str(point id) -> text
+        """
+        texts = {
+            str(hit.id): hit.payload.get("text")
+            for hit in hits
+            if hit.payload and hit.payload.get("text")
+        }
+        missing = [str(hit.id) for hit in hits if str(hit.id) not in texts]
+        if missing and self._content_store is not None:
+            texts.update(self._content_store.get_many(missing))
+        return texts
 
     async def ingest_norm(
         self,
@@ -598,113 +675,46 @@ class LegalKnowledgeGraph:
         if not self._qdrant or not self._embedding_service:
             return 0
 
-        points_to_upsert = []
-        base_payload = {
-            "article_urn": article_urn,
-            "tipo_atto": metadata.tipo_atto,
-            "numero_articolo": metadata.numero_articolo,
-        }
-
-        # 1. Embedding del testo normativo (sempre)
-        if article_text and len(article_text.strip()) > 20:
-            embedding = await self._embedding_service.encode_document_async(article_text)
-            point_id = hash(f"{article_urn}:norma") % (2**63)
-            points_to_upsert.append(PointStruct(
-                id=point_id,
-                vector=embedding,
-                payload={
-                    **base_payload,
-                    "source_type": "norma",
-                    "text": article_text[:2000],
-                },
-            ))
-            log.debug(f"Created embedding for norma: {article_urn}")
-
-        # Process Brocardi info if available
-        if brocardi_info:
-            # 2. Embedding della Spiegazione
-            spiegazione = brocardi_info.get("Spiegazione", "")
-            if spiegazione and len(spiegazione.strip()) > 50:
-                embedding = await self._embedding_service.encode_document_async(spiegazione)
-                point_id = hash(f"{article_urn}:spiegazione") % (2**63)
-                points_to_upsert.append(PointStruct(
-                    id=point_id,
-                    vector=embedding,
-                    payload={
-                        **base_payload,
-                        "source_type": "spiegazione",
-                        "text": spiegazione[:2000],
-                    },
-                ))
-                log.debug(f"Created embedding for spiegazione: {article_urn}")
-
-            # 3. Embedding della Ratio legis
-            ratio = brocardi_info.get("Ratio", "")
-            if ratio and len(ratio.strip()) > 50:
-                embedding = await self._embedding_service.encode_document_async(ratio)
-                point_id = hash(f"{article_urn}:ratio") % (2**63)
-                points_to_upsert.append(PointStruct(
-                    id=point_id,
-                    vector=embedding,
-                    payload={
-                        **base_payload,
-                        "source_type": "ratio",
-                        "text": ratio[:2000],
-                    },
-                ))
-                log.debug(f"Created embedding for ratio: {article_urn}")
-
-            # 4. Embedding delle Massime (top 5)
-            massime = brocardi_info.get("Massime", [])
-            massime_added = 0
-            if isinstance(massime, list):
-                for i, massima in enumerate(massime[:5]):
-                    # Handle various formats from Brocardi
-                    # Field is "massima" from BrocardiScraper._parse_massima()
-                    if isinstance(massima, str):
-                        testo = massima
-                    elif isinstance(massima, dict):
-                        testo = massima.get("massima", massima.get("testo", massima.get("Testo", "")))
-                    else:
-                        continue
-
-                    if testo and len(testo.strip()) > 50:
-                        embedding = await self._embedding_service.encode_document_async(testo)
-                        point_id = hash(f"{article_urn}:massima:{i}") % (2**63)
-                        points_to_upsert.append(PointStruct(
-                            id=point_id,
-                            vector=embedding,
-                            payload={
-                                **base_payload,
-                                "source_type": "massima",
-                                "massima_index": i,
-                                "text": testo[:2000],
-                            },
-                        ))
-                        massime_added += 1
-
-                if massime_added:
-                    log.debug(f"Created {massime_added} massima embeddings for: {article_urn}")
-
-        # Upsert all points at once
-        if points_to_upsert:
-            self._qdrant.upsert(
-                collection_name=self.config.qdrant_collection,
-                points=points_to_upsert,
-            )
-            log.info(f"Upserted {len(points_to_upsert)} multi-source embeddings for {article_urn}")
-
-        return len(points_to_upsert)
+        candidates = build_article_points(
+            article_urn,
+            base_payload={
+                "article_urn": article_urn,
+                "tipo_atto": metadata.tipo_atto,
+                "numero_articolo": metadata.numero_articolo,
+            },
+            article_text=article_text,
+            brocardi_info=brocardi_info,
+        )
+        # Id deterministici + content hash: i testi invariati non vengono ri-encodati
+        upserted = await upsert_changed_points(
+            self._qdrant,
+            self.config.qdrant_collection,
+            self._embedding_service,
+            candidates,
+            before_upsert=self._store_point_texts,
+        )
+        if upserted:
+            log.info(f"Upserted {upserted} multi-source embeddings for {article_urn}")
+        return upserted
 
     async def _get_cached_norm_tree(self, tipo_atto: str) -> Optional[NormTree]:
-        """Get cached NormTree for act type, or fetch and cache it."""
+        """
+        Get cached NormTree for act type, or fetch and cache it.
+
+        Ordine: memoria, store su disco (norm_tree_cache_dir), Normattiva.
+        """
         if tipo_atto not in self._norm_trees:
             try:
                 # Genera URN direttamente (Norma non ha property .urn)
                 urn = generate_urn(act_type=tipo_atto, urn_flag=True)
                 if urn:
-                    tree, status = await get_hierarchical_tree(urn)
-                    if status == 200 and isinstance(tree, NormTree):
+                    if self._norm_tree_store is not None:
+                        tree, article_count = await get_cached_hierarchical_tree(
+                            urn, store=self._norm_tree_store
+                        )
+                    else:
+                        tree, article_count = await get_hierarchical_tree(urn)
+                    if article_count > 0 and isinstance(tree, NormTree):
                         self._norm_trees[tipo_atto] = tree
             except Exception as e:
                 log.warning(f"Could not fetch NormTree for {tipo_atto}: {e}")
@@ -746,8 +756,10 @@ class LegalKnowledgeGraph:
             collection_name=self.config.qdrant_collection,
             query=query_embedding,
             limit=top_k,
+            search_params=self.config.collection_profile.search_params(),
         )
         results = response.points
+        texts = self._resolve_point_texts(results)
 
         # Format results
         formatted = []
@@ -756,7 +768,7 @@ class LegalKnowledgeGraph:
                 "urn": hit.payload.get("urn"),
                 "tipo_atto": hit.payload.get("tipo_atto"),
                 "numero_articolo": hit.payload.get("numero_articolo"),
-                "text": hit.payload.get("text"),
+                "text": texts.get(str(hit.id)),
                 "score": hit.score,
             }
 
@@ -973,12 +985,15 @@ class LegalKnowledgeGraph:
             # Crea retriever se non esiste
             if not hasattr(self, '_retriever') or self._retriever is None:
                 try:
-                    retriever_config = RetrieverConfig()
+                    retriever_config = RetrieverConfig(
+                        qdrant_profile=self.config.qdrant_profile,
+                    )
                     self._retriever = GraphAwareRetriever(
                         vector_db=self._qdrant,
                         graph_db=self._falkordb,
                         bridge_table=self._bridge_table,
                         config=retriever_config,
+                        content_store=self._content_store,
                     )
                 except Exception as e:
                     log.warning(f"Could not create GraphAwareRetriever: {e}")
@@ -1172,6 +1187,12 @@ class LegalKnowledgeGraph:
         max_concurrent_fetches: int = 5,
         include_brocardi: bool = True,
         include_multivigenza: bool = True,
+        pipelined: bool = True,
+        stage_concurrency: Optional[Dict[str, int]] = None,
+        resume: bool = False,
+        checkpoint_path: Optional[str] = None,
+        revalidate: bool = False,
+        parse_workers: Optional[int] = None,
     ) -> "BatchIngestionResult":
         """
         Ingest batch di articoli con ottimizzazioni per performance.
@@ -1180,6 +1201,7 @@ class LegalKnowledgeGraph:
         - HTTP fetches (Normattiva + Brocardi)
         - Embedding generation (batch encoding)
         - Database operations (batch upserts)
+        - Stage in pipeline: fetch del batch N+1 durante l'embedding del batch N
 
         Performance: 5-10x più veloce di ingest_norm sequenziale.
 
@@ -1190,9 +1212,21 @@ class LegalKnowledgeGraph:
             max_concurrent_fetches: Max fetch HTTP paralleli (default: 5)
             include_brocardi: Include enrichment Brocardi
             include_multivigenza: Include tracking modifiche
+            pipelined: Stage in pipeline con code limitate (default: True)
+            stage_concurrency: Concorrenza per stage, es. {"fetch": 3}
+                (vedi DEFAULT_STAGE_CONCURRENCY)
+            resume: Riprende da checkpoint, saltando articoli e stage già
+                completati (default journal:
+                data/checkpoints/ingestion/{graph_name}.sqlite)
+            checkpoint_path: File del journal; se indicato il progresso viene
+                registrato anche senza resume
+            revalidate: Con resume, riscarica gli articoli completati e
+                riesegue solo gli stage il cui contenuto è cambiato
+            parse_workers: Processi worker per il parsing dei testi
+                (ParsePool); None = parsing inline nell'event loop
 
         Returns:
-            BatchIngestionResult con statistiche complete
+            BatchIngestionResult con statistiche complete (incluse stage_metrics)
 
         Example:
             >>> # Ingest Libro IV (artt. 1173-2059)
@@ -1207,24 +1241,49 @@ class LegalKnowledgeGraph:
             raise RuntimeError("Not connected. Call connect() first.")
 
         from merlt.pipeline.batch_ingestion import BatchIngestionPipeline
+        from merlt.pipeline.ingestion_journal import IngestionJournal
+        from merlt.pipeline.parse_pool import ParsePool
 
         # Create article numbers list
         start, end = article_range
         article_numbers = [str(n) for n in range(start, end + 1)]
 
+        # Checkpoint journal (resume)
+        journal = None
+        if resume or checkpoint_path:
+            journal = IngestionJournal(
+                checkpoint_path
+                or f"data/checkpoints/ingestion/{self.config.graph_name}.sqlite"
+            )
+
+        # Parsing in processi worker (chiuso a fine run)
+        parse_pool = ParsePool(max_workers=parse_workers) if parse_workers else None
+
         # Create and run batch pipeline
         pipeline = BatchIngestionPipeline(
             kg=self,
             batch_size=batch_size,
             max_concurrent_fetches=max_concurrent_fetches,
+            pipelined=pipelined,
+            stage_concurrency=stage_concurrency,
+            journal=journal,
+            parse_pool=parse_pool,
         )
 
-        return await pipeline.ingest_batch(
-            tipo_atto=tipo_atto,
-            article_numbers=article_numbers,
-            include_brocardi=include_brocardi,
-            include_multivigenza=include_multivigenza,
-        )
+        try:
+            return await pipeline.ingest_batch(
+                tipo_atto=tipo_atto,
+                article_numbers=article_numbers,
+                include_brocardi=include_brocardi,
+                include_multivigenza=include_multivigenza,
+                resume=resume,
+                revalidate=revalidate,
+            )
+        finally:
+            if journal is not None:
+                journal.close()
+            if parse_pool is not None:
+                parse_pool.close()
 
 
 # Type hint for return type
@@ -9,6 +9,8 @@ Componenti:
 - CommaParser: Parsing articoli in componenti strutturati
 - StructuralChunker: Chunking a livello comma
 - MultivigenzaPipeline: Gestione versioni e modifiche
+- IngestionJournal: Checkpoint per il resume della batch ingestion
+- ParsePool: Parsing/chunking in processi worker
 
 Esempio:
     from merlt.pipeline import IngestionPipelineV2
@@ -21,6 +23,8 @@ from merlt.pipeline.ingestion import IngestionPipelineV2
 from merlt.pipeline.parsing import CommaParser, ArticleStructure, parse_article
 from merlt.pipeline.chunking import StructuralChunker, Chunk, chunk_article
 from merlt.pipeline.multivigenza import MultivigenzaPipeline
+from merlt.pipeline.ingestion_journal import IngestionJournal
+from merlt.pipeline.parse_pool import ParsePool
 
 __all__ = [
     "IngestionPipelineV2",
@@ -31,4 +35,6 @@ __all__ = [
     "Chunk",
     "chunk_article",
     "MultivigenzaPipeline",
+    "IngestionJournal",
+    "ParsePool",
 ]
@@ -6,6 +6,14 @@ Ottimizzazioni implementate:
 1. Parallel HTTP fetches (Normattiva + Brocardi in parallelo)
 2. Batch embedding generation (tutti i testi insieme)
 3. Batch database operations (upsert in blocchi)
+4. Esecuzione pipelined: gli stage (fetch, graph, embed, bridge, multivigenza)
+   sono collegati da code asyncio limitate, così il batch N+1 viene scaricato
+   mentre il batch N viene embeddato. Il throughput tende a quello dello
+   stage più lento invece che alla somma degli stage.
+5. Resume: con un IngestionJournal ogni stage completato viene registrato
+   per articolo; ingest_batch(resume=True) salta il lavoro già fatto.
+6. Parsing in processi worker: con un ParsePool i testi di ogni batch
+   vengono parsati (CommaParser) fuori dall'event loop, in parallelo.
 
 Performance:
 - Sequenziale: ~8-18s per articolo
@@ -19,13 +27,18 @@ Usage:
 """
 
 import asyncio
+import time
 import structlog
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime, timezone
 
 from merlt.pipeline.visualex import VisualexArticle, NormaMetadata
 from merlt.pipeline.ingestion import IngestionPipelineV2, IngestionResult
+from merlt.pipeline.ingestion_journal import IngestionJournal, fetch_content_hash
+from merlt.pipeline.parse_pool import ParsePool
+from merlt.pipeline.parsing import ArticleStructure
+from merlt.storage.vectors.points import build_article_points, upsert_changed_points
 from merlt.sources.utils.norma import NormaVisitata, Norma
 from merlt.models import BridgeMapping
 
@@ -57,23 +70,119 @@ class BatchIngestionResult:
     graph_nodes_created: int
     bridge_mappings_created: int
     duration_seconds: float
+    skipped: int = 0  # Articoli già completati (resume)
     errors: List[str] = field(default_factory=list)
     articles_processed: List[str] = field(default_factory=list)
+    stage_metrics: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
     @property
     def success_rate(self) -> float:
-        return self.successful / self.total_articles if self.total_articles > 0 else 0.0
+        attempted = self.total_articles - self.skipped
+        return self.successful / attempted if attempted > 0 else 0.0
 
     def summary(self) -> str:
+        skipped = f" | Skipped: {self.skipped}" if self.skipped else ""
         return (
-            f"BatchIngestion: {self.successful}/{self.total_articles} "
+            f"BatchIngestion: {self.successful}/{self.total_articles - self.skipped} "
             f"({self.success_rate:.1%}) in {self.duration_seconds:.1f}s | "
             f"Embeddings: {self.embeddings_created} | "
             f"Nodes: {self.graph_nodes_created} | "
             f"Bridge: {self.bridge_mappings_created}"
+            f"{skipped}"
         )
 
 
+# Stage della pipeline, in ordine
+PIPELINE_STAGES = ("fetch", "graph", "embed", "bridge", "multivigenza")
+
+# Batch in lavorazione contemporanea per stage. Fetch è I/O di rete (2 batch in
+# volo, i singoli articoli sono già limitati da max_concurrent_fetches); gli
+# altri stage scrivono su un solo backend (FalkorDB, encoder, Postgres).
+DEFAULT_STAGE_CONCURRENCY = {
+    "fetch": 2,
+    "graph": 1,
+    "embed": 1,
+    "bridge": 1,
+    "multivigenza": 1,
+}
+
+
+@dataclass
+class StageMetrics:
+    """Metriche di uno stage della pipeline."""
+    name: str
+    concurrency: int = 1
+    batches: int = 0
+    articles: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """Articoli/s durante il lavoro effettivo dello stage."""
+        return self.articles / self.busy_seconds if self.busy_seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "batches": self.batches,
+            "articles": self.articles,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "articles_per_second": round(self.throughput, 2),
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+
+@dataclass
+class _BatchWork:
+    """Stato di un batch che attraversa gli stage."""
+    batch_num: int
+    article_numbers: List[str]
+    fetch_results: List[ArticleFetchResult] = field(default_factory=list)
+    ingestion_results: Dict[str, IngestionResult] = field(default_factory=dict)
+    embeddings: int = 0
+    bridge: int = 0
+    fatal_error: Optional[str] = None
+    # Resume: content hash e stage da eseguire per articolo (None = tutti)
+    content_hashes: Dict[str, str] = field(default_factory=dict)
+    pending: Optional[Dict[str, Set[str]]] = None
+
+    def needs(self, article_num: str, *stages: str) -> bool:
+        """True se almeno uno degli stage va eseguito per l'articolo."""
+        if self.pending is None:
+            return True
+        return bool(self.pending.get(article_num, set()) & set(stages))
+
+    @property
+    def successful_fetches(self) -> List[ArticleFetchResult]:
+        return [r for r in self.fetch_results if r.success]
+
+    @property
+    def failed_fetches(self) -> List[ArticleFetchResult]:
+        return [r for r in self.fetch_results if not r.success]
+
+    @property
+    def has_work(self) -> bool:
+        """False se il batch è fallito o non ha articoli da processare."""
+        return self.fatal_error is None and (
+            not self.fetch_results or bool(self.successful_fetches)
+        )
+
+    def to_counts(self) -> Dict[str, Any]:
+        successful = self.successful_fetches
+        return {
+            "successful": len(successful),
+            "failed": len(self.article_numbers) - len(successful),
+            "embeddings": self.embeddings,
+            "nodes": sum(len(r.nodes_created) for r in self.ingestion_results.values()),
+            "bridge": self.bridge,
+            "processed": [f.article_num for f in successful],
+            "errors": [f.error for f in self.failed_fetches if f.error],
+        }
+
+
 class BatchIngestionPipeline:
     """
     Ottimizza ingestion parallelizzando I/O e batching embeddings.
@@ -82,12 +191,22 @@ class BatchIngestionPipeline:
     1. Fetch parallelo: N articoli contemporaneamente (Normattiva + Brocardi)
     2. Batch embeddings: tutti i testi di un batch insieme
     3. Batch DB ops: upsert in blocchi
+    4. Pipelining: stage collegati da code limitate (queue_size batch),
+       ognuno con la propria concorrenza
 
     Args:
         kg: LegalKnowledgeGraph connesso
         batch_size: Articoli per batch (default: 10)
         max_concurrent_fetches: Max fetch paralleli (default: 5)
         embedding_batch_size: Testi per batch embedding (default: 32)
+        pipelined: Esegue gli stage in pipeline (default: True);
+            False = stage in sequenza per ogni batch
+        stage_concurrency: Override della concorrenza per stage
+            (chiavi di PIPELINE_STAGES, default: DEFAULT_STAGE_CONCURRENCY)
+        queue_size: Batch in attesa tra uno stage e il successivo (default: 2)
+        journal: IngestionJournal per checkpoint e resume (opzionale)
+        parse_pool: ParsePool per il parsing degli articoli in processi
+            worker (opzionale; default: parsing inline per articolo)
     """
 
     def __init__(
@@ -96,11 +215,28 @@ class BatchIngestionPipeline:
         batch_size: int = 10,
         max_concurrent_fetches: int = 5,
         embedding_batch_size: int = 32,
+        pipelined: bool = True,
+        stage_concurrency: Optional[Dict[str, int]] = None,
+        queue_size: int = 2,
+        journal: Optional[IngestionJournal] = None,
+        parse_pool: Optional[ParsePool] = None,
     ):
         self.kg = kg
+        self.journal = journal
+        self.parse_pool = parse_pool
         self.batch_size = batch_size
         self.max_concurrent_fetches = max_concurrent_fetches
         self.embedding_batch_size = embedding_batch_size
+        self.pipelined = pipelined
+        self.queue_size = max(1, queue_size)
+
+        unknown = set(stage_concurrency or {}) - set(PIPELINE_STAGES)
+        if unknown:
+            raise ValueError(f"Unknown pipeline stages: {sorted(unknown)}")
+        self.stage_concurrency = {
+            name: max(1, (stage_concurrency or {}).get(name, default))
+            for name, default in DEFAULT_STAGE_CONCURRENCY.items()
+        }
 
         # Semaphore per limitare concorrenza HTTP
         self._fetch_semaphore = asyncio.Semaphore(max_concurrent_fetches)
@@ -110,6 +246,7 @@ class BatchIngestionPipeline:
             batch_size=batch_size,
             max_concurrent=max_concurrent_fetches,
             embedding_batch=embedding_batch_size,
+            pipelined=pipelined,
         )
 
     async def ingest_batch(
@@ -118,6 +255,8 @@ class BatchIngestionPipeline:
         article_numbers: List[str],
         include_brocardi: bool = True,
         include_multivigenza: bool = True,
+        resume: bool = False,
+        revalidate: bool = False,
     ) -> BatchIngestionResult:
         """
         Ingest batch di articoli con ottimizzazioni.
@@ -127,139 +266,335 @@ class BatchIngestionPipeline:
             article_numbers: Lista numeri articoli
             include_brocardi: Include enrichment Brocardi
             include_multivigenza: Include tracking modifiche
+            resume: Salta gli stage già completati nel journal
+                (richiede journal); gli articoli completi non vengono scaricati
+            revalidate: Con resume, riscarica anche gli articoli completi e
+                riesegue solo gli stage il cui contenuto è cambiato
 
         Returns:
             BatchIngestionResult con statistiche
         """
+        if resume and self.journal is None:
+            raise ValueError("resume=True requires an IngestionJournal")
+
         start_time = datetime.now(timezone.utc)
         total = len(article_numbers)
 
         log.info(f"Starting batch ingestion: {total} articles")
 
-        result = BatchIngestionResult(
-            total_articles=total,
-            successful=0,
-            failed=0,
-            embeddings_created=0,
-            graph_nodes_created=0,
-            bridge_mappings_created=0,
-            duration_seconds=0,
-        )
-
-        # Process in batches
-        for i in range(0, total, self.batch_size):
-            batch = article_numbers[i:i + self.batch_size]
-            batch_num = i // self.batch_size + 1
-            total_batches = (total + self.batch_size - 1) // self.batch_size
+        brocardi_scraper = getattr(self.kg, "_brocardi_scraper", None)
+        build_index = include_brocardi and brocardi_scraper is not None
+        if build_index:
+            # Run batch: indice articoli del codice costruito al primo lookup
+            # (1 richiesta per articolo invece della scansione delle sezioni).
+            # Lo scraper è condiviso dal knowledge graph: a fine run si
+            # ripristina il valore precedente, così i lookup singoli non
+            # avviano il crawl del codice
+            previous_auto_build = brocardi_scraper.auto_build_index
+            brocardi_scraper.auto_build_index = True
 
-            log.info(f"Processing batch {batch_num}/{total_batches}: articles {batch[0]}-{batch[-1]}")
-
-            try:
-                batch_result = await self._process_batch(
-                    tipo_atto=tipo_atto,
-                    article_numbers=batch,
-                    include_brocardi=include_brocardi,
-                    include_multivigenza=include_multivigenza,
+        try:
+            skipped: Set[str] = set()
+            if resume and not revalidate:
+                skipped = self.journal.completed_articles(
+                    tipo_atto, self._journal_stages(include_multivigenza)
                 )
+                article_numbers = [n for n in article_numbers if n not in skipped]
+                if skipped:
+                    log.info(f"Resume: skipping {total - len(article_numbers)} completed articles")
+
+            result = BatchIngestionResult(
+                total_articles=total,
+                successful=0,
+                failed=0,
+                embeddings_created=0,
+                graph_nodes_created=0,
+                bridge_mappings_created=0,
+                duration_seconds=0,
+                skipped=total - len(article_numbers),
+            )
 
-                result.successful += batch_result["successful"]
-                result.failed += batch_result["failed"]
-                result.embeddings_created += batch_result["embeddings"]
-                result.graph_nodes_created += batch_result["nodes"]
-                result.bridge_mappings_created += batch_result["bridge"]
-                result.articles_processed.extend(batch_result["processed"])
-                result.errors.extend(batch_result["errors"])
-
-            except Exception as e:
-                log.error(f"Batch {batch_num} failed: {e}")
-                result.failed += len(batch)
-                result.errors.append(f"Batch {batch_num}: {str(e)}")
-
-        result.duration_seconds = (datetime.now(timezone.utc) - start_time).total_seconds()
-
-        log.info(result.summary())
-        return result
+            batches = [
+                _BatchWork(
+                    batch_num=i // self.batch_size + 1,
+                    article_numbers=article_numbers[i:i + self.batch_size],
+                )
+                for i in range(0, len(article_numbers), self.batch_size)
+            ]
+            stages = self._build_stages(
+                tipo_atto, include_brocardi, include_multivigenza, resume, revalidate
+            )
+            metrics = {
+                name: StageMetrics(name=name, concurrency=self.stage_concurrency[name])
+                for name, _ in stages
+            }
 
-    async def _process_batch(
+            if self.pipelined:
+                await self._run_pipelined(batches, stages, metrics)
+            else:
+                for work in batches:
+                    log.info(
+                        f"Processing batch {work.batch_num}/{len(batches)}: "
+                        f"articles {work.article_numbers[0]}-{work.article_numbers[-1]}"
+                    )
+                    for name, stage in stages:
+                        await self._run_stage(name, stage, work, metrics[name])
+
+            for work in batches:
+                if work.fatal_error is not None:
+                    result.failed += len(work.article_numbers)
+                    result.errors.append(f"Batch {work.batch_num}: {work.fatal_error}")
+                    continue
+
+                counts = work.to_counts()
+                result.successful += counts["successful"]
+                result.failed += counts["failed"]
+                result.embeddings_created += counts["embeddings"]
+                result.graph_nodes_created += counts["nodes"]
+                result.bridge_mappings_created += counts["bridge"]
+                result.articles_processed.extend(counts["processed"])
+                result.errors.extend(counts["errors"])
+
+            result.stage_metrics = {name: m.to_dict() for name, m in metrics.items()}
+            result.duration_seconds = (datetime.now(timezone.utc) - start_time).total_seconds()
+
+            log.info(result.summary(), stages=result.stage_metrics)
+            return result
+        finally:
+            if build_index:
+                brocardi_scraper.auto_build_index = previous_auto_build
+
+    def _journal_stages(self, include_multivigenza: bool) -> List[str]:
+        """Stage che devono risultare completati perché un articolo sia finito."""
+        stages = ["fetch", "graph"]
+        if self.kg._qdrant and self.kg._embedding_service:
+            stages.append("embed")
+        if self.kg._bridge_builder:
+            stages.append("bridge")
+        if include_multivigenza and self.kg._multivigenza_pipeline:
+            stages.append("multivigenza")
+        return stages
+
+    def _build_stages(
         self,
         tipo_atto: str,
-        article_numbers: List[str],
         include_brocardi: bool,
         include_multivigenza: bool,
-    ) -> Dict[str, Any]:
-        """Process single batch of articles."""
-
-        # ═══════════════════════════════════════════════════════════════
-        # STEP 1: Parallel HTTP Fetches
-        # ═══════════════════════════════════════════════════════════════
-        fetch_results = await self._fetch_articles_parallel(
-            tipo_atto=tipo_atto,
-            article_numbers=article_numbers,
-            include_brocardi=include_brocardi,
-        )
+        resume: bool = False,
+        revalidate: bool = False,
+    ) -> List[Tuple[str, Callable[[_BatchWork], Awaitable[None]]]]:
+        """
+        Stage da applicare a ogni batch, in ordine.
 
-        successful_fetches = [r for r in fetch_results if r.success]
-        failed_fetches = [r for r in fetch_results if not r.success]
-
-        if failed_fetches:
-            log.warning(f"Failed fetches: {len(failed_fetches)}")
-
-        if not successful_fetches:
-            return {
-                "successful": 0,
-                "failed": len(article_numbers),
-                "embeddings": 0,
-                "nodes": 0,
-                "bridge": 0,
-                "processed": [],
-                "errors": [f.error for f in failed_fetches if f.error],
+        Con un journal ogni stage registra gli articoli completati; con resume
+        ogni stage elabora solo gli articoli per cui è ancora pendente
+        (con revalidate il fetch è sempre rieseguito e decide il content hash).
+        """
+        journal = self.journal
+        downstream = [s for s in self._journal_stages(include_multivigenza) if s != "fetch"]
+
+        async def fetch(work: _BatchWork) -> None:
+            cached = {}
+            if resume and not revalidate:
+                cached = journal.load_fetched(tipo_atto, work.article_numbers)
+            to_fetch = [n for n in work.article_numbers if n not in cached]
+            fetched = {}
+            if to_fetch:
+                fetched = {
+                    r.article_num: r
+                    for r in await self._fetch_articles_parallel(
+                        tipo_atto=tipo_atto,
+                        article_numbers=to_fetch,
+                        include_brocardi=include_brocardi,
+                    )
+                }
+
+            work.fetch_results = []
+            for num in work.article_numbers:
+                if num in cached:
+                    payload = cached[num][1]
+                    work.fetch_results.append(ArticleFetchResult(
+                        article_num=num,
+                        norma_visitata=self._norma_visitata(tipo_atto, num),
+                        article_text=payload.get("article_text"),
+                        article_url=payload.get("article_url"),
+                        brocardi_info=payload.get("brocardi_info"),
+                    ))
+                else:
+                    work.fetch_results.append(fetched[num])
+
+            if work.failed_fetches:
+                log.warning(f"Failed fetches: {len(work.failed_fetches)}")
+
+            work.content_hashes = {
+                f.article_num: fetch_content_hash(f.article_text, f.brocardi_info)
+                for f in work.successful_fetches
             }
+            if journal is None:
+                return
+
+            new = [f for f in work.successful_fetches if f.article_num not in cached]
+            journal.save_fetched(tipo_atto, {
+                f.article_num: (work.content_hashes[f.article_num], {
+                    "article_text": f.article_text,
+                    "article_url": f.article_url,
+                    "brocardi_info": f.brocardi_info,
+                })
+                for f in new
+            })
+            journal.record(tipo_atto, "fetch", {
+                f.article_num: work.content_hashes[f.article_num] for f in new
+            })
+            if resume:
+                work.pending = {
+                    num: journal.pending_stages(tipo_atto, num, downstream, h)
+                    for num, h in work.content_hashes.items()
+                }
+
+        async def graph(work: _BatchWork) -> None:
+            # Graph (MERGE, idempotente) serve anche a embed e bridge: rieseguito
+            # se uno qualsiasi dei tre è pendente
+            targets = [
+                f for f in work.successful_fetches
+                if work.needs(f.article_num, "graph", "embed", "bridge")
+            ]
+            if not targets:
+                return
+            work.ingestion_results = await self._ingest_to_graph_parallel(
+                fetch_results=targets,
+                tipo_atto=tipo_atto,
+            )
+            record_work("graph", work, list(work.ingestion_results))
+
+        async def embed(work: _BatchWork) -> None:
+            targets = [
+                f for f in work.successful_fetches
+                if f.article_num in work.ingestion_results and work.needs(f.article_num, "embed")
+            ]
+            if not targets:
+                return
+            work.embeddings = await self._generate_embeddings_batch(
+                fetch_results=targets,
+                ingestion_results=work.ingestion_results,
+            )
+            if self.kg._qdrant and self.kg._embedding_service:
+                record_work("embed", work, [f.article_num for f in targets])
+
+        async def bridge(work: _BatchWork) -> None:
+            # Solo articoli pendenti: è un'ottimizzazione, le insert sono idempotenti
+            # (ON CONFLICT (chunk_id, graph_node_urn) DO NOTHING in add_mappings_batch)
+            targets = {
+                num: r for num, r in work.ingestion_results.items()
+                if work.needs(num, "bridge")
+            }
+            if not targets:
+                return
+            try:
+                work.bridge = await self._insert_bridge_mappings_batch(ingestion_results=targets)
+            except Exception as e:
+                # Non registrato nel journal: ritentato al prossimo resume
+                log.error(f"Bridge batch insert failed: {e}")
+                return
+            # Registrato anche con 0 righe inserite: su resume dopo un crash
+            # successivo al COPY le mappature sono già presenti
+            if self.kg._bridge_builder:
+                record_work("bridge", work, list(targets))
+
+        async def multivigenza(work: _BatchWork) -> None:
+            targets = [
+                f for f in work.successful_fetches
+                if work.needs(f.article_num, "multivigenza")
+            ]
+            if not targets:
+                return
+            done = await self._process_multivigenza_parallel(fetch_results=targets)
+            record_work("multivigenza", work, done)
+
+        def record_work(stage: str, work: _BatchWork, article_nums: List[str]) -> None:
+            if journal is not None:
+                journal.record(tipo_atto, stage, {
+                    n: work.content_hashes[n] for n in article_nums if n in work.content_hashes
+                })
 
-        # ═══════════════════════════════════════════════════════════════
-        # STEP 2: Graph Ingestion (può essere parallelizzato)
-        # ═══════════════════════════════════════════════════════════════
-        ingestion_results = await self._ingest_to_graph_parallel(
-            fetch_results=successful_fetches,
-            tipo_atto=tipo_atto,
-        )
-
-        # ═══════════════════════════════════════════════════════════════
-        # STEP 3: Batch Embeddings (OTTIMIZZAZIONE PRINCIPALE)
-        # ═══════════════════════════════════════════════════════════════
-        embeddings_count = await self._generate_embeddings_batch(
-            fetch_results=successful_fetches,
-            ingestion_results=ingestion_results,
-        )
+        stages = [("fetch", fetch), ("graph", graph), ("embed", embed), ("bridge", bridge)]
+        if include_multivigenza:
+            stages.append(("multivigenza", multivigenza))
+        return stages
 
-        # ═══════════════════════════════════════════════════════════════
-        # STEP 4: Batch Bridge Table Insert
-        # ═══════════════════════════════════════════════════════════════
-        bridge_count = await self._insert_bridge_mappings_batch(
-            ingestion_results=ingestion_results,
-        )
+    async def _run_stage(
+        self,
+        name: str,
+        stage: Callable[[_BatchWork], Awaitable[None]],
+        work: _BatchWork,
+        metrics: StageMetrics,
+    ) -> None:
+        """Applica uno stage a un batch; un'eccezione marca il batch come fallito."""
+        if not work.has_work:
+            return
 
-        # ═══════════════════════════════════════════════════════════════
-        # STEP 5: Multivigenza (parallel)
-        # ═══════════════════════════════════════════════════════════════
-        if include_multivigenza:
-            await self._process_multivigenza_parallel(
-                fetch_results=successful_fetches,
+        start = time.perf_counter()
+        try:
+            await stage(work)
+        except Exception as e:
+            log.error(f"Batch {work.batch_num} failed at stage {name}: {e}")
+            work.fatal_error = f"{name}: {e}"
+            metrics.errors += 1
+        finally:
+            metrics.busy_seconds += time.perf_counter() - start
+            metrics.batches += 1
+            metrics.articles += (
+                len(work.article_numbers) if name == "fetch" else len(work.successful_fetches)
             )
 
-        # Conta nodi creati
-        total_nodes = sum(
-            len(r.nodes_created) for r in ingestion_results.values()
-        )
+    async def _run_pipelined(
+        self,
+        batches: List[_BatchWork],
+        stages: List[Tuple[str, Callable[[_BatchWork], Awaitable[None]]]],
+        metrics: Dict[str, StageMetrics],
+    ) -> None:
+        """
+        Esegue gli stage in pipeline con code asyncio limitate.
 
-        return {
-            "successful": len(successful_fetches),
-            "failed": len(failed_fetches),
-            "embeddings": embeddings_count,
-            "nodes": total_nodes,
-            "bridge": bridge_count,
-            "processed": [f.article_num for f in successful_fetches],
-            "errors": [f.error for f in failed_fetches if f.error],
-        }
+        Ogni stage ha `concurrency` worker che leggono dalla propria coda e
+        scrivono in quella dello stage successivo; le code piene bloccano lo
+        stage a monte (backpressure). None segnala la fine a ciascun worker.
+        """
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in stages]
+
+        async def put(index: int, item: Optional[_BatchWork]) -> None:
+            await queues[index].put(item)
+            name = stages[index][0]
+            metrics[name].max_queue_depth = max(metrics[name].max_queue_depth, queues[index].qsize())
+
+        async def feed() -> None:
+            for work in batches:
+                await put(0, work)
+            for _ in range(self.stage_concurrency[stages[0][0]]):
+                await put(0, None)
+
+        async def worker(index: int) -> None:
+            name, stage = stages[index]
+            while True:
+                work = await queues[index].get()
+                if work is None:
+                    return
+                if index == 0:
+                    log.info(
+                        f"Processing batch {work.batch_num}/{len(batches)}: "
+                        f"articles {work.article_numbers[0]}-{work.article_numbers[-1]}"
+                    )
+                await self._run_stage(name, stage, work, metrics[name])
+                if index + 1 < len(stages):
+                    await put(index + 1, work)
+
+        async def run_stage_workers(index: int) -> None:
+            name = stages[index][0]
+            await asyncio.gather(*(worker(index) for _ in range(self.stage_concurrency[name])))
+            if index + 1 < len(stages):
+                for _ in range(self.stage_concurrency[stages[index + 1][0]]):
+                    await put(index + 1, None)
+
+        await asyncio.gather(feed(), *(run_stage_workers(i) for i in range(len(stages))))
 
     async def _fetch_articles_parallel(
         self,
@@ -294,6 +629,11 @@ class BatchIngestionPipeline:
 
         return fetch_results
 
+    @staticmethod
+    def _norma_visitata(tipo_atto: str, article_num: str) -> NormaVisitata:
+        norma = Norma(tipo_atto=tipo_atto, data=None, numero_atto=None)
+        return NormaVisitata(norma=norma, numero_articolo=article_num.replace(' ', '-'))
+
     async def _fetch_single_article(
         self,
         tipo_atto: str,
@@ -302,8 +642,7 @@ class BatchIngestionPipeline:
     ) -> ArticleFetchResult:
         """Fetch single article with Normattiva + Brocardi in parallel."""
 
-        norma = Norma(tipo_atto=tipo_atto, data=None, numero_atto=None)
-        nv = NormaVisitata(norma=norma, numero_articolo=article_num.replace(' ', '-'))
+        nv = self._norma_visitata(tipo_atto, article_num)
 
         result = ArticleFetchResult(
             article_num=article_num,
@@ -348,6 +687,20 @@ class BatchIngestionPipeline:
         """Ingest articles to graph in parallel."""
 
         results = {}
+        pipeline = self.kg._ingestion_pipeline
+
+        # Con un ParsePool il batch viene parsato tutto insieme nei worker;
+        # i testi non parsabili vengono riparsati inline (stesso errore di prima)
+        structures: Dict[str, ArticleStructure] = {}
+        if self.parse_pool is not None:
+            parsed = await pipeline.parse_articles(
+                [f.article_text for f in fetch_results], pool=self.parse_pool
+            )
+            structures = {
+                f.article_num: s
+                for f, s in zip(fetch_results, parsed)
+                if isinstance(s, ArticleStructure)
+            }
 
         async def ingest_single(fetch: ArticleFetchResult) -> Tuple[str, IngestionResult]:
             metadata = NormaMetadata(
@@ -367,10 +720,15 @@ class BatchIngestionPipeline:
             # Get cached norm tree
             cached_tree = await self.kg._get_cached_norm_tree(tipo_atto)
 
-            ingestion_result = await self.kg._ingestion_pipeline.ingest_article(
+            kwargs = {}
+            if fetch.article_num in structures:
+                kwargs["article_structure"] = structures[fetch.article_num]
+
+            ingestion_result = await pipeline.ingest_article(
                 article=visualex_article,
                 create_graph_nodes=True,
                 norm_tree=cached_tree,
+                **kwargs,
             )
 
             return fetch.article_num, ingestion_result
@@ -395,134 +753,64 @@ class BatchIngestionPipeline:
 
         Invece di generare embeddings uno alla volta:
         1. Raccoglie tutti i testi da tutti gli articoli
-        2. Genera embeddings in un singolo batch
-        3. Upsert a Qdrant in blocco
+        2. Scarta i testi invariati (content hash già presente in Qdrant)
+        3. Genera embeddings in un singolo batch
+        4. Upsert a Qdrant in blocco
         """
         if not self.kg._qdrant or not self.kg._embedding_service:
             return 0
 
-        # Collect all texts to embed with metadata
-        texts_to_embed = []
-        text_metadata = []  # Parallel list with metadata for each text
-
+        # Collect all texts to embed (id deterministici per articolo/fonte)
+        candidates = []
         for fetch in fetch_results:
             if fetch.article_num not in ingestion_results:
                 continue
 
-            ingestion = ingestion_results[fetch.article_num]
-            article_urn = ingestion.article_urn
-
-            base_meta = {
-                "article_urn": article_urn,
-                "tipo_atto": fetch.norma_visitata.norma.tipo_atto,
-                "numero_articolo": fetch.article_num,
-            }
-
-            # 1. Article text (norma)
-            if fetch.article_text and len(fetch.article_text.strip()) > 20:
-                texts_to_embed.append(fetch.article_text)
-                text_metadata.append({
-                    **base_meta,
-                    "source_type": "norma",
-                    "point_id_suffix": "norma",
-                    "text_preview": fetch.article_text[:2000],
-                })
+            article_urn = ingestion_results[fetch.article_num].article_urn
+            candidates.extend(build_article_points(
+                article_urn,
+                base_payload={
+                    "article_urn": article_urn,
+                    "tipo_atto": fetch.norma_visitata.norma.tipo_atto,
+                    "numero_articolo": fetch.article_num,
+                },
+                article_text=fetch.article_text,
+                brocardi_info=fetch.brocardi_info,
+            ))
 
-            # 2-4. Brocardi content
-            if fetch.brocardi_info:
-                # Spiegazione
-                spiegazione = fetch.brocardi_info.get("Spiegazione", "")
-                if spiegazione and len(spiegazione.strip()) > 50:
-                    texts_to_embed.append(spiegazione)
-                    text_metadata.append({
-                        **base_meta,
-                        "source_type": "spiegazione",
-                        "point_id_suffix": "spiegazione",
-                        "text_preview": spiegazione[:2000],
-                    })
-
-                # Ratio
-                ratio = fetch.brocardi_info.get("Ratio", "")
-                if ratio and len(ratio.strip()) > 50:
-                    texts_to_embed.append(ratio)
-                    text_metadata.append({
-                        **base_meta,
-                        "source_type": "ratio",
-                        "point_id_suffix": "ratio",
-                        "text_preview": ratio[:2000],
-                    })
-
-                # Massime (top 5)
-                massime = fetch.brocardi_info.get("Massime", [])
-                if isinstance(massime, list):
-                    for i, massima in enumerate(massime[:5]):
-                        if isinstance(massima, str):
-                            testo = massima
-                        elif isinstance(massima, dict):
-                            testo = massima.get("massima", massima.get("testo", ""))
-                        else:
-                            continue
-
-                        if testo and len(testo.strip()) > 50:
-                            texts_to_embed.append(testo)
-                            text_metadata.append({
-                                **base_meta,
-                                "source_type": "massima",
-                                "massima_index": i,
-                                "point_id_suffix": f"massima:{i}",
-                                "text_preview": testo[:2000],
-                            })
-
-        if not texts_to_embed:
+        if not candidates:
             return 0
 
-        log.info(f"Batch embedding {len(texts_to_embed)} texts from {len(fetch_results)} articles")
-
-        # BATCH ENCODING - Much faster than sequential!
-        embeddings = await self.kg._embedding_service.encode_batch_async(
-            texts_to_embed,
-            is_query=False,
-            show_progress_bar=len(texts_to_embed) > 50,
+        log.info(f"Batch embedding {len(candidates)} texts from {len(fetch_results)} articles")
+
+        # BATCH ENCODING - solo testi nuovi o modificati, upsert a Qdrant in blocco
+        upserted = await upsert_changed_points(
+            self.kg._qdrant,
+            self.kg.config.qdrant_collection,
+            self.kg._embedding_service,
+            candidates,
+            # Slim payload mode: testo nel content store locale
+            before_upsert=self.kg._store_point_texts,
+            show_progress_bar=len(candidates) > 50,
         )
 
-        # Build points for Qdrant
-        from qdrant_client.models import PointStruct
-
-        points = []
-        for i, (embedding, meta) in enumerate(zip(embeddings, text_metadata)):
-            point_id = hash(f"{meta['article_urn']}:{meta['point_id_suffix']}") % (2**63)
-
-            payload = {
-                "article_urn": meta["article_urn"],
-                "tipo_atto": meta["tipo_atto"],
-                "numero_articolo": meta["numero_articolo"],
-                "source_type": meta["source_type"],
-                "text": meta["text_preview"],
-            }
-
-            if "massima_index" in meta:
-                payload["massima_index"] = meta["massima_index"]
-
-            points.append(PointStruct(
-                id=point_id,
-                vector=embedding,
-                payload=payload,
-            ))
-
-        # Batch upsert to Qdrant
-        self.kg._qdrant.upsert(
-            collection_name=self.kg.config.qdrant_collection,
-            points=points,
+        log.info(
+            f"Upserted {upserted} embeddings to Qdrant "
+            f"({len(candidates) - upserted} unchanged)"
         )
-
-        log.info(f"Upserted {len(points)} embeddings to Qdrant")
-        return len(points)
+        return upserted
 
     async def _insert_bridge_mappings_batch(
         self,
         ingestion_results: Dict[str, IngestionResult],
     ) -> int:
-        """Insert all bridge mappings in batch."""
+        """
+        Insert all bridge mappings in batch.
+
+        Returns the number of rows actually inserted (0 if all mappings
+        already exist). Errors are raised, so that a failure is not
+        mistaken for a no-op.
+        """
 
         if not self.kg._bridge_builder:
             return 0
@@ -534,34 +822,36 @@ class BatchIngestionPipeline:
         if not all_mappings:
             return 0
 
-        try:
-            inserted = await self.kg._bridge_builder.insert_mappings(all_mappings)
-            return inserted
-        except Exception as e:
-            log.error(f"Bridge batch insert failed: {e}")
-            return 0
+        return await self.kg._bridge_builder.insert_mappings(all_mappings)
 
     async def _process_multivigenza_parallel(
         self,
         fetch_results: List[ArticleFetchResult],
-    ) -> None:
-        """Process multivigenza for articles in parallel."""
+    ) -> List[str]:
+        """
+        Process multivigenza for articles in parallel.
+
+        Returns numeri degli articoli elaborati senza errori.
+        """
 
         if not self.kg._multivigenza_pipeline:
-            return
+            return []
 
-        async def process_single(fetch: ArticleFetchResult):
+        async def process_single(fetch: ArticleFetchResult) -> Optional[str]:
             try:
                 await self.kg._multivigenza_pipeline.ingest_with_history(
                     fetch.norma_visitata,
                     fetch_all_versions=False,
                     create_modifying_acts=True,
                 )
+                return fetch.article_num
             except Exception as e:
                 log.warning(f"Multivigenza failed for {fetch.article_num}: {e}")
+                return None
 
         tasks = [process_single(f) for f in fetch_results]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return [r for r in results if isinstance(r, str)]
 
 
 # Export
@@ -569,4 +859,8 @@ __all__ = [
     "BatchIngestionPipeline",
     "BatchIngestionResult",
     "ArticleFetchResult",
+    "IngestionJournal",
+    "StageMetrics",
+    "PIPELINE_STAGES",
+    "DEFAULT_STAGE_CONCURRENCY",
 ]
@@ -271,6 +271,7 @@ class StructuralChunker:
     def chunk_batch(
         self,
         articles: List[Dict[str, Any]],
+        pool=None,
     ) -> List[Chunk]:
         """
         Process a batch of articles and return all chunks.
@@ -283,10 +284,15 @@ class StructuralChunker:
 
         Args:
             articles: List of article dictionaries
+            pool: Optional ParsePool (merlt.pipeline.parse_pool) to chunk
+                the batch in worker processes
 
         Returns:
             Flat list of all chunks from all articles
         """
+        if pool is not None:
+            return pool.chunk_many(articles, chunker=self)
+
         all_chunks = []
 
         for article_data in articles:
@@ -9,6 +9,18 @@ Permette di:
 - Riprendere da dove si era interrotti
 - Evitare ri-processamento di contenuti già elaborati
 
+Formato su disco (per run_id):
+- ``{run_id}.json``: snapshot completo dello stato (compattazione)
+- ``{run_id}.journal.jsonl``: journal append-only, una riga per
+  mark_done / mark_error / start_run dopo l'ultimo snapshot
+
+Ogni mark_done aggiunge una riga al journal invece di riscrivere tutto lo
+stato: il costo per item resta costante. L'fsync è fatto a blocchi di
+``auto_save_interval`` righe; lo snapshot viene riscritto (atomicamente)
+solo quando il journal supera ``compact_interval`` righe e lo stato
+corrente, e a finalize. Il resume carica lo snapshot e rilegge il journal,
+ignorando le righe già compattate e un'eventuale ultima riga troncata.
+
 Esempio:
     checkpoint = CheckpointManager(Path("data/checkpoints/enrichment/"))
 
@@ -24,10 +36,11 @@ Esempio:
 
 import json
 import logging
+import os
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from typing import IO, Any, Dict, Iterator, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +57,7 @@ class CheckpointState:
         last_updated: Timestamp ultimo aggiornamento
         config_hash: Hash della config per validazione
         stats: Statistiche parziali
+        journal_seq: Ultima riga del journal inclusa nello stato
     """
     run_id: str
     processed_ids: Set[str] = field(default_factory=set)
@@ -51,6 +65,7 @@ class CheckpointState:
     last_updated: str = ""
     config_hash: str = ""
     stats: Dict[str, int] = field(default_factory=dict)
+    journal_seq: int = 0
 
     def __post_init__(self):
         if not self.started_at:
@@ -75,8 +90,24 @@ class CheckpointState:
             "last_updated": self.last_updated,
             "config_hash": self.config_hash,
             "stats": self.stats,
+            "journal_seq": self.journal_seq,
         }
 
+    def apply(self, record: Dict[str, Any]) -> None:
+        """Applica una riga del journal allo stato."""
+        op = record.get("op")
+        if op == "done":
+            self.processed_ids.add(record["id"])
+            for key, value in (record.get("stats") or {}).items():
+                self.stats[key] = self.stats.get(key, 0) + value
+        elif op == "error":
+            self.stats["errors"] = self.stats.get("errors", 0) + 1
+        elif op == "start":
+            self.config_hash = record.get("config_hash", self.config_hash)
+            self.started_at = record.get("ts", self.started_at)
+        self.journal_seq = record.get("seq", self.journal_seq)
+        self.last_updated = record.get("ts", self.last_updated)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CheckpointState":
         """Deserializza da dict."""
@@ -87,6 +118,7 @@ class CheckpointState:
             last_updated=data.get("last_updated", ""),
             config_hash=data.get("config_hash", ""),
             stats=data.get("stats", {}),
+            journal_seq=data.get("journal_seq", 0),
         )
 
 
@@ -94,8 +126,8 @@ class CheckpointManager:
     """
     Gestisce checkpoint per pipeline di enrichment.
 
-    Salva lo stato su filesystem per permettere resume dopo
-    interruzioni o errori.
+    Salva lo stato su filesystem (snapshot + journal append-only) per
+    permettere resume dopo interruzioni o errori.
 
     Attributes:
         checkpoint_dir: Directory per file checkpoint
@@ -120,6 +152,8 @@ class CheckpointManager:
         checkpoint_dir: Path,
         run_id: Optional[str] = None,
         auto_save_interval: int = 10,
+        compact_interval: int = 10_000,
+        fsync: bool = True,
     ):
         """
         Inizializza il checkpoint manager.
@@ -127,14 +161,21 @@ class CheckpointManager:
         Args:
             checkpoint_dir: Directory per file checkpoint
             run_id: ID esecuzione (genera se None)
-            auto_save_interval: Ogni quanti item salvare automaticamente
+            auto_save_interval: Ogni quante righe di journal fare fsync
+            compact_interval: Righe di journal minime prima di riscrivere lo snapshot
+            fsync: Se False le righe arrivano al sistema operativo ma non
+                vengono forzate su disco (più veloce, meno durevole)
         """
         self.checkpoint_dir = Path(checkpoint_dir)
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
 
         self.run_id = run_id or self._generate_run_id()
         self.auto_save_interval = auto_save_interval
+        self.compact_interval = compact_interval
+        self.fsync = fsync
         self._items_since_save = 0
+        self._journal_records = 0
+        self._journal: Optional[IO[str]] = None
 
         # Carica stato esistente o crea nuovo
         self.state = self._load_or_create_state()
@@ -145,23 +186,61 @@ class CheckpointManager:
         return f"enrichment_{timestamp}"
 
     def _checkpoint_path(self) -> Path:
-        """Path del file checkpoint."""
+        """Path del file checkpoint (snapshot)."""
         return self.checkpoint_dir / f"{self.run_id}.json"
 
+    def _journal_path(self) -> Path:
+        """Path del journal append-only."""
+        return self.checkpoint_dir / f"{self.run_id}.journal.jsonl"
+
+    @staticmethod
+    def _read_journal(path: Path) -> Iterator[Dict[str, Any]]:
+        """Righe valide del journal (un'ultima riga troncata viene ignorata)."""
+        if not path.exists():
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Riga di journal non valida ignorata in {path.name}")
+
+    @classmethod
+    def _read_state(cls, snapshot: Path, journal: Path, run_id: str) -> Tuple[CheckpointState, int]:
+        """
+        Stato da snapshot + journal.
+
+        Returns:
+            (stato, righe di journal non ancora compattate)
+        """
+        if snapshot.exists():
+            with open(snapshot, "r", encoding="utf-8") as f:
+                state = CheckpointState.from_dict(json.load(f))
+        else:
+            state = CheckpointState(run_id=run_id)
+
+        pending = 0
+        for record in cls._read_journal(journal):
+            # Righe già incluse nello snapshot (compattazione interrotta)
+            if record.get("seq", 0) <= state.journal_seq:
+                continue
+            state.apply(record)
+            pending += 1
+        return state, pending
+
     def _load_or_create_state(self) -> CheckpointState:
-        """Carica stato esistente o crea nuovo."""
-        path = self._checkpoint_path()
-        if path.exists():
+        """Carica stato esistente (snapshot + journal) o crea nuovo."""
+        snapshot, journal = self._checkpoint_path(), self._journal_path()
+        if snapshot.exists() or journal.exists():
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                state = CheckpointState.from_dict(data)
+                state, self._journal_records = self._read_state(snapshot, journal, self.run_id)
                 logger.info(
                     f"Checkpoint caricato: {len(state.processed_ids)} items già processati"
                 )
                 return state
             except Exception as e:
                 logger.warning(f"Errore caricamento checkpoint: {e}. Creo nuovo.")
+                self._journal_records = 0
 
         return CheckpointState(run_id=self.run_id)
 
@@ -172,9 +251,8 @@ class CheckpointManager:
         Args:
             config_hash: Hash della config per validazione consistenza
         """
-        self.state.config_hash = config_hash
-        self.state.started_at = datetime.now().isoformat()
-        self._save()
+        self._append({"op": "start", "config_hash": config_hash})
+        self._sync()
         logger.info(f"Run iniziato: {self.run_id}")
 
     def is_processed(self, content_id: str) -> bool:
@@ -201,19 +279,18 @@ class CheckpointManager:
             content_id: ID del contenuto completato
             stats_update: Aggiornamento statistiche opzionale
         """
-        self.state.processed_ids.add(content_id)
-        self.state.last_updated = datetime.now().isoformat()
-
-        # Aggiorna statistiche
+        record: Dict[str, Any] = {"op": "done", "id": content_id}
         if stats_update:
-            for key, value in stats_update.items():
-                self.state.stats[key] = self.state.stats.get(key, 0) + value
+            record["stats"] = stats_update
+        self._append(record)
 
-        # Auto-save periodico
+        # fsync a blocchi
         self._items_since_save += 1
         if self._items_since_save >= self.auto_save_interval:
-            self._save()
-            self._items_since_save = 0
+            self._sync()
+
+        if self._journal_records >= max(self.compact_interval, len(self.state.processed_ids)):
+            self.compact()
 
     def mark_error(self, content_id: str) -> None:
         """
@@ -224,8 +301,7 @@ class CheckpointManager:
         Args:
             content_id: ID del contenuto con errore
         """
-        self.state.stats["errors"] = self.state.stats.get("errors", 0) + 1
-        self.state.last_updated = datetime.now().isoformat()
+        self._append({"op": "error", "id": content_id})
 
     def load(self) -> Set[str]:
         """
@@ -236,13 +312,88 @@ class CheckpointManager:
         """
         return self.state.processed_ids.copy()
 
-    def _save(self) -> None:
-        """Salva stato su disco."""
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Applica una riga allo stato e la aggiunge al journal."""
+        record["seq"] = self.state.journal_seq + 1
+        record["ts"] = datetime.now().isoformat()
+        self.state.apply(record)
+        try:
+            if self._journal is None:
+                self._journal = self._open_journal()
+            self._journal.write(json.dumps(record, ensure_ascii=False) + "\n")
+            # Al sistema operativo subito: sopravvive al crash del processo
+            self._journal.flush()
+            self._journal_records += 1
+        except Exception as e:
+            logger.error(f"Errore scrittura journal checkpoint: {e}")
+
+    def _open_journal(self) -> IO[str]:
+        """
+        Apre il journal in append.
+
+        Un'ultima riga troncata (crash durante la scrittura) viene rimossa:
+        altrimenti la riga successiva verrebbe scritta di seguito e andrebbe
+        persa con lei.
+        """
+        path = self._journal_path()
+        if path.exists():
+            with open(path, "rb+") as f:
+                end = f.seek(0, os.SEEK_END)
+                if end:
+                    f.seek(end - 1)
+                    if f.read(1) != b"\n":
+                        # Indietro a blocchi fino all'ultimo a capo
+                        cut = 0
+                        pos = end
+                        while pos > 0:
+                            start = max(0, pos - 4096)
+                            f.seek(start)
+                            newline = f.read(pos - start).rfind(b"\n")
+                            if newline >= 0:
+                                cut = start + newline + 1
+                                break
+                            pos = start
+                        f.truncate(cut)
+        return open(path, "a", encoding="utf-8")
+
+    def _sync(self) -> None:
+        """Forza su disco le righe di journal scritte."""
+        self._items_since_save = 0
+        if self._journal is None or not self.fsync:
+            return
+        try:
+            os.fsync(self._journal.fileno())
+        except Exception as e:
+            logger.error(f"Errore fsync journal checkpoint: {e}")
+
+    def _close_journal(self) -> None:
+        if self._journal is not None:
+            self._sync()
+            self._journal.close()
+            self._journal = None
+
+    def compact(self) -> None:
+        """
+        Riscrive lo snapshot con lo stato corrente e svuota il journal.
+
+        Lo snapshot è scritto su un file temporaneo e sostituito con
+        os.replace; se il processo si interrompe prima di svuotare il
+        journal, le righe già compattate vengono saltate al resume
+        (``journal_seq``).
+        """
         path = self._checkpoint_path()
+        tmp_path = path.with_suffix(".json.tmp")
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(self.state.to_dict(), f, indent=2, ensure_ascii=False)
-            logger.debug(f"Checkpoint salvato: {len(self.state.processed_ids)} items")
+            self._close_journal()
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.state.to_dict(), f, ensure_ascii=False)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+            self._journal_path().unlink(missing_ok=True)
+            self._journal_records = 0
+            logger.debug(f"Checkpoint compattato: {len(self.state.processed_ids)} items")
         except Exception as e:
             logger.error(f"Errore salvataggio checkpoint: {e}")
 
@@ -254,7 +405,7 @@ class CheckpointManager:
             Statistiche finali
         """
         self.state.last_updated = datetime.now().isoformat()
-        self._save()
+        self.compact()
 
         logger.info(
             f"Run completato: {len(self.state.processed_ids)} items processati"
@@ -273,10 +424,15 @@ class CheckpointManager:
 
         ATTENZIONE: Elimina tutto il progresso salvato.
         """
-        path = self._checkpoint_path()
-        if path.exists():
-            path.unlink()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        for path in (self._checkpoint_path(), self._journal_path()):
+            if path.exists():
+                path.unlink()
         self.state = CheckpointState(run_id=self.run_id)
+        self._items_since_save = 0
+        self._journal_records = 0
         logger.warning(f"Checkpoint resettato: {self.run_id}")
 
     @classmethod
@@ -296,15 +452,23 @@ class CheckpointManager:
         if not checkpoint_dir.exists():
             return checkpoints
 
-        for path in checkpoint_dir.glob("*.json"):
+        run_ids = {path.stem for path in checkpoint_dir.glob("*.json")}
+        run_ids |= {
+            path.name[: -len(".journal.jsonl")]
+            for path in checkpoint_dir.glob("*.journal.jsonl")
+        }
+        for run_id in run_ids:
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                state, _ = cls._read_state(
+                    checkpoint_dir / f"{run_id}.json",
+                    checkpoint_dir / f"{run_id}.journal.jsonl",
+                    run_id,
+                )
                 checkpoints.append({
-                    "run_id": data.get("run_id", path.stem),
-                    "processed_count": len(data.get("processed_ids", [])),
-                    "last_updated": data.get("last_updated", ""),
-                    "stats": data.get("stats", {}),
+                    "run_id": state.run_id,
+                    "processed_count": len(state.processed_ids),
+                    "last_updated": state.last_updated,
+                    "stats": state.stats,
                 })
             except Exception:
                 continue
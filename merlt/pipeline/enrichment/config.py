@@ -95,6 +95,8 @@ class EnrichmentConfig:
         checkpoint_dir: Directory per checkpoint/resume
         retry_count: Numero retry per errori transitori
         batch_size: Batch size per processing parallelo
+        content_workers: Contenuti in lavorazione contemporanea (1 = sequenziale)
+        combined_extraction: Se True, una chiamata LLM per contenuto per tutti i tipi
         similarity_threshold: Soglia per deduplicazione
         merge_strategy: Strategia merge duplicati
         log_extractions: Se loggare ogni estrazione
@@ -135,6 +137,8 @@ class EnrichmentConfig:
     retry_delay_seconds: float = 1.0
     batch_size: int = 10
     max_concurrent: int = 5  # Max richieste LLM parallele
+    content_workers: int = 1  # Contenuti estratti in parallelo (1 = sequenziale)
+    combined_extraction: bool = False  # Tutti i tipi in una sola chiamata LLM
 
     # Deduplicazione
     similarity_threshold: float = 0.85
@@ -153,6 +157,9 @@ class EnrichmentConfig:
 
     def __post_init__(self):
         """Validazione e setup post-init."""
+        if self.content_workers < 1:
+            raise ValueError(f"content_workers deve essere >= 1, ricevuto {self.content_workers}")
+
         # Crea directory checkpoint se non esiste
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
 
@@ -176,6 +183,7 @@ class EnrichmentConfig:
             } if self.scope else None,
             "llm_model": self.llm_model,
             "llm_temperature": self.llm_temperature,
+            "combined_extraction": self.combined_extraction,
             "retry_count": self.retry_count,
             "batch_size": self.batch_size,
             "similarity_threshold": self.similarity_threshold,
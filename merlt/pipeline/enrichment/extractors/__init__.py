@@ -9,6 +9,7 @@ Estrattori disponibili:
 - PrincipleExtractor: Estrae principi giuridici (affidamento, etc.)
 - DefinitionExtractor: Estrae definizioni legali esplicite
 - GenericExtractor: Estrattore generico per tutti i tipi di entità
+- CombinedExtractor: Tutti i tipi abilitati con una chiamata LLM per contenuto
 
 Factory:
 - create_extractor: Crea l'estrattore appropriato per un tipo di entità
@@ -30,6 +31,7 @@ from merlt.pipeline.enrichment.extractors.generic import (
     GenericExtractor,
     create_extractor,
 )
+from merlt.pipeline.enrichment.extractors.combined import CombinedExtractor
 
 __all__ = [
     "BaseEntityExtractor",
@@ -37,5 +39,6 @@ __all__ = [
     "PrincipleExtractor",
     "DefinitionExtractor",
     "GenericExtractor",
+    "CombinedExtractor",
     "create_extractor",
 ]
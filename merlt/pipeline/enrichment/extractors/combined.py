@@ -0,0 +1,256 @@
+"""
+Combined Entity Extractor
+=========================
+
+Estrattore che richiede tutti i tipi di entità abilitati con una sola
+chiamata LLM per contenuto.
+
+Gli estrattori per tipo inviano ciascuno il testo completo: con N tipi
+abilitati ogni contenuto costa N chiamate e N volte i token di input.
+CombinedExtractor chiede un unico JSON con una lista per tipo e riusa gli
+estrattori per tipo (create_extractor) per parsing e validazione di ogni
+lista, così le regole di config/extractors.yaml restano le stesse.
+
+Configurazione: config/extractors.yaml → combined
+
+Esempio:
+    >>> extractor = CombinedExtractor(llm_service, [EntityType.CONCETTO, EntityType.PRINCIPIO])
+    >>> by_type = await extractor.extract_by_type(content)
+    >>> print(len(by_type[EntityType.CONCETTO]))
+"""
+
+import json
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence
+
+from merlt.pipeline.enrichment.extractors.base import (
+    BaseEntityExtractor,
+    _load_extractors_config,
+)
+from merlt.pipeline.enrichment.extractors.generic import create_extractor
+from merlt.pipeline.enrichment.models import EntityType
+
+if TYPE_CHECKING:
+    from merlt.pipeline.enrichment.models import EnrichmentContent, ExtractedEntity
+    from merlt.rlcf.ai_service import OpenRouterService
+
+logger = logging.getLogger(__name__)
+
+# Schema di fallback per un elemento, se il tipo non ne definisce uno
+_DEFAULT_ITEM_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "nome": {"type": "string"},
+        "descrizione": {"type": "string"},
+    },
+    "required": ["nome"],
+}
+
+
+class CombinedExtractor:
+    """
+    Estrae più tipi di entità con una chiamata LLM per contenuto.
+
+    Espone la stessa interfaccia ``extract(content)`` degli estrattori per
+    tipo, quindi la pipeline può usarlo al loro posto.
+
+    Attributes:
+        llm: Servizio OpenRouter per chiamate LLM
+        entity_types: Tipi di entità richiesti
+        extractors: Estrattori per tipo, usati per parsing e validazione
+
+    Example:
+        >>> extractor = CombinedExtractor(llm, config.entity_types)
+        >>> entities = await extractor.extract(content)
+    """
+
+    def __init__(
+        self,
+        llm_service: "OpenRouterService",
+        entity_types: Sequence[EntityType],
+    ):
+        """
+        Inizializza l'estrattore combinato.
+
+        Args:
+            llm_service: Servizio OpenRouter per chiamate LLM
+            entity_types: Tipi di entità da estrarre (almeno uno)
+        """
+        if not entity_types:
+            raise ValueError("CombinedExtractor richiede almeno un tipo di entità")
+
+        self.llm = llm_service
+        self.entity_types = list(dict.fromkeys(entity_types))
+        self.extractors: Dict[EntityType, BaseEntityExtractor] = {
+            entity_type: create_extractor(llm_service, entity_type)
+            for entity_type in self.entity_types
+        }
+        self._config = _load_extractors_config()
+
+    @property
+    def extractor_config(self) -> Dict[str, Any]:
+        """Configurazione dell'estrattore combinato (da YAML)."""
+        return self._config.get("combined", {})
+
+    @property
+    def response_schema(self) -> Dict[str, Any]:
+        """Schema JSON con una lista per tipo, costruito dagli schemi per tipo."""
+        properties = {}
+        for entity_type, extractor in self.extractors.items():
+            entities_schema = extractor.response_schema.get("properties", {}).get("entities", {})
+            properties[entity_type.value] = {
+                "type": "array",
+                "items": entities_schema.get("items", _DEFAULT_ITEM_SCHEMA),
+            }
+        return {
+            "type": "object",
+            "properties": properties,
+            "required": [t.value for t in self.entity_types],
+        }
+
+    def _get_prompt_template(self) -> str:
+        """Carica template prompt da YAML config."""
+        return self.extractor_config.get("prompt", self._get_default_prompt())
+
+    def _get_default_prompt(self) -> str:
+        """Prompt di default se non presente in YAML."""
+        return """Analizza il testo ed estrai entità giuridiche dei tipi:
+{entity_types}
+
+TESTO:
+{text}
+
+Rispondi in JSON con formato: {response_keys}"""
+
+    def _describe_types(self) -> str:
+        """Elenco dei tipi con la descrizione presa dalla config di ciascuno."""
+        lines = []
+        for entity_type, extractor in self.extractors.items():
+            description = extractor.extractor_config.get("description", "")
+            description = description.removeprefix("Estrae ").strip()
+            lines.append(f"- {entity_type.value}: {description}" if description else f"- {entity_type.value}")
+        return "\n".join(lines)
+
+    def _build_prompt(self, content: "EnrichmentContent") -> str:
+        """
+        Costruisce il prompt combinato.
+
+        Args:
+            content: Contenuto da processare
+
+        Returns:
+            Prompt formattato
+        """
+        response_keys = json.dumps(
+            {t.value: ["..."] for t in self.entity_types}, ensure_ascii=False
+        )
+        return self._get_prompt_template().format(
+            text=content.text,
+            source=content.source,
+            content_type=content.content_type,
+            article_refs=", ".join(content.article_refs),
+            entity_types=self._describe_types(),
+            response_keys=response_keys,
+        )
+
+    def _get_llm_config(self) -> Dict[str, Any]:
+        """Configurazione LLM: quella condivisa, con max_tokens della sezione combined."""
+        llm_config = next(iter(self.extractors.values()))._get_llm_config()
+        llm_config["max_tokens"] = self.extractor_config.get(
+            "max_tokens", llm_config["max_tokens"] * 2
+        )
+        return llm_config
+
+    async def extract_by_type(
+        self,
+        content: "EnrichmentContent",
+    ) -> Dict[EntityType, List["ExtractedEntity"]]:
+        """
+        Estrae tutti i tipi con una chiamata LLM e separa i risultati per tipo.
+
+        Args:
+            content: Contenuto da processare
+
+        Returns:
+            Dict tipo -> entità validate (ogni tipo richiesto è presente)
+        """
+        by_type: Dict[EntityType, List["ExtractedEntity"]] = {t: [] for t in self.entity_types}
+
+        try:
+            llm_config = self._get_llm_config()
+            first = next(iter(self.extractors.values()))
+
+            response = await self.llm.generate_json_completion(
+                prompt=self._build_prompt(content),
+                json_schema=self.response_schema,
+                system_prompt=first._get_system_prompt(),
+                model=llm_config["model"],
+                temperature=llm_config["temperature"],
+                max_tokens=llm_config["max_tokens"],
+                timeout=llm_config["timeout"],
+            )
+
+        except Exception as e:
+            logger.error(f"Errore estrazione combinata {content.id}: {e}")
+            return by_type
+
+        return self._split_response(response, content)
+
+    def _split_response(
+        self,
+        response: Dict[str, Any],
+        content: "EnrichmentContent",
+    ) -> Dict[EntityType, List["ExtractedEntity"]]:
+        """
+        Valida la risposta e la separa per tipo.
+
+        Ogni lista passa dal ``_parse_response`` dell'estrattore del suo
+        tipo. Chiavi non richieste e valori che non sono liste vengono
+        ignorati.
+        """
+        by_type: Dict[EntityType, List["ExtractedEntity"]] = {t: [] for t in self.entity_types}
+        if not isinstance(response, dict):
+            logger.warning(f"Risposta combinata non valida per {content.id}: {type(response).__name__}")
+            return by_type
+
+        for key, raw_entities in response.items():
+            try:
+                entity_type = EntityType(key)
+            except ValueError:
+                logger.debug(f"Chiave ignorata nella risposta combinata: {key}")
+                continue
+            if entity_type not in self.extractors:
+                continue
+            # Gemini può restituire null invece di []
+            if raw_entities is None:
+                continue
+            if not isinstance(raw_entities, list):
+                logger.warning(f"Lista {key} non valida per {content.id}")
+                continue
+
+            raw_entities = [raw for raw in raw_entities if isinstance(raw, dict)]
+            by_type[entity_type] = self.extractors[entity_type]._parse_response(
+                {"entities": raw_entities}, content
+            )
+
+        logger.debug(
+            f"Estrazione combinata {content.id}: "
+            f"{ {t.value: len(e) for t, e in by_type.items()} }"
+        )
+        return by_type
+
+    async def extract(
+        self,
+        content: "EnrichmentContent",
+    ) -> List["ExtractedEntity"]:
+        """
+        Estrae le entità di tutti i tipi in un'unica lista.
+
+        Args:
+            content: Contenuto da processare
+
+        Returns:
+            Lista di entità estratte, nell'ordine dei tipi richiesti
+        """
+        by_type = await self.extract_by_type(content)
+        return [entity for entity_type in self.entity_types for entity in by_type[entity_type]]
@@ -6,6 +6,8 @@ Componenti per entity linking e deduplicazione.
 
 Componenti:
 - EntityLinker: Linking entità estratte al grafo esistente con dedup
+- EntityIndex: Indice in memoria (esatto + n-grammi) delle entità esistenti
+- MinHashLSH: Ricerca near-duplicate sub-quadratica (MinHash + LSH)
 - normalization: Utility per normalizzazione nomi
 
 Esempio:
@@ -15,14 +17,20 @@ Esempio:
     linked = await linker.link_batch(extracted_entities)
 """
 
+from merlt.pipeline.enrichment.linkers.entity_index import EntityIndex
 from merlt.pipeline.enrichment.linkers.entity_linker import EntityLinker
 from merlt.pipeline.enrichment.linkers.normalization import (
+    MinHashLSH,
+    find_near_duplicates,
     normalize_name,
     normalize_for_search,
 )
 
 __all__ = [
+    "EntityIndex",
     "EntityLinker",
+    "MinHashLSH",
+    "find_near_duplicates",
     "normalize_name",
     "normalize_for_search",
 ]
@@ -0,0 +1,246 @@
+"""
+Entity Index
+============
+
+Indice in memoria delle entità già presenti nel grafo, per il linking.
+
+Senza indice EntityLinker esegue una query al grafo per ogni entità
+estratta. L'indice carica una volta per run nome e nome normalizzato di
+tutti i nodi delle label di enrichment e li tiene in:
+- una hash map per tipo (nome_normalizzato -> entità) per i match esatti
+- un indice inverso di n-grammi di caratteri per i candidati fuzzy
+
+L'indice va aggiornato con le entità scritte durante il run (``add``),
+così il linking resta un'operazione in memoria.
+
+Esempio:
+    >>> index = EntityIndex()
+    >>> await index.load(graph_client)
+    >>> index.get(EntityType.CONCETTO, "buona_fede")
+    >>> index.candidates("buona fede ogettiva", EntityType.CONCETTO)
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from merlt.pipeline.enrichment.linkers.normalization import (
+    normalize_for_search,
+    normalize_name,
+)
+from merlt.pipeline.enrichment.models import EntityType
+
+if TYPE_CHECKING:
+    from merlt.storage.graph import FalkorDBClient
+
+logger = logging.getLogger(__name__)
+
+# Label dei nodi per tipo di entità (come in writers.yaml → cypher_create)
+ENTITY_LABELS: Dict[EntityType, str] = {
+    EntityType.CONCETTO: "ConcettoGiuridico",
+    EntityType.PRINCIPIO: "PrincipioGiuridico",
+    EntityType.DEFINIZIONE: "DefinizioneLegale",
+    EntityType.SOGGETTO: "SoggettoGiuridico",
+    EntityType.RUOLO: "Ruolo",
+    EntityType.MODALITA: "ModalitaGiuridica",
+    EntityType.FATTO: "FattoGiuridico",
+    EntityType.ATTO: "AttoGiuridicoEntita",
+    EntityType.PROCEDURA: "Procedura",
+    EntityType.TERMINE: "Termine",
+    EntityType.EFFETTO: "EffettoGiuridico",
+    EntityType.RESPONSABILITA: "Responsabilita",
+    EntityType.RIMEDIO: "Rimedio",
+    EntityType.SANZIONE: "Sanzione",
+    EntityType.CASO: "Caso",
+    EntityType.ECCEZIONE: "Eccezione",
+    EntityType.CLAUSOLA: "Clausola",
+}
+
+_LOAD_QUERY = """
+    MATCH (n:{label})
+    RETURN n.node_id as node_id, n.nome as nome,
+           n.nome_normalizzato as nome_normalizzato, n.fonti as fonti
+    ORDER BY n.node_id
+    SKIP $skip LIMIT $limit
+"""
+
+_Key = Tuple[EntityType, str]
+
+
+@dataclass
+class IndexedEntity:
+    """Entità esistente nel grafo, come la vede il linker."""
+    node_id: str
+    nome: str
+    nome_normalizzato: str
+    tipo: EntityType
+    fonti: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Stesso formato delle query find_* di linkers.yaml."""
+        return {
+            "node_id": self.node_id,
+            "nome": self.nome,
+            "fonti": list(self.fonti),
+        }
+
+
+class EntityIndex:
+    """
+    Indice esatto + n-grammi delle entità esistenti, per tipo.
+
+    Attributes:
+        ngram_size: Lunghezza degli n-grammi di caratteri
+        loaded: True dopo ``load`` (anche se il grafo è vuoto)
+
+    Example:
+        >>> index = EntityIndex(ngram_size=3)
+        >>> index.add(EntityType.CONCETTO, "concetto:buona_fede", "Buona fede")
+        >>> index.get(EntityType.CONCETTO, "buona_fede").node_id
+        'concetto:buona_fede'
+    """
+
+    def __init__(self, ngram_size: int = 3):
+        self.ngram_size = ngram_size
+        self.loaded = False
+        self._entities: Dict[_Key, IndexedEntity] = {}
+        self._grams: Dict[_Key, Set[str]] = {}
+        self._postings: Dict[str, Set[_Key]] = defaultdict(set)
+
+    def _ngrams(self, name: str) -> Set[str]:
+        text = f" {normalize_for_search(name)} "
+        n = self.ngram_size
+        if len(text) <= n:
+            return {text}
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+    async def load(
+        self,
+        graph: "FalkorDBClient",
+        entity_types: Optional[Iterable[EntityType]] = None,
+        page_size: int = 10_000,
+    ) -> int:
+        """
+        Carica dal grafo le entità dei tipi richiesti.
+
+        Args:
+            graph: Client FalkorDB
+            entity_types: Tipi da caricare (default: tutti quelli con label)
+            page_size: Nodi per query
+
+        Returns:
+            Numero di entità caricate
+        """
+        types = list(entity_types) if entity_types is not None else list(ENTITY_LABELS)
+        loaded = 0
+
+        for entity_type in types:
+            label = ENTITY_LABELS.get(entity_type)
+            if label is None:
+                continue
+            query = _LOAD_QUERY.format(label=label)
+            skip = 0
+            while True:
+                rows = await graph.query(query, {"skip": skip, "limit": page_size})
+                for row in rows or []:
+                    row = dict(row)
+                    if not row.get("node_id") or not row.get("nome"):
+                        continue
+                    self.add(
+                        entity_type,
+                        row["node_id"],
+                        row["nome"],
+                        fonti=row.get("fonti") or [],
+                        nome_normalizzato=row.get("nome_normalizzato"),
+                    )
+                    loaded += 1
+                if not rows or len(rows) < page_size:
+                    break
+                skip += page_size
+
+        self.loaded = True
+        logger.info(f"EntityIndex: caricate {loaded} entità per {len(types)} tipi")
+        return loaded
+
+    def add(
+        self,
+        entity_type: EntityType,
+        node_id: str,
+        nome: str,
+        fonti: Optional[List[str]] = None,
+        nome_normalizzato: Optional[str] = None,
+    ) -> IndexedEntity:
+        """
+        Aggiunge o aggiorna un'entità (es. appena scritta nel grafo).
+
+        Se l'entità è già presente le fonti vengono unite.
+        """
+        normalized = nome_normalizzato or normalize_name(nome)
+        key = (entity_type, normalized)
+
+        existing = self._entities.get(key)
+        if existing is not None:
+            for fonte in fonti or []:
+                if fonte not in existing.fonti:
+                    existing.fonti.append(fonte)
+            return existing
+
+        indexed = IndexedEntity(
+            node_id=node_id,
+            nome=nome,
+            nome_normalizzato=normalized,
+            tipo=entity_type,
+            fonti=list(fonti or []),
+        )
+        self._entities[key] = indexed
+        grams = self._ngrams(nome)
+        self._grams[key] = grams
+        for gram in grams:
+            self._postings[gram].add(key)
+        return indexed
+
+    def get(self, entity_type: EntityType, nome_normalizzato: str) -> Optional[IndexedEntity]:
+        """Match esatto per tipo e nome normalizzato."""
+        return self._entities.get((entity_type, nome_normalizzato))
+
+    def candidates(
+        self,
+        name: str,
+        entity_type: Optional[EntityType] = None,
+        limit: int = 10,
+        min_similarity: float = 0.0,
+    ) -> List[Tuple[IndexedEntity, float]]:
+        """
+        Candidati fuzzy per similarità Jaccard sugli n-grammi di caratteri.
+
+        Args:
+            name: Nome da cercare
+            entity_type: Limita a un tipo (None = tutti)
+            limit: Max risultati
+            min_similarity: Soglia minima (0.0-1.0)
+
+        Returns:
+            Lista (entità, similarità) in ordine decrescente di similarità
+        """
+        grams = self._ngrams(name)
+        shared: Dict[_Key, int] = defaultdict(int)
+        for gram in grams:
+            for key in self._postings.get(gram, ()):
+                if entity_type is None or key[0] == entity_type:
+                    shared[key] += 1
+
+        scored = []
+        for key, count in shared.items():
+            similarity = count / (len(grams) + len(self._grams[key]) - count)
+            if similarity >= min_similarity:
+                scored.append((self._entities[key], similarity))
+
+        scored.sort(key=lambda item: (-item[1], item[0].node_id))
+        return scored[:limit]
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __repr__(self) -> str:
+        return f"EntityIndex(entities={len(self)}, ngrams={len(self._postings)}, loaded={self.loaded})"
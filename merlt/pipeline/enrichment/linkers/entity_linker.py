@@ -10,10 +10,14 @@ Responsabilità:
 - Merge intelligente di entità duplicate
 - Normalizzazione nomi per chiavi univoche
 
+Con l'indice caricato (``load_index``) il lookup delle entità esistenti
+avviene in memoria (EntityIndex) invece che con una query per entità.
+
 Configurazione: config/linkers.yaml
 
 Esempio:
     linker = EntityLinker(graph_client)
+    await linker.load_index()
     linked = await linker.link_batch(extracted_entities)
 """
 
@@ -23,10 +27,16 @@ from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 import yaml
 
+from merlt.pipeline.enrichment.linkers.entity_index import (
+    ENTITY_LABELS,
+    EntityIndex,
+    IndexedEntity,
+)
 from merlt.pipeline.enrichment.linkers.normalization import (
     normalize_name,
     compute_similarity,
     are_variants,
+    extract_root_concept,
 )
 from merlt.pipeline.enrichment.models import (
     ExtractedEntity,
@@ -69,6 +79,7 @@ class EntityLinker:
     Attributes:
         graph: Client FalkorDB
         config: Configurazione da YAML
+        index: Indice in memoria delle entità esistenti (None se disabilitato)
         _cache: Cache lookup risultati
 
     Example:
@@ -83,6 +94,7 @@ class EntityLinker:
         graph_client: "FalkorDBClient",
         similarity_threshold: Optional[float] = None,
         merge_strategy: Optional[str] = None,
+        index: Optional[EntityIndex] = None,
     ):
         """
         Inizializza l'entity linker.
@@ -91,6 +103,7 @@ class EntityLinker:
             graph_client: Client FalkorDB per lookup
             similarity_threshold: Override soglia similarità
             merge_strategy: Override strategia merge
+            index: Indice entità da usare (default: da config)
         """
         self.graph = graph_client
         self._config = _load_linker_config()
@@ -110,6 +123,52 @@ class EntityLinker:
             "manuale", "brocardi", "giurisprudenza", "altro"
         ])
 
+        # Indice in memoria (popolato da load_index)
+        index_config = linker_config.get("index", {})
+        if index is None and index_config.get("enabled", True):
+            index = EntityIndex(ngram_size=index_config.get("ngram_size", 3))
+        self.index = index
+        self.fuzzy_linking = index_config.get("fuzzy_linking", False)
+
+    @property
+    def index_ready(self) -> bool:
+        """True se il lookup può avvenire sull'indice in memoria."""
+        return self.index is not None and self.index.loaded
+
+    async def load_index(
+        self,
+        entity_types: Optional[List[EntityType]] = None,
+    ) -> int:
+        """
+        Carica l'indice delle entità esistenti (una volta per run).
+
+        Args:
+            entity_types: Tipi da caricare (default: tutti)
+
+        Returns:
+            Numero di entità caricate (0 se l'indice è disabilitato)
+        """
+        if self.index is None:
+            return 0
+        return await self.index.load(self.graph, entity_types)
+
+    def register(self, written: List[LinkedEntity]) -> None:
+        """
+        Aggiorna l'indice con entità appena scritte nel grafo.
+
+        Le occorrenze successive della stessa entità vengono linkate come
+        esistenti senza interrogare il grafo.
+        """
+        if not self.index_ready:
+            return
+        for le in written:
+            self.index.add(
+                le.entity.tipo,
+                le.node_id,
+                le.entity.nome,
+                fonti=[le.entity.fonte] if le.entity.fonte else [],
+            )
+
     async def link_batch(
         self,
         entities: List[ExtractedEntity]
@@ -165,7 +224,8 @@ class EntityLinker:
             if cached:
                 return LinkedEntity(
                     entity=entity,
-                    node_id=node_id,
+                    # Il match fuzzy è in cache sotto l'id del nome estratto
+                    node_id=cached.get("node_id", node_id),
                     is_new=False,
                     merged_from=[entity.fonte, cached.get("fonte", "unknown")],
                     final_descrizione=self._merge_descriptions(
@@ -175,8 +235,14 @@ class EntityLinker:
                     ),
                 )
 
-        # Query grafo
-        existing = await self._query_existing(entity.tipo, normalized)
+        # Lookup: indice in memoria se caricato, altrimenti query grafo
+        if self.index_ready:
+            indexed = self.index.get(entity.tipo, normalized)
+            if indexed is None and self.fuzzy_linking:
+                indexed = self._fuzzy_match(entity)
+            existing = indexed.to_dict() if indexed else None
+        else:
+            existing = await self._query_existing(entity.tipo, normalized)
 
         if existing:
             self._cache[node_id] = existing
@@ -202,6 +268,26 @@ class EntityLinker:
             final_descrizione=entity.descrizione,
         )
 
+    def _fuzzy_match(self, entity: ExtractedEntity) -> Optional[IndexedEntity]:
+        """
+        Miglior candidato fuzzy dello stesso tipo sopra la soglia.
+
+        Nomi che differiscono solo per un qualificatore (es. "buona fede
+        oggettiva" / "buona fede soggettiva") sono varianti distinte e non
+        vengono uniti.
+        """
+        root = extract_root_concept(entity.nome)
+        for candidate, _ in self.index.candidates(
+            entity.nome,
+            entity_type=entity.tipo,
+            limit=5,
+            min_similarity=self.similarity_threshold,
+        ):
+            if extract_root_concept(candidate.nome) == root:
+                continue
+            return candidate
+        return None
+
     async def _query_existing(
         self,
         entity_type: EntityType,
@@ -304,6 +390,9 @@ class EntityLinker:
         """
         Trova entità simili per nome (fuzzy).
 
+        Con l'indice caricato usa la similarità sugli n-grammi di caratteri
+        (campo ``similarity``), altrimenti una query CONTAINS sul prefisso.
+
         Args:
             name: Nome da cercare
             limit: Max risultati
@@ -311,6 +400,16 @@ class EntityLinker:
         Returns:
             Lista di entità simili trovate
         """
+        if self.index_ready:
+            return [
+                {
+                    **candidate.to_dict(),
+                    "labels": [ENTITY_LABELS[candidate.tipo]],
+                    "similarity": similarity,
+                }
+                for candidate, similarity in self.index.candidates(name, limit=limit)
+            ]
+
         queries = self._config.get("cypher_queries", {})
         query = queries.get("find_similar")
 
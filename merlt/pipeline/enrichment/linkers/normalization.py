@@ -9,6 +9,10 @@ La normalizzazione è fondamentale per:
 - Creare chiavi univoche per il grafo
 - Permettere merge di entità da fonti diverse
 
+Per insiemi grandi (decine di migliaia di nomi) il confronto a coppie con
+compute_similarity è O(n²): MinHashLSH trova i candidati near-duplicate in
+tempo sub-lineare e li verifica con compute_similarity.
+
 Esempio:
     >>> normalize_name("Buona Fede Oggettiva")
     'buona_fede_oggettiva'
@@ -18,7 +22,11 @@ Esempio:
 
 import re
 import unicodedata
-from typing import Optional
+import zlib
+from collections import defaultdict
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
 
 
 def normalize_name(name: str) -> str:
@@ -194,3 +202,322 @@ def are_variants(name1: str, name2: str, threshold: float = 0.5) -> bool:
 
     # Similarità token
     return compute_similarity(name1, name2) >= threshold
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# MinHash / LSH per near-duplicate su grandi insiemi di nomi
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Primo di Mersenne per l'hashing universale (a * h + b) mod p
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+def name_tokens(name: str) -> Set[str]:
+    """Token di un nome, come in compute_similarity."""
+    return set(normalize_for_search(name).split())
+
+
+def _permutations(num_perm: int, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Coefficienti (a, b) delle permutazioni in [1, p).
+
+    a * h + b può superare 2^64: l'overflow uint64 (modulo 2^64) è voluto e
+    mescola i bit come in datasketch.
+    """
+    rng = np.random.RandomState(seed)
+    a = rng.randint(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+    b = rng.randint(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+    return a, b
+
+
+def _token_hashes(tokens: Iterable[str]) -> np.ndarray:
+    return np.array(
+        [zlib.crc32(token.encode("utf-8")) for token in tokens],
+        dtype=np.uint64,
+    )
+
+
+def _jaccard(tokens1: Set[str], tokens2: Set[str]) -> float:
+    if not tokens1 or not tokens2:
+        return 0.0
+    intersection = len(tokens1 & tokens2)
+    return intersection / (len(tokens1) + len(tokens2) - intersection)
+
+
+def minhash_signature(
+    name: str,
+    num_perm: int = 128,
+    seed: int = 1,
+) -> np.ndarray:
+    """
+    Firma MinHash dei token di un nome.
+
+    La frazione di posizioni uguali tra due firme stima la similarità
+    Jaccard sui token (la stessa di compute_similarity).
+
+    Args:
+        name: Nome da firmare
+        num_perm: Numero di permutazioni (lunghezza della firma)
+        seed: Seed delle permutazioni (firme confrontabili solo a parità di seed)
+
+    Returns:
+        Array uint64 di lunghezza num_perm (tutto _MAX_HASH se il nome è vuoto)
+
+    Example:
+        >>> a = minhash_signature("buona fede oggettiva")
+        >>> b = minhash_signature("buona fede")
+        >>> float((a == b).mean())  # ~0.67
+    """
+    a, b = _permutations(num_perm, seed)
+    hashes = _token_hashes(name_tokens(name))
+    if hashes.size == 0:
+        return np.full(num_perm, _MAX_HASH, dtype=np.uint64)
+    return ((np.outer(hashes, a) + b) % _MERSENNE_PRIME).min(axis=0) & _MAX_HASH
+
+
+def _collision_probability(similarity: float, bands: int, rows: int) -> float:
+    """Probabilità che due nomi con questa similarità collidano in almeno una banda."""
+    return 1 - (1 - similarity ** rows) ** bands
+
+
+def optimal_bands(
+    threshold: float,
+    num_perm: int,
+    recall: float = 0.95,
+) -> Tuple[int, int]:
+    """
+    Sceglie (bands, rows) con bands * rows <= num_perm.
+
+    Tra le combinazioni che a similarità ``threshold`` diventano candidate
+    con probabilità >= ``recall``, sceglie quella con meno candidati sotto
+    soglia (area della curva di collisione in [0, threshold]): i falsi
+    positivi costano solo una verifica, i falsi negativi sono duplicati persi.
+
+    Args:
+        threshold: Similarità Jaccard target
+        num_perm: Permutazioni disponibili
+        recall: Probabilità minima di trovare una coppia a similarità threshold
+
+    Returns:
+        (bands, rows)
+    """
+    xs = np.linspace(0.0, threshold, 50)
+    best, best_area = None, float("inf")
+    fallback, fallback_p = (num_perm, 1), -1.0
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        p = _collision_probability(threshold, bands, rows)
+        if p < recall:
+            if p > fallback_p:
+                fallback, fallback_p = (bands, rows), p
+            continue
+        area = float(_collision_probability(xs, bands, rows).mean()) * threshold
+        if area < best_area:
+            best, best_area = (bands, rows), area
+    return best or fallback
+
+
+class MinHashLSH:
+    """
+    Indice LSH su firme MinHash per trovare near-duplicate in tempo sub-lineare.
+
+    Ogni nome è diviso in ``bands`` bande di ``rows`` valori della firma:
+    due nomi sono candidati se coincidono in almeno una banda. I candidati
+    vengono poi verificati con la similarità esatta contro
+    ``verify_threshold``, quindi i falsi positivi LSH non arrivano al
+    chiamante. La verifica di default è la Jaccard sui token di
+    compute_similarity, calcolata sui token già normalizzati in indice.
+
+    Args:
+        threshold: Similarità Jaccard target per la scelta delle bande
+        num_perm: Lunghezza della firma MinHash
+        bands: Numero di bande (None = scelto con optimal_bands)
+        rows: Righe per banda (richiesto se bands è indicato)
+        verify_threshold: Soglia della verifica (default: threshold)
+        verify: Similarità (nome1, nome2) alternativa per la verifica
+        seed: Seed delle permutazioni
+
+    Example:
+        >>> lsh = MinHashLSH(threshold=0.5)
+        >>> lsh.add_many({"c1": "buona fede oggettiva", "c2": "inadempimento"})
+        >>> lsh.query("buona fede")
+        [('c1', 0.666...)]
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        num_perm: int = 128,
+        bands: Optional[int] = None,
+        rows: Optional[int] = None,
+        verify_threshold: Optional[float] = None,
+        verify: Optional[Callable[[str, str], float]] = None,
+        seed: int = 1,
+    ):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"threshold deve essere in (0, 1], ricevuto {threshold}")
+        if bands is None:
+            bands, rows = optimal_bands(threshold, num_perm)
+        elif rows is None or bands * rows > num_perm:
+            raise ValueError("bands * rows deve essere <= num_perm")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = rows
+        self.verify_threshold = threshold if verify_threshold is None else verify_threshold
+        self.verify = verify
+        self.seed = seed
+
+        self._a, self._b = _permutations(num_perm, seed)
+        self._names: Dict[Hashable, str] = {}
+        self._tokens: Dict[Hashable, Set[str]] = {}
+        self._band_index: Dict[Hashable, List[bytes]] = {}
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [defaultdict(list) for _ in range(bands)]
+
+    def _signatures(self, token_sets: List[Set[str]]) -> np.ndarray:
+        """Firme di più insiemi di token (non vuoti) in un'unica operazione vettoriale."""
+        hash_lists = [_token_hashes(tokens) for tokens in token_sets]
+        hashes = np.concatenate(hash_lists)
+        offsets = np.cumsum([0] + [h.size for h in hash_lists[:-1]])
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME
+        return np.minimum.reduceat(permuted, offsets, axis=0) & _MAX_HASH
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        r = self.rows
+        return [signature[i * r:(i + 1) * r].tobytes() for i in range(self.bands)]
+
+    def _similarity(self, name: str, tokens: Set[str], key: Hashable) -> float:
+        if self.verify is not None:
+            return self.verify(name, self._names[key])
+        return _jaccard(tokens, self._tokens[key])
+
+    def add(self, key: Hashable, name: str) -> None:
+        """Aggiunge un nome all'indice."""
+        self.add_many({key: name})
+
+    def add_many(self, names: Dict[Hashable, str], batch_size: int = 10_000) -> None:
+        """
+        Aggiunge molti nomi (firme calcolate a blocchi).
+
+        I nomi senza token non vengono indicizzati: non hanno near-duplicate.
+
+        Raises:
+            ValueError: Se una chiave è già presente
+        """
+        items = []
+        for key, name in names.items():
+            if key in self._names:
+                raise ValueError(f"Chiave già presente nell'indice: {key!r}")
+            tokens = name_tokens(name)
+            if tokens:
+                items.append((key, name, tokens))
+
+        for start in range(0, len(items), batch_size):
+            batch = items[start:start + batch_size]
+            signatures = self._signatures([tokens for _, _, tokens in batch])
+            for (key, name, tokens), signature in zip(batch, signatures):
+                band_keys = self._band_keys(signature)
+                self._names[key] = name
+                self._tokens[key] = tokens
+                self._band_index[key] = band_keys
+                for band, band_key in zip(self._buckets, band_keys):
+                    band[band_key].append(key)
+
+    def _candidates(self, tokens: Set[str]) -> Set[Hashable]:
+        signature = self._signatures([tokens])[0]
+        found: Set[Hashable] = set()
+        for band, band_key in zip(self._buckets, self._band_keys(signature)):
+            found.update(band.get(band_key, ()))
+        return found
+
+    def candidates(self, name: str) -> Set[Hashable]:
+        """Chiavi che condividono almeno una banda con il nome (non verificate)."""
+        tokens = name_tokens(name)
+        return self._candidates(tokens) if tokens else set()
+
+    def query(self, name: str) -> List[Tuple[Hashable, float]]:
+        """
+        Near-duplicate verificati di un nome.
+
+        Returns:
+            Lista (chiave, similarità) con similarità >= verify_threshold,
+            in ordine decrescente di similarità
+        """
+        tokens = name_tokens(name)
+        if not tokens:
+            return []
+        matches = []
+        for key in self._candidates(tokens):
+            similarity = self._similarity(name, tokens, key)
+            if similarity >= self.verify_threshold:
+                matches.append((key, similarity))
+        matches.sort(key=lambda item: (-item[1], str(item[0])))
+        return matches
+
+    def duplicate_pairs(self) -> List[Tuple[Hashable, Hashable, float]]:
+        """
+        Tutte le coppie di near-duplicate verificate nell'indice.
+
+        Per ogni nome si uniscono i bucket delle sue bande e si verificano
+        solo i candidati inseriti dopo di lui: ogni coppia compare una sola
+        volta, senza tenere in memoria l'insieme di tutte le coppie candidate.
+        Le chiavi di una coppia sono nell'ordine di inserimento.
+
+        Returns:
+            Lista (chiave1, chiave2, similarità)
+        """
+        order = {key: i for i, key in enumerate(self._names)}
+        pairs = []
+        for key, band_keys in self._band_index.items():
+            position = order[key]
+            candidates: Set[Hashable] = set()
+            for band, band_key in zip(self._buckets, band_keys):
+                bucket = band[band_key]
+                if len(bucket) > 1:
+                    candidates.update(bucket)
+            for other in candidates:
+                if order[other] <= position:
+                    continue
+                similarity = self._similarity(self._names[key], self._tokens[key], other)
+                if similarity >= self.verify_threshold:
+                    pairs.append((key, other, similarity))
+        return pairs
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._names
+
+    def __repr__(self) -> str:
+        return (
+            f"MinHashLSH(names={len(self)}, threshold={self.threshold}, "
+            f"bands={self.bands}, rows={self.rows})"
+        )
+
+
+def find_near_duplicates(
+    names: List[str],
+    threshold: float = 0.5,
+    num_perm: int = 128,
+) -> List[Tuple[int, int, float]]:
+    """
+    Coppie di near-duplicate in una lista di nomi, senza confronto a coppie.
+
+    Args:
+        names: Nomi da confrontare
+        threshold: Similarità minima (verificata con compute_similarity)
+        num_perm: Lunghezza della firma MinHash
+
+    Returns:
+        Lista (indice1, indice2, similarità) con indice1 < indice2
+
+    Example:
+        >>> find_near_duplicates(["buona fede", "buona fede oggettiva", "dolo"])
+        [(0, 1, 0.666...)]
+    """
+    lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+    lsh.add_many(dict(enumerate(names)))
+    return sorted(lsh.duplicate_pairs())
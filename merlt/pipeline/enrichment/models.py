@@ -476,6 +476,9 @@ class EnrichmentResult:
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
+    # Secondi cumulati per fase (embed, extract, link, write, bridge, checkpoint)
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+
     # Dettagli (per debug)
     entities_created: List[str] = field(default_factory=list)
 
@@ -513,6 +516,15 @@ class EnrichmentResult:
         elif phase == "writing":
             self.stats.write_errors += 1
 
+    def add_stage_time(self, stage: str, seconds: float) -> None:
+        """
+        Accumula il tempo speso in una fase.
+
+        Con più worker i tempi delle fasi parallele (embed, extract) si
+        sommano tra contenuti e possono superare la durata totale.
+        """
+        self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
     def summary(self) -> str:
         """Restituisce un riepilogo testuale con tutte le 17 tipologie."""
         s = self.stats
@@ -570,5 +582,12 @@ class EnrichmentResult:
         if self.duration_seconds:
             lines.append(f"\nDurata: {self.duration_seconds:.1f}s")
 
+        if self.stage_seconds:
+            lines.append("Tempi per fase:")
+            lines.extend(
+                f"  {stage:<11} {seconds:>8.1f}s"
+                for stage, seconds in self.stage_seconds.items()
+            )
+
         lines.append("═" * 60)
         return "\n".join(lines)
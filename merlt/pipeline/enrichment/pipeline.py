@@ -10,6 +10,12 @@ Coordina:
 - Linking e deduplicazione (Linkers)
 - Scrittura nel grafo (Writers)
 
+Con ``config.content_workers > 1`` embedding ed estrazione LLM di più
+contenuti procedono in parallelo, mentre linking, scrittura e checkpoint
+restano sequenziali e nell'ordine della fonte: il linker vede le entità
+nello stesso ordine dell'esecuzione sequenziale e il checkpoint non marca
+mai un contenuto prima di quelli che lo precedono.
+
 Esempio:
     from merlt.pipeline.enrichment import EnrichmentPipeline, EnrichmentConfig
 
@@ -26,9 +32,12 @@ Esempio:
 import asyncio
 import hashlib
 import logging
-from collections import defaultdict
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional
 
 from merlt.pipeline.enrichment.checkpoint import CheckpointManager
 from merlt.pipeline.enrichment.config import EnrichmentConfig
@@ -49,6 +58,25 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _PreparedContent:
+    """Esito della parte parallela (embed + estrazione) di un contenuto."""
+    content: EnrichmentContent
+    chunk_id: Optional[str] = None
+    entities: List[ExtractedEntity] = field(default_factory=list)
+    error: Optional[Exception] = None
+
+
+@contextmanager
+def _timed(result: EnrichmentResult, stage: str):
+    """Accumula in result.stage_seconds il tempo del blocco."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        result.add_stage_time(stage, time.perf_counter() - start)
+
+
 class EnrichmentPipeline:
     """
     Pipeline di enrichment per estrarre entità strutturate.
@@ -125,6 +153,19 @@ class EnrichmentPipeline:
 
     async def _init_components(self) -> None:
         """Inizializza componenti lazy."""
+        if self._extractors is None and self.config.combined_extraction:
+            from merlt.pipeline.enrichment.extractors import CombinedExtractor
+
+            # Un solo extractor: tutti i tipi con una chiamata per contenuto
+            self._extractors = {
+                "combined": CombinedExtractor(self.llm, self.config.entity_types)
+            }
+
+            logger.info(
+                f"Estrazione combinata: "
+                f"{[t.value for t in self.config.entity_types]} in una chiamata per contenuto"
+            )
+
         if self._extractors is None:
             from merlt.pipeline.enrichment.extractors import create_extractor
 
@@ -148,6 +189,13 @@ class EnrichmentPipeline:
                 merge_strategy=self.config.merge_strategy,
             )
 
+            # Indice entità esistenti: linking in memoria invece di una query per entità
+            if self.graph is not None:
+                try:
+                    await self._linker.load_index(self.config.entity_types)
+                except Exception as e:
+                    logger.warning(f"Indice entità non caricato, lookup su grafo: {e}")
+
         if self._writer is None:
             from merlt.pipeline.enrichment.writers import EnrichmentGraphWriter
 
@@ -191,7 +239,7 @@ class EnrichmentPipeline:
         total_phases = len(sources_by_phase)
         logger.info(
             f"Avvio enrichment: {len(self.config.sources)} fonti in {total_phases} fasi, "
-            f"{len(processed)} già processati"
+            f"{len(processed)} già processati, {self.config.content_workers} worker"
         )
 
         # Esegui fase per fase (ordine crescente)
@@ -207,14 +255,7 @@ class EnrichmentPipeline:
                 logger.info(f"Processing fonte: {source.source_name}")
 
                 try:
-                    async for content in source.fetch(self.config.scope):
-                        # Skip se già processato
-                        if content.id in processed:
-                            continue
-
-                        # Processa content
-                        await self._process_content(content, result)
-                        result.contents_processed += 1
+                    await self._process_source(source, processed, result)
 
                 except Exception as e:
                     logger.error(f"Errore fonte {source.source_name}: {e}")
@@ -233,53 +274,117 @@ class EnrichmentPipeline:
         logger.info(result.summary())
         return result
 
-    async def _process_content(
+    async def _process_source(
         self,
-        content: EnrichmentContent,
+        source,
+        processed: set,
         result: EnrichmentResult,
     ) -> None:
         """
-        Processa un singolo contenuto.
+        Processa tutti i contenuti di una fonte.
 
-        Flow:
-        1. Embed chunk → Qdrant (se configurato)
-        2. Estrai entità → FalkorDB
-        3. Link e dedup
-        4. Scrivi nel grafo
-        5. Crea bridge entries → chunk_id ↔ entity_node_id
+        Fino a ``config.content_workers`` contenuti sono in fase di
+        embed/estrazione contemporaneamente; il commit (link, scrittura,
+        bridge, checkpoint) avviene un contenuto alla volta nell'ordine di
+        fetch. Se il fetch fallisce, i contenuti già avviati vengono
+        comunque completati prima di propagare l'errore.
 
         Args:
-            content: Contenuto da processare
+            source: Fonte da processare
+            processed: ID già processati (checkpoint)
             result: Risultato da aggiornare
         """
+        workers = self.config.content_workers
+        pending: Deque[asyncio.Task] = deque()
+        fetch_error: Optional[Exception] = None
+
         try:
-            chunk_id = None
+            async for content in source.fetch(self.config.scope):
+                # Skip se già processato
+                if content.id in processed:
+                    continue
+
+                pending.append(asyncio.create_task(self._prepare_content(content, result)))
+                if len(pending) >= workers:
+                    await self._commit_content(await pending.popleft(), result)
+
+        except Exception as e:
+            fetch_error = e
+        except BaseException:
+            for task in pending:
+                task.cancel()
+            raise
+
+        while pending:
+            await self._commit_content(await pending.popleft(), result)
 
+        if fetch_error is not None:
+            raise fetch_error
+
+    async def _prepare_content(
+        self,
+        content: EnrichmentContent,
+        result: EnrichmentResult,
+    ) -> _PreparedContent:
+        """
+        Parte parallelizzabile: embed del chunk ed estrazione entità.
+
+        Non tocca grafo né checkpoint; gli errori vengono restituiti
+        nell'esito e registrati al commit.
+        """
+        prepared = _PreparedContent(content=content)
+        try:
             # 1. Embed chunk in Qdrant (se configurato)
             if self.qdrant and self.embeddings and not self.config.dry_run:
-                chunk_id = await self._embed_chunk(content)
+                with _timed(result, "embed"):
+                    prepared.chunk_id = await self._embed_chunk(content)
                 if self.config.verbose:
-                    logger.debug(f"Chunk {content.id} embedded: {chunk_id}")
+                    logger.debug(f"Chunk {content.id} embedded: {prepared.chunk_id}")
 
             # 2. Estrai entità
-            entities = await self._extract_entities(content)
+            with _timed(result, "extract"):
+                prepared.entities = await self._extract_entities(content)
 
             if self.config.verbose:
                 logger.debug(
-                    f"Estratte {len(entities)} entità da {content.id}"
+                    f"Estratte {len(prepared.entities)} entità da {content.id}"
                 )
 
+        except Exception as e:
+            prepared.error = e
+
+        return prepared
+
+    async def _commit_content(
+        self,
+        prepared: _PreparedContent,
+        result: EnrichmentResult,
+    ) -> None:
+        """
+        Parte sequenziale: link, scrittura, bridge e checkpoint.
+
+        Viene chiamata nell'ordine di fetch, un contenuto alla volta.
+        """
+        content = prepared.content
+        try:
+            if prepared.error is not None:
+                raise prepared.error
+
             # 3. Link e dedup
-            linked = await self._linker.link_batch(entities)
+            with _timed(result, "link"):
+                linked = await self._linker.link_batch(prepared.entities)
 
             # 4. Scrivi nel grafo (se non dry_run)
             if not self.config.dry_run:
-                written = await self._writer.write_batch(linked, content)
+                with _timed(result, "write"):
+                    written = await self._writer.write_batch(linked, content)
+                self._linker.register(written)
                 self._update_stats(result, written)
 
                 # 5. Crea bridge entries (se configurato)
-                if chunk_id and self.bridge_builder:
-                    await self._create_bridge_entries(chunk_id, written, content)
+                if prepared.chunk_id and self.bridge_builder:
+                    with _timed(result, "bridge"):
+                        await self._create_bridge_entries(prepared.chunk_id, written, content)
                     if self.config.verbose:
                         logger.debug(
                             f"Bridge entries create per {len(written)} entità"
@@ -290,16 +395,19 @@ class EnrichmentPipeline:
                     result.entities_created.append(le.node_id)
 
             # 6. Checkpoint
-            self.checkpoint.mark_done(
-                content.id,
-                stats_update={"processed": 1}
-            )
+            with _timed(result, "checkpoint"):
+                self.checkpoint.mark_done(
+                    content.id,
+                    stats_update={"processed": 1}
+                )
 
         except Exception as e:
             logger.error(f"Errore processing {content.id}: {e}")
             result.add_error(content.id, "processing", e)
             self.checkpoint.mark_error(content.id)
 
+        result.contents_processed += 1
+
     async def _extract_entities(
         self,
         content: EnrichmentContent,
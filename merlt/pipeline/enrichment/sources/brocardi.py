@@ -74,7 +74,8 @@ class BrocardiEnrichmentSource(BaseEnrichmentSource):
     async def initialize(self) -> None:
         """Inizializza lo scraper Brocardi."""
         if not self._initialized:
-            self._scraper = BrocardiScraper()
+            # Run di enrichment: l'indice articoli del codice si ripaga subito
+            self._scraper = BrocardiScraper(auto_build_index=True)
             self._initialized = True
             logger.info("BrocardiEnrichmentSource inizializzato")
 
@@ -261,19 +262,20 @@ class BrocardiEnrichmentSource(BaseEnrichmentSource):
                 start, end = scope.articoli
             else:
                 # Lista specifica
-                from merlt.sources.utils.urn import generate_urn
-                return [
-                    (str(n), generate_urn(self.act_type, article=str(n)))
-                    for n in scope.articoli
-                ]
+                return self._articles_with_urns(scope.articoli)
         else:
             start, end = 1173, 2059
 
-        from merlt.sources.utils.urn import generate_urn
-        return [
-            (str(n), generate_urn(self.act_type, article=str(n)))
-            for n in range(start, end + 1)
-        ]
+        return self._articles_with_urns(range(start, end + 1))
+
+    def _articles_with_urns(self, numbers) -> List[tuple]:
+        """Coppie (numero, URN) con una sola risoluzione dell'atto."""
+        from merlt.sources.utils.urn import generate_urns
+        numbers = [str(n) for n in numbers]
+        urns = generate_urns(
+            {"act_type": self.act_type, "article": n} for n in numbers
+        )
+        return list(zip(numbers, urns))
 
     def _create_norma_visitata(self, article_num: str) -> NormaVisitata:
         """Crea NormaVisitata per BrocardiScraper."""
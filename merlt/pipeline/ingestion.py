@@ -21,13 +21,14 @@ Usage:
 
 import structlog
 import re
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from uuid import UUID
 
 from merlt.pipeline.parsing import CommaParser, ArticleStructure, Comma, Lettera, parse_article
 from merlt.pipeline.chunking import StructuralChunker, Chunk, chunk_article
+from merlt.pipeline.parse_pool import ParsePool
 from merlt.pipeline.visualex import VisualexArticle, NormaMetadata
 from merlt.models import BridgeMapping
 
@@ -172,6 +173,7 @@ class IngestionPipelineV2:
         falkordb_client=None,
         comma_parser: Optional[CommaParser] = None,
         chunker: Optional[StructuralChunker] = None,
+        parse_pool: Optional[ParsePool] = None,
     ):
         """
         Initialize pipeline.
@@ -180,18 +182,52 @@ class IngestionPipelineV2:
             falkordb_client: FalkorDB client for graph operations
             comma_parser: Optional custom parser (default: CommaParser())
             chunker: Optional custom chunker (default: StructuralChunker())
+            parse_pool: Optional ParsePool used by parse_articles() to parse
+                batches in worker processes
         """
         self.falkordb = falkordb_client
         self.parser = comma_parser or CommaParser()
         self.chunker = chunker or StructuralChunker()
+        self.parse_pool = parse_pool
 
         log.info("IngestionPipelineV2 initialized")
 
+    async def parse_articles(
+        self,
+        article_texts: List[str],
+        pool: Optional[ParsePool] = None,
+    ) -> List[Union[ArticleStructure, ValueError]]:
+        """
+        Parse a batch of article texts with this pipeline's parser.
+
+        With a ParsePool (argument or self.parse_pool) the batch is parsed in
+        worker processes without blocking the event loop; otherwise inline.
+        Texts that cannot be parsed yield their ValueError in place.
+
+        Args:
+            article_texts: Raw article_text values from VisualexAPI
+            pool: ParsePool overriding self.parse_pool
+
+        Returns:
+            ArticleStructure (or ValueError) per text, in input order
+        """
+        pool = pool or self.parse_pool
+        if pool is None:
+            results: List[Union[ArticleStructure, ValueError]] = []
+            for text in article_texts:
+                try:
+                    results.append(self.parser.parse(text))
+                except ValueError as e:
+                    results.append(e)
+            return results
+        return await pool.parse_batch(article_texts, parser=self.parser, return_exceptions=True)
+
     async def ingest_article(
         self,
         article: VisualexArticle,
         create_graph_nodes: bool = True,
         norm_tree: Optional[NormTree] = None,
+        article_structure: Optional[ArticleStructure] = None,
     ) -> IngestionResult:
         """
         Ingest a single article with comma-level chunking.
@@ -200,6 +236,8 @@ class IngestionPipelineV2:
             article: VisualexArticle from API
             create_graph_nodes: Whether to create graph nodes (default True)
             norm_tree: Optional NormTree for hierarchy extraction when Brocardi not available
+            article_structure: Already parsed article_text (e.g. from
+                parse_articles); parsed inline if None
 
         Returns:
             IngestionResult with chunks, mappings, and graph info
@@ -214,7 +252,8 @@ class IngestionPipelineV2:
         log.info(f"Ingesting article: {article_urn}")
 
         # Step 1: Parse article text into commas
-        article_structure = self.parser.parse(article.article_text)
+        if article_structure is None:
+            article_structure = self.parser.parse(article.article_text)
 
         # Step 2: Get position for hierarchy (Brocardi first, treextractor fallback)
         brocardi_position = None
@@ -0,0 +1,220 @@
+"""
+Ingestion Journal
+=================
+
+Checkpoint durevole per BatchIngestionPipeline.
+
+Journal append-only (SQLite) del completamento di ogni stage per articolo
+(fetch, graph, embed, bridge, multivigenza). Ogni riga porta il content hash
+dei dati scaricati (testo + Brocardi): uno stage è completo per un articolo
+solo se è stato registrato con l'hash corrente, quindi un cambiamento a monte
+(testo modificato su Normattiva, nuove massime) riapre gli stage a valle.
+
+I dati scaricati vengono salvati accanto al journal: su resume un articolo
+già scaricato ma non completato non viene ri-scaricato.
+
+Usage:
+    from merlt.pipeline.ingestion_journal import IngestionJournal
+
+    journal = IngestionJournal("data/checkpoints/ingestion/merl_t_prod.sqlite")
+    pipeline = BatchIngestionPipeline(kg, journal=journal)
+    result = await pipeline.ingest_batch("codice civile", articles, resume=True)
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Iterable, Optional, Set, Tuple, Union
+
+import structlog
+
+log = structlog.get_logger()
+
+# Limite parametri per statement SQLite
+_SQLITE_CHUNK = 900
+
+
+def fetch_content_hash(
+    article_text: Optional[str],
+    brocardi_info: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Hash dei dati scaricati per un articolo (testo + info Brocardi)."""
+    data = json.dumps(
+        {"text": article_text or "", "brocardi": brocardi_info or {}},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class IngestionJournal:
+    """
+    Journal append-only dei completamenti di stage, su file SQLite.
+
+    Lo stato corrente (ultimo hash registrato per articolo e stage) è tenuto
+    in memoria e ricostruito all'apertura rileggendo il journal in ordine.
+
+    Args:
+        path: File SQLite (creato se non esiste); ":memory:" per test
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS journal ("
+            "seq INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "tipo_atto TEXT NOT NULL, article TEXT NOT NULL, stage TEXT NOT NULL, "
+            "content_hash TEXT NOT NULL, recorded_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS fetched ("
+            "tipo_atto TEXT NOT NULL, article TEXT NOT NULL, content_hash TEXT NOT NULL, "
+            "payload TEXT NOT NULL, PRIMARY KEY (tipo_atto, article))"
+        )
+        self._conn.commit()
+
+        self._state: Dict[Tuple[str, str], Dict[str, str]] = {}
+        rows = self._conn.execute(
+            "SELECT tipo_atto, article, stage, content_hash FROM journal ORDER BY seq"
+        )
+        for tipo_atto, article, stage, content_hash in rows:
+            self._state.setdefault((tipo_atto, article), {})[stage] = content_hash
+
+        log.debug(f"IngestionJournal opened: {self.path} ({len(self._state)} articles)")
+
+    def record(self, tipo_atto: str, stage: str, hashes: Dict[str, str]) -> None:
+        """
+        Registra il completamento di uno stage.
+
+        Args:
+            tipo_atto: Tipo atto
+            stage: Nome dello stage
+            hashes: Dict article_num -> content hash dei dati processati
+        """
+        if not hashes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO journal (tipo_atto, article, stage, content_hash, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(tipo_atto, article, stage, h, now) for article, h in hashes.items()],
+            )
+            self._conn.commit()
+            for article, h in hashes.items():
+                self._state.setdefault((tipo_atto, article), {})[stage] = h
+
+    def save_fetched(self, tipo_atto: str, fetched: Dict[str, Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Salva i dati scaricati per il resume.
+
+        Args:
+            fetched: Dict article_num -> (content hash, payload JSON-serializzabile)
+        """
+        if not fetched:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO fetched (tipo_atto, article, content_hash, payload) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (tipo_atto, article, h, json.dumps(payload, ensure_ascii=False, default=str))
+                    for article, (h, payload) in fetched.items()
+                ],
+            )
+            self._conn.commit()
+
+    def load_fetched(
+        self,
+        tipo_atto: str,
+        articles: Iterable[str],
+    ) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """
+        Dati scaricati in un run precedente.
+
+        Returns:
+            Dict article_num -> (content hash, payload); gli articoli mancanti
+            o il cui hash non corrisponde all'ultimo fetch registrato sono omessi
+        """
+        ids = list(dict.fromkeys(articles))
+        found: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        with self._lock:
+            for i in range(0, len(ids), _SQLITE_CHUNK):
+                chunk = ids[i:i + _SQLITE_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT article, content_hash, payload FROM fetched "
+                    f"WHERE tipo_atto = ? AND article IN ({placeholders})",
+                    [tipo_atto, *chunk],
+                ).fetchall()
+                for article, h, payload in rows:
+                    if self.content_hash(tipo_atto, article) == h:
+                        found[article] = (h, json.loads(payload))
+        return found
+
+    def content_hash(self, tipo_atto: str, article: str) -> Optional[str]:
+        """Hash dell'ultimo fetch registrato per l'articolo."""
+        return self._state.get((tipo_atto, article), {}).get("fetch")
+
+    def pending_stages(
+        self,
+        tipo_atto: str,
+        article: str,
+        stages: Iterable[str],
+        content_hash: Optional[str] = None,
+    ) -> Set[str]:
+        """
+        Stage non ancora completati per il contenuto corrente.
+
+        Args:
+            content_hash: Hash dei dati correnti (default: ultimo fetch registrato)
+        """
+        done = self._state.get((tipo_atto, article), {})
+        current = content_hash or done.get("fetch")
+        return {
+            stage for stage in stages
+            if current is None or done.get(stage) != current
+        }
+
+    def completed_articles(self, tipo_atto: str, stages: Iterable[str]) -> Set[str]:
+        """Articoli con tutti gli stage indicati completati sull'ultimo fetch."""
+        stages = list(stages)
+        return {
+            article
+            for (tipo, article), done in self._state.items()
+            if tipo == tipo_atto
+            and not self.pending_stages(tipo_atto, article, stages)
+        }
+
+    def stats(self, tipo_atto: str) -> Dict[str, int]:
+        """Numero di articoli completati per stage (sul contenuto corrente)."""
+        counts: Dict[str, int] = {}
+        for (tipo, _), done in self._state.items():
+            if tipo != tipo_atto:
+                continue
+            current = done.get("fetch")
+            for stage, h in done.items():
+                if h == current:
+                    counts[stage] = counts.get(stage, 0) + 1
+        return counts
+
+    def close(self) -> None:
+        """Chiude la connessione SQLite."""
+        with self._lock:
+            self._conn.close()
+
+    def __repr__(self) -> str:
+        return f"IngestionJournal(path={self.path}, articles={len(self._state)})"
+
+
+__all__ = ["IngestionJournal", "fetch_content_hash"]
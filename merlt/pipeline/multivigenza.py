@@ -28,6 +28,7 @@ Usage:
     result = await pipeline.ingest_with_history(norma_visitata)
 """
 
+import asyncio
 import structlog
 import re
 from datetime import datetime, timezone
@@ -54,6 +55,10 @@ RELATION_TYPES = {
     TipoModifica.INSERISCE: "inserisce",
 }
 
+# Versioni storiche scaricate in parallelo per articolo (il rate limiter per
+# host di http_client resta il limite globale verso Normattiva)
+DEFAULT_VERSION_CONCURRENCY = 4
+
 # Mapping tipo atto da estremi a tipo_documento standardizzato
 TIPO_ATTO_MAPPING = {
     "legge": "legge",
@@ -406,6 +411,270 @@ def build_disposizione_urn(base_urn: str, disposizione_parsed: Dict) -> str:
     return urn
 
 
+class _ModificationBatch:
+    """
+    Nodi e relazioni di tutte le modifiche di un articolo, scritti con un
+    unico statement (UNWIND per livello).
+
+    Riproduce la struttura di MultivigenzaPipeline._create_modification
+    (atto -> articolo -> comma -> lettera -> numero, relazione di modifica dal
+    nodo più specifico). Le righe sono deduplicate per URN: a parità di URN
+    vince la prima modifica, come con MERGE ... ON CREATE SET sequenziali.
+    """
+
+    # (parametro, label) dei nodi, in ordine gerarchico
+    NODE_LEVELS = (
+        ("atti", "Norma"),
+        ("articoli", "Norma"),
+        ("commi", "Comma"),
+        ("lettere", "Lettera"),
+        ("numeri", "Numero"),
+    )
+
+    # (parametro, label sorgente, label destinazione, con ordinamento)
+    CONTIENE_LEVELS = (
+        ("atto_articolo", "Norma", "Norma", False),
+        ("articolo_comma", "Norma", "Comma", True),
+        ("comma_lettera", "Comma", "Lettera", True),
+        ("lettera_numero", "Lettera", "Numero", True),
+    )
+
+    def __init__(self, target_urn: str, timestamp: Optional[str]):
+        self.target_urn = target_urn
+        self.timestamp = timestamp
+        self.nodes: Dict[str, Dict[str, Dict[str, Any]]] = {
+            name: {} for name, _ in self.NODE_LEVELS
+        }
+        self.contiene: Dict[str, Dict[Tuple[str, str], Dict[str, Any]]] = {
+            name: {} for name, *_ in self.CONTIENE_LEVELS
+        }
+        self.relations: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]] = {}
+        self.atti: List[str] = []
+
+    def _node(self, level: str, row: Dict[str, Any]) -> None:
+        self.nodes[level].setdefault(row["urn"], row)
+
+    def _edge(self, level: str, src: str, dst: str, ordinamento: Optional[int] = None) -> None:
+        self.contiene[level].setdefault((src, dst), {"src": src, "dst": dst, "ord": ordinamento})
+
+    def add(self, modifica: Modifica) -> Optional[str]:
+        """
+        Aggiunge una modifica al batch.
+
+        Returns:
+            Descrizione della relazione di modifica (None se manca l'URN
+            dell'atto modificante)
+        """
+        atto_urn = modifica.atto_modificante_urn
+        if not atto_urn:
+            log.warning(f"Missing URN for modifying act: {modifica.atto_modificante_estremi}")
+            return None
+
+        estremi = modifica.atto_modificante_estremi
+        parsed_estremi = parse_estremi(estremi)
+        parsed_disp = parse_disposizione(modifica.disposizione)
+        tipo_doc = parsed_estremi["tipo_documento"] or "atto normativo"
+        autorita = _derive_autorita_emanante(tipo_doc)
+        data_gu = modifica.data_pubblicazione_gu
+
+        self._node("atti", {
+            "urn": atto_urn,
+            "url": _build_normattiva_url(atto_urn),
+            "estremi": estremi,
+            "tipo_documento": tipo_doc,
+            "titolo": parsed_estremi["titolo"] or estremi,
+            "data_gu": data_gu,
+            "autorita": autorita,
+        })
+        if atto_urn not in self.atti:
+            self.atti.append(atto_urn)
+
+        source_urn, source_label = atto_urn, "Norma"
+
+        art_num = parsed_disp["numero_articolo"]
+        if art_num:
+            articolo_urn = f"{atto_urn}~art{art_num.replace('-', '')}"
+            self._node("articoli", {
+                "urn": articolo_urn,
+                "url": _build_normattiva_url(articolo_urn),
+                "numero": art_num,
+                "estremi": f"Art. {art_num} {estremi}",
+                "autorita": autorita,
+                "data_gu": data_gu,
+            })
+            self._edge("atto_articolo", atto_urn, articolo_urn)
+            source_urn = articolo_urn
+
+            commi = parsed_disp["commi"]
+            if commi:
+                for comma_num in commi:
+                    comma_urn = f"{articolo_urn}-com{comma_num}"
+                    self._node("commi", {
+                        "urn": comma_urn,
+                        "posizione": f"comma {comma_num}",
+                        "estremi": f"Art. {art_num}, comma {comma_num}, {estremi}",
+                        "testo": modifica.disposizione,
+                    })
+                    self._edge("articolo_comma", articolo_urn, comma_urn, int(comma_num))
+
+                first_comma_urn = f"{articolo_urn}-com{commi[0]}"
+                source_urn, source_label = first_comma_urn, "Comma"
+
+                lettere = parsed_disp["lettere"]
+                if lettere:
+                    for lettera in lettere:
+                        lettera_urn = f"{first_comma_urn}-let{lettera}"
+                        self._node("lettere", {
+                            "urn": lettera_urn,
+                            "posizione": f"lettera {lettera})",
+                            "estremi": f"Art. {art_num}, comma {commi[0]}, lettera {lettera}), {estremi}",
+                        })
+                        self._edge(
+                            "comma_lettera", first_comma_urn, lettera_urn, ord(lettera) - ord('a') + 1
+                        )
+
+                    first_lettera_urn = f"{first_comma_urn}-let{lettere[0]}"
+                    source_urn, source_label = first_lettera_urn, "Lettera"
+
+                    numeri = parsed_disp.get("numeri")
+                    if numeri:
+                        for numero in numeri:
+                            numero_urn = f"{first_lettera_urn}-num{numero}"
+                            self._node("numeri", {
+                                "urn": numero_urn,
+                                "posizione": f"numero {numero})",
+                                "estremi": (
+                                    f"Art. {art_num}, comma {commi[0]}, lettera {lettere[0]}), "
+                                    f"numero {numero}), {estremi}"
+                                ),
+                            })
+                            self._edge("lettera_numero", first_lettera_urn, numero_urn, int(numero))
+
+                        source_urn, source_label = f"{first_lettera_urn}-num{numeri[0]}", "Numero"
+
+        relation_type = RELATION_TYPES[modifica.tipo_modifica]
+        self.relations.setdefault((source_label, relation_type), {}).setdefault(source_urn, {
+            "src": source_urn,
+            "disposizione": modifica.disposizione,
+            "data_eff": modifica.data_efficacia,
+            "data_gu": data_gu,
+            "estremi": estremi,
+        })
+        return f"{relation_type}:{source_urn}->{self.target_urn}"
+
+    def to_query(self) -> Tuple[str, Dict[str, Any]]:
+        """
+        Statement Cypher unico e parametri.
+
+        Ogni livello è una sezione UNWIND; le sezioni sono separate da
+        ``WITH count(*)`` (che produce sempre una riga, anche se la sezione
+        precedente non ne ha), così un livello vuoto non interrompe i
+        successivi.
+        """
+        node_sets = {
+            "atti": """
+                MERGE (atto:Norma {URN: row.urn})
+                ON CREATE SET
+                    atto.node_id = row.urn,
+                    atto.url = row.url,
+                    atto.estremi = row.estremi,
+                    atto.tipo_documento = row.tipo_documento,
+                    atto.titolo = row.titolo,
+                    atto.stato = 'vigente',
+                    atto.vigenza = 'vigente',
+                    atto.efficacia = 'permanente',
+                    atto.data_pubblicazione = row.data_gu,
+                    atto.data_entrata_vigore = row.data_gu,
+                    atto.autorita_emanante = row.autorita,
+                    atto.ambito_territoriale = 'nazionale',
+                    atto.fonte = 'Normattiva',
+                    atto.created_at = $timestamp,
+                    atto.updated_at = $timestamp""",
+            "articoli": """
+                MERGE (art:Norma {URN: row.urn})
+                ON CREATE SET
+                    art.node_id = row.urn,
+                    art.url = row.url,
+                    art.tipo_documento = 'articolo',
+                    art.numero_articolo = row.numero,
+                    art.estremi = row.estremi,
+                    art.stato = 'vigente',
+                    art.vigenza = 'vigente',
+                    art.autorita_emanante = row.autorita,
+                    art.data_pubblicazione = row.data_gu,
+                    art.data_entrata_vigore = row.data_gu,
+                    art.fonte = 'Normattiva',
+                    art.created_at = $timestamp,
+                    art.updated_at = $timestamp""",
+            "commi": """
+                MERGE (comma:Comma {URN: row.urn})
+                ON CREATE SET
+                    comma.node_id = row.urn,
+                    comma.tipo = 'comma',
+                    comma.posizione = row.posizione,
+                    comma.estremi = row.estremi,
+                    comma.testo = row.testo,
+                    comma.fonte = 'Normattiva',
+                    comma.created_at = $timestamp""",
+            "lettere": """
+                MERGE (let:Lettera {URN: row.urn})
+                ON CREATE SET
+                    let.node_id = row.urn,
+                    let.tipo = 'lettera',
+                    let.posizione = row.posizione,
+                    let.estremi = row.estremi,
+                    let.fonte = 'Normattiva',
+                    let.created_at = $timestamp""",
+            "numeri": """
+                MERGE (num:Numero {URN: row.urn})
+                ON CREATE SET
+                    num.node_id = row.urn,
+                    num.tipo = 'numero',
+                    num.posizione = row.posizione,
+                    num.estremi = row.estremi,
+                    num.fonte = 'Normattiva',
+                    num.created_at = $timestamp""",
+        }
+
+        params: Dict[str, Any] = {"timestamp": self.timestamp, "target_urn": self.target_urn}
+        sections: List[str] = []
+
+        def add_section(name: str, rows: List[Dict[str, Any]], body: str) -> None:
+            if rows:
+                params[name] = rows
+                sections.append(f"UNWIND ${name} AS row{body}")
+
+        for name, _ in self.NODE_LEVELS:
+            add_section(name, list(self.nodes[name].values()), node_sets[name])
+
+        for name, src_label, dst_label, ordered in self.CONTIENE_LEVELS:
+            add_section(name, list(self.contiene[name].values()), f"""
+                MATCH (src:{src_label} {{URN: row.src}})
+                MATCH (dst:{dst_label} {{URN: row.dst}})
+                MERGE (src)-[r:contiene]->(dst)
+                ON CREATE SET r.certezza = 1.0{", r.ordinamento = row.ord" if ordered else ""}""")
+
+        for i, ((label, relation_type), rows) in enumerate(sorted(self.relations.items())):
+            add_section(f"rel{i}", list(rows.values()), f"""
+                MATCH (src:{label} {{URN: row.src}})
+                MATCH (target:Norma {{URN: $target_urn}})
+                MERGE (src)-[r:{relation_type}]->(target)
+                ON CREATE SET
+                    r.disposizione = row.disposizione,
+                    r.data_efficacia = row.data_eff,
+                    r.data_pubblicazione_gu = row.data_gu,
+                    r.certezza = 1.0,
+                    r.fonte = 'Normattiva',
+                    r.fonte_relazione = row.estremi,
+                    r.data_decorrenza = row.data_eff""")
+
+        query = "".join(
+            section if i == 0 else f"\nWITH count(*) AS done{i}\n{section}"
+            for i, section in enumerate(sections)
+        )
+        return query, params
+
+
 @dataclass
 class MultivigenzaResult:
     """
@@ -479,7 +748,9 @@ class MultivigenzaPipeline:
         self,
         falkordb_client=None,
         scraper: Optional[NormattivaScraper] = None,
-        dry_run: bool = False
+        dry_run: bool = False,
+        version_concurrency: int = DEFAULT_VERSION_CONCURRENCY,
+        batch_writes: bool = True,
     ):
         """
         Initialize pipeline.
@@ -488,6 +759,11 @@ class MultivigenzaPipeline:
             falkordb_client: FalkorDB client for graph operations
             scraper: Optional NormattivaScraper (default: creates new one)
             dry_run: Se True, non scrive nel grafo (solo logging)
+            version_concurrency: Versioni storiche scaricate in parallelo
+                (fetch_all_versions=True)
+            batch_writes: Se True, tutte le modifiche di un articolo sono
+                scritte con un unico statement; se False, una modifica alla
+                volta con _create_modification
 
         Example:
             # Dry-run per test
@@ -498,6 +774,8 @@ class MultivigenzaPipeline:
         self.falkordb = falkordb_client
         self.scraper = scraper or NormattivaScraper()
         self.dry_run = dry_run
+        self.version_concurrency = max(1, version_concurrency)
+        self.batch_writes = batch_writes
         self._timestamp = None
 
         log.info("MultivigenzaPipeline initialized", dry_run=dry_run)
@@ -570,8 +848,11 @@ class MultivigenzaPipeline:
 
             # 3. Create modifying act nodes and relations
             if create_modifying_acts and self.falkordb:
-                for modifica in modifiche:
-                    await self._create_modification(normavisitata, modifica, result)
+                if self.batch_writes:
+                    await self._create_modifications_batch(normavisitata, modifiche, result)
+                else:
+                    for modifica in modifiche:
+                        await self._create_modification(normavisitata, modifica, result)
 
             # 4. Optionally fetch all historical versions
             if fetch_all_versions:
@@ -946,6 +1227,45 @@ class MultivigenzaPipeline:
 
         log.debug(f"Created hierarchical modification: {relation_desc}")
 
+    async def _create_modifications_batch(
+        self,
+        normavisitata: NormaVisitata,
+        modifiche: List[Modifica],
+        result: MultivigenzaResult,
+    ) -> None:
+        """
+        Crea nodi e relazioni di tutte le modifiche di un articolo con un
+        unico statement (stessa struttura di _create_modification).
+
+        Per articoli con decine di modifiche evita centinaia di round-trip
+        verso FalkorDB.
+        """
+        if not self.falkordb or not modifiche:
+            return
+
+        target_urn = normavisitata.urn
+        batch = _ModificationBatch(target_urn, self._timestamp)
+        relations = []
+        for modifica in modifiche:
+            relation_desc = batch.add(modifica)
+            if relation_desc:
+                relations.append(relation_desc)
+
+        if not relations:
+            return
+
+        query, params = batch.to_query()
+        await self.falkordb.query(query, params)
+
+        for atto_urn in batch.atti:
+            if atto_urn not in result.atti_modificanti_creati:
+                result.atti_modificanti_creati.append(atto_urn)
+        result.relazioni_create.extend(relations)
+
+        log.debug(
+            f"Created {len(relations)} modifications for {target_urn} in one statement"
+        )
+
     async def _fetch_all_versions(
         self,
         normavisitata: NormaVisitata,
@@ -958,50 +1278,96 @@ class MultivigenzaPipeline:
         For each modification, fetches the version as it was BEFORE
         that modification took effect.
 
+        Le versioni sono scaricate in parallelo (al massimo
+        version_concurrency alla volta, tramite la sessione HTTP condivisa)
+        e salvate con un unico statement.
+
         Returns:
             Number of versions saved
         """
         if not self.falkordb:
             return 0
 
-        versions_saved = 0
-
         # Get unique dates when versions changed
         version_dates = sorted(set(m.data_efficacia for m in modifiche if m.data_efficacia))
 
-        # Also get original version
+        semaphore = asyncio.Semaphore(self.version_concurrency)
+
+        async def fetch(fetcher, *args) -> str:
+            async with semaphore:
+                testo, _urn = await fetcher(normavisitata, *args)
+            return testo
+
+        # Original version + version before each modification date
+        pending = [("originale", normavisitata.norma.data, fetch(self.scraper.get_original_version))]
+        pending.extend(
+            (f"v{i+1}", date, fetch(self.scraper.get_version_at_date, date))
+            for i, date in enumerate(version_dates)
+        )
+        fetched = await asyncio.gather(
+            *(coro for _, _, coro in pending), return_exceptions=True
+        )
+
+        versions: List[Tuple[str, str, str]] = []
+        for (label, date, _), testo in zip(pending, fetched):
+            if isinstance(testo, BaseException):
+                if label == "originale":
+                    result.errors.append(f"Could not fetch original version: {testo}")
+                else:
+                    result.errors.append(f"Could not fetch version at {date}: {testo}")
+                continue
+            versions.append((label, date, testo))
+
         try:
-            testo_orig, urn_orig = await self.scraper.get_original_version(normavisitata)
-            await self._save_version(
-                normavisitata,
-                version_label="originale",
-                version_date=normavisitata.norma.data,
-                testo=testo_orig,
-            )
-            versions_saved += 1
+            await self._save_versions(normavisitata, versions)
         except Exception as e:
-            result.errors.append(f"Could not fetch original version: {e}")
+            result.errors.append(f"Could not save versions: {e}")
+            return 0
 
-        # Fetch version before each modification date
-        for i, date in enumerate(version_dates):
-            try:
-                # Get version as it was the day before this modification
-                # (to capture the state before this change)
-                version_label = f"v{i+1}"
-
-                testo, urn = await self.scraper.get_version_at_date(normavisitata, date)
-                await self._save_version(
-                    normavisitata,
-                    version_label=version_label,
-                    version_date=date,
-                    testo=testo,
-                )
-                versions_saved += 1
+        return len(versions)
+
+    async def _save_versions(
+        self,
+        normavisitata: NormaVisitata,
+        versions: List[Tuple[str, str, str]],
+    ) -> None:
+        """
+        Salva più versioni storiche con un unico statement.
+
+        Args:
+            versions: Tuple (label, data versione, testo)
+        """
+        if not self.falkordb or not versions:
+            return
+
+        base_urn = normavisitata.urn
+        rows = [
+            {"urn": f"{base_urn}!vig={date}", "label": label, "date": date, "testo": testo}
+            for label, date, testo in versions
+        ]
 
-            except Exception as e:
-                result.errors.append(f"Could not fetch version at {date}: {e}")
+        await self.falkordb.query(
+            """
+            UNWIND $versions AS row
+            MERGE (ver:Norma {URN: row.urn})
+            ON CREATE SET
+                ver.node_id = row.urn,
+                ver.tipo_documento = 'versione_storica',
+                ver.versione = row.label,
+                ver.data_versione = row.date,
+                ver.testo_storico = row.testo,
+                ver.is_versione_vigente = false,
+                ver.fonte = 'Normattiva',
+                ver.created_at = $timestamp
+            WITH ver
+            MATCH (art:Norma {URN: $art_urn})
+            MERGE (ver)-[r:versione_di]->(art)
+            ON CREATE SET r.certezza = 1.0
+            """,
+            {"art_urn": base_urn, "versions": rows, "timestamp": self._timestamp},
+        )
 
-        return versions_saved
+        log.debug(f"Saved {len(rows)} versions of {base_urn}")
 
     async def _save_version(
         self,
@@ -0,0 +1,273 @@
+"""
+Parse Pool
+==========
+
+Stage di parsing su ProcessPoolExecutor per CommaParser e StructuralChunker.
+
+Il parsing di un articolo (regex su commi e lettere, conteggio token) è
+puro CPU: eseguito inline blocca l'event loop e, su un codice intero
+(~3000 articoli), non sfrutta più di un core. ParsePool distribuisce i testi
+ai processi worker in blocchi di ``chunksize`` articoli (una sola
+serializzazione per blocco invece che per articolo) e restituisce i
+risultati nello stesso ordine dell'input.
+
+ArticleStructure, Comma, Lettera, Chunk e ChunkMetadata sono dataclass
+semplici, quindi picklable: i worker restituiscono gli stessi oggetti del
+parsing inline.
+
+Sotto ``min_batch`` testi il parsing resta inline (l'overhead di
+serializzazione supererebbe il guadagno).
+
+Usage:
+    from merlt.pipeline.parse_pool import ParsePool
+
+    with ParsePool(max_workers=4) as pool:
+        structures = await pool.parse_batch(texts)
+        chunks = await pool.chunk_batch(articles)
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import structlog
+
+from merlt.pipeline.chunking import Chunk, StructuralChunker
+from merlt.pipeline.parsing import ArticleStructure, CommaParser
+
+log = structlog.get_logger()
+
+# Articoli per blocco inviato a un worker
+DEFAULT_CHUNKSIZE = 32
+
+# Sotto questa soglia il batch viene parsato inline
+DEFAULT_MIN_BATCH = 16
+
+
+def _parse_chunk(
+    parser: CommaParser,
+    texts: Sequence[str],
+) -> List[Union[ArticleStructure, ValueError]]:
+    """Worker: parsa un blocco di testi (errori di parsing restituiti, non sollevati)."""
+    results: List[Union[ArticleStructure, ValueError]] = []
+    for text in texts:
+        try:
+            results.append(parser.parse(text))
+        except ValueError as e:
+            results.append(e)
+    return results
+
+
+def _chunk_chunk(
+    chunker: StructuralChunker,
+    articles: Sequence[Dict[str, Any]],
+) -> List[List[Chunk]]:
+    """Worker: chunking di un blocco di articoli (stesso formato di chunk_batch)."""
+    return [
+        chunker.chunk_article(
+            article_structure=article["article_structure"],
+            article_urn=article["article_urn"],
+            article_url=article["article_url"],
+            brocardi_position=article.get("brocardi_position"),
+        )
+        for article in articles
+    ]
+
+
+class ParsePool:
+    """
+    Pool di processi per parsing e chunking degli articoli.
+
+    Il pool viene creato alla prima richiesta che supera min_batch e
+    riutilizzato fino a close().
+
+    Args:
+        max_workers: Processi worker (default: os.cpu_count())
+        chunksize: Articoli per blocco inviato a un worker
+        min_batch: Batch più piccoli vengono processati inline
+        mp_context: Start method multiprocessing (default "spawn": sicuro
+            anche con thread ed event loop attivi nel processo padre)
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        min_batch: int = DEFAULT_MIN_BATCH,
+        mp_context: Optional[str] = "spawn",
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunksize = max(1, chunksize)
+        self.min_batch = min_batch
+        self.mp_context = mp_context
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            context = multiprocessing.get_context(self.mp_context) if self.mp_context else None
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+            log.info(f"ParsePool started: {self.max_workers} workers, chunksize={self.chunksize}")
+        return self._executor
+
+    def _use_pool(self, size: int) -> bool:
+        return self.max_workers > 1 and size >= self.min_batch
+
+    def _submit(self, fn, worker_arg: Any, items: Sequence[Any]) -> List[Future]:
+        executor = self._get_executor()
+        return [
+            executor.submit(fn, worker_arg, items[i:i + self.chunksize])
+            for i in range(0, len(items), self.chunksize)
+        ]
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Parsing
+    # ─────────────────────────────────────────────────────────────────────
+
+    def parse_many(
+        self,
+        texts: Sequence[str],
+        parser: Optional[CommaParser] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[ArticleStructure, ValueError]]:
+        """
+        Parsa una lista di testi (bloccante).
+
+        Args:
+            texts: article_text da VisualexAPI
+            parser: CommaParser da usare (default: CommaParser()); deve
+                essere picklable
+            return_exceptions: Se True i testi non parsabili restituiscono
+                il ValueError al loro posto invece di sollevarlo
+
+        Returns:
+            ArticleStructure nello stesso ordine dei testi
+        """
+        parser = parser or CommaParser()
+        texts = list(texts)
+        start = time.perf_counter()
+
+        if self._use_pool(len(texts)):
+            results = [r for future in self._submit(_parse_chunk, parser, texts) for r in future.result()]
+        else:
+            results = _parse_chunk(parser, texts)
+
+        self._log_done("parse", len(texts), start)
+        return self._check(results, return_exceptions)
+
+    async def parse_batch(
+        self,
+        texts: Sequence[str],
+        parser: Optional[CommaParser] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[ArticleStructure, ValueError]]:
+        """
+        Come parse_many, senza bloccare l'event loop.
+
+        I blocchi vengono inviati tutti subito e attesi insieme.
+        """
+        parser = parser or CommaParser()
+        texts = list(texts)
+        if not self._use_pool(len(texts)):
+            return self.parse_many(texts, parser, return_exceptions)
+
+        start = time.perf_counter()
+        futures = self._submit(_parse_chunk, parser, texts)
+        blocks = await asyncio.gather(*(asyncio.wrap_future(f) for f in futures))
+        results = [r for block in blocks for r in block]
+
+        self._log_done("parse", len(texts), start)
+        return self._check(results, return_exceptions)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Chunking
+    # ─────────────────────────────────────────────────────────────────────
+
+    def chunk_many(
+        self,
+        articles: Sequence[Dict[str, Any]],
+        chunker: Optional[StructuralChunker] = None,
+    ) -> List[Chunk]:
+        """
+        Chunking di un batch di articoli (bloccante).
+
+        Args:
+            articles: Dict nel formato di StructuralChunker.chunk_batch
+            chunker: StructuralChunker da usare (default: StructuralChunker())
+
+        Returns:
+            Lista piatta dei chunk, nell'ordine degli articoli
+        """
+        chunker = chunker or StructuralChunker()
+        articles = list(articles)
+        start = time.perf_counter()
+
+        if self._use_pool(len(articles)):
+            blocks = [b for future in self._submit(_chunk_chunk, chunker, articles) for b in future.result()]
+        else:
+            blocks = _chunk_chunk(chunker, articles)
+
+        self._log_done("chunk", len(articles), start)
+        return [chunk for block in blocks for chunk in block]
+
+    async def chunk_batch(
+        self,
+        articles: Sequence[Dict[str, Any]],
+        chunker: Optional[StructuralChunker] = None,
+    ) -> List[Chunk]:
+        """Come chunk_many, senza bloccare l'event loop."""
+        chunker = chunker or StructuralChunker()
+        articles = list(articles)
+        if not self._use_pool(len(articles)):
+            return self.chunk_many(articles, chunker)
+
+        start = time.perf_counter()
+        futures = self._submit(_chunk_chunk, chunker, articles)
+        blocks = await asyncio.gather(*(asyncio.wrap_future(f) for f in futures))
+
+        self._log_done("chunk", len(articles), start)
+        return [chunk for block in blocks for article_chunks in block for chunk in article_chunks]
+
+    # ─────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _check(results: List[Any], return_exceptions: bool) -> List[Any]:
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, ValueError):
+                    raise result
+        return results
+
+    def _log_done(self, what: str, count: int, start: float) -> None:
+        elapsed = time.perf_counter() - start
+        log.debug(
+            f"ParsePool {what}: {count} articles in {elapsed:.3f}s",
+            pooled=self._use_pool(count),
+        )
+
+    def close(self) -> None:
+        """Termina i processi worker."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> "ParsePool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"ParsePool(max_workers={self.max_workers}, chunksize={self.chunksize}, "
+            f"started={self._executor is not None})"
+        )
+
+
+__all__ = [
+    "ParsePool",
+    "DEFAULT_CHUNKSIZE",
+    "DEFAULT_MIN_BATCH",
+]
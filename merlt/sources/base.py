@@ -6,7 +6,9 @@ Interfaccia base per tutti gli scrapers di fonti giuridiche.
 
 Features:
 - Retry automatico con exponential backoff
-- Rate limiting con semaforo
+- Rate limiting con semaforo e rate limiter per host condiviso
+  (merlt.sources.utils.rate_limit, adattivo su 429/503)
+- Cache persistente delle risposte (merlt.sources.utils.http)
 - Configurazione centralizzata
 """
 
@@ -18,7 +20,8 @@ from abc import ABC
 from dataclasses import dataclass, field
 from typing import Optional
 
-from merlt.sources.utils.http import http_client
+from merlt.sources.utils.http import OfflineCacheMiss, http_client
+from merlt.sources.utils.rate_limit import ThrottledError
 from merlt.sources.utils.retry import RetryConfig, with_retry
 
 log = structlog.get_logger()
@@ -33,7 +36,10 @@ class ScraperConfig:
         timeout: Timeout per richieste HTTP in secondi
         retry_config: Configurazione retry
         max_concurrent: Numero massimo di richieste concorrenti
-        cache_ttl: Time-to-live cache in secondi
+        cache_ttl: Override del TTL della response cache in secondi
+            (None = TTL per fonte, vedi HttpCacheConfig)
+        html_backend: Backend di estrazione HTML, "lxml" o "bs4"
+            (None = default_html_backend(), vedi merlt.sources.utils.html_backend)
 
     Example:
         >>> config = ScraperConfig(timeout=60, max_concurrent=3)
@@ -42,7 +48,8 @@ class ScraperConfig:
     timeout: int = 30
     retry_config: RetryConfig = field(default_factory=RetryConfig)
     max_concurrent: int = 5
-    cache_ttl: int = 86400  # 24 ore
+    cache_ttl: Optional[int] = None
+    html_backend: Optional[str] = None
 
 
 class ScraperError(Exception):
@@ -76,7 +83,8 @@ class BaseScraper(ABC):
     - Parsing HTML
 
     Tutti gli scrapers (NormattivaScraper, BrocardiScraper, etc.)
-    devono ereditare da questa classe.
+    devono ereditare da questa classe. cache_source identifica la fonte
+    per il TTL della response cache.
 
     Example:
         >>> class MyCustomScraper(BaseScraper):
@@ -85,6 +93,8 @@ class BaseScraper(ABC):
         ...         return self.parse_document(html)
     """
 
+    cache_source: str = "default"
+
     def __init__(self, config: Optional[ScraperConfig] = None):
         """
         Inizializza lo scraper con configurazione opzionale.
@@ -110,24 +120,31 @@ class BaseScraper(ABC):
             DocumentNotFoundError: Se il documento non esiste (404)
         """
         async with self._semaphore:
-            return await self._request_with_retry(url)
+            try:
+                return await self._request_with_retry(url)
+            except ThrottledError as e:
+                raise NetworkError(str(e))
 
     @with_retry()
     async def _request_with_retry(self, url: str) -> str:
         """
         Implementazione interna della richiesta con retry.
 
-        Il decorator @with_retry usa la configurazione di default.
+        Il decorator @with_retry usa la configurazione di default:
+        ThrottledError (429/503) viene ritentata rispettando Retry-After.
         """
         log.info("Consulting source", url=url[:100])
-        session = await http_client.get_session()
 
         try:
-            async with session.get(url, timeout=self.config.timeout) as response:
-                if response.status == 404:
-                    raise DocumentNotFoundError(f"Document not found: {url}")
-                response.raise_for_status()
-                return await response.text()
+            return await http_client.get_text(
+                url,
+                source=self.cache_source,
+                timeout=self.config.timeout,
+                ttl=self.config.cache_ttl,
+            )
+
+        except OfflineCacheMiss as e:
+            raise NetworkError(str(e))
 
         except aiohttp.ClientResponseError as e:
             if e.status == 404:
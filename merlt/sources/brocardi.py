@@ -8,14 +8,23 @@ import aiohttp
 import asyncio
 import requests
 from bs4 import BeautifulSoup
-from aiocache import cached, Cache
-from aiocache.serializers import JsonSerializer
 
 from merlt.sources.utils.map import BROCARDI_CODICI
 from merlt.sources.utils.norma import NormaVisitata
 from merlt.sources.utils.text import normalize_act_type
 from merlt.sources.base import BaseScraper
-from merlt.sources.utils.http import http_client
+from merlt.sources.utils.http import OfflineCacheMiss, ThrottledError, http_client
+from merlt.sources.utils.brocardi_index import BrocardiArticleIndex
+from merlt.sources.utils.html_backend import (
+    Selector,
+    class_test,
+    element_string,
+    find_next_sibling,
+    first,
+    get_text,
+    parse_html,
+    resolve_html_backend,
+)
 
 # Configurazione del logger di modulo
 log = structlog.get_logger()
@@ -63,6 +72,20 @@ AUTORITA_GIUDIZIARIE = {
 # Pattern combinato per tutte le autorità (per il parsing)
 AUTORITA_PATTERN = '|'.join(f'({pattern})' for pattern in AUTORITA_GIUDIZIARIE.values())
 
+# Classe del contenitore principale della pagina articolo
+CONTENT_CLASS = 'panes-condensed panes-w-ads content-ext-guide content-mark'
+
+# Selettori del backend lxml (stessi match dei find() BeautifulSoup)
+_XP_BREADCRUMB = Selector(".//div[@id='breadcrumb']")
+_XP_CONTENT = Selector(f".//div[normalize-space(@class)='{CONTENT_CLASS}']")
+_XP_BROCARDI = Selector(f".//div[{class_test('brocardi-content')}]")
+_XP_RATIO = Selector(f".//div[{class_test('container-ratio')}]")
+_XP_CORPO_TESTO = Selector(f".//div[{class_test('corpoDelTesto')}]")
+_XP_H3 = Selector(".//h3")
+_XP_SENTENZE = Selector(f".//div[{class_test('sentenza')}]")
+_XP_STRONG = Selector(".//strong")
+_XP_PDF_BUTTON = Selector(f".//button[{class_test('button-download-pdf')}]")
+
 
 @dataclass
 class RequestConfig:
@@ -83,12 +106,38 @@ class RelazioneContent:
 
 
 class BrocardiScraper(BaseScraper):
-    def __init__(self) -> None:
+    """
+    Scraper Brocardi.it (spiegazioni, ratio, massime, relazioni).
+
+    I link agli articoli si risolvono con l'indice persistente per codice
+    (BrocardiArticleIndex): con auto_build_index=True il primo lookup su un
+    codice ne visita una volta l'albero delle sezioni, poi ogni articolo costa
+    una sola richiesta. Senza indice completo si ricade sulla scansione delle
+    sezioni (_find_article_link) e i link trovati vengono aggiunti all'indice.
+
+    Args:
+        article_index: Indice articoli (default: data/cache/brocardi/index)
+        auto_build_index: Costruisce l'indice del codice al primo lookup
+            (consigliato per run batch, sconsigliato per lookup singoli)
+        html_backend: Backend di estrazione delle pagine articolo, "lxml" o
+            "bs4" (default: default_html_backend())
+    """
+    cache_source = "brocardi"
+
+    def __init__(
+        self,
+        article_index: Optional[BrocardiArticleIndex] = None,
+        auto_build_index: bool = False,
+        html_backend: Optional[str] = None,
+    ) -> None:
         log.info("Initializing BrocardiScraper")
         self.knowledge: List[Dict[str, Any]] = [BROCARDI_CODICI]
         self.request_config = RequestConfig()
         # Semaforo per limitare le richieste concorrenti
         self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self.article_index = article_index or BrocardiArticleIndex()
+        self.auto_build_index = auto_build_index
+        self.html_backend = resolve_html_backend(html_backend)
 
     @staticmethod
     def _clean_text(text: str) -> str:
@@ -131,6 +180,20 @@ class BrocardiScraper(BaseScraper):
             Dict with: autorita, numero, anno, massima (text)
             or None if parsing fails
         """
+        try:
+            header = sentenza_div.find('strong')
+            header_text = header.get_text(strip=True) if header else None
+            return self._parse_massima_text(header_text, sentenza_div.get_text())
+        except Exception as e:
+            log.warning(f"Error parsing massima: {e}")
+
+        return None
+
+    def _parse_massima_text(self, header_text: Optional[str], text: str) -> Optional[Dict[str, Any]]:
+        """
+        Parsa una massima dal testo dell'header (<strong>) e dal testo completo
+        del div sentenza (comune ai backend bs4 e lxml).
+        """
         try:
             result = {
                 'autorita': None,
@@ -139,11 +202,8 @@ class BrocardiScraper(BaseScraper):
                 'massima': None
             }
 
-            # Find the header with case number (usually in <strong>)
-            header = sentenza_div.find('strong')
-            if header:
-                header_text = header.get_text(strip=True)
-
+            # Header with case number (usually in <strong>)
+            if header_text is not None:
                 # Pattern generico: (Autorita) n. (Numero)/(Anno)
                 # Supporta tutte le autorità definite in AUTORITA_GIUDIZIARIE
                 match = re.match(
@@ -185,7 +245,7 @@ class BrocardiScraper(BaseScraper):
                             result['autorita'] = fallback_match.group(1).strip().rstrip('.')
 
             # Get full text (excluding the header)
-            full_text = self._clean_text(sentenza_div.get_text())
+            full_text = self._clean_text(text)
 
             # Remove the header part from the text to get just the massima
             if result['numero'] and result['anno']:
@@ -209,21 +269,30 @@ class BrocardiScraper(BaseScraper):
                                        config: RequestConfig = None) -> Optional[str]:
         """
         Effettua una richiesta HTTP con retry automatico e gestione errori migliorata.
+
+        Le risposte passano dalla response cache persistente (http_client.get_text).
         """
         if config is None:
             config = self.request_config
             
         for attempt in range(config.retry_attempts + 1):
+            retry_after = 0.0
             try:
                 # Acquisisce il semaforo per limitare le richieste concorrenti
                 async with self.semaphore:
                     timeout = aiohttp.ClientTimeout(total=config.timeout)
                     log.debug(f"Attempting request {attempt + 1}/{config.retry_attempts + 1} to: {url}")
                     
-                    async with session.get(url, timeout=timeout) as response:
-                        response.raise_for_status()
-                        return await response.text()
-                        
+                    return await http_client.get_text(
+                        url, source=self.cache_source, timeout=timeout
+                    )
+
+            except OfflineCacheMiss as e:
+                log.warning(str(e))
+                return None
+            except ThrottledError as e:
+                log.warning(f"Throttled for URL {url} on attempt {attempt + 1}: {e}")
+                retry_after = e.retry_after or 0.0
             except asyncio.TimeoutError:
                 log.warning(f"Timeout for URL {url} on attempt {attempt + 1}")
             except aiohttp.ClientError as e:
@@ -233,14 +302,14 @@ class BrocardiScraper(BaseScraper):
             
             # Se non è l'ultimo tentativo, aspetta prima di riprovare
             if attempt < config.retry_attempts:
-                wait_time = config.retry_delay * (2 ** attempt)  # Exponential backoff
+                # Exponential backoff, almeno il Retry-After indicato dal server
+                wait_time = max(config.retry_delay * (2 ** attempt), retry_after)
                 log.debug(f"Waiting {wait_time}s before retry...")
                 await asyncio.sleep(wait_time)
         
         log.error(f"Failed to fetch {url} after {config.retry_attempts + 1} attempts")
         return None
 
-    @cached(ttl=86400, cache=Cache.MEMORY, serializer=JsonSerializer())
     async def do_know(self, norma_visitata: NormaVisitata) -> Optional[Tuple[str, str]]:
         log.info(f"Checking if knowledge exists for norma: {norma_visitata}")
 
@@ -278,7 +347,6 @@ class BrocardiScraper(BaseScraper):
         log.warning(f"No knowledge found for norma: {norma_visitata}")
         return None
 
-    @cached(ttl=86400, cache=Cache.MEMORY, serializer=JsonSerializer())
     async def look_up(self, norma_visitata: NormaVisitata) -> Optional[str]:
         log.info(f"Looking up norma: {norma_visitata}")
 
@@ -288,7 +356,18 @@ class BrocardiScraper(BaseScraper):
             return None
 
         link: str = norma_info[1]
-        
+
+        numero_articolo: Optional[str] = (
+            norma_visitata.numero_articolo.replace('-', '')
+            if norma_visitata.numero_articolo else None
+        )
+
+        if numero_articolo:
+            indexed_link = await self._indexed_article_link(link, numero_articolo)
+            if indexed_link:
+                log.info(f"Article link found in index: {indexed_link}")
+                return indexed_link
+
         session = await http_client.get_session()
         log.info(f"Requesting main link: {link}")
         html_text = await self._make_request_with_retry(session, link)
@@ -298,18 +377,49 @@ class BrocardiScraper(BaseScraper):
             
         soup: BeautifulSoup = BeautifulSoup(html_text, 'html.parser')
 
-        numero_articolo: Optional[str] = (
-            norma_visitata.numero_articolo.replace('-', '')
-            if norma_visitata.numero_articolo else None
-        )
-        
         if numero_articolo:
             article_link = await self._find_article_link(soup, BASE_URL, numero_articolo, session)
+            if article_link:
+                self.article_index.add(link, numero_articolo, article_link)
             return article_link
             
         log.info("No article number provided")
         return None
 
+    async def _indexed_article_link(self, codice_link: str, numero_articolo: str) -> Optional[str]:
+        """
+        Link dell'articolo dall'indice del codice (None se non indicizzato).
+
+        Con auto_build_index l'indice viene costruito al primo lookup sul
+        codice; i lookup concorrenti attendono la stessa build.
+        """
+        article_link = self.article_index.get(codice_link, numero_articolo)
+        if article_link or not self.auto_build_index:
+            return article_link
+
+        async with self.article_index.lock(codice_link):
+            if not self.article_index.is_complete(codice_link):
+                await self.build_article_index(codice_link)
+        return self.article_index.get(codice_link, numero_articolo)
+
+    async def build_article_index(self, codice_link: str) -> Dict[str, str]:
+        """
+        Costruisce e salva l'indice articoli di un codice.
+
+        Args:
+            codice_link: Pagina Brocardi del codice (valori di BROCARDI_CODICI)
+
+        Returns:
+            Dict numero articolo -> URL
+        """
+        session = await http_client.get_session()
+        log.info(f"Building Brocardi article index for {codice_link}")
+        return await self.article_index.build(
+            codice_link,
+            lambda url: self._make_request_with_retry(session, url),
+            concurrency=MAX_CONCURRENT_REQUESTS,
+        )
+
     async def _find_article_link(self, soup: BeautifulSoup, base_url: str, numero_articolo: str, 
                                  session: aiohttp.ClientSession) -> Optional[str]:
         """
@@ -378,10 +488,6 @@ class BrocardiScraper(BaseScraper):
                 log.error(f"Unexpected error in batch {i//batch_size + 1}: {e}")
                 continue
 
-            # Piccola pausa tra i batch per essere rispettosi verso il server
-            if i + batch_size < len(section_links):
-                await asyncio.sleep(0.5)
-
         log.info(f"No matching article found for {numero_articolo} after checking sections")
         return None
 
@@ -431,14 +537,10 @@ class BrocardiScraper(BaseScraper):
                 log.error(f"Failed to retrieve content for norma link: {norma_link}")
                 return None, {}, None
 
-            soup = BeautifulSoup(html_text, 'html.parser')
-
-            info: Dict[str, Any] = {}
-            info['Position'] = self._extract_position(soup)
-            self._extract_sections(soup, info)
+            info, object_id = self.extract_info(html_text)
 
             # Estrai Relazioni storiche (Guardasigilli)
-            relazioni = await self._extract_relazioni(soup, session)
+            relazioni = await self._extract_relazioni(object_id, session)
             if relazioni:
                 info['Relazioni'] = [
                     {
@@ -459,17 +561,42 @@ class BrocardiScraper(BaseScraper):
             log.error(f"Unexpected error in get_info for {norma_visitata}: {e}")
             return None, {}, None
 
+    def extract_info(self, html_text: str) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Estrae posizione e sezioni da una pagina articolo con il backend configurato.
+
+        Returns:
+            Tuple con:
+            - Dict con Position e le sezioni presenti (Brocardi, Ratio,
+              Spiegazione, Massime, RelazioneCostituzione)
+            - object_id della pagina per le Relazioni (None se assente)
+        """
+        info: Dict[str, Any] = {}
+        if self.html_backend == "lxml":
+            root = parse_html(html_text)
+            info['Position'] = self._extract_position_lxml(root)
+            self._extract_sections_lxml(root, info)
+            return info, self._extract_object_id_lxml(root, html_text)
+
+        soup = BeautifulSoup(html_text, 'html.parser')
+        info['Position'] = self._extract_position(soup)
+        self._extract_sections(soup, info)
+        return info, self._extract_object_id(soup)
+
+    def _clean_position(self, text: str) -> Optional[str]:
+        # Pulisci e normalizza il breadcrumb
+        position = self._clean_text(text)
+        # Rimuovi prefisso "Brocardi.it > "
+        if position.startswith("Brocardi.it"):
+            position = position[17:].strip(" >")
+        return position if position else None
+
     def _extract_position(self, soup: BeautifulSoup) -> Optional[str]:
         """Estrae la posizione dal breadcrumb."""
         try:
             position_tag = soup.find('div', id='breadcrumb', recursive=True)
             if position_tag:
-                # Pulisci e normalizza il breadcrumb
-                position = self._clean_text(position_tag.get_text())
-                # Rimuovi prefisso "Brocardi.it > "
-                if position.startswith("Brocardi.it"):
-                    position = position[17:].strip(" >")
-                return position if position else None
+                return self._clean_position(position_tag.get_text())
         except Exception as e:
             log.warning(f"Error extracting position: {e}")
 
@@ -479,7 +606,7 @@ class BrocardiScraper(BaseScraper):
     def _extract_sections(self, soup: BeautifulSoup, info: Dict[str, Any]) -> None:
         """Estrae le sezioni del contenuto con gestione errori migliorata."""
         try:
-            corpo = soup.find('div', class_='panes-condensed panes-w-ads content-ext-guide content-mark', recursive=True)
+            corpo = soup.find('div', class_=CONTENT_CLASS, recursive=True)
             if not corpo:
                 log.warning("Main content section not found")
                 return
@@ -552,6 +679,92 @@ class BrocardiScraper(BaseScraper):
         except Exception as e:
             log.error(f"Unexpected error in _extract_sections: {e}")
 
+    # ─────────────────────────────────────────────────────────────────────
+    # Backend lxml: stesse sezioni e stesso testo dei metodi BeautifulSoup
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _extract_position_lxml(self, root) -> Optional[str]:
+        try:
+            position_tag = first(_XP_BREADCRUMB(root)) if root is not None else None
+            if position_tag is not None:
+                return self._clean_position(get_text(position_tag))
+        except Exception as e:
+            log.warning(f"Error extracting position: {e}")
+
+        log.warning("Breadcrumb position not found")
+        return None
+
+    @staticmethod
+    def _section_after_header(corpo, title: str):
+        # h3 con testo (Tag.string) contenente il titolo -> primo div.text successivo
+        for header in _XP_H3(corpo):
+            text = element_string(header)
+            if text and title in text:
+                return find_next_sibling(header, 'div', 'text')
+        return None
+
+    def _extract_sections_lxml(self, root, info: Dict[str, Any]) -> None:
+        try:
+            corpo = first(_XP_CONTENT(root)) if root is not None else None
+            if corpo is None:
+                log.warning("Main content section not found")
+                return
+
+            brocardi_sections = _XP_BROCARDI(corpo)
+            if brocardi_sections:
+                info['Brocardi'] = [self._clean_text(get_text(s)) for s in brocardi_sections]
+
+            ratio_section = first(_XP_RATIO(corpo))
+            if ratio_section is not None:
+                ratio_text = first(_XP_CORPO_TESTO(ratio_section))
+                if ratio_text is not None:
+                    info['Ratio'] = self._clean_text(get_text(ratio_text))
+
+            spiegazione_content = self._section_after_header(corpo, "Spiegazione dell'art")
+            if spiegazione_content is not None:
+                info['Spiegazione'] = self._clean_text(get_text(spiegazione_content))
+
+            massime_content = self._section_after_header(corpo, "Massime relative all'art")
+            if massime_content is not None:
+                info['Massime'] = []
+                for sentenza_div in _XP_SENTENZE(massime_content):
+                    header = first(_XP_STRONG(sentenza_div))
+                    header_text = get_text(header, strip=True) if header is not None else None
+                    parsed = self._parse_massima_text(header_text, get_text(sentenza_div))
+                    if parsed:
+                        info['Massime'].append(parsed)
+                log.debug(f"Extracted {len(info['Massime'])} massime")
+
+            relazione_content = self._section_after_header(
+                corpo, "Relazione al Progetto della Costituzione"
+            )
+            if relazione_content is not None:
+                info['RelazioneCostituzione'] = {
+                    'titolo': 'Relazione al Progetto della Costituzione',
+                    'autore': 'Meuccio Ruini',
+                    'anno': 1947,
+                    'testo': self._clean_text(get_text(relazione_content))
+                }
+                log.info("Extracted Relazione al Progetto della Costituzione")
+
+        except Exception as e:
+            log.error(f"Unexpected error in _extract_sections_lxml: {e}")
+
+    def _extract_object_id_lxml(self, root, html_text: str) -> Optional[str]:
+        try:
+            button = first(_XP_PDF_BUTTON(root)) if root is not None else None
+            if button is not None and button.get('data-object-id'):
+                return button.get('data-object-id')
+
+            match = re.search(r'hierarchy-paragraphs:(\d+):', html_text)
+            if match:
+                return match.group(1)
+
+        except Exception as e:
+            log.warning(f"Error extracting object_id: {e}")
+
+        return None
+
     def _build_norma_string(self, norma_visitata: Union[NormaVisitata, str]) -> Optional[str]:
         """Costruisce la stringa della norma per la ricerca."""
         try:
@@ -608,9 +821,9 @@ class BrocardiScraper(BaseScraper):
             }
             async with self.semaphore:
                 timeout = aiohttp.ClientTimeout(total=self.request_config.timeout)
-                async with session.get(url, timeout=timeout, headers=headers) as response:
-                    if response.status == 200:
-                        return await response.text()
+                return await http_client.get_text(
+                    url, source=self.cache_source, headers=headers, timeout=timeout
+                )
         except Exception as e:
             log.warning(f"Error fetching relazione (type={content_type}): {e}")
 
@@ -672,10 +885,13 @@ class BrocardiScraper(BaseScraper):
 
         return None
 
-    async def _extract_relazioni(self, soup: BeautifulSoup,
+    async def _extract_relazioni(self, object_id: Optional[str],
                                   session: aiohttp.ClientSession) -> List[RelazioneContent]:
         """
-        Estrae le Relazioni storiche (Guardasigilli) dalla pagina.
+        Estrae le Relazioni storiche (Guardasigilli) della pagina.
+
+        Args:
+            object_id: ID dell'articolo su Brocardi (da extract_info)
 
         Returns:
             Lista di RelazioneContent con i testi delle relazioni e gli articoli citati
@@ -683,7 +899,6 @@ class BrocardiScraper(BaseScraper):
         relazioni = []
 
         try:
-            object_id = self._extract_object_id(soup)
             if not object_id:
                 log.debug("No object_id found, skipping relazioni extraction")
                 return relazioni
@@ -1,7 +1,5 @@
 import structlog
 import os
-from aiocache import cached, Cache
-from aiocache.serializers import JsonSerializer
 from merlt.sources.utils.map import EURLEX
 from merlt.sources.base import BaseScraper
 
@@ -9,7 +7,10 @@ from merlt.sources.base import BaseScraper
 log = structlog.get_logger()
 
 class EurlexScraper(BaseScraper):
+    cache_source = "eurlex"
+
     def __init__(self):
+        super().__init__()
         self.base_url = 'https://eur-lex.europa.eu/eli'
         log.info("EurlexScraper initialized")
 
@@ -25,7 +26,6 @@ class EurlexScraper(BaseScraper):
         
         return uri
 
-    @cached(ttl=86400, cache=Cache.MEMORY, serializer=JsonSerializer())
     async def get_document(self, normavisitata=None, act_type=None, article=None, year=None, num=None, urn=None):
         log.info(f"Fetching EUR-Lex document with parameters {normavisitata.to_dict()}: act_type={act_type}, article={article}, year={year}, num={num}, urn={urn}")
 
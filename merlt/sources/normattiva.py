@@ -4,18 +4,65 @@ from typing import Tuple, Optional, Union, Dict, Any, List
 from datetime import datetime
 
 from bs4 import BeautifulSoup, NavigableString, Tag
-from aiocache import cached, Cache
-from aiocache.serializers import JsonSerializer
 
 from merlt.sources.utils.norma import NormaVisitata, Modifica, TipoModifica, StoriaArticolo
 from merlt.sources.base import BaseScraper
 from merlt.sources.utils.urn import generate_urn
 from merlt.sources.utils.text import normalize_act_type
+from merlt.sources.utils.html_backend import (
+    Selector,
+    class_test,
+    first,
+    get_text,
+    is_element,
+    node_tail,
+    node_text,
+    parse_html,
+    resolve_html_backend,
+)
 
 # Configurazione del logger di modulo
 log = structlog.get_logger()
 
 
+# Selettori del backend lxml (stessi match dei find() BeautifulSoup)
+_XP_BODY = Selector(f".//div[{class_test('bodyTesto')}]")
+_XP_HAS_COMMA = Selector(f"boolean(.//*[{class_test('art-comma-div-akn')}])")
+_XP_HAS_JUST_TEXT = Selector(f"boolean(.//*[{class_test('art-just-text-akn')}])")
+_XP_HAS_ATTACHMENT = Selector(f"boolean(.//*[{class_test('attachment-just-text')}])")
+_XP_COMMI = Selector(f".//div[{class_test('art-comma-div-akn')}]")
+_XP_JUST_TEXT = Selector(f".//span[{class_test('art-just-text-akn')}]")
+_XP_ATTACHMENT = Selector(f".//span[{class_test('attachment-just-text')}]")
+_XP_AGGIORNAMENTI = Selector(f".//div[{class_test('art_aggiornamento-akn')}]")
+_XP_ARTICLE_NUM = Selector(f".//h2[{class_test('article-num-akn')}]")
+_XP_ARTICLE_HEADING = Selector(f".//div[{class_test('article-heading-akn')}]")
+
+
+def _text_recursive_lxml(element, link: bool, link_dict: Dict[str, str]) -> str:
+    """Come NormattivaScraper.extract_text_recursive, su un elemento lxml."""
+    text_parts = [node_text(element)]
+
+    for child in element:
+        if not is_element(child):
+            # Commenti: NavigableString per BeautifulSoup, inclusi nel testo
+            text_parts.append(node_text(child))
+        elif child.tag == 'br':
+            text_parts.append('\n')
+        elif child.tag == 'p':
+            text_parts.append(_text_recursive_lxml(child, link, link_dict) + '\n')
+        elif child.tag == 'li':
+            text_parts.append(' - ' + _text_recursive_lxml(child, link, link_dict) + '\n')
+        elif child.tag == 'a':
+            if link:
+                link_dict[get_text(child, strip=True)] = child.get('href', '').strip()
+            text_parts.append(_text_recursive_lxml(child, link, link_dict))
+        else:
+            text_parts.append(_text_recursive_lxml(child, link, link_dict))
+        text_parts.append(node_tail(child))
+
+    return ''.join(text_parts)
+
+
 # Thread-safe singleton per LLM service
 import asyncio
 from functools import lru_cache
@@ -272,6 +319,8 @@ class NormattivaScraper(BaseScraper):
         >>> text, urn = await scraper.get_document(nv)
     """
 
+    cache_source = "normattiva"
+
     def __init__(self, config: Optional["ScraperConfig"] = None) -> None:
         """
         Inizializza NormattivaScraper.
@@ -284,9 +333,13 @@ class NormattivaScraper(BaseScraper):
         super().__init__(config or ScraperConfig())
 
         self.base_url: str = "https://www.normattiva.it/"
-        log.info("NormattivaScraper initialized", timeout=self.config.timeout)
+        self.html_backend: str = resolve_html_backend(self.config.html_backend)
+        log.info(
+            "NormattivaScraper initialized",
+            timeout=self.config.timeout,
+            html_backend=self.html_backend,
+        )
 
-    @cached(ttl=86400, cache=Cache.MEMORY, serializer=JsonSerializer())
     async def get_document(self, normavisitata: NormaVisitata) -> Tuple[str, str]:
         log.info(f"Fetching Normattiva document for: {normavisitata}")
         urn: str = normavisitata.urn
@@ -307,6 +360,8 @@ class NormattivaScraper(BaseScraper):
     async def estrai_da_html(
         self, atto: str, comma: Optional[str] = None, get_link_dict: bool = False
     ) -> Union[str, Dict[str, Any]]:
+        if self.html_backend == "lxml":
+            return self._estrai_da_html_lxml(atto, link=get_link_dict)
         try:
             soup: BeautifulSoup = self.parse_document(atto)
             corpo: Optional[Tag] = soup.find('div', class_='bodyTesto')
@@ -449,6 +504,76 @@ class NormattivaScraper(BaseScraper):
     def parse_document(self, atto: str) -> BeautifulSoup:
         return BeautifulSoup(atto, 'html.parser')
 
+    # ─────────────────────────────────────────────────────────────────────
+    # Backend lxml: stessi scenari e stesso testo dei metodi BeautifulSoup
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _estrai_da_html_lxml(self, atto: str, link: bool = False) -> Union[str, Dict[str, Any]]:
+        try:
+            root = parse_html(atto)
+            corpo = first(_XP_BODY(root)) if root is not None else None
+            if corpo is None:
+                log.warning("Body of the document not found")
+                return "Body of the document not found"
+
+            if _XP_HAS_COMMA(corpo):
+                return self._format_testo_lxml(
+                    corpo, _XP_COMMI(corpo), link, "Articolo non trovato", separator='\n\n'
+                )
+            elif _XP_HAS_JUST_TEXT(corpo):
+                return self._format_testo_lxml(corpo, _XP_JUST_TEXT(corpo)[:1], link, "")
+            elif _XP_HAS_ATTACHMENT(corpo):
+                return self._estrai_testo_allegato_lxml(corpo, link)
+            else:
+                log.warning("Unknown formatting structure")
+                return "Unknown formatting structure"
+        except Exception as e:
+            log.error(f"Generic error: {e}", exc_info=True)
+            return f"Generic error: {e}"
+
+    def _format_testo_lxml(
+        self,
+        corpo,
+        parts: List[Any],
+        link: bool,
+        missing_number: str,
+        separator: str = "",
+    ) -> Union[str, Dict[str, Any]]:
+        # Scenari 1 (commi AKN) e 2 (testo semplice AKN): numero, rubrica, contenuto
+        link_dict: Dict[str, str] = {}
+        number_tag = first(_XP_ARTICLE_NUM(corpo))
+        title_tag = first(_XP_ARTICLE_HEADING(corpo))
+        article_number = get_text(number_tag, strip=True) if number_tag is not None else missing_number
+        article_title = get_text(title_tag, strip=True) if title_tag is not None else ""
+
+        final_text = f"{article_number}\n{article_title}\n\n"
+        for part in parts:
+            final_text += _text_recursive_lxml(part, link, link_dict).strip() + separator
+
+        final_text = re.sub(r'\n{3,}', '\n\n', final_text).strip()
+        final_text = re.sub(r'[ \t]+', ' ', final_text)
+
+        if link:
+            return {"testo": final_text, "link": link_dict}
+        return final_text
+
+    def _estrai_testo_allegato_lxml(self, corpo, link: bool = False) -> Union[str, Dict[str, Any]]:
+        link_dict: Dict[str, str] = {}
+        final_text = ""
+        attachment = first(_XP_ATTACHMENT(corpo))
+        if attachment is not None:
+            final_text += _text_recursive_lxml(attachment, link, link_dict).strip()
+
+        for aggiornamento in _XP_AGGIORNAMENTI(corpo):
+            final_text += '\n\n' + _text_recursive_lxml(aggiornamento, link, link_dict).strip()
+
+        final_text = re.sub(r'\n{3,}', '\n\n', final_text).strip()
+        final_text = re.sub(r'[ \t]+', ' ', final_text)
+
+        if link:
+            return {"testo": final_text, "link": link_dict}
+        return final_text
+
     async def get_amendment_history(
         self, normavisitata: NormaVisitata, filter_article: bool = True
     ) -> List[Modifica]:
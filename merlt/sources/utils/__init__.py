@@ -6,10 +6,13 @@ Utilità per gli scrapers: parsing URN, estrazione struttura, operazioni testo.
 
 Componenti:
 - norma: NormaVisitata, Modifica, TipoModifica, StoriaArticolo
-- urn: generate_urn, parse_urn
-- tree: NormTree, get_article_position, get_hierarchical_tree
+- urn: generate_urn, generate_urns, parse_urn
+- act_dates: Date degli atti da (tipo, anno, numero), tabella + store + HTTP
+- tree: NormTree, NormTreeStore, get_article_position, get_hierarchical_tree
 - text: normalize_act_type, clean_text
 - http: HTTP client utilities
+- rate_limit: Rate limiter per host condiviso (token bucket, AIMD)
+- html_backend: Estrazione HTML con lxml (alternativa a BeautifulSoup)
 - map: Mappature codici (BROCARDI_CODICI, etc.)
 """
 
@@ -19,10 +22,12 @@ from merlt.sources.utils.norma import (
     TipoModifica,
     StoriaArticolo,
 )
-from merlt.sources.utils.urn import generate_urn
+from merlt.sources.utils.urn import generate_urn, generate_urns
 from merlt.sources.utils.tree import (
     NormTree,
+    NormTreeStore,
     get_article_position,
+    get_cached_hierarchical_tree,
     get_hierarchical_tree,
 )
 from merlt.sources.utils.text import normalize_act_type
@@ -36,9 +41,12 @@ __all__ = [
     "StoriaArticolo",
     # URN
     "generate_urn",
+    "generate_urns",
     # Tree
     "NormTree",
+    "NormTreeStore",
     "get_article_position",
+    "get_cached_hierarchical_tree",
     "get_hierarchical_tree",
     # Text
     "normalize_act_type",
@@ -0,0 +1,377 @@
+"""
+Date degli Atti
+===============
+
+Completamento della data di un atto noto solo per tipo, numero e anno
+("d.lgs. 206/2005" -> 2005-09-06), necessario per costruire l'URN Normattiva.
+
+Prima complete_date apriva un browser Selenium, cercava l'atto sul sito e
+leggeva il primo risultato: secondi per lookup, nessuna cache reale
+(``lru_cache`` non si applica a una coroutine). L'ordine di risoluzione ora è:
+
+1. Cache in memoria del processo (LRU, con cache negativa a tempo)
+2. Tabella inclusa nel pacchetto (NORMATTIVA_URN_CODICI + NORMATTIVA_DATE_ATTI)
+3. Store SQLite locale con le date già risolte (aggiornabile con load_table)
+4. Richiesta HTTP all'URN Normattiva con solo l'anno
+   (``urn:nir:stato:legge:1990;241``), che il resolver di Normattiva
+   reindirizza all'atto; la data si legge dal titolo della pagina
+
+Lookup concorrenti della stessa chiave condividono una sola richiesta.
+
+Usage:
+    from merlt.sources.utils.act_dates import act_date_resolver
+
+    await act_date_resolver.resolve("decreto legislativo", "2005", "206")
+    # '2005-09-06'
+"""
+
+import asyncio
+import json
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Awaitable, Callable, Dict, Iterable, Mapping, Optional, Tuple, Union
+
+import structlog
+
+from merlt.sources.utils.config import MAX_CACHE_SIZE
+from merlt.sources.utils.map import NORMATTIVA_DATE_ATTI, NORMATTIVA_URN_CODICI
+from merlt.sources.utils.text import normalize_act_type, parse_date
+
+log = structlog.get_logger()
+
+DEFAULT_STORE_PATH = "data/cache/act_dates.sqlite"
+
+NORMATTIVA_URN_BASE = "https://www.normattiva.it/uri-res/N2Ls?urn:nir:stato:"
+
+# Un atto non trovato viene ritentato dopo un'ora
+DEFAULT_NEGATIVE_TTL = 3600
+
+_MESI = (
+    "gennaio|febbraio|marzo|aprile|maggio|giugno|luglio|"
+    "agosto|settembre|ottobre|novembre|dicembre"
+)
+_DATE_PATTERN = re.compile(rf"\b(\d{{1,2}})\s*[°º]?\s+({_MESI})\s+(\d{{4}})\b", re.IGNORECASE)
+_TAG = re.compile(r"<[^>]+>")
+_URN_DATE = re.compile(r"^([a-z.]+):(\d{4})-(\d{2})-(\d{2});(\d+)")
+
+FetchText = Callable[[str], Awaitable[str]]
+
+
+def act_key(act_type: str, year: Union[str, int], number: Union[str, int]) -> str:
+    """
+    Chiave di un atto nel formato URN senza data ("decreto.legislativo:2005;206").
+
+    Il tipo è normalizzato con normalize_act_type e scritto con i punti,
+    così "d.lgs.", "decreto legislativo" e "decreto.legislativo" coincidono.
+    """
+    tipo = normalize_act_type(str(act_type)).lower()
+    tipo = re.sub(r"[\s.]+", ".", tipo).strip(".")
+    return f"{tipo}:{str(year).strip()};{str(number).strip().lower()}"
+
+
+def _bundled_table() -> Dict[str, str]:
+    table: Dict[str, str] = {}
+    for urn in NORMATTIVA_URN_CODICI.values():
+        match = _URN_DATE.match(urn)
+        if match:
+            tipo, year, month, day, number = match.groups()
+            table[f"{tipo}:{year};{number}"] = f"{year}-{month}-{day}"
+    table.update(NORMATTIVA_DATE_ATTI)
+    return table
+
+
+BUNDLED_ACT_DATES = _bundled_table()
+
+
+def extract_act_date(html: str, year: Union[str, int], number: Union[str, int, None] = None) -> Optional[str]:
+    """
+    Data dell'atto dal titolo della pagina Normattiva.
+
+    Preferisce una data seguita da ", n. <numero>" (come nel titolo
+    "DECRETO LEGISLATIVO 6 settembre 2005, n. 206"), altrimenti la prima data
+    dell'anno atteso.
+
+    Returns:
+        Data ISO o None se non trovata
+    """
+    text = " ".join(_TAG.sub(" ", html).split())
+    year = str(year).strip()
+
+    candidates = [m for m in _DATE_PATTERN.finditer(text) if m.group(3) == year]
+    if not candidates:
+        return None
+
+    best = candidates[0]
+    if number is not None:
+        numbered = re.compile(rf"\s*,?\s*n\.?\s*{re.escape(str(number).strip())}\b", re.IGNORECASE)
+        for match in candidates:
+            if numbered.match(text, match.end()):
+                best = match
+                break
+
+    day, month, _ = best.groups()
+    try:
+        return parse_date(f"{day} {month.lower()} {year}")
+    except ValueError:
+        return None
+
+
+class ActDateStore:
+    """
+    Date degli atti risolte, su file SQLite.
+
+    Args:
+        path: File SQLite (creato se non esiste); ":memory:" per test
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_STORE_PATH):
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS act_dates ("
+            "key TEXT PRIMARY KEY, date TEXT NOT NULL, "
+            "source TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Data ISO dell'atto o None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT date FROM act_dates WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, date: str, source: str = "normattiva") -> None:
+        """Registra (o sovrascrive) la data di un atto."""
+        self.put_many({key: date}, source=source)
+
+    def put_many(self, dates: Mapping[str, str], source: str = "normattiva") -> int:
+        """
+        Registra più date in una transazione.
+
+        Returns:
+            Numero di righe scritte
+        """
+        if not dates:
+            return 0
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO act_dates (key, date, source, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                [(key, date, source, now) for key, date in dates.items()],
+            )
+            self._conn.commit()
+        return len(dates)
+
+    def load_table(self, table: Union[str, Path, Mapping[str, str]], source: str = "table") -> int:
+        """
+        Importa una tabella di date (dict o file JSON {chiave: data ISO}).
+
+        Le chiavi sono nel formato di act_key; le date vengono validate
+        con parse_date.
+
+        Returns:
+            Numero di righe importate
+        """
+        if not isinstance(table, Mapping):
+            table = json.loads(Path(table).read_text(encoding="utf-8"))
+        dates = {str(key): parse_date(str(date)) for key, date in table.items()}
+        count = self.put_many(dates, source=source)
+        log.info(f"ActDateStore: loaded {count} act dates from {source}")
+        return count
+
+    def items(self) -> Iterable[Tuple[str, str]]:
+        """Coppie (chiave, data) registrate."""
+        with self._lock:
+            return self._conn.execute("SELECT key, date FROM act_dates ORDER BY key").fetchall()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM act_dates").fetchone()[0]
+
+    def close(self) -> None:
+        """Chiude la connessione SQLite."""
+        with self._lock:
+            self._conn.close()
+
+    def __repr__(self) -> str:
+        return f"ActDateStore(path={self.path})"
+
+
+class ActDateResolver:
+    """
+    Risolve la data completa di un atto da (tipo, anno, numero).
+
+    La cache in memoria è condivisa tra thread e loop (generate_urn esegue
+    la coroutine in un loop proprio); la deduplicazione delle richieste in
+    corso vale invece per il singolo loop.
+
+    Args:
+        store: Store SQLite (default: aperto su DEFAULT_STORE_PATH al primo uso)
+        fetch: Coroutine url -> HTML (default: http_client.get_text, con cache HTTP)
+        table: Tabella inclusa (default: BUNDLED_ACT_DATES)
+        max_size: Voci massime nella cache in memoria
+        negative_ttl: Secondi prima di ritentare un atto non trovato
+    """
+
+    def __init__(
+        self,
+        store: Optional[ActDateStore] = None,
+        fetch: Optional[FetchText] = None,
+        table: Optional[Mapping[str, str]] = None,
+        max_size: int = MAX_CACHE_SIZE,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+    ):
+        self._store = store
+        self._fetch = fetch
+        self.table = dict(BUNDLED_ACT_DATES if table is None else table)
+        self.max_size = max_size
+        self.negative_ttl = negative_ttl
+
+        self._lock = Lock()
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._misses: Dict[str, float] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {"memory": 0, "table": 0, "store": 0, "http": 0, "not_found": 0}
+
+    @property
+    def store(self) -> ActDateStore:
+        if self._store is None:
+            self._store = ActDateStore()
+        return self._store
+
+    async def resolve(
+        self,
+        act_type: str,
+        year: Union[str, int],
+        number: Union[str, int],
+    ) -> Optional[str]:
+        """
+        Data ISO dell'atto o None se non risolvibile.
+
+        Raises:
+            Eccezioni di rete del fetch (non vengono messe in cache)
+        """
+        key = act_key(act_type, year, number)
+
+        cached = self._cached(key)
+        if cached is not None:
+            self.stats["memory"] += 1
+            return cached
+        if self._recent_miss(key):
+            return None
+
+        date = self.table.get(key)
+        if date is not None:
+            self.stats["table"] += 1
+            self._remember(key, date)
+            return date
+
+        date = self.store.get(key)
+        if date is not None:
+            self.stats["store"] += 1
+            self._remember(key, date)
+            return date
+
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(key)
+        if pending is not None and pending.get_loop() is loop:
+            return await asyncio.shield(pending)
+
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            date = await self._resolve_remote(key, year, number)
+        except BaseException as e:
+            future.set_exception(e)
+            # L'eccezione è già propagata al chiamante: evita il warning
+            # "exception never retrieved" se nessun altro era in attesa
+            future.exception()
+            raise
+        else:
+            future.set_result(date)
+            return date
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def _resolve_remote(self, key: str, year: Union[str, int], number: Union[str, int]) -> Optional[str]:
+        tipo = key.split(":", 1)[0]
+        url = f"{NORMATTIVA_URN_BASE}{tipo}:{str(year).strip()};{str(number).strip()}"
+        log.info(f"Resolving act date via {url}")
+
+        html = await self._fetch_text(url)
+        date = extract_act_date(html, year, number)
+        if date is None:
+            log.warning(f"Act date not found for {key}")
+            self.stats["not_found"] += 1
+            with self._lock:
+                self._misses[key] = time.monotonic()
+            return None
+
+        self.stats["http"] += 1
+        self.store.put(key, date, source="normattiva")
+        self._remember(key, date)
+        return date
+
+    async def _fetch_text(self, url: str) -> str:
+        if self._fetch is not None:
+            return await self._fetch(url)
+        from merlt.sources.utils.http import http_client
+        return await http_client.get_text(url, source="normattiva")
+
+    def _cached(self, key: str) -> Optional[str]:
+        with self._lock:
+            date = self._cache.get(key)
+            if date is not None:
+                self._cache.move_to_end(key)
+            return date
+
+    def _recent_miss(self, key: str) -> bool:
+        with self._lock:
+            missed_at = self._misses.get(key)
+            if missed_at is None:
+                return False
+            if time.monotonic() - missed_at < self.negative_ttl:
+                return True
+            del self._misses[key]
+            return False
+
+    def _remember(self, key: str, date: str) -> None:
+        with self._lock:
+            self._cache[key] = date
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+            self._misses.pop(key, None)
+
+    def clear_cache(self) -> None:
+        """Svuota la cache in memoria (positiva e negativa)."""
+        with self._lock:
+            self._cache.clear()
+            self._misses.clear()
+
+
+# Istanza condivisa usata da urn.complete_date
+act_date_resolver = ActDateResolver()
+
+
+__all__ = [
+    "ActDateResolver",
+    "ActDateStore",
+    "BUNDLED_ACT_DATES",
+    "act_date_resolver",
+    "act_key",
+    "extract_act_date",
+]
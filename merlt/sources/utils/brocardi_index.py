@@ -0,0 +1,279 @@
+"""
+Indice Articoli Brocardi
+========================
+
+Mappa numero articolo -> URL della pagina Brocardi, costruita una volta per
+codice e salvata su disco.
+
+Senza indice BrocardiScraper._find_article_link scansiona fino a 10 pagine di
+sezione per ogni articolo. L'indice si costruisce visitando una sola volta
+l'albero delle sezioni del codice (libro -> titolo -> capo -> ...) e
+raccogliendo tutti i link ``art<numero>.html``; dopo, la ricerca di un
+articolo costa un lookup in memoria e una sola richiesta (la pagina
+dell'articolo).
+
+I numeri sono normalizzati come in BrocardiScraper.look_up: minuscolo, senza
+trattini ("2645-bis" -> "2645bis").
+
+Usage:
+    from merlt.sources.utils.brocardi_index import BrocardiArticleIndex
+
+    index = BrocardiArticleIndex()
+    await index.build("https://www.brocardi.it/codice-civile/", fetch_html)
+    index.get("https://www.brocardi.it/codice-civile/", "1453")
+"""
+
+import asyncio
+import json
+import re
+import time
+from collections import deque
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+from urllib.parse import urljoin, urlsplit
+
+import structlog
+
+log = structlog.get_logger()
+
+DEFAULT_INDEX_DIR = "data/cache/brocardi/index"
+
+# Un codice viene ricostruito dopo 30 giorni (nuovi articoli bis/ter)
+DEFAULT_MAX_AGE = 30 * 86400
+
+# Limite di pagine di sezione visitate per codice
+DEFAULT_MAX_PAGES = 3000
+
+_ARTICLE_HREF = re.compile(r'href=["\']([^"\']*?art(\d+[a-z]*)\.html)["\']', re.IGNORECASE)
+_HREF = re.compile(r'href=["\']([^"\'#?]+)["\']', re.IGNORECASE)
+
+
+def normalize_article_number(numero_articolo: str) -> str:
+    """Numero articolo come chiave dell'indice ("2645-bis" -> "2645bis")."""
+    return numero_articolo.replace("-", "").replace(" ", "").lower()
+
+
+def extract_article_links(
+    html: str,
+    base_url: str,
+    root_url: Optional[str] = None,
+) -> Dict[str, str]:
+    """
+    Link agli articoli presenti in una pagina.
+
+    Con root_url vengono tenuti solo gli articoli sotto root_url: rinvii,
+    sidebar e massime possono linkare articoli di altri codici con lo
+    stesso numero.
+
+    Returns:
+        Dict numero normalizzato -> URL assoluto (vince il primo link)
+    """
+    root = _strip_host(root_url) if root_url else None
+    links: Dict[str, str] = {}
+    for href, numero in _ARTICLE_HREF.findall(html):
+        url = urljoin(base_url, href)
+        if root is not None and not _strip_host(url).startswith(root):
+            continue
+        links.setdefault(numero.lower(), url)
+    return links
+
+
+def extract_section_links(html: str, base_url: str, root_url: str) -> List[str]:
+    """
+    Link alle pagine di sezione sotto root_url (URL che terminano con '/').
+    """
+    root = _strip_host(root_url)
+    sections: List[str] = []
+    for href in _HREF.findall(html):
+        url = urljoin(base_url, href)
+        path = _strip_host(url)
+        if path.endswith("/") and path.startswith(root) and path != root:
+            sections.append(url)
+    return list(dict.fromkeys(sections))
+
+
+def _strip_host(url: str) -> str:
+    # www.brocardi.it e brocardi.it servono le stesse pagine
+    return urlsplit(url).path
+
+
+class BrocardiArticleIndex:
+    """
+    Indice persistente numero articolo -> URL, un file JSON per codice.
+
+    Args:
+        directory: Cartella dei file di indice
+        max_age: Età massima (secondi) oltre la quale un indice è scaduto
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path] = DEFAULT_INDEX_DIR,
+        max_age: Optional[int] = DEFAULT_MAX_AGE,
+    ):
+        self.directory = Path(directory)
+        self.max_age = max_age
+        self._indexes: Dict[str, Dict[str, str]] = {}
+        self._complete: Dict[str, bool] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    @staticmethod
+    def _key(root_url: str) -> str:
+        return _strip_host(root_url).strip("/") or "root"
+
+    def path_for(self, root_url: str) -> Path:
+        """File JSON dell'indice di un codice."""
+        return self.directory / f"{self._key(root_url).replace('/', '__')}.json"
+
+    def load(self, root_url: str) -> Optional[Dict[str, str]]:
+        """
+        Indice di un codice (memoria, poi disco).
+
+        Returns:
+            Dict numero -> URL, o None se assente o scaduto
+        """
+        key = self._key(root_url)
+        if key in self._indexes:
+            return self._indexes[key]
+
+        path = self.path_for(root_url)
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            log.warning(f"Unreadable Brocardi index {path}: {e}")
+            return None
+        if self.max_age is not None and time.time() - data.get("built_at", 0) > self.max_age:
+            log.info(f"Brocardi index expired: {path}")
+            return None
+
+        self._indexes[key] = data.get("articles", {})
+        self._complete[key] = data.get("complete", True)
+        return self._indexes[key]
+
+    def get(self, root_url: str, numero_articolo: str) -> Optional[str]:
+        """URL dell'articolo dall'indice (None se non indicizzato)."""
+        articles = self.load(root_url)
+        if not articles:
+            return None
+        return articles.get(normalize_article_number(numero_articolo))
+
+    def is_complete(self, root_url: str) -> bool:
+        """True se l'indice del codice è stato costruito con build()."""
+        if self.load(root_url) is None:
+            return False
+        return self._complete.get(self._key(root_url), False)
+
+    def save(self, root_url: str, articles: Dict[str, str], complete: bool = True) -> Path:
+        """
+        Salva (sovrascrive) l'indice di un codice.
+
+        Args:
+            complete: False per indici parziali (solo link aggiunti con add())
+        """
+        path = self.path_for(root_url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps(
+                {
+                    "root": root_url,
+                    "built_at": time.time(),
+                    "complete": complete,
+                    "articles": articles,
+                },
+                ensure_ascii=False,
+                sort_keys=True,
+            ),
+            encoding="utf-8",
+        )
+        tmp.replace(path)
+        self._indexes[self._key(root_url)] = articles
+        self._complete[self._key(root_url)] = complete
+        return path
+
+    def add(self, root_url: str, numero_articolo: str, url: str) -> None:
+        """
+        Aggiunge un singolo link (es. trovato dalla scansione di fallback).
+
+        Se l'indice del codice non esiste ancora viene creato parziale.
+        """
+        complete = self.is_complete(root_url)
+        articles = dict(self.load(root_url) or {})
+        key = normalize_article_number(numero_articolo)
+        if articles.get(key) == url:
+            return
+        articles[key] = url
+        self.save(root_url, articles, complete=complete)
+
+    def lock(self, root_url: str) -> asyncio.Lock:
+        """Lock per codice: una sola build concorrente."""
+        return self._locks.setdefault(self._key(root_url), asyncio.Lock())
+
+    async def build(
+        self,
+        root_url: str,
+        fetch: Callable[[str], Awaitable[Optional[str]]],
+        max_pages: int = DEFAULT_MAX_PAGES,
+        concurrency: int = 4,
+    ) -> Dict[str, str]:
+        """
+        Visita l'albero delle sezioni di un codice e salva l'indice.
+
+        Visita in ampiezza a partire da root_url, seguendo solo le pagine
+        di sezione sotto il percorso del codice.
+
+        Args:
+            root_url: Pagina principale del codice (es. https://www.brocardi.it/codice-civile/)
+            fetch: Coroutine url -> HTML (None se la pagina non è disponibile)
+            max_pages: Limite di pagine di sezione visitate
+            concurrency: Pagine scaricate in parallelo
+
+        Returns:
+            Dict numero -> URL
+        """
+        start = time.perf_counter()
+        articles: Dict[str, str] = {}
+        seen = {_strip_host(root_url)}
+        queue = deque([root_url])
+        pages = 0
+
+        while queue and pages < max_pages:
+            level = [queue.popleft() for _ in range(min(concurrency, len(queue), max_pages - pages))]
+            pages += len(level)
+            results = await asyncio.gather(*(fetch(url) for url in level), return_exceptions=True)
+
+            for url, html in zip(level, results):
+                if isinstance(html, BaseException) or not html:
+                    log.debug(f"Brocardi index: skipped {url}: {html!r}"[:200])
+                    continue
+                for numero, link in extract_article_links(html, url, root_url).items():
+                    articles.setdefault(numero, link)
+                for section in extract_section_links(html, url, root_url):
+                    path = _strip_host(section)
+                    if path not in seen:
+                        seen.add(path)
+                        queue.append(section)
+
+        if queue:
+            log.warning(f"Brocardi index for {root_url} truncated at {max_pages} pages")
+
+        self.save(root_url, articles)
+        log.info(
+            f"Brocardi index built for {root_url}: {len(articles)} articles, "
+            f"{pages} pages in {time.perf_counter() - start:.1f}s"
+        )
+        return articles
+
+    def __repr__(self) -> str:
+        return f"BrocardiArticleIndex(directory={self.directory}, loaded={len(self._indexes)})"
+
+
+__all__ = [
+    "BrocardiArticleIndex",
+    "extract_article_links",
+    "extract_section_links",
+    "normalize_article_number",
+    "DEFAULT_INDEX_DIR",
+]
@@ -0,0 +1,254 @@
+"""
+Backend di Estrazione HTML
+==========================
+
+Helper lxml per l'estrazione di testo dalle pagine Normattiva e Brocardi,
+alternativi a BeautifulSoup (html.parser).
+
+BeautifulSoup con html.parser costruisce l'albero in Python puro ed è il
+parser più lento disponibile; con la response cache attiva il parsing delle
+pagine diventa una quota rilevante del tempo di ingestion. lxml costruisce
+l'albero in C (libxml2) e le query usano XPath precompilate.
+
+Gli helper riproducono la semantica BeautifulSoup usata dagli scrapers, così
+i due backend producono lo stesso testo:
+- node_text() / node_tail(): le stringhe di soli spazi ASCII diventano
+  "\\n" (se contengono un a capo) o " ", come fa BeautifulSoup in parsing
+- get_text(): esclude commenti e contenuto di script/style/template
+- element_string(): equivalente di Tag.string (un solo figlio)
+- class_test(): match su un token dell'attributo class (come class_=...)
+
+Differenza nota: libxml2 normalizza i fine riga ``\\r\\n`` in ``\\n``.
+
+Backend disponibili (ScraperConfig.html_backend / BrocardiScraper(html_backend=...)):
+    "lxml"  default se lxml è installato
+    "bs4"   BeautifulSoup html.parser (implementazione di riferimento)
+
+Configurazione da environment:
+    HTML_PARSER_BACKEND=bs4     forza il backend BeautifulSoup
+
+Usage:
+    from merlt.sources.utils.html_backend import Selector, class_test, first, get_text, parse_html
+
+    BODY = Selector(f".//div[{class_test('bodyTesto')}]")
+
+    corpo = first(BODY(parse_html(html)))
+    get_text(corpo, strip=True)
+"""
+
+import os
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional
+
+HTML_BACKENDS = ("lxml", "bs4")
+
+# Tag il cui contenuto non compare in BeautifulSoup.get_text()
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+# Tag in cui BeautifulSoup preserva le stringhe di soli spazi
+_PRESERVE_WHITESPACE_TAGS = frozenset({"pre", "textarea"})
+
+# BeautifulSoup.ASCII_SPACES
+_ASCII_SPACES = " \n\t\x0c\r"
+
+
+def lxml_available() -> bool:
+    """True se lxml è importabile."""
+    try:
+        import lxml.html  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def default_html_backend() -> str:
+    """Backend da HTML_PARSER_BACKEND, altrimenti lxml se disponibile."""
+    backend = os.getenv("HTML_PARSER_BACKEND", "").strip().lower()
+    if backend:
+        return resolve_html_backend(backend)
+    return "lxml" if lxml_available() else "bs4"
+
+
+def resolve_html_backend(backend: Optional[str]) -> str:
+    """
+    Valida il nome del backend (None = default).
+
+    Raises:
+        ValueError: Backend sconosciuto
+        ImportError: Backend lxml richiesto ma lxml non installato
+    """
+    if backend is None:
+        return default_html_backend()
+    backend = backend.lower()
+    if backend not in HTML_BACKENDS:
+        raise ValueError(f"Unknown HTML backend: {backend!r} (expected one of {HTML_BACKENDS})")
+    if backend == "lxml" and not lxml_available():
+        raise ImportError(
+            "lxml is required for the lxml HTML backend. "
+            "Install it with: pip install lxml"
+        )
+    return backend
+
+
+@lru_cache(maxsize=1)
+def _parser():
+    import lxml.html
+    return lxml.html.HTMLParser(encoding="utf-8")
+
+
+def parse_html(html: str):
+    """
+    Parsa un documento HTML con lxml.
+
+    Returns:
+        Elemento radice (<html>), o None per documenti vuoti
+    """
+    if not html or not html.strip():
+        return None
+    import lxml.html
+    # Bytes + encoding esplicito: ignora eventuali dichiarazioni di charset
+    return lxml.html.document_fromstring(html.encode("utf-8"), parser=_parser())
+
+
+@lru_cache(maxsize=None)
+def xpath(expression: str):
+    """XPath compilata (cache per espressione)."""
+    from lxml import etree
+    return etree.XPath(expression)
+
+
+class Selector:
+    """
+    XPath precompilata, definibile a livello di modulo.
+
+    La compilazione avviene alla prima chiamata: lxml viene importato solo
+    se il backend lxml è effettivamente usato.
+    """
+
+    __slots__ = ("expression", "_compiled")
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self._compiled = None
+
+    def __call__(self, node: Any) -> List[Any]:
+        if self._compiled is None:
+            self._compiled = xpath(self.expression)
+        return self._compiled(node)
+
+    def __repr__(self) -> str:
+        return f"Selector({self.expression!r})"
+
+
+def class_test(name: str) -> str:
+    """Predicato XPath: l'attributo class contiene il token ``name``."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def first(elements: Any) -> Optional[Any]:
+    """Primo risultato di una XPath (None se vuota)."""
+    return elements[0] if elements else None
+
+
+def is_element(node: Any) -> bool:
+    """True per elementi (False per commenti e processing instructions)."""
+    return isinstance(node.tag, str)
+
+
+def has_class(element: Any, name: str) -> bool:
+    return name in (element.get("class") or "").split()
+
+
+def _collapse(text: Optional[str], parent: Any) -> str:
+    # Stringa di soli spazi ASCII -> "\n" o " " (BeautifulSoup.endData)
+    if not text or text.strip(_ASCII_SPACES):
+        return text or ""
+    if parent is not None and (
+        parent.tag in _PRESERVE_WHITESPACE_TAGS
+        or any(a.tag in _PRESERVE_WHITESPACE_TAGS for a in parent.iterancestors())
+    ):
+        return text
+    return "\n" if "\n" in text else " "
+
+
+def node_text(node: Any) -> str:
+    """Testo iniziale di un nodo (element.text), normalizzato come BeautifulSoup."""
+    return _collapse(node.text, node)
+
+
+def node_tail(node: Any) -> str:
+    """Testo dopo un nodo (element.tail), normalizzato come BeautifulSoup."""
+    return _collapse(node.tail, node.getparent())
+
+
+def iter_strings(element: Any) -> Iterator[str]:
+    """Stringhe di testo in ordine di documento, come BeautifulSoup._all_strings()."""
+    if element.tag in _NON_TEXT_TAGS:
+        return
+    if element.text:
+        yield node_text(element)
+    for child in element:
+        if is_element(child):
+            yield from iter_strings(child)
+        if child.tail:
+            yield node_tail(child)
+
+
+def get_text(element: Any, strip: bool = False) -> str:
+    """Equivalente di Tag.get_text() / Tag.get_text(strip=True)."""
+    if strip:
+        return "".join(s.strip() for s in iter_strings(element) if s.strip())
+    return "".join(iter_strings(element))
+
+
+def element_string(element: Any) -> Optional[str]:
+    """
+    Equivalente di Tag.string: il testo se l'elemento ha un solo figlio
+    (stringa, commento o elemento con a sua volta un solo figlio).
+    """
+    contents = []
+    if element.text:
+        contents.append(node_text(element))
+    for child in element:
+        contents.append(child)
+        if child.tail:
+            contents.append(node_tail(child))
+        if len(contents) > 1:
+            return None
+    if len(contents) != 1:
+        return None
+    only = contents[0]
+    if isinstance(only, str):
+        return only
+    if not is_element(only):
+        return node_text(only)
+    return element_string(only)
+
+
+def find_next_sibling(element: Any, tag: str, class_name: Optional[str] = None) -> Optional[Any]:
+    """Equivalente di Tag.find_next_sibling(tag, class_=class_name)."""
+    for sibling in element.itersiblings():
+        if sibling.tag == tag and (class_name is None or has_class(sibling, class_name)):
+            return sibling
+    return None
+
+
+__all__ = [
+    "HTML_BACKENDS",
+    "lxml_available",
+    "default_html_backend",
+    "resolve_html_backend",
+    "parse_html",
+    "xpath",
+    "Selector",
+    "class_test",
+    "first",
+    "is_element",
+    "has_class",
+    "node_text",
+    "node_tail",
+    "iter_strings",
+    "get_text",
+    "element_string",
+    "find_next_sibling",
+]
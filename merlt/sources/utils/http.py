@@ -1,5 +1,345 @@
-import aiohttp
+"""
+HTTP Client e Response Cache
+============================
+
+Sessione HTTP globale (``http_client``) e cache persistente delle risposte
+per gli scrapers.
+
+La cache (SQLite, corpo compresso) è indicizzata per URL normalizzato +
+parametri e conserva ETag e Last-Modified: entro il TTL della fonte la
+risposta viene servita da disco, dopo il TTL viene rivalidata con una GET
+condizionale (If-None-Match / If-Modified-Since) e un 304 costa solo gli
+header. La dimensione è limitata (eviction LRU) e in modalità offline le
+richieste sono servite solo dalla cache. Le letture non scrivono su disco
+(gli accessi per l'LRU sono registrati a blocchi) e l'I/O SQLite gira in
+un thread, fuori dall'event loop.
+
+Le richieste in rete passano dal rate limiter per host condiviso
+(merlt.sources.utils.rate_limit): 429/503 riducono il rate dell'host e
+sollevano ThrottledError, ritentata da with_retry.
+
+Configurazione da environment (vedi HttpCacheConfig.from_env):
+    HTTP_CACHE_ENABLED=0            disabilita la cache
+    HTTP_CACHE_PATH=...             file SQLite (default data/cache/http/responses.sqlite)
+    HTTP_CACHE_MAX_MB=512           dimensione massima
+    HTTP_CACHE_OFFLINE=1            serve solo dalla cache
+    HTTP_CACHE_TTL_NORMATTIVA=...   TTL in secondi per fonte
+
+Usage:
+    from merlt.sources.utils.http import http_client
+
+    html = await http_client.get_text(url, source="normattiva")
+"""
+
 import asyncio
+import os
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Mapping, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import aiohttp
+import structlog
+
+from merlt.sources.utils.rate_limit import (
+    THROTTLE_STATUSES,
+    RateLimiter,
+    ThrottledError,
+    rate_limiter,
+)
+
+log = structlog.get_logger()
+
+# TTL di default per fonte (secondi). Scaduto il TTL la risposta non viene
+# riscaricata ma rivalidata con una GET condizionale.
+DEFAULT_SOURCE_TTLS: Dict[str, int] = {
+    "normattiva": 86400,       # testo vigente: può cambiare con nuove modifiche
+    "brocardi": 7 * 86400,     # commenti e massime: aggiornamenti rari
+    "eurlex": 30 * 86400,      # testi UE pubblicati in GU: stabili
+}
+DEFAULT_TTL = 86400
+
+
+class OfflineCacheMiss(Exception):
+    """Richiesta non presente in cache con la modalità offline attiva."""
+    pass
+
+
+def cache_key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """
+    Chiave di cache: URL normalizzato + parametri.
+
+    Schema e host in minuscolo, query string ordinata (inclusi i params
+    passati a parte), fragment rimosso.
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query.extend((str(k), str(v)) for k, v in params.items())
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path or "/",
+        urlencode(sorted(query)),
+        "",
+    ))
+
+
+@dataclass
+class HttpCacheConfig:
+    """
+    Configurazione della response cache.
+
+    Attributes:
+        enabled: Se False le richieste vanno sempre in rete
+        path: File SQLite della cache
+        max_size_mb: Dimensione massima (corpi compressi)
+        default_ttl: TTL per fonti non configurate
+        source_ttls: TTL per fonte (secondi)
+        offline: Serve solo dalla cache (OfflineCacheMiss se assente)
+    """
+    enabled: bool = True
+    path: str = "data/cache/http/responses.sqlite"
+    max_size_mb: int = 512
+    default_ttl: int = DEFAULT_TTL
+    source_ttls: Dict[str, int] = field(default_factory=lambda: dict(DEFAULT_SOURCE_TTLS))
+    offline: bool = False
+
+    def ttl_for(self, source: str) -> int:
+        return self.source_ttls.get(source, self.default_ttl)
+
+    @classmethod
+    def from_env(cls) -> "HttpCacheConfig":
+        """Configurazione da variabili d'ambiente HTTP_CACHE_*."""
+        default = cls()
+        source_ttls = dict(default.source_ttls)
+        for source in list(source_ttls):
+            env_ttl = os.getenv(f"HTTP_CACHE_TTL_{source.upper()}")
+            if env_ttl:
+                source_ttls[source] = int(env_ttl)
+        return cls(
+            enabled=os.getenv("HTTP_CACHE_ENABLED", "1").lower() not in ("0", "false", "no"),
+            path=os.getenv("HTTP_CACHE_PATH", default.path),
+            max_size_mb=int(os.getenv("HTTP_CACHE_MAX_MB", str(default.max_size_mb))),
+            default_ttl=int(os.getenv("HTTP_CACHE_TTL", str(default.default_ttl))),
+            source_ttls=source_ttls,
+            offline=os.getenv("HTTP_CACHE_OFFLINE", "0").lower() in ("1", "true", "yes"),
+        )
+
+
+@dataclass
+class CachedResponse:
+    """Risposta in cache."""
+    url: str
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+
+    def age(self, now: Optional[float] = None) -> float:
+        return (now or time.time()) - self.fetched_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class HttpCacheStats:
+    """Contatori della response cache."""
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0  # 304 Not Modified
+    refreshed: int = 0    # scaduta e riscaricata (200)
+    stale_served: int = 0  # errore di rete, servita la copia scaduta
+    evicted: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "refreshed": self.refreshed,
+            "stale_served": self.stale_served,
+            "evicted": self.evicted,
+        }
+
+
+class HttpResponseCache:
+    """
+    Cache persistente delle risposte HTTP su SQLite.
+
+    I corpi sono compressi con zlib (l'HTML di Normattiva/Brocardi si riduce
+    di 5-10x). Oltre max_size_mb vengono eliminate le voci usate meno di
+    recente fino al 90% del limite.
+
+    get() è in sola lettura: l'ultimo accesso di ogni voce resta in memoria
+    e viene scritto insieme alla prossima put/touch (prima dell'eviction),
+    oppure ogni ``access_flush_size`` voci lette.
+
+    Args:
+        path: File SQLite (creato se non esiste); ":memory:" per test
+        max_size_mb: Dimensione massima dei corpi compressi
+        access_flush_size: Accessi in sospeso oltre i quali vengono scritti
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_size_mb: int = 512,
+        access_flush_size: int = 1000,
+    ):
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.stats = HttpCacheStats()
+        self.access_flush_size = access_flush_size
+        self._accessed: Dict[str, float] = {}
+
+        self._lock = Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, url TEXT NOT NULL, source TEXT NOT NULL, "
+            "body BLOB NOT NULL, etag TEXT, last_modified TEXT, "
+            "fetched_at REAL NOT NULL, accessed_at REAL NOT NULL, size INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)"
+        )
+        self._conn.commit()
+        self._size = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Legge una voce (l'ultimo accesso viene scritto a blocchi)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, body, etag, last_modified, fetched_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._accessed[key] = time.time()
+            if len(self._accessed) >= self.access_flush_size:
+                self._flush_accessed_locked()
+                self._conn.commit()
+        url, body, etag, last_modified, fetched_at = row
+        return CachedResponse(
+            url=url,
+            body=zlib.decompress(body).decode("utf-8"),
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=fetched_at,
+        )
+
+    def put(
+        self,
+        key: str,
+        url: str,
+        body: str,
+        source: str = "default",
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Inserisce o sostituisce una voce."""
+        data = zlib.compress(body.encode("utf-8"), 6)
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, source, body, etag, last_modified, fetched_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, source, data, etag, last_modified, now, now, len(data)),
+            )
+            self._size += len(data) - (old[0] if old else 0)
+            self._accessed.pop(key, None)
+            self._flush_accessed_locked()
+            self._evict_locked()
+            self._conn.commit()
+
+    def touch(self, key: str) -> None:
+        """Segna una voce come rivalidata (304): riparte il TTL."""
+        now = time.time()
+        with self._lock:
+            self._accessed.pop(key, None)
+            self._flush_accessed_locked()
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, key),
+            )
+            self._conn.commit()
+
+    def _flush_accessed_locked(self) -> None:
+        if not self._accessed:
+            return
+        self._conn.executemany(
+            "UPDATE responses SET accessed_at = ? WHERE key = ?",
+            [(accessed_at, key) for key, accessed_at in self._accessed.items()],
+        )
+        self._accessed.clear()
+
+    def _evict_locked(self) -> None:
+        if self._size <= self.max_size_bytes:
+            return
+        target = int(self.max_size_bytes * 0.9)
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        evict = []
+        for key, size in rows:
+            if self._size <= target:
+                break
+            evict.append((key,))
+            self._size -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evict)
+        self.stats.evicted += len(evict)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def clear(self, source: Optional[str] = None) -> None:
+        """Svuota la cache (o solo le voci di una fonte)."""
+        with self._lock:
+            self._flush_accessed_locked()
+            if source is None:
+                self._conn.execute("DELETE FROM responses")
+            else:
+                self._conn.execute("DELETE FROM responses WHERE source = ?", (source,))
+            self._conn.commit()
+            self._size = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        """Scrive gli accessi in sospeso e chiude la connessione SQLite."""
+        with self._lock:
+            self._flush_accessed_locked()
+            self._conn.commit()
+            self._conn.close()
+
+    def __repr__(self) -> str:
+        return f"HttpResponseCache(path={self.path}, size={self._size / 1e6:.1f}MB)"
+
 
 class HttpClient:
     """
@@ -7,9 +347,16 @@ class HttpClient:
 
     Quando il loop cambia (es. tra test pytest), la sessione viene ricreata
     automaticamente per evitare errori "Event loop is closed".
+
+    get_text() passa dalla response cache persistente, creata alla prima
+    richiesta con HttpCacheConfig.from_env() se non configurata prima
+    con configure_cache(), e dal rate limiter per host (rate_limiter).
     """
     _session: aiohttp.ClientSession = None
     _session_loop: asyncio.AbstractEventLoop = None
+    _cache_config: Optional[HttpCacheConfig] = None
+    _cache: Optional[HttpResponseCache] = None
+    rate_limiter: RateLimiter = rate_limiter
 
     async def get_session(self) -> aiohttp.ClientSession:
         """
@@ -59,5 +406,146 @@ class HttpClient:
             self._session = None
             self._session_loop = None
 
+    def configure_cache(self, config: Optional[HttpCacheConfig] = None, **overrides: Any) -> None:
+        """
+        (Ri)configura la response cache.
+
+        Args:
+            config: Configurazione completa (default: da environment)
+            **overrides: Campi di HttpCacheConfig da sovrascrivere (es. offline=True)
+        """
+        config = config or HttpCacheConfig.from_env()
+        for name, value in overrides.items():
+            setattr(config, name, value)
+        if self._cache is not None:
+            self._cache.close()
+        self._cache = None
+        self._cache_config = config
+
+    @property
+    def cache_config(self) -> HttpCacheConfig:
+        if self._cache_config is None:
+            self._cache_config = HttpCacheConfig.from_env()
+        return self._cache_config
+
+    @property
+    def response_cache(self) -> Optional[HttpResponseCache]:
+        """Response cache corrente (None se disabilitata)."""
+        config = self.cache_config
+        if not config.enabled:
+            return None
+        if self._cache is None:
+            self._cache = HttpResponseCache(config.path, config.max_size_mb)
+            log.debug(f"HTTP response cache opened: {config.path}")
+        return self._cache
+
+    async def get_text(
+        self,
+        url: str,
+        source: str = "default",
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Union[float, aiohttp.ClientTimeout, None] = 30,
+        ttl: Optional[int] = None,
+    ) -> str:
+        """
+        GET con response cache persistente.
+
+        - Voce fresca (età < TTL): servita da disco, nessuna richiesta
+        - Voce scaduta: GET condizionale; 304 -> riusa il corpo, 200 -> aggiorna
+        - Errore di rete o throttling con voce scaduta: servita la copia scaduta
+        - Modalità offline: solo cache, OfflineCacheMiss se assente
+
+        Le richieste in rete attendono il proprio turno nel rate limiter
+        dell'host; 429/503 ne riducono il rate (AIMD).
+
+        Args:
+            url: URL da scaricare
+            source: Fonte (normattiva, brocardi, eurlex) per il TTL
+            params: Query params (parte della chiave di cache)
+            headers: Header aggiuntivi (non fanno parte della chiave)
+            timeout: Timeout in secondi o aiohttp.ClientTimeout
+            ttl: Override del TTL della fonte
+
+        Returns:
+            Corpo della risposta
+
+        Raises:
+            ThrottledError: Risposta 429/503 (con retry_after se indicato)
+            aiohttp.ClientResponseError: Altre risposte HTTP non 2xx
+            OfflineCacheMiss: Modalità offline e URL non in cache
+        """
+        config = self.cache_config
+        cache = self.response_cache
+        key = cache_key(url, params)
+        # I/O SQLite in un thread: non blocca l'event loop
+        entry = await asyncio.to_thread(cache.get, key) if cache is not None else None
+
+        ttl = ttl if ttl is not None else config.ttl_for(source)
+        if entry is not None and (config.offline or entry.age() < ttl):
+            cache.stats.hits += 1
+            return entry.body
+
+        if config.offline:
+            raise OfflineCacheMiss(f"Offline mode: {url} not in HTTP cache")
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(entry.conditional_headers())
+        if isinstance(timeout, (int, float)):
+            timeout = aiohttp.ClientTimeout(total=timeout)
+
+        session = await self.get_session()
+        limiter = self.rate_limiter
+        try:
+            async with limiter.slot(url) as host, session.get(
+                url, params=params, headers=request_headers, timeout=timeout
+            ) as response:
+                retry_after = limiter.record_response(url, response.status, response.headers)
+                if response.status in THROTTLE_STATUSES:
+                    raise ThrottledError(host, response.status, retry_after)
+
+                if response.status == 304 and entry is not None:
+                    await asyncio.to_thread(cache.touch, key)
+                    cache.stats.revalidated += 1
+                    return entry.body
+
+                response.raise_for_status()
+                body = await response.text()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError, ThrottledError) as e:
+            if entry is None:
+                raise
+            log.warning("Network error, serving stale cached response", url=url[:100], error=str(e))
+            cache.stats.stale_served += 1
+            return entry.body
+
+        if cache is not None:
+            await asyncio.to_thread(
+                cache.put, key, url, body, source=source, etag=etag, last_modified=last_modified
+            )
+            if entry is None:
+                cache.stats.misses += 1
+            else:
+                cache.stats.refreshed += 1
+        return body
+
+
 # Global instance to be used across the application
 http_client = HttpClient()
+
+
+__all__ = [
+    "HttpClient",
+    "http_client",
+    "HttpCacheConfig",
+    "HttpCacheStats",
+    "HttpResponseCache",
+    "CachedResponse",
+    "OfflineCacheMiss",
+    "ThrottledError",
+    "cache_key",
+    "DEFAULT_SOURCE_TTLS",
+]
@@ -409,4 +409,25 @@ FONTI_PRINCIPALI = [
             "codice dell'ordinamento militare", 'codice del processo amministrativo', 'codice del turismo',
             'codice antimafia', 'codice di giustizia contabile', 'codice del terzo settore',
             'codice della protezione civile', "codice della crisi d'impresa e dell'insolvenza"
-        ]
\ No newline at end of file
+        ]
+# Date complete di atti citati spesso senza data (solo anno e numero).
+# Chiave "<tipo URN>:<anno>;<numero>", valore data ISO. Integra le date già
+# presenti in NORMATTIVA_URN_CODICI; vedi merlt.sources.utils.act_dates.
+NORMATTIVA_DATE_ATTI = {
+    "legge:1970;300": "1970-05-20",
+    "legge:1981;689": "1981-11-24",
+    "legge:1990;241": "1990-08-07",
+    "legge:1992;104": "1992-02-05",
+    "legge:2012;190": "2012-11-06",
+    "decreto.legislativo:1993;385": "1993-09-01",
+    "decreto.legislativo:1998;58": "1998-02-24",
+    "decreto.legislativo:2001;165": "2001-03-30",
+    "decreto.legislativo:2001;231": "2001-06-08",
+    "decreto.legislativo:2008;81": "2008-04-09",
+    "decreto.legislativo:2013;33": "2013-03-14",
+    "decreto.legislativo:2016;50": "2016-04-18",
+    "decreto.del.presidente.della.repubblica:1986;917": "1986-12-22",
+    "decreto.del.presidente.della.repubblica:2000;445": "2000-12-28",
+    "decreto.del.presidente.della.repubblica:2001;380": "2001-06-06",
+    "regio.decreto:1942;267": "1942-03-16",
+}
@@ -0,0 +1,335 @@
+"""
+Rate Limiter per Host
+=====================
+
+Token bucket condiviso, per host, per tutte le richieste degli scrapers
+(http_client.get_text).
+
+Ogni host ha un bucket (rate + burst) e un limite di richieste in volo.
+Il rate si adatta con AIMD:
+- Risposta ok: rate += increase_step (fino a max_rate)
+- 429 / 503: rate *= decrease_factor (fino a min_rate) e, se presente
+  Retry-After, l'host resta bloccato fino alla scadenza
+
+Essendo condiviso nel processo, più pipeline/scrapers che colpiscono lo
+stesso sito si coordinano invece di sommare i propri delay fissi.
+
+Configurazione da environment:
+    HTTP_RATE_LIMIT_ENABLED=0       disabilita il rate limiting
+
+Usage:
+    from merlt.sources.utils.rate_limit import rate_limiter
+
+    async with rate_limiter.slot(url):
+        async with session.get(url) as response:
+            rate_limiter.record_response(url, response.status, response.headers)
+
+    rate_limiter.metrics()  # {"normattiva.it": {"rate": 2.1, "in_flight": 1, ...}}
+"""
+
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+import structlog
+
+log = structlog.get_logger()
+
+# Status che indicano throttling lato server
+THROTTLE_STATUSES = (429, 503)
+
+
+class ThrottledError(ConnectionError):
+    """
+    Il server ha risposto 429/503.
+
+    Sottoclasse di ConnectionError: viene ritentata da with_retry con la
+    configurazione di default, rispettando retry_after.
+    """
+
+    def __init__(self, host: str, status: int, retry_after: Optional[float] = None):
+        self.host = host
+        self.status = status
+        self.retry_after = retry_after
+        message = f"{host} throttled (HTTP {status})"
+        if retry_after:
+            message += f", retry after {retry_after:.1f}s"
+        super().__init__(message)
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Secondi di attesa da un header Retry-After (delta in secondi o HTTP-date).
+
+    Returns:
+        Secondi (>= 0) o None se assente/non valido
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when - (now or time.time()))
+
+
+@dataclass
+class HostLimit:
+    """
+    Limiti di un host.
+
+    Attributes:
+        rate: Richieste/secondo iniziali
+        burst: Capacità del bucket (richieste consecutive senza attesa)
+        max_in_flight: Richieste concorrenti massime
+        min_rate: Rate minimo dopo i decrementi
+        max_rate: Rate massimo raggiungibile con gli incrementi
+        increase_step: Incremento additivo del rate per risposta ok
+        decrease_factor: Fattore moltiplicativo su 429/503
+    """
+    rate: float = 2.0
+    burst: int = 4
+    max_in_flight: int = 4
+    min_rate: float = 0.2
+    max_rate: float = 8.0
+    increase_step: float = 0.05
+    decrease_factor: float = 0.5
+
+
+# Limiti iniziali per i siti usati dagli scrapers (match per suffisso di host)
+DEFAULT_HOST_LIMITS: Dict[str, HostLimit] = {
+    "normattiva.it": HostLimit(rate=2.0, burst=4, max_in_flight=4),
+    "brocardi.it": HostLimit(rate=2.0, burst=4, max_in_flight=3),
+    "eur-lex.europa.eu": HostLimit(rate=3.0, burst=6, max_in_flight=5),
+}
+
+
+@dataclass
+class HostMetrics:
+    """Metriche di un host."""
+    requests: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    throttled: int = 0        # risposte 429/503
+    delayed: int = 0          # richieste che hanno atteso un token
+    wait_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "throttled": self.throttled,
+            "delayed": self.delayed,
+            "wait_seconds": round(self.wait_seconds, 3),
+        }
+
+
+@dataclass
+class _HostState:
+    """Stato del bucket di un host (loop asyncio singolo)."""
+    limit: HostLimit
+    rate: float
+    tokens: float
+    updated: float
+    blocked_until: float = 0.0
+    metrics: HostMetrics = field(default_factory=HostMetrics)
+    _semaphore: Optional[asyncio.Semaphore] = None
+    _semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def reserve(self, now: float) -> float:
+        """
+        Prenota un token e restituisce l'attesa necessaria.
+
+        Il bucket può andare in negativo: ogni richiesta prenota subito il
+        proprio turno, così i waiter non si contendono il token al risveglio.
+        """
+        self.tokens = min(
+            float(self.limit.burst), self.tokens + (now - self.updated) * self.rate
+        )
+        self.updated = now
+        self.tokens -= 1.0
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.blocked_until - now)
+
+    def semaphore(self) -> asyncio.Semaphore:
+        # Il semaforo è legato al loop: ricreato se il loop cambia (es. tra test)
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.limit.max_in_flight)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+
+class RateLimiter:
+    """
+    Rate limiter token bucket per host con adattamento AIMD.
+
+    Args:
+        limits: Limiti per host (match esatto o per suffisso, es. "brocardi.it"
+            vale anche per "www.brocardi.it"); default DEFAULT_HOST_LIMITS
+        default_limit: Limiti per host non configurati
+        enabled: Se False slot() non attende mai
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, HostLimit]] = None,
+        default_limit: Optional[HostLimit] = None,
+        enabled: bool = True,
+    ):
+        self.limits: Dict[str, HostLimit] = dict(
+            DEFAULT_HOST_LIMITS if limits is None else limits
+        )
+        self.default_limit = default_limit or HostLimit()
+        self.enabled = enabled
+        self._hosts: Dict[str, _HostState] = {}
+
+    @classmethod
+    def from_env(cls) -> "RateLimiter":
+        """Rate limiter con HTTP_RATE_LIMIT_ENABLED da environment."""
+        enabled = os.getenv("HTTP_RATE_LIMIT_ENABLED", "1").lower() not in ("0", "false", "no")
+        return cls(enabled=enabled)
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Host normalizzato (minuscolo, senza porta né 'www.')."""
+        host = (urlsplit(url).hostname or url).lower()
+        return host[4:] if host.startswith("www.") else host
+
+    def limit_for(self, host: str) -> HostLimit:
+        for suffix, limit in self.limits.items():
+            if host == suffix or host.endswith("." + suffix):
+                return limit
+        return self.default_limit
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            limit = self.limit_for(host)
+            state = _HostState(
+                limit=limit,
+                rate=limit.rate,
+                tokens=float(limit.burst),
+                updated=time.monotonic(),
+            )
+            self._hosts[host] = state
+        return state
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[str]:
+        """
+        Attende un token e uno slot di concorrenza per l'host dell'URL.
+
+        Yields:
+            Host normalizzato
+        """
+        host = self.host_of(url)
+        if not self.enabled:
+            yield host
+            return
+
+        state = self._state(host)
+        async with state.semaphore():
+            wait = state.reserve(time.monotonic())
+            if wait > 0:
+                state.metrics.delayed += 1
+                state.metrics.wait_seconds += wait
+                await asyncio.sleep(wait)
+
+            metrics = state.metrics
+            metrics.requests += 1
+            metrics.in_flight += 1
+            metrics.peak_in_flight = max(metrics.peak_in_flight, metrics.in_flight)
+            try:
+                yield host
+            finally:
+                metrics.in_flight -= 1
+
+    def record_response(
+        self,
+        url: str,
+        status: int,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional[float]:
+        """
+        Adatta il rate dell'host all'esito di una risposta (AIMD).
+
+        Returns:
+            Secondi di Retry-After per risposte 429/503 (None altrimenti)
+        """
+        host = self.host_of(url)
+        state = self._state(host)
+        limit = state.limit
+
+        if status not in THROTTLE_STATUSES:
+            if status < 400:
+                state.rate = min(limit.max_rate, state.rate + limit.increase_step)
+            return None
+
+        retry_after = parse_retry_after((headers or {}).get("Retry-After"))
+        previous = state.rate
+        state.rate = max(limit.min_rate, state.rate * limit.decrease_factor)
+        state.tokens = min(state.tokens, 0.0)
+        if retry_after:
+            state.blocked_until = max(state.blocked_until, time.monotonic() + retry_after)
+        state.metrics.throttled += 1
+
+        log.warning(
+            "Host throttled, reducing request rate",
+            host=host,
+            status=status,
+            rate_before=round(previous, 2),
+            rate_after=round(state.rate, 2),
+            retry_after=retry_after,
+        )
+        return retry_after
+
+    def current_rate(self, url_or_host: str) -> float:
+        host = self.host_of(url_or_host) if "://" in url_or_host else url_or_host
+        return self._state(host).rate
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Metriche per host: rate corrente, in volo, throttling, attese."""
+        now = time.monotonic()
+        return {
+            host: {
+                "rate": round(state.rate, 3),
+                "blocked_for": round(max(0.0, state.blocked_until - now), 3),
+                **state.metrics.to_dict(),
+            }
+            for host, state in self._hosts.items()
+        }
+
+    def reset(self) -> None:
+        """Azzera stato e metriche di tutti gli host."""
+        self._hosts.clear()
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(hosts={len(self._hosts)}, enabled={self.enabled})"
+
+
+# Istanza condivisa da tutti gli scrapers (via http_client)
+rate_limiter = RateLimiter.from_env()
+
+
+__all__ = [
+    "RateLimiter",
+    "HostLimit",
+    "HostMetrics",
+    "ThrottledError",
+    "THROTTLE_STATUSES",
+    "DEFAULT_HOST_LIMITS",
+    "parse_retry_after",
+    "rate_limiter",
+]
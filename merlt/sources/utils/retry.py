@@ -4,6 +4,10 @@ Retry Logic per Scrapers
 
 Fornisce retry con exponential backoff per operazioni HTTP.
 
+Le eccezioni con attributo ``retry_after`` (es. ThrottledError del rate
+limiter su 429/503) allungano l'attesa fino al Retry-After indicato dal
+server, entro max_wait.
+
 Usage:
     from merlt.sources.utils.retry import RetryConfig, with_retry
 
@@ -81,6 +85,18 @@ class RetryConfig:
 
         return delay
 
+    def delay_for(self, attempt: int, error: BaseException) -> float:
+        """
+        Delay per un tentativo fallito con l'eccezione indicata.
+
+        Rispetta ``error.retry_after`` se presente (capped a max_wait).
+        """
+        delay = self.calculate_delay(attempt)
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after:
+            delay = max(delay, min(float(retry_after), self.max_wait))
+        return delay
+
 
 def with_retry(config: RetryConfig = None):
     """
@@ -114,7 +130,7 @@ def with_retry(config: RetryConfig = None):
                     attempts_left = cfg.max_attempts - attempt - 1
 
                     if attempts_left > 0:
-                        delay = cfg.calculate_delay(attempt)
+                        delay = cfg.delay_for(attempt, e)
                         log.warning(
                             "Retry scheduled",
                             function=func.__name__,
@@ -186,7 +202,7 @@ class RetryableOperation:
                 attempts_left = self.config.max_attempts - attempt - 1
 
                 if attempts_left > 0:
-                    delay = self.config.calculate_delay(attempt)
+                    delay = self.config.delay_for(attempt, e)
                     log.warning(
                         "Retry scheduled",
                         function=func.__name__ if hasattr(func, '__name__') else str(func),
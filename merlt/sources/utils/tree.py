@@ -7,15 +7,25 @@ Extracts hierarchical structure of legal norms from Normattiva and EUR-Lex.
 Provides two APIs:
 - get_tree(): Flat list of articles (backward compatible)
 - get_hierarchical_tree(): Full tree structure with Libro/Titolo/Capo/Sezione hierarchy
+
+NormTree è serializzabile (to_dict/from_dict) e porta una mappa precalcolata
+articolo -> posizione gerarchica: get_article_position è una lettura di
+dizionario. NormTreeStore salva gli alberi su disco (JSON, o msgpack se
+installato) per URN + data di vigenza, e get_cached_hierarchical_tree evita
+download e parsing tra run diversi.
 """
 
 import asyncio
+import hashlib
+import json
+import time
 import aiohttp
 from bs4 import BeautifulSoup
 import structlog
 import re
 from aiocache import cached
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple, Union
 from enum import Enum
 
@@ -65,6 +75,35 @@ class NormNode:
             return f"{level_name} {self.number} - {self.title}"
         return f"{level_name} {self.number}"
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializza il nodo (e i figli) in un dict JSON-compatibile."""
+        data: Dict[str, Any] = {"level": self.level.value, "number": self.number}
+        if self.title is not None:
+            data["title"] = self.title
+        if self.url is not None:
+            data["url"] = self.url
+        if self.attachment_number is not None:
+            data["attachment_number"] = self.attachment_number
+        if self.children:
+            data["children"] = [child.to_dict() for child in self.children]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NormNode":
+        return cls(
+            level=NormLevel(data["level"]),
+            number=data["number"],
+            title=data.get("title"),
+            url=data.get("url"),
+            children=[cls.from_dict(child) for child in data.get("children", [])],
+            attachment_number=data.get("attachment_number"),
+        )
+
+
+# Versione del formato serializzato di NormTree (alberi salvati con un
+# formato diverso vengono riscaricati)
+NORM_TREE_FORMAT_VERSION = 1
+
 
 @dataclass
 class NormTree:
@@ -72,10 +111,73 @@ class NormTree:
     Complete hierarchical tree for a norm.
 
     Root contains the full structure from Libro down to Articolo.
+
+    La mappa articolo -> posizione è calcolata alla prima richiesta (o letta
+    dal formato serializzato); se l'albero viene modificato dopo, chiamare
+    invalidate_positions().
     """
     base_urn: str
     children: List[NormNode] = field(default_factory=list)
     article_count: int = 0
+    version_date: Optional[str] = None
+    _positions: Optional[Dict[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def article_positions(self) -> Dict[str, str]:
+        """
+        Mappa numero articolo normalizzato -> posizione (formato Brocardi).
+
+        Se un numero compare più volte (es. allegati) vale la prima
+        occorrenza in ordine di visita, come in get_article_position.
+        """
+        if self._positions is None:
+            positions: Dict[str, str] = {}
+
+            def collect(nodes: List[NormNode], current_path: List[NormNode]) -> None:
+                for node in nodes:
+                    if node.is_article:
+                        positions.setdefault(
+                            _normalize_article_num(node.number),
+                            ", ".join(n.full_text for n in current_path),
+                        )
+                    else:
+                        collect(node.children, current_path + [node])
+
+            collect(self.children, [])
+            self._positions = positions
+        return self._positions
+
+    def position_of(self, article_num: str) -> Optional[str]:
+        """Posizione di un articolo (None se assente)."""
+        return self.article_positions().get(_normalize_article_num(article_num))
+
+    def invalidate_positions(self) -> None:
+        """Scarta la mappa delle posizioni (dopo modifiche all'albero)."""
+        self._positions = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Formato serializzato, inclusa la mappa delle posizioni."""
+        return {
+            "format": NORM_TREE_FORMAT_VERSION,
+            "base_urn": self.base_urn,
+            "version_date": self.version_date,
+            "article_count": self.article_count,
+            "children": [child.to_dict() for child in self.children],
+            "positions": self.article_positions(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NormTree":
+        tree = cls(
+            base_urn=data["base_urn"],
+            children=[NormNode.from_dict(child) for child in data.get("children", [])],
+            article_count=data.get("article_count", 0),
+            version_date=data.get("version_date"),
+        )
+        if "positions" in data:
+            tree._positions = dict(data["positions"])
+        return tree
 
 
 # Pattern per estrarre i livelli strutturali dal testo (possono essere multipli in una stringa)
@@ -571,6 +673,9 @@ def get_article_position(tree: NormTree, article_num: str) -> Optional[str]:
     """
     Get the position string for an article in Brocardi format.
 
+    Lettura dalla mappa precalcolata del NormTree (O(1) dopo la prima
+    chiamata sull'albero).
+
     Args:
         tree: NormTree from get_hierarchical_tree()
         article_num: Article number (e.g., "1453", "1453bis")
@@ -585,26 +690,7 @@ def get_article_position(tree: NormTree, article_num: str) -> Optional[str]:
         >>> print(pos)
         "Libro IV - Delle obbligazioni, Titolo II - Dei contratti in generale, Capo XIV - Della risoluzione del contratto"
     """
-    path = []
-
-    def find_article(nodes: List[NormNode], current_path: List[NormNode]) -> bool:
-        for node in nodes:
-            if node.is_article:
-                if _normalize_article_num(node.number) == _normalize_article_num(article_num):
-                    path.extend(current_path)
-                    return True
-            else:
-                # Structural node - add to path and search children
-                if find_article(node.children, current_path + [node]):
-                    return True
-        return False
-
-    if find_article(tree.children, []):
-        # Filter out articles and join structural nodes
-        structural_path = [n for n in path if not n.is_article]
-        return ", ".join(node.full_text for node in structural_path)
-
-    return None
+    return tree.position_of(article_num)
 
 
 def get_all_articles_with_positions(tree: NormTree) -> List[Dict[str, Any]]:
@@ -638,6 +724,135 @@ def _normalize_article_num(num: str) -> str:
     return num.lower().replace(' ', '').replace('-', '')
 
 
+# =============================================================================
+# Persistent NormTree Store
+# =============================================================================
+
+DEFAULT_NORM_TREE_DIR = "data/cache/norm_trees"
+
+# Gli alberi vigenti possono cambiare (nuovi articoli bis/ter, abrogazioni):
+# vengono riscaricati dopo 7 giorni. Gli alberi a una data di vigenza sono
+# immutabili e non scadono.
+DEFAULT_NORM_TREE_MAX_AGE = 7 * 86400
+
+
+class NormTreeStore:
+    """
+    Store su disco dei NormTree, un file per URN + data di vigenza.
+
+    Args:
+        directory: Cartella dei file
+        fmt: "json" oppure "msgpack" (richiede il pacchetto msgpack)
+        max_age: Età massima (secondi) degli alberi vigenti; None = mai scaduti
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path] = DEFAULT_NORM_TREE_DIR,
+        fmt: str = "json",
+        max_age: Optional[int] = DEFAULT_NORM_TREE_MAX_AGE,
+    ):
+        if fmt not in ("json", "msgpack"):
+            raise ValueError(f"Unknown NormTree format: {fmt}")
+        if fmt == "msgpack":
+            try:
+                import msgpack  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "msgpack is required for fmt='msgpack'. Install it with: pip install msgpack"
+                )
+        self.directory = Path(directory)
+        self.fmt = fmt
+        self.max_age = max_age
+
+    def path_for(self, normurn: str, version_date: Optional[str] = None) -> Path:
+        """File dell'albero (nome derivato dall'hash dell'URN)."""
+        digest = hashlib.sha1(normurn.encode("utf-8")).hexdigest()[:16]
+        return self.directory / f"{digest}_{version_date or 'vigente'}.{self.fmt}"
+
+    def load(self, normurn: str, version_date: Optional[str] = None) -> Optional[NormTree]:
+        """
+        Albero salvato per URN e data di vigenza.
+
+        Returns:
+            NormTree o None se assente, scaduto o in un formato diverso
+        """
+        path = self.path_for(normurn, version_date)
+        if not path.exists():
+            return None
+        if (
+            version_date is None
+            and self.max_age is not None
+            and time.time() - path.stat().st_mtime > self.max_age
+        ):
+            log.info(f"NormTree cache expired: {path}")
+            return None
+        try:
+            raw = path.read_bytes()
+            if self.fmt == "msgpack":
+                import msgpack
+                data = msgpack.unpackb(raw, raw=False)
+            else:
+                data = json.loads(raw.decode("utf-8"))
+        except Exception as e:
+            log.warning(f"Unreadable NormTree cache {path}: {e}")
+            return None
+        if data.get("format") != NORM_TREE_FORMAT_VERSION or data.get("base_urn") != normurn:
+            return None
+        return NormTree.from_dict(data)
+
+    def save(self, normurn: str, tree: NormTree, version_date: Optional[str] = None) -> Path:
+        """Salva un albero (scrittura atomica)."""
+        data = tree.to_dict()
+        data["base_urn"] = normurn
+        data["version_date"] = version_date
+        if self.fmt == "msgpack":
+            import msgpack
+            raw = msgpack.packb(data, use_bin_type=True)
+        else:
+            raw = json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+        path = self.path_for(normurn, version_date)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(raw)
+        tmp.replace(path)
+        return path
+
+
+async def get_cached_hierarchical_tree(
+    normurn: str,
+    version_date: Optional[str] = None,
+    store: Optional[NormTreeStore] = None,
+) -> Tuple[Union[NormTree, str], int]:
+    """
+    get_hierarchical_tree con store persistente.
+
+    Args:
+        normurn: URL/URN della norma (senza !vig=)
+        version_date: Data di vigenza (YYYY-MM-DD); None = vigente
+        store: NormTreeStore (default: data/cache/norm_trees, JSON)
+
+    Returns:
+        (NormTree, article_count) or (error_message, 0) on failure
+    """
+    store = store or NormTreeStore()
+    tree = store.load(normurn, version_date)
+    if tree is not None:
+        log.debug(f"NormTree loaded from cache: {normurn} ({version_date or 'vigente'})")
+        return tree, tree.article_count
+
+    url = f"{normurn}!vig={version_date}" if version_date else normurn
+    tree, count = await get_hierarchical_tree(url)
+    if isinstance(tree, NormTree) and count > 0:
+        tree.version_date = version_date
+        try:
+            store.save(normurn, tree, version_date)
+        except OSError as e:
+            log.warning(f"Could not persist NormTree for {normurn}: {e}")
+    return tree, count
+
+
 # =============================================================================
 # Test Main
 # =============================================================================
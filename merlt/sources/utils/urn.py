@@ -2,14 +2,10 @@ import re
 import asyncio
 import structlog
 from functools import lru_cache
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+from merlt.sources.utils.act_dates import act_date_resolver
 from merlt.sources.utils.config import MAX_CACHE_SIZE
-from merlt.sources.utils.text import normalize_act_type, parse_date, estrai_data_da_denominazione
+from merlt.sources.utils.text import normalize_act_type, parse_date
 from merlt.sources.utils.map import NORMATTIVA_URN_CODICI, EURLEX
-from merlt.sources.utils.sys_op import web_driver_manager
 
 # Lazy import to avoid circular dependency
 # EurlexScraper will be imported only when needed (for EU legislation)
@@ -18,10 +14,13 @@ EurlexScraper = None
 # Configure logging
 log = structlog.get_logger()
 
-lru_cache(maxsize=MAX_CACHE_SIZE)
 async def complete_date(act_type, date, act_number):
     """
-    Completes the date of a legal norm using the Normattiva website.
+    Completes the date of a legal norm from its year and number.
+
+    Looks the act up in the bundled date table, the local act date store
+    and, as a last resort, the Normattiva URN resolver over plain HTTP
+    (see merlt.sources.utils.act_dates).
 
     Arguments:
     act_type -- Type of the legal act
@@ -29,79 +28,83 @@ async def complete_date(act_type, date, act_number):
     act_number -- Number of the act
 
     Returns:
-    str -- Completed date or error message
+    str -- Completed date (YYYY-MM-DD) or error message
     """
     log.info(f"Completing date for act_type: {act_type}, date: {date}, act_number: {act_number}")
 
-    loop = asyncio.get_running_loop()
+    try:
+        completed_date = await act_date_resolver.resolve(act_type, date, act_number)
+    except Exception as e:
+        log.error(f"Error in complete_date: {e}", exc_info=True)
+        return f"Errore nel completamento della data, inserisci la data completa: {e}"
+
+    if completed_date is None:
+        return "Timeout: Elemento non trovato. La ricerca non ha prodotto risultati."
+    log.info(f"Completed date: {completed_date}")
+    return completed_date
+
+NORMATTIVA_URN_BASE = "https://www.normattiva.it/uri-res/N2Ls?urn:nir:stato:"
+
+_ARTICLE_PREFIX = re.compile(r'\b[Aa]rticoli?\b|\b[Aa]rt\.?\b')
+
+
+@lru_cache(maxsize=MAX_CACHE_SIZE)
+def _normalized_act_type(act_type, search=False):
+    """Memoized normalize_act_type (pure mapping lookup)."""
+    return normalize_act_type(act_type, search=search)
+
+
+@lru_cache(maxsize=MAX_CACHE_SIZE)
+def _article_suffix(article):
+    """URN suffix for an article ("5-bis" -> "~art5bis"), as built by append_article_info."""
+    extension = None
+    if '-' in article:
+        parts = article.split('-')
+        article = parts[0]
+        extension = parts[1]
+    if not article:
+        return ""
+    article = _ARTICLE_PREFIX.sub("", article).strip()
+    return f"~art{article}{extension or ''}"
+
+
+def _run_coroutine(coro_factory):
+    """
+    Runs a coroutine to completion from sync code.
+
+    Inside a running event loop the coroutine gets its own loop in a
+    worker thread, so the caller's loop is not blocked by asyncio.run.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # No running loop, safe to use asyncio.run() directly
+        return asyncio.run(coro_factory())
+
+    import concurrent.futures
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro_factory()).result()
 
-    def run_selenium_sync():
-        driver = web_driver_manager.get_driver()
+
+def _eurlex_urn(normalized_act_type, date, act_number):
+    """Resolves an EU act through EurlexScraper (None if unavailable)."""
+    # Lazy import to avoid circular dependency
+    global EurlexScraper
+    if EurlexScraper is None:
         try:
-            driver.get("https://www.normattiva.it/")
+            from merlt.sources.eurlex import EurlexScraper as _EurlexScraper
+            EurlexScraper = _EurlexScraper
+        except ImportError:
+            # Fallback for older import path
+            EurlexScraper = None
+            log.warning("EurlexScraper not available")
+            return None
 
-            # Handle cookie consent banner
-            try:
-                cookie_banner = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.ID, "cookie_poilicy_mobile_close"))
-                )
-                cookie_banner.click()
-                log.info("Closed cookie consent banner.")
-            except TimeoutException:
-                log.info("Cookie consent banner not found or already closed.")
-
-            search_box = driver.find_element(By.CSS_SELECTOR, "#testoRicerca")
-            search_criteria = f"{normalize_act_type(input_type=act_type, search=False, source='normattiva')} {act_number} {date}"
-            log.info(f"Search criteria: {search_criteria}")
-            
-            search_box.clear()
-            search_box.send_keys(search_criteria)
-            
-            # Using the new search button selector
-            search_button = WebDriverWait(driver, 5).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "button.btn.btn-primary[type='submit']"))
-            )
-            search_button.click()
-
-            # Small delay to allow page transition
-            import time
-            time.sleep(2)
-
-            # Wait for search results and try multiple selectors for the first result link
-            element = None
-            selectors_to_try = [
-                (By.XPATH, '//*[@id="heading_1"]/p[1]/a'),  # Original selector
-                (By.CSS_SELECTOR, '.card-body a'),  # New structure selector
-                (By.CSS_SELECTOR, '.risultati-ricerca a'),  # Alternative selector
-                (By.XPATH, '//div[contains(@class, "card-body")]//a[1]'),  # First link in card body
-            ]
-
-            for selector_type, selector in selectors_to_try:
-                try:
-                    element = WebDriverWait(driver, 5).until(
-                        EC.presence_of_element_located((selector_type, selector))
-                    )
-                    log.info(f"Found search result using selector: {selector}")
-                    break
-                except TimeoutException:
-                    continue
-
-            if element is None:
-                raise TimeoutException("No search results found with any selector")
-            element_text = element.text
-            log.info(f"Element text found: {element_text}")
-            
-            completed_date = estrai_data_da_denominazione(element_text)
-            log.info(f"Completed date: {completed_date}")
-            return completed_date
-        except TimeoutException:
-            log.error("Timeout while waiting for search results.", exc_info=True)
-            return f"Timeout: Elemento non trovato. La ricerca non ha prodotto risultati."
-        except Exception as e:
-            log.error(f"Error in complete_date: {e}", exc_info=True)
-            return f"Errore nel completamento della data, inserisci la data completa: {e}"
+    if EurlexScraper:
+        eurlex_scraper = EurlexScraper()
+        return eurlex_scraper.get_uri(act_type=normalized_act_type.lower(), year=date, num=act_number)
+    return None
 
-    return await loop.run_in_executor(None, run_selenium_sync)
 
 def generate_urn(act_type, date=None, act_number=None, article=None, annex=None, version=None, version_date=None, urn_flag=True):
     """
@@ -122,8 +125,8 @@ def generate_urn(act_type, date=None, act_number=None, article=None, annex=None,
     """
     log.info(f"Generating URN for act_type: {act_type}, date: {date}, act_number: {act_number}, article: {article}, annex: {annex}, version: {version}, version_date: {version_date}, urn_flag: {urn_flag}")
     codici_urn = NORMATTIVA_URN_CODICI  
-    base_url = "https://www.normattiva.it/uri-res/N2Ls?urn:nir:stato:"
-    normalized_act_type = normalize_act_type(act_type)  
+    base_url = NORMATTIVA_URN_BASE
+    normalized_act_type = _normalized_act_type(act_type)
     
     # Check if 'article' is a valid string before attempting to split it
     extension = None
@@ -134,22 +137,7 @@ def generate_urn(act_type, date=None, act_number=None, article=None, annex=None,
     
     # Handle EURLEX cases
     if normalized_act_type.lower() in EURLEX:
-        # Lazy import to avoid circular dependency
-        global EurlexScraper
-        if EurlexScraper is None:
-            try:
-                from merlt.sources.eurlex import EurlexScraper as _EurlexScraper
-                EurlexScraper = _EurlexScraper
-            except ImportError:
-                # Fallback for older import path
-                EurlexScraper = None
-                log.warning("EurlexScraper not available")
-                return None
-
-        if EurlexScraper:
-            eurlex_scraper = EurlexScraper()
-            return eurlex_scraper.get_uri(act_type=normalized_act_type.lower(), year=date, num=act_number)
-        return None
+        return _eurlex_urn(normalized_act_type, date, act_number)
 
     # Handle other cases with codici_urn
     if normalized_act_type in codici_urn:
@@ -157,22 +145,10 @@ def generate_urn(act_type, date=None, act_number=None, article=None, annex=None,
         log.info(f"URN found in codici_urn: {urn}")
     else:
         try:
-            # Create a coroutine and run it in a new thread to avoid blocking the event loop
-            import concurrent.futures
-
-            async def run_async():
-                return await complete_date_or_parse(date, act_type, act_number)
-
-            try:
-                # Check if we're in an async context
-                loop = asyncio.get_running_loop()
-                # Run in a thread pool to avoid blocking the current event loop
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, run_async())
-                    formatted_date = future.result()
-            except RuntimeError:
-                # No running loop, safe to use asyncio.run() directly
-                formatted_date = asyncio.run(run_async())
+            # Run the coroutine without blocking a running event loop
+            formatted_date = _run_coroutine(
+                lambda: complete_date_or_parse(date, act_type, act_number)
+            )
 
             urn = f"{normalized_act_type}:{formatted_date};{act_number}"
             log.info(f"Generated base URN: {urn}")
@@ -193,6 +169,78 @@ def generate_urn(act_type, date=None, act_number=None, article=None, annex=None,
     
     return result
 
+def generate_urns(requests):
+    """
+    Generates URNs for many norms at once.
+
+    Act-level work (act type normalization, date completion, EUR-Lex
+    lookup) is done once per distinct act: a codice with thousands of
+    articles normalizes its act type and resolves its date a single time,
+    and distinct acts needing date completion are resolved concurrently
+    in one event loop. Article suffixes are memoized as well.
+
+    Arguments:
+    requests -- Iterable of dicts with generate_urn keyword arguments
+                (act_type required; date, act_number, article, annex,
+                version, version_date, urn_flag optional)
+
+    Returns:
+    list -- URNs in request order (None where generate_urn would return None)
+    """
+    requests = [dict(request) for request in requests]
+    log.info(f"Generating {len(requests)} URNs")
+
+    # Base URN (or final EUR-Lex URI) per distinct act
+    bases = {}
+    to_complete = {}
+    for request in requests:
+        act = (request["act_type"], request.get("date"), request.get("act_number"))
+        if act in bases or act in to_complete:
+            continue
+        act_type, date, act_number = act
+        normalized_act_type = _normalized_act_type(act_type)
+        if normalized_act_type.lower() in EURLEX:
+            bases[act] = ("eurlex", _eurlex_urn(normalized_act_type, date, act_number))
+        elif normalized_act_type in NORMATTIVA_URN_CODICI:
+            bases[act] = ("normattiva", NORMATTIVA_URN_CODICI[normalized_act_type])
+        else:
+            to_complete[act] = normalized_act_type
+
+    if to_complete:
+        acts = list(to_complete)
+
+        async def complete_all():
+            return await asyncio.gather(
+                *[complete_date_or_parse(date, act_type, act_number) for act_type, date, act_number in acts],
+                return_exceptions=True,
+            )
+
+        for act, formatted_date in zip(acts, _run_coroutine(complete_all)):
+            if isinstance(formatted_date, Exception):
+                log.error(f"Error generating URN for {act}: {formatted_date}")
+                bases[act] = ("normattiva", None)
+            else:
+                bases[act] = ("normattiva", f"{to_complete[act]}:{formatted_date};{act[2]}")
+
+    urns = []
+    for request in requests:
+        kind, urn = bases[(request["act_type"], request.get("date"), request.get("act_number"))]
+        if kind == "eurlex" or urn is None:
+            urns.append(urn)
+            continue
+
+        annex = request.get("annex")
+        if annex:
+            urn = urn + f':{annex.strip()}'
+        article = request.get("article")
+        if article:
+            urn += _article_suffix(article)
+        urn = append_version_info(urn, request.get("version"), request.get("version_date"))
+
+        final_urn = NORMATTIVA_URN_BASE + urn
+        urns.append(final_urn if request.get("urn_flag", True) else final_urn.split("~")[0])
+    return urns
+
 async def complete_date_or_parse(date, act_type, act_number):
     """
     Completes the date if necessary or parses the date.
@@ -206,7 +254,7 @@ async def complete_date_or_parse(date, act_type, act_number):
     str -- Formatted date
     """
     if re.match(r"^\d{4}$", date) and act_number:
-        act_type_for_search = normalize_act_type(act_type, search=True)
+        act_type_for_search = _normalized_act_type(act_type, search=True)
         full_date = await complete_date(act_type=act_type_for_search, date=date, act_number=act_number)
 
         # Check if complete_date returned an error message instead of a date
@@ -239,7 +287,7 @@ def append_article_info(urn, article, extension):
     if article:
         if "-" in article:
             article, extension = article.split("-")
-        article = re.sub(r'\b[Aa]rticoli?\b|\b[Aa]rt\.?\b', "", article).strip()
+        article = _ARTICLE_PREFIX.sub("", article).strip()
         urn += f"~art{article}"
         if extension:
             urn += extension
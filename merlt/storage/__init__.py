@@ -31,10 +31,42 @@ v2 Architecture:
             final_score = alpha * sim + (1-alpha) * graph
 """
 
-from merlt.storage.graph import FalkorDBClient, FalkorDBConfig
-from merlt.storage.bridge import BridgeTable, BridgeTableConfig, BridgeTableEntry
-from merlt.storage.retriever import GraphAwareRetriever, RetrievalResult, RetrieverConfig
-from merlt.storage.vectors.embeddings import EmbeddingService
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Import on-demand (PEP 562): i backend (falkordb, sqlalchemy, torch) vengono
+# caricati solo quando il relativo componente viene effettivamente usato.
+_LAZY_ATTRS = {
+    "FalkorDBClient": "merlt.storage.graph",
+    "FalkorDBConfig": "merlt.storage.graph",
+    "BridgeTable": "merlt.storage.bridge",
+    "BridgeTableConfig": "merlt.storage.bridge",
+    "BridgeTableEntry": "merlt.storage.bridge",
+    "GraphAwareRetriever": "merlt.storage.retriever",
+    "RetrievalResult": "merlt.storage.retriever",
+    "RetrieverConfig": "merlt.storage.retriever",
+    "EmbeddingService": "merlt.storage.vectors.embeddings",
+}
+
+if TYPE_CHECKING:
+    from merlt.storage.graph import FalkorDBClient, FalkorDBConfig
+    from merlt.storage.bridge import BridgeTable, BridgeTableConfig, BridgeTableEntry
+    from merlt.storage.retriever import GraphAwareRetriever, RetrievalResult, RetrieverConfig
+    from merlt.storage.vectors.embeddings import EmbeddingService
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_ATTRS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     # FalkorDB
@@ -24,14 +24,18 @@ Schema:
 """
 
 from .models import BridgeTableEntry, Base
-from .bridge_table import BridgeTable, BridgeTableConfig
+from .bridge_table import BridgeTable, BridgeTableConfig, BulkInsertStats
 from .bridge_builder import BridgeBuilder, insert_ingestion_result
+from .cache import BridgeCache, BridgeCacheStats
 
 __all__ = [
     "BridgeTable",
     "BridgeTableConfig",
+    "BulkInsertStats",
     "BridgeTableEntry",
     "Base",
     "BridgeBuilder",
     "insert_ingestion_result",
+    "BridgeCache",
+    "BridgeCacheStats",
 ]
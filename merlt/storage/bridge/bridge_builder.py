@@ -18,6 +18,7 @@ Usage:
     inserted = await builder.insert_mappings(result.bridge_mappings)
 """
 
+import time
 import structlog
 from typing import List, Dict, Any, Optional
 
@@ -120,14 +121,21 @@ class BridgeBuilder:
     async def insert_mappings(
         self,
         mappings: List[BridgeMapping],
-        batch_size: int = 100
+        batch_size: Optional[int] = None,
+        method: Optional[str] = None,
     ) -> int:
         """
         Insert multiple mappings in batches.
 
+        Ogni batch è un solo insert bulk (COPY o executemany, vedi
+        BridgeTable.add_mappings_batch); i mapping già presenti vengono
+        saltati.
+
         Args:
             mappings: List of BridgeMapping objects
-            batch_size: Number of mappings per batch (default 100)
+            batch_size: Number of mappings per batch
+                (default: bridge_table.config.bulk_chunk_size)
+            method: "copy" o "executemany" (default: bridge_table.config.bulk_method)
 
         Returns:
             Total number of mappings inserted
@@ -136,19 +144,28 @@ class BridgeBuilder:
             return 0
 
         converted = self.convert_batch(mappings)
+        batch_size = batch_size or self.bridge.config.bulk_chunk_size
         total_inserted = 0
+        start = time.perf_counter()
 
         # Insert in batches
         for i in range(0, len(converted), batch_size):
             batch = converted[i:i + batch_size]
-            inserted = await self.bridge.add_mappings_batch(batch)
+            inserted = await self.bridge.add_mappings_batch(
+                batch, method=method, chunk_size=batch_size
+            )
             total_inserted += inserted
-            log.info(
+            log.debug(
                 f"Inserted batch {i // batch_size + 1}: "
                 f"{inserted} mappings"
             )
 
-        log.info(f"Total mappings inserted: {total_inserted}")
+        elapsed = time.perf_counter() - start
+        rate = len(converted) / elapsed if elapsed > 0 else 0.0
+        log.info(
+            f"Total mappings inserted: {total_inserted}/{len(converted)} "
+            f"in {elapsed:.2f}s ({rate:.0f} rows/s)"
+        )
         return total_inserted
 
 
@@ -6,25 +6,37 @@ Service class for managing vector-to-graph mappings.
 
 Features:
 - Insert/update/delete mappings
-- Query by chunk_id or graph_node_urn
-- Batch operations for ingestion
+- Query by chunk_id or graph_node_urn (singoli o in batch con = ANY)
+- Cache read-through dei lookup (BridgeCache), invalidata dalle scritture
+- Batch operations for ingestion (COPY su tabella di staging o executemany)
 - Async/await for performance
 - Supporta separazione test/prod con tabelle diverse
 """
 
 import json
+import time
 import structlog
-from typing import List, Optional, Dict, Any, Type
+from typing import List, Optional, Dict, Any, Tuple, Type
 from uuid import UUID
 from dataclasses import dataclass, field
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
+from .cache import BridgeCache
 from .models import Base, get_bridge_table_model
 
 log = structlog.get_logger()
 
+# Metodi di insert bulk supportati da add_mappings_batch
+BULK_METHODS = ("copy", "executemany")
+
+# Colonne scritte dagli insert bulk (ordine dei record COPY)
+_BULK_COLUMNS = (
+    "chunk_id", "graph_node_urn", "node_type", "relation_type",
+    "confidence", "chunk_text", "source", "metadata",
+)
+
 
 @dataclass
 class BridgeTableConfig:
@@ -43,6 +55,11 @@ class BridgeTableConfig:
     pool_size: int = 10
     max_overflow: int = 20
     table_name: str = "bridge_table"  # Nome tabella (bridge_table_test, bridge_table_prod)
+    bulk_method: str = "copy"  # "copy" (COPY + staging) o "executemany"
+    bulk_chunk_size: int = 5000  # Righe per statement/COPY negli insert bulk
+    cache_size: int = 50_000  # Voci per direzione della cache lookup (0 = disattivata)
+    cache_ttl: Optional[float] = None  # Secondi di validità delle voci (None = fino a invalidazione)
+    cache_warm_prefixes: List[str] = field(default_factory=list)  # Codici caricati in cache in connect()
 
     def get_connection_string(self) -> str:
         """Get async PostgreSQL connection string."""
@@ -79,6 +96,62 @@ class BridgeTableConfig:
         return cls(table_name="bridge_table_prod")
 
 
+@dataclass
+class BulkInsertStats:
+    """
+    Statistiche dell'ultimo insert bulk (BridgeTable.last_bulk_stats).
+
+    rows sono le righe inviate, inserted quelle effettivamente scritte
+    (le coppie chunk_id/graph_node_urn già presenti vengono saltate).
+    """
+    method: str
+    rows: int = 0
+    inserted: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "method": self.method,
+            "rows": self.rows,
+            "inserted": self.inserted,
+            "chunks": self.chunks,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+def mapping_record(mapping: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Converte un mapping di add_mappings_batch in un record ordinato
+    come _BULK_COLUMNS (chunk_id come UUID, metadata come JSON).
+    """
+    metadata = mapping.get("metadata") or mapping.get("extra_metadata")
+    chunk_id = mapping["chunk_id"]
+    return (
+        chunk_id if isinstance(chunk_id, UUID) else UUID(str(chunk_id)),
+        mapping["graph_node_urn"],
+        mapping["node_type"],
+        mapping.get("relation_type"),
+        mapping.get("confidence"),
+        mapping.get("chunk_text"),
+        mapping.get("source"),
+        json.dumps(metadata) if metadata else None,
+    )
+
+
+def _inserted_count(status: str) -> int:
+    """Righe inserite dal command tag asyncpg ("INSERT 0 <n>")."""
+    try:
+        return int(status.split()[-1])
+    except (AttributeError, IndexError, ValueError):
+        return 0
+
+
 class BridgeTable:
     """
     Service for managing chunk-to-graph mappings.
@@ -115,6 +188,11 @@ class BridgeTable:
         self._engine = None
         self._session_maker = None
         self._connected = False
+        self.last_bulk_stats: Optional[BulkInsertStats] = None
+        self.cache: Optional[BridgeCache] = (
+            BridgeCache(self.config.cache_size, self.config.cache_ttl)
+            if self.config.cache_size > 0 else None
+        )
 
         # Modello specifico per la tabella configurata
         self._model_class = get_bridge_table_model(self.config.table_name)
@@ -149,6 +227,12 @@ class BridgeTable:
         self._connected = True
         log.info(f"Connected to PostgreSQL at {self.config.host}:{self.config.port}, table={self.config.table_name}")
 
+        if self.cache is not None and self.config.cache_warm_prefixes:
+            try:
+                await self.warm_cache(self.config.cache_warm_prefixes)
+            except Exception as e:
+                log.warning(f"Bridge cache warm-load failed: {e}")
+
     async def ensure_table_exists(self):
         """
         Crea la tabella se non esiste.
@@ -177,6 +261,8 @@ class BridgeTable:
         CREATE INDEX IF NOT EXISTS {self.config.table_name}_chunk_id_idx ON {self.config.table_name}(chunk_id);
         CREATE INDEX IF NOT EXISTS {self.config.table_name}_graph_node_urn_idx ON {self.config.table_name}(graph_node_urn);
         CREATE INDEX IF NOT EXISTS {self.config.table_name}_node_type_idx ON {self.config.table_name}(node_type);
+        CREATE INDEX IF NOT EXISTS {self.config.table_name}_chunk_id_node_type_idx ON {self.config.table_name}(chunk_id, node_type);
+        CREATE INDEX IF NOT EXISTS {self.config.table_name}_graph_node_urn_chunk_id_idx ON {self.config.table_name}(graph_node_urn, chunk_id);
         """
 
         async with self._engine.begin() as conn:
@@ -197,6 +283,8 @@ class BridgeTable:
 
         async with self._engine.begin() as conn:
             await conn.execute(text(f"DROP TABLE IF EXISTS {self.config.table_name} CASCADE"))
+        if self.cache is not None:
+            self.cache.clear()
 
         log.warning(f"Table {self.config.table_name} dropped")
 
@@ -211,6 +299,8 @@ class BridgeTable:
 
         async with self._engine.begin() as conn:
             await conn.execute(text(f"TRUNCATE TABLE {self.config.table_name}"))
+        if self.cache is not None:
+            self.cache.clear()
 
         log.warning(f"Table {self.config.table_name} truncated")
 
@@ -298,6 +388,9 @@ class BridgeTable:
             await session.commit()
             entry_id = result.scalar()
 
+            if self.cache is not None:
+                self.cache.invalidate([str(chunk_id)], [graph_node_urn])
+
             log.debug(
                 f"Added mapping: chunk_id={chunk_id} -> "
                 f"node_urn={graph_node_urn[:50]}..."
@@ -307,11 +400,21 @@ class BridgeTable:
 
     async def add_mappings_batch(
         self,
-        mappings: List[Dict[str, Any]]
+        mappings: List[Dict[str, Any]],
+        method: Optional[str] = None,
+        chunk_size: Optional[int] = None,
     ) -> int:
         """
         Add multiple mappings in a batch (faster for ingestion).
 
+        Le coppie (chunk_id, graph_node_urn) già presenti vengono saltate
+        (ON CONFLICT DO NOTHING), quindi un re-ingest è idempotente.
+
+        Metodi:
+        - "copy": copy_records_to_table asyncpg in una tabella di staging
+          temporanea, poi INSERT ... SELECT ... ON CONFLICT DO NOTHING
+        - "executemany": INSERT multi-riga via executemany, a blocchi
+
         Args:
             mappings: List of mapping dicts with keys:
                 - chunk_id (required)
@@ -322,9 +425,12 @@ class BridgeTable:
                 - chunk_text (optional)
                 - source (optional)
                 - metadata (optional)
+            method: "copy" o "executemany" (default: config.bulk_method)
+            chunk_size: Righe per COPY/statement (default: config.bulk_chunk_size)
 
         Returns:
-            Number of mappings inserted
+            Number of mappings inserted (righe nuove con "copy",
+            righe inviate con "executemany")
 
         Example:
             await bridge.add_mappings_batch([
@@ -343,34 +449,87 @@ class BridgeTable:
         if not mappings:
             return 0
 
+        method = method or self.config.bulk_method
+        if method not in BULK_METHODS:
+            raise ValueError(f"Unknown bulk method '{method}', expected one of {BULK_METHODS}")
+        chunk_size = max(1, chunk_size or self.config.bulk_chunk_size)
+
+        records = [mapping_record(m) for m in mappings]
+        stats = BulkInsertStats(method=method, rows=len(records))
+        start = time.perf_counter()
+
+        if method == "copy":
+            stats.inserted, stats.chunks = await self._copy_records(records, chunk_size)
+        else:
+            stats.inserted, stats.chunks = await self._executemany_records(records, chunk_size)
+
+        stats.seconds = time.perf_counter() - start
+        self.last_bulk_stats = stats
+
+        if self.cache is not None:
+            self.cache.invalidate({str(r[0]) for r in records}, {r[1] for r in records})
+
+        log.info(
+            f"Batch inserted {stats.inserted}/{stats.rows} mappings into {self.config.table_name} "
+            f"({method}, {stats.rows_per_second:.0f} rows/s)"
+        )
+        return stats.inserted
+
+    async def _copy_records(self, records: List[Tuple[Any, ...]], chunk_size: int) -> Tuple[int, int]:
+        """COPY in staging + INSERT ON CONFLICT, in una sola transazione."""
+        columns = ", ".join(_BULK_COLUMNS)
+        staging = f"{self.config.table_name}_staging"
+        inserted = 0
+        chunks = 0
+
+        async with self._engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            pg = raw.driver_connection
+            async with pg.transaction():
+                await pg.execute(
+                    f"CREATE TEMP TABLE IF NOT EXISTS {staging} ("
+                    "chunk_id UUID, graph_node_urn VARCHAR(500), node_type VARCHAR(50), "
+                    "relation_type VARCHAR(50), confidence FLOAT, chunk_text TEXT, "
+                    "source VARCHAR(100), metadata JSONB) ON COMMIT DELETE ROWS"
+                )
+                for i in range(0, len(records), chunk_size):
+                    await pg.copy_records_to_table(
+                        staging,
+                        records=records[i:i + chunk_size],
+                        columns=list(_BULK_COLUMNS),
+                    )
+                    status = await pg.execute(
+                        f"INSERT INTO {self.config.table_name} ({columns}) "
+                        f"SELECT {columns} FROM {staging} "
+                        "ON CONFLICT (chunk_id, graph_node_urn) DO NOTHING"
+                    )
+                    await pg.execute(f"TRUNCATE {staging}")
+                    inserted += _inserted_count(status)
+                    chunks += 1
+
+        return inserted, chunks
+
+    async def _executemany_records(self, records: List[Tuple[Any, ...]], chunk_size: int) -> Tuple[int, int]:
+        """INSERT ON CONFLICT via executemany, un blocco per statement."""
         insert_sql = text(f"""
             INSERT INTO {self.config.table_name}
             (chunk_id, graph_node_urn, node_type, relation_type, confidence, chunk_text, source, metadata)
             VALUES (:chunk_id, :graph_node_urn, :node_type, :relation_type, :confidence, :chunk_text, :source, CAST(:metadata AS jsonb))
+            ON CONFLICT (chunk_id, graph_node_urn) DO NOTHING
         """)
-
-        # Prepara i parametri per ogni mapping
-        params = []
-        for m in mappings:
-            metadata_json = json.dumps(m.get("metadata") or m.get("extra_metadata")) if (m.get("metadata") or m.get("extra_metadata")) else None
-            params.append({
-                "chunk_id": str(m["chunk_id"]),
-                "graph_node_urn": m["graph_node_urn"],
-                "node_type": m["node_type"],
-                "relation_type": m.get("relation_type"),
-                "confidence": m.get("confidence"),
-                "chunk_text": m.get("chunk_text"),
-                "source": m.get("source"),
-                "metadata": metadata_json
-            })
+        params = [
+            dict(zip(_BULK_COLUMNS, (str(r[0]),) + r[1:]))
+            for r in records
+        ]
+        chunks = 0
 
         async with self._session_maker() as session:
-            for p in params:
-                await session.execute(insert_sql, p)
+            for i in range(0, len(params), chunk_size):
+                await session.execute(insert_sql, params[i:i + chunk_size])
+                chunks += 1
             await session.commit()
 
-            log.info(f"Batch inserted {len(params)} mappings into {self.config.table_name}")
-            return len(params)
+        return len(params), chunks
 
     async def get_nodes_for_chunk(
         self,
@@ -392,15 +551,120 @@ class BridgeTable:
                 - confidence
                 - metadata
         """
+        grouped = await self.get_nodes_for_chunks([chunk_id], node_type=node_type)
+        nodes = grouped[str(chunk_id)]
+        log.debug(f"Found {len(nodes)} nodes for chunk_id={chunk_id}")
+        return nodes
+
+    async def get_chunks_for_node(
+        self,
+        graph_node_urn: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all chunks linked to a graph node.
+
+        Args:
+            graph_node_urn: URN of the graph node
+
+        Returns:
+            List of chunk dicts with fields:
+                - chunk_id
+                - chunk_text
+                - relation_type
+                - confidence
+        """
+        grouped = await self.get_chunks_for_nodes([graph_node_urn])
+        chunks = grouped[graph_node_urn]
+        log.debug(f"Found {len(chunks)} chunks for node_urn={graph_node_urn[:50]}...")
+        return chunks
+
+    async def get_nodes_for_chunks(
+        self,
+        chunk_ids: List[UUID],
+        node_type: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get graph nodes linked to many chunks in one query (chunk_id = ANY).
+
+        Con la cache attiva interroga solo i chunk non in cache (righe
+        complete, il filtro node_type è applicato in memoria).
+
+        Args:
+            chunk_ids: UUIDs of the chunks
+            node_type: Optional filter by node type
+
+        Returns:
+            Dict str(chunk_id) -> list of node dicts (same fields as
+            get_nodes_for_chunk); every requested chunk is present,
+            with an empty list if it has no mappings
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to PostgreSQL. Call connect() first.")
+
+        keys = list(dict.fromkeys(str(chunk_id) for chunk_id in chunk_ids))
+        if not keys:
+            return {}
+
+        if self.cache is None:
+            return await self._query_nodes_for_chunks(keys, node_type)
+
+        found, missing = self.cache.get_nodes(keys)
+        if missing:
+            fetched = await self._query_nodes_for_chunks(missing)
+            self.cache.put_nodes(fetched)
+            found.update(fetched)
+
+        if node_type:
+            return {key: [n for n in found[key] if n["node_type"] == node_type] for key in keys}
+        return {key: found[key] for key in keys}
+
+    async def get_chunks_for_nodes(
+        self,
+        graph_node_urns: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get chunks linked to many graph nodes in one query (graph_node_urn = ANY).
+
+        Con la cache attiva interroga solo i nodi non in cache.
+
+        Args:
+            graph_node_urns: URNs of the graph nodes
+
+        Returns:
+            Dict graph_node_urn -> list of chunk dicts (same fields as
+            get_chunks_for_node); every requested URN is present,
+            with an empty list if it has no mappings
+        """
         if not self._connected:
             raise RuntimeError("Not connected to PostgreSQL. Call connect() first.")
 
+        urns = list(dict.fromkeys(graph_node_urns))
+        if not urns:
+            return {}
+
+        if self.cache is None:
+            return await self._query_chunks_for_nodes(urns)
+
+        found, missing = self.cache.get_chunks(urns)
+        if missing:
+            fetched = await self._query_chunks_for_nodes(missing)
+            self.cache.put_chunks(fetched)
+            found.update(fetched)
+        return {urn: found[urn] for urn in urns}
+
+    async def _query_nodes_for_chunks(
+        self,
+        keys: List[str],
+        node_type: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        grouped: Dict[str, List[Dict[str, Any]]] = {key: [] for key in keys}
+
         query_sql = f"""
-            SELECT graph_node_urn, node_type, relation_type, confidence, metadata
+            SELECT chunk_id, graph_node_urn, node_type, relation_type, confidence, metadata
             FROM {self.config.table_name}
-            WHERE chunk_id = :chunk_id
+            WHERE chunk_id = ANY(CAST(:chunk_ids AS uuid[]))
         """
-        params = {"chunk_id": str(chunk_id)}
+        params: Dict[str, Any] = {"chunk_ids": keys}
 
         if node_type:
             query_sql += " AND node_type = :node_type"
@@ -410,63 +674,114 @@ class BridgeTable:
             result = await session.execute(text(query_sql), params)
             rows = result.fetchall()
 
-            log.debug(f"Found {len(rows)} nodes for chunk_id={chunk_id}")
+        for row in rows:
+            grouped[str(row[0])].append({
+                "graph_node_urn": row[1],
+                "node_type": row[2],
+                "relation_type": row[3],
+                "confidence": row[4],
+                "metadata": row[5]
+            })
 
-            return [
-                {
-                    "graph_node_urn": row[0],
-                    "node_type": row[1],
-                    "relation_type": row[2],
-                    "confidence": row[3],
-                    "metadata": row[4]
-                }
-                for row in rows
-            ]
+        log.debug(f"Found {len(rows)} nodes for {len(keys)} chunks")
+        return grouped
 
-    async def get_chunks_for_node(
-        self,
-        graph_node_urn: str
-    ) -> List[Dict[str, Any]]:
+    async def _query_chunks_for_nodes(self, urns: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        grouped: Dict[str, List[Dict[str, Any]]] = {urn: [] for urn in urns}
+
+        query_sql = f"""
+            SELECT graph_node_urn, chunk_id, chunk_text, relation_type, confidence
+            FROM {self.config.table_name}
+            WHERE graph_node_urn = ANY(CAST(:graph_node_urns AS varchar[]))
         """
-        Get all chunks linked to a graph node.
+
+        async with self._session_maker() as session:
+            result = await session.execute(
+                text(query_sql),
+                {"graph_node_urns": urns}
+            )
+            rows = result.fetchall()
+
+        for row in rows:
+            grouped[row[0]].append({
+                "chunk_id": str(row[1]),
+                "chunk_text": row[2],
+                "relation_type": row[3],
+                "confidence": row[4]
+            })
+
+        log.debug(f"Found {len(rows)} chunks for {len(urns)} nodes")
+        return grouped
+
+    async def warm_cache(self, urn_prefixes: List[str]) -> int:
+        """
+        Carica in cache tutti i mapping dei codici indicati.
+
+        Per ogni chunk collegato a un nodo il cui URN inizia con uno dei
+        prefissi vengono lette tutte le sue righe (anche verso nodi fuori
+        dal codice), così le voci chunk -> nodi sono complete; le voci
+        nodo -> chunks vengono registrate solo per i nodi del codice.
 
         Args:
-            graph_node_urn: URN of the graph node
+            urn_prefixes: Prefissi URN dei codici (es. URN del codice civile)
 
         Returns:
-            List of chunk dicts with fields:
-                - chunk_id
-                - chunk_text
-                - relation_type
-                - confidence
+            Numero di righe caricate (0 se la cache è disattivata)
         """
         if not self._connected:
             raise RuntimeError("Not connected to PostgreSQL. Call connect() first.")
+        if self.cache is None or not urn_prefixes:
+            return 0
 
+        patterns = [
+            prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            for prefix in urn_prefixes
+        ]
         query_sql = f"""
-            SELECT chunk_id, chunk_text, relation_type, confidence
+            SELECT chunk_id, graph_node_urn, node_type, relation_type, confidence, metadata, chunk_text
             FROM {self.config.table_name}
-            WHERE graph_node_urn = :graph_node_urn
+            WHERE chunk_id IN (
+                SELECT chunk_id FROM {self.config.table_name}
+                WHERE graph_node_urn LIKE ANY(CAST(:patterns AS text[]))
+            )
         """
 
         async with self._session_maker() as session:
-            result = await session.execute(
-                text(query_sql),
-                {"graph_node_urn": graph_node_urn}
-            )
+            result = await session.execute(text(query_sql), {"patterns": patterns})
             rows = result.fetchall()
 
-            log.debug(f"Found {len(rows)} chunks for node_urn={graph_node_urn[:50]}...")
+        prefixes = tuple(urn_prefixes)
+        nodes_by_chunk: Dict[str, List[Dict[str, Any]]] = {}
+        chunks_by_node: Dict[str, List[Dict[str, Any]]] = {}
+        for chunk_id, urn, node_type, relation_type, confidence, metadata, chunk_text in rows:
+            nodes_by_chunk.setdefault(str(chunk_id), []).append({
+                "graph_node_urn": urn,
+                "node_type": node_type,
+                "relation_type": relation_type,
+                "confidence": confidence,
+                "metadata": metadata
+            })
+            if urn.startswith(prefixes):
+                chunks_by_node.setdefault(urn, []).append({
+                    "chunk_id": str(chunk_id),
+                    "chunk_text": chunk_text,
+                    "relation_type": relation_type,
+                    "confidence": confidence
+                })
 
-            return [
-                {
-                    "chunk_id": str(row[0]),
-                    "chunk_text": row[1],
-                    "relation_type": row[2],
-                    "confidence": row[3]
-                }
-                for row in rows
-            ]
+        self.cache.put_nodes(nodes_by_chunk)
+        self.cache.put_chunks(chunks_by_node)
+
+        if max(len(nodes_by_chunk), len(chunks_by_node)) > self.cache.max_size:
+            log.warning(
+                f"Bridge cache warm-load exceeds cache_size={self.cache.max_size} "
+                f"({len(nodes_by_chunk)} chunks, {len(chunks_by_node)} nodes)"
+            )
+        log.info(
+            f"Bridge cache warmed: {len(rows)} rows, {len(nodes_by_chunk)} chunks, "
+            f"{len(chunks_by_node)} nodes"
+        )
+        return len(rows)
 
     async def delete_mappings_for_chunk(self, chunk_id: UUID) -> int:
         """
@@ -494,6 +809,8 @@ class BridgeTable:
             await session.commit()
 
             count = result.rowcount
+            if self.cache is not None:
+                self.cache.invalidate([str(chunk_id)])
             log.debug(f"Deleted {count} mappings for chunk_id={chunk_id}")
             return count
 
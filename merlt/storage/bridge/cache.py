@@ -0,0 +1,205 @@
+"""
+Bridge Table Cache
+==================
+
+Cache read-through in memoria per i lookup della Bridge Table.
+
+I mapping chunk -> nodo cambiano solo durante l'ingestion ma vengono letti a
+ogni query: la cache tiene, per chunk_id e per graph_node_urn, la lista
+completa delle righe lette da PostgreSQL (LRU limitata, con TTL opzionale
+per accorgersi di scritture fatte da altri processi).
+
+Le voci si popolano con le letture (singole e batch) e con il warm-load dei
+codici più usati; ogni scrittura della BridgeTable invalida le chiavi
+toccate.
+
+Usage:
+    config = BridgeTableConfig(cache_size=100_000, cache_ttl=3600)
+    bridge = BridgeTable(config)
+    await bridge.connect()
+    await bridge.warm_cache(["https://www.normattiva.it/uri-res/N2Ls?urn:nir:stato:regio.decreto:1942-03-16;262:2"])
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+Rows = List[Dict[str, Any]]
+
+
+@dataclass
+class BridgeCacheStats:
+    """Contatori della cache."""
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 3),
+        }
+
+
+class _LRU:
+    """Mappa chiave -> (righe, timestamp) con limite di voci e TTL."""
+
+    def __init__(self, max_size: int, ttl: Optional[float], stats: BridgeCacheStats):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stats = stats
+        self._data: "OrderedDict[str, Tuple[Rows, float]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Rows]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        rows, stored_at = entry
+        if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return rows
+
+    def put(self, key: str, rows: Rows) -> None:
+        self._data[key] = (rows, time.monotonic())
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.stats.evictions += 1
+
+    def discard(self, key: str) -> bool:
+        return self._data.pop(key, None) is not None
+
+    def keys_where(self, predicate) -> List[str]:
+        return [key for key, (rows, _) in self._data.items() if predicate(rows)]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class BridgeCache:
+    """
+    Cache LRU dei lookup chunk -> nodi e nodo -> chunks.
+
+    Le righe in cache sono sempre la lista completa per la chiave (senza
+    filtri): i filtri (es. node_type) si applicano in memoria. Le liste
+    restituite sono copie, modificarle non altera la cache.
+
+    Args:
+        max_size: Voci massime per direzione (chunk e nodo)
+        ttl: Secondi di validità di una voce (None = fino a invalidazione)
+    """
+
+    def __init__(self, max_size: int = 50_000, ttl: Optional[float] = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stats = BridgeCacheStats()
+        self._chunks = _LRU(max_size, ttl, self.stats)
+        self._nodes = _LRU(max_size, ttl, self.stats)
+
+    @staticmethod
+    def _copy(rows: Rows) -> Rows:
+        return [dict(row) for row in rows]
+
+    def _lookup(self, lru: _LRU, keys: Iterable[str]) -> Tuple[Dict[str, Rows], List[str]]:
+        found: Dict[str, Rows] = {}
+        missing: List[str] = []
+        for key in keys:
+            rows = lru.get(key)
+            if rows is None:
+                missing.append(key)
+            else:
+                found[key] = self._copy(rows)
+        self.stats.hits += len(found)
+        self.stats.misses += len(missing)
+        return found, missing
+
+    def get_nodes(self, chunk_ids: Iterable[str]) -> Tuple[Dict[str, Rows], List[str]]:
+        """
+        Nodi in cache per i chunk richiesti.
+
+        Returns:
+            (dict chunk_id -> nodi per le hit, lista dei chunk_id mancanti)
+        """
+        return self._lookup(self._chunks, chunk_ids)
+
+    def get_chunks(self, graph_node_urns: Iterable[str]) -> Tuple[Dict[str, Rows], List[str]]:
+        """
+        Chunks in cache per i nodi richiesti.
+
+        Returns:
+            (dict urn -> chunks per le hit, lista degli urn mancanti)
+        """
+        return self._lookup(self._nodes, graph_node_urns)
+
+    def put_nodes(self, nodes_by_chunk: Dict[str, Rows]) -> None:
+        """Registra le liste complete di nodi per chunk_id."""
+        for chunk_id, rows in nodes_by_chunk.items():
+            self._chunks.put(chunk_id, self._copy(rows))
+
+    def put_chunks(self, chunks_by_node: Dict[str, Rows]) -> None:
+        """Registra le liste complete di chunks per graph_node_urn."""
+        for urn, rows in chunks_by_node.items():
+            self._nodes.put(urn, self._copy(rows))
+
+    def invalidate(
+        self,
+        chunk_ids: Iterable[str] = (),
+        graph_node_urns: Iterable[str] = (),
+    ) -> int:
+        """
+        Invalida le voci toccate da una scrittura.
+
+        Per ogni chunk invalidato vengono invalidati anche i nodi in cache
+        che lo contengono (la riga rimossa o aggiunta compare in entrambe
+        le direzioni).
+
+        Returns:
+            Numero di voci rimosse
+        """
+        chunk_ids = set(chunk_ids)
+        urns = set(graph_node_urns)
+        if chunk_ids:
+            urns.update(self._nodes.keys_where(
+                lambda rows: any(row.get("chunk_id") in chunk_ids for row in rows)
+            ))
+
+        removed = sum(self._chunks.discard(key) for key in chunk_ids)
+        removed += sum(self._nodes.discard(key) for key in urns)
+        self.stats.invalidations += removed
+        return removed
+
+    def clear(self) -> None:
+        """Svuota la cache."""
+        self.stats.invalidations += len(self._chunks) + len(self._nodes)
+        self._chunks.clear()
+        self._nodes.clear()
+
+    def __len__(self) -> int:
+        return len(self._chunks) + len(self._nodes)
+
+    def __repr__(self) -> str:
+        return (
+            f"BridgeCache(chunks={len(self._chunks)}, nodes={len(self._nodes)}, "
+            f"max_size={self.max_size}, hit_rate={self.stats.hit_rate:.2f})"
+        )
+
+
+__all__ = [
+    "BridgeCache",
+    "BridgeCacheStats",
+]
@@ -51,6 +51,10 @@ CREATE INDEX IF NOT EXISTS idx_bridge_confidence ON bridge_table(confidence);
 -- Composite index for hybrid queries
 CREATE INDEX IF NOT EXISTS idx_bridge_chunk_node ON bridge_table(chunk_id, graph_node_urn);
 
+-- Composite indexes for batched lookups (chunk_id = ANY / graph_node_urn = ANY)
+CREATE INDEX IF NOT EXISTS idx_bridge_chunk_node_type ON bridge_table(chunk_id, node_type);
+CREATE INDEX IF NOT EXISTS idx_bridge_node_chunk ON bridge_table(graph_node_urn, chunk_id);
+
 -- Update trigger for updated_at
 CREATE OR REPLACE FUNCTION update_bridge_table_updated_at()
 RETURNS TRIGGER AS $$
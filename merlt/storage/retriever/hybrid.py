@@ -137,13 +137,24 @@ class GraphAwareRetriever:
         # STEP 2: Graph enrichment
         enriched_results = []
 
+        # Bridge table fallback: one round-trip for all candidates without article_urn
+        use_graph = hasattr(self.graph_db, 'get_related_nodes_for_article')
+        bridge_chunk_ids = [
+            vr.chunk_id for vr in vector_results
+            if not (use_graph and vr.metadata.get("article_urn", ""))
+        ]
+        bridge_nodes = (
+            await self.bridge.get_nodes_for_chunks(bridge_chunk_ids)
+            if bridge_chunk_ids else {}
+        )
+
         for vr in vector_results:
             # Get article_urn from payload metadata (more reliable than chunk_id)
             article_urn = vr.metadata.get("article_urn", "")
 
             # Find graph nodes linked to this article via FalkorDB
             # This is more reliable than bridge table since it queries the graph directly
-            if article_urn and hasattr(self.graph_db, 'get_related_nodes_for_article'):
+            if article_urn and use_graph:
                 linked_nodes = await self.graph_db.get_related_nodes_for_article(
                     article_urn,
                     max_results=10
@@ -161,7 +172,7 @@ class GraphAwareRetriever:
                 ]
             else:
                 # Fallback to bridge table (may not work if chunk_id mismatch)
-                linked_nodes = await self.bridge.get_nodes_for_chunk(vr.chunk_id)
+                linked_nodes = bridge_nodes.get(str(vr.chunk_id), [])
 
             # Compute graph score
             graph_score = await self._compute_graph_score(
@@ -88,6 +88,8 @@ class RetrieverConfig:
                                  Default: True
         collection_name: Qdrant collection name
                          Default: 'merl_t_dev_chunks'
+        qdrant_profile: Collection profile name, used for search params
+                        (hnsw ef, quantization rescoring). Default: None
     """
     alpha: float = 0.7
     over_retrieve_factor: int = 3
@@ -95,6 +97,7 @@ class RetrieverConfig:
     default_graph_score: float = 0.5
     enable_graph_enrichment: bool = True
     collection_name: str = "merl_t_dev_chunks"
+    qdrant_profile: Optional[str] = None
 
     def __post_init__(self):
         """Validate configuration values."""
@@ -66,7 +66,8 @@ class GraphAwareRetriever:
         vector_db: Any,  # Qdrant client (not typed to avoid dependency)
         graph_db: FalkorDBClient,
         bridge_table: BridgeTable,
-        config: Optional[RetrieverConfig] = None
+        config: Optional[RetrieverConfig] = None,
+        content_store: Optional[Any] = None,
     ):
         """
         Initialize GraphAwareRetriever.
@@ -76,11 +77,14 @@ class GraphAwareRetriever:
             graph_db: FalkorDB client for graph traversal
             bridge_table: Bridge table for chunk→node mapping
             config: Retriever configuration (default: alpha=0.7)
+            content_store: ChunkContentStore for slim-payload collections
+                           (texts not stored in the Qdrant payload)
         """
         self.vector_db = vector_db
         self.graph_db = graph_db
         self.bridge = bridge_table
         self.config = config or RetrieverConfig()
+        self.content_store = content_store
 
         log.info(
             f"GraphAwareRetriever initialized - "
@@ -144,13 +148,24 @@ class GraphAwareRetriever:
         # STEP 2: Graph enrichment
         enriched_results = []
 
+        # Bridge table fallback: one round-trip for all candidates without article_urn
+        use_graph = hasattr(self.graph_db, 'get_related_nodes_for_article')
+        bridge_chunk_ids = [
+            vr.chunk_id for vr in vector_results
+            if not (use_graph and vr.metadata.get("article_urn", ""))
+        ]
+        bridge_nodes = (
+            await self.bridge.get_nodes_for_chunks(bridge_chunk_ids)
+            if bridge_chunk_ids else {}
+        )
+
         for vr in vector_results:
             # Get article_urn from payload metadata (more reliable than chunk_id)
             article_urn = vr.metadata.get("article_urn", "")
 
             # Find graph nodes linked to this article via FalkorDB
             # This is more reliable than bridge table since it queries the graph directly
-            if article_urn and hasattr(self.graph_db, 'get_related_nodes_for_article'):
+            if article_urn and use_graph:
                 linked_nodes = await self.graph_db.get_related_nodes_for_article(
                     article_urn,
                     max_results=10
@@ -168,7 +183,7 @@ class GraphAwareRetriever:
                 ]
             else:
                 # Fallback to bridge table (may not work if chunk_id mismatch)
-                linked_nodes = await self.bridge.get_nodes_for_chunk(vr.chunk_id)
+                linked_nodes = bridge_nodes.get(str(vr.chunk_id), [])
 
             # Compute graph score
             graph_score = await self._compute_graph_score(
@@ -248,11 +263,17 @@ class GraphAwareRetriever:
                 log.debug(f"Applying source_type filter: {source_types}")
 
             # query_points() is the correct API for qdrant-client 1.16+
+            search_params = None
+            if self.config.qdrant_profile:
+                from merlt.storage.vectors.collections import get_collection_profile
+                search_params = get_collection_profile(self.config.qdrant_profile).search_params()
+
             response = self.vector_db.query_points(
                 collection_name=collection_name,
                 query=query_embedding,
                 limit=limit,
-                query_filter=query_filter
+                query_filter=query_filter,
+                search_params=search_params,
             )
 
             results = []
@@ -279,6 +300,17 @@ class GraphAwareRetriever:
                     similarity_score=r.score,
                     metadata=r.payload or {}
                 ))
+
+            # Slim payload: testo recuperato dal content store solo per i risultati
+            if self.content_store is not None:
+                missing = {
+                    str(point.id): result
+                    for point, result in zip(response.points, results)
+                    if not result.text
+                }
+                if missing:
+                    for point_id, text in self.content_store.get_many(missing).items():
+                        missing[point_id].text = text
             return results
 
         except Exception as e:
@@ -6,6 +6,10 @@ Embeddings con E5-large e storage su Qdrant.
 
 Componenti:
 - EmbeddingService: Generazione embeddings con E5-large multilingual
+- EncodeExecutor: Pool dedicato per l'encoding con backpressure e metriche
+- QdrantCollectionProfile: Profili collection (quantizzazione, on-disk, HNSW)
+- ChunkContentStore: Store locale dei testi per la modalità slim payload
+- chunk_point_id / upsert_changed_points: Id deterministici e upsert incrementali
 
 Esempio:
     from merlt.storage.vectors import EmbeddingService
@@ -15,8 +19,46 @@ Esempio:
     doc_vector = service.encode_document(article_text)
 """
 
-from merlt.storage.vectors.embeddings import EmbeddingService
+from typing import TYPE_CHECKING
+
+from merlt.storage.vectors.collections import (
+    COLLECTION_PROFILES,
+    QdrantCollectionProfile,
+    get_collection_profile,
+)
+from merlt.storage.vectors.content_store import ChunkContentStore
+from merlt.storage.vectors.executor import EncodeExecutor, EncodeExecutorStats
+from merlt.storage.vectors.points import (
+    PointCandidate,
+    build_article_points,
+    chunk_point_id,
+    content_hash,
+    upsert_changed_points,
+)
+
+if TYPE_CHECKING:
+    from merlt.storage.vectors.embeddings import EmbeddingService
+
+
+def __getattr__(name: str):
+    # EmbeddingService importa il modulo solo on-demand (PEP 562)
+    if name == "EmbeddingService":
+        from merlt.storage.vectors.embeddings import EmbeddingService
+        globals()[name] = EmbeddingService
+        return EmbeddingService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "EmbeddingService",
+    "EncodeExecutor",
+    "EncodeExecutorStats",
+    "COLLECTION_PROFILES",
+    "QdrantCollectionProfile",
+    "get_collection_profile",
+    "ChunkContentStore",
+    "PointCandidate",
+    "build_article_points",
+    "chunk_point_id",
+    "content_hash",
+    "upsert_changed_points",
 ]
@@ -0,0 +1,525 @@
+"""
+Qdrant Collection Profiles
+==========================
+
+Profili nominati per la creazione delle collection Qdrant.
+
+Un profilo raccoglie le scelte di storage e indicizzazione di una collection:
+- Scalar quantization int8 (con rescoring sui vettori originali)
+- Vettori e payload su disco (mmap) invece che in RAM
+- Parametri HNSW (`m`, `ef_construct`) e `ef` di ricerca
+
+Profili disponibili:
+- default: float32 in RAM, parametri HNSW di Qdrant (comportamento storico)
+- quantized: int8 in RAM + originali in RAM, rescoring
+- on_disk: vettori e payload su disco, nessuna quantizzazione
+- quantized_on_disk: int8 in RAM, originali e payload su disco, rescoring
+
+Con E5-large (1024 dim) un vettore float32 occupa 4KB: int8 lo riduce a 1KB
+in RAM, mentre gli originali su disco servono solo al rescoring dei top-k.
+
+Al setup vengono inoltre creati indici keyword sui campi di payload usati nei
+filtri (source_type, article_urn, tipo_atto), anche su collection esistenti.
+
+Usage:
+    from merlt.storage.vectors.collections import (
+        get_collection_profile, ensure_collection, migrate_collection, compare_collections,
+    )
+
+    profile = get_collection_profile("quantized_on_disk")
+    ensure_collection(client, "merl_t_prod_chunks", 1024, profile)
+
+    # Ricostruisce una collection esistente con un nuovo profilo
+    result = migrate_collection(client, "merl_t_prod_chunks", "merl_t_prod_chunks_q8", profile)
+    report = compare_collections(client, "merl_t_prod_chunks", "merl_t_prod_chunks_q8", profile)
+    print(report.summary())
+"""
+
+import random
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import structlog
+
+log = structlog.get_logger()
+
+
+@dataclass(frozen=True)
+class QdrantCollectionProfile:
+    """
+    Profilo di storage/indicizzazione per una collection Qdrant.
+
+    Attributes:
+        name: Nome del profilo
+        description: Descrizione leggibile
+        hnsw_m: Archi per nodo del grafo HNSW (default Qdrant: 16)
+        hnsw_ef_construct: Ampiezza della ricerca in costruzione (default Qdrant: 100)
+        hnsw_on_disk: Se True, l'indice HNSW è su disco
+        search_ef: `ef` usato in ricerca (None = default Qdrant)
+        vectors_on_disk: Se True, i vettori originali sono su disco (mmap)
+        payload_on_disk: Se True, il payload è su disco
+        scalar_quantization: Se True, abilita quantizzazione scalare int8
+        quantile: Quantile per il calcolo dei bound di quantizzazione
+        quantization_always_ram: Mantiene i vettori quantizzati in RAM
+        rescore: Rescoring dei candidati con i vettori originali
+        oversampling: Fattore di over-retrieval prima del rescoring
+    """
+    name: str
+    description: str = ""
+    hnsw_m: int = 16
+    hnsw_ef_construct: int = 100
+    hnsw_on_disk: bool = False
+    search_ef: Optional[int] = None
+    vectors_on_disk: bool = False
+    payload_on_disk: bool = False
+    scalar_quantization: bool = False
+    quantile: float = 0.99
+    quantization_always_ram: bool = True
+    rescore: bool = True
+    oversampling: float = 2.0
+
+    def vectors_config(self, dimension: int) -> Any:
+        """VectorParams per create_collection."""
+        from qdrant_client.models import Distance, VectorParams
+
+        return VectorParams(
+            size=dimension,
+            distance=Distance.COSINE,
+            on_disk=self.vectors_on_disk,
+        )
+
+    def hnsw_config(self) -> Any:
+        """HnswConfigDiff per create_collection."""
+        from qdrant_client.models import HnswConfigDiff
+
+        return HnswConfigDiff(
+            m=self.hnsw_m,
+            ef_construct=self.hnsw_ef_construct,
+            on_disk=self.hnsw_on_disk,
+        )
+
+    def quantization_config(self) -> Optional[Any]:
+        """ScalarQuantization int8, o None se disabilitata."""
+        if not self.scalar_quantization:
+            return None
+
+        from qdrant_client.models import ScalarQuantization, ScalarQuantizationConfig, ScalarType
+
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8,
+                quantile=self.quantile,
+                always_ram=self.quantization_always_ram,
+            )
+        )
+
+    def search_params(self) -> Optional[Any]:
+        """SearchParams da passare a query_points (None = default Qdrant)."""
+        if self.search_ef is None and not self.scalar_quantization:
+            return None
+
+        from qdrant_client.models import QuantizationSearchParams, SearchParams
+
+        quantization = None
+        if self.scalar_quantization:
+            quantization = QuantizationSearchParams(
+                ignore=False,
+                rescore=self.rescore,
+                oversampling=self.oversampling,
+            )
+
+        return SearchParams(hnsw_ef=self.search_ef, quantization=quantization)
+
+    def create_collection_kwargs(self, dimension: int) -> Dict[str, Any]:
+        """Argomenti keyword per QdrantClient.create_collection."""
+        return {
+            "vectors_config": self.vectors_config(dimension),
+            "hnsw_config": self.hnsw_config(),
+            "quantization_config": self.quantization_config(),
+            "on_disk_payload": self.payload_on_disk,
+        }
+
+
+COLLECTION_PROFILES: Dict[str, QdrantCollectionProfile] = {
+    "default": QdrantCollectionProfile(
+        name="default",
+        description="float32 in RAM, parametri HNSW di Qdrant",
+    ),
+    "quantized": QdrantCollectionProfile(
+        name="quantized",
+        description="int8 scalar quantization in RAM con rescoring",
+        hnsw_ef_construct=200,
+        search_ef=128,
+        scalar_quantization=True,
+    ),
+    "on_disk": QdrantCollectionProfile(
+        name="on_disk",
+        description="vettori e payload su disco (mmap), HNSW in RAM",
+        hnsw_ef_construct=200,
+        search_ef=128,
+        vectors_on_disk=True,
+        payload_on_disk=True,
+    ),
+    "quantized_on_disk": QdrantCollectionProfile(
+        name="quantized_on_disk",
+        description="int8 in RAM, originali e payload su disco, rescoring",
+        hnsw_ef_construct=200,
+        search_ef=128,
+        vectors_on_disk=True,
+        payload_on_disk=True,
+        scalar_quantization=True,
+    ),
+}
+
+
+def get_collection_profile(
+    profile: Union[str, QdrantCollectionProfile, None],
+) -> QdrantCollectionProfile:
+    """
+    Risolve un profilo per nome (o ritorna l'istanza passata).
+
+    Args:
+        profile: Nome profilo, istanza QdrantCollectionProfile, o None (default)
+
+    Returns:
+        QdrantCollectionProfile
+
+    Raises:
+        ValueError: Se il nome non corrisponde a nessun profilo
+    """
+    if isinstance(profile, QdrantCollectionProfile):
+        return profile
+    name = profile or "default"
+    if name not in COLLECTION_PROFILES:
+        raise ValueError(
+            f"Unknown Qdrant collection profile: {name!r}. "
+            f"Available: {sorted(COLLECTION_PROFILES)}"
+        )
+    return COLLECTION_PROFILES[name]
+
+
+# Campi di payload filtrati in retrieval/ingestion: indicizzati come keyword
+DEFAULT_PAYLOAD_INDEXES: Tuple[str, ...] = ("source_type", "article_urn", "tipo_atto")
+
+
+def ensure_payload_indexes(
+    client: Any,
+    collection_name: str,
+    fields: Sequence[str] = DEFAULT_PAYLOAD_INDEXES,
+) -> List[str]:
+    """
+    Crea gli indici keyword mancanti sui campi di payload indicati.
+
+    Senza indice Qdrant valuta i filtri (es. source_type) scorrendo i payload,
+    con costo che cresce con la collection.
+
+    Returns:
+        Campi per cui è stato creato un indice
+    """
+    from qdrant_client.models import PayloadSchemaType
+
+    existing = client.get_collection(collection_name).payload_schema or {}
+    created = []
+    for field_name in fields:
+        if field_name in existing:
+            continue
+        client.create_payload_index(
+            collection_name=collection_name,
+            field_name=field_name,
+            field_schema=PayloadSchemaType.KEYWORD,
+        )
+        created.append(field_name)
+
+    if created:
+        log.info(f"Created payload indexes on {collection_name}: {created}")
+    return created
+
+
+def ensure_collection(
+    client: Any,
+    collection_name: str,
+    dimension: int,
+    profile: Union[str, QdrantCollectionProfile, None] = None,
+    payload_indexes: Sequence[str] = DEFAULT_PAYLOAD_INDEXES,
+) -> bool:
+    """
+    Crea la collection con il profilo indicato se non esiste.
+
+    Una collection esistente non viene modificata: per cambiare profilo
+    usare migrate_collection. Gli indici di payload mancanti vengono creati
+    in entrambi i casi.
+
+    Returns:
+        True se la collection è stata creata
+    """
+    profile = get_collection_profile(profile)
+
+    collections = client.get_collections().collections
+    created = not any(c.name == collection_name for c in collections)
+
+    if created:
+        client.create_collection(
+            collection_name=collection_name,
+            **profile.create_collection_kwargs(dimension),
+        )
+        log.info(f"Created Qdrant collection: {collection_name} (profile={profile.name})")
+
+    if payload_indexes:
+        ensure_payload_indexes(client, collection_name, payload_indexes)
+
+    return created
+
+
+@dataclass
+class CollectionMigrationResult:
+    """Risultato di migrate_collection."""
+    source: str
+    target: str
+    profile: str
+    points_copied: int = 0
+    duration_seconds: float = 0.0
+
+    def summary(self) -> str:
+        rate = self.points_copied / self.duration_seconds if self.duration_seconds else 0.0
+        return (
+            f"Migrated {self.points_copied} points {self.source} -> {self.target} "
+            f"(profile={self.profile}) in {self.duration_seconds:.1f}s ({rate:.0f} pts/s)"
+        )
+
+
+def _collection_dimension(client: Any, collection_name: str) -> int:
+    """Dimensione dei vettori (collection a vettore singolo non nominato)."""
+    info = client.get_collection(collection_name)
+    vectors = info.config.params.vectors
+    if isinstance(vectors, dict):
+        raise ValueError(f"Collection {collection_name} uses named vectors, not supported")
+    return vectors.size
+
+
+def migrate_collection(
+    client: Any,
+    source: str,
+    target: str,
+    profile: Union[str, QdrantCollectionProfile, None],
+    batch_size: int = 256,
+    recreate: bool = False,
+) -> CollectionMigrationResult:
+    """
+    Ricostruisce `source` in una nuova collection `target` con il profilo dato.
+
+    Copia punti (id, vettore, payload) via scroll + upsert. La collection
+    sorgente non viene toccata: lo switch (rename/alias) resta esplicito.
+
+    Args:
+        client: QdrantClient
+        source: Collection esistente
+        target: Collection da creare
+        profile: Profilo della nuova collection
+        batch_size: Punti per pagina di scroll/upsert
+        recreate: Se True, elimina `target` se già esiste
+
+    Returns:
+        CollectionMigrationResult
+    """
+    profile = get_collection_profile(profile)
+    start = time.perf_counter()
+
+    if recreate and any(c.name == target for c in client.get_collections().collections):
+        client.delete_collection(target)
+        log.info(f"Deleted existing target collection: {target}")
+
+    ensure_collection(client, target, _collection_dimension(client, source), profile)
+
+    from qdrant_client.models import PointStruct
+
+    result = CollectionMigrationResult(source=source, target=target, profile=profile.name)
+    offset = None
+    while True:
+        records, offset = client.scroll(
+            collection_name=source,
+            limit=batch_size,
+            offset=offset,
+            with_payload=True,
+            with_vectors=True,
+        )
+        if records:
+            client.upsert(
+                collection_name=target,
+                points=[
+                    PointStruct(id=r.id, vector=r.vector, payload=r.payload or {})
+                    for r in records
+                ],
+                wait=True,
+            )
+            result.points_copied += len(records)
+            log.debug(f"Migrated {result.points_copied} points to {target}")
+        if offset is None:
+            break
+
+    result.duration_seconds = time.perf_counter() - start
+    log.info(result.summary())
+    return result
+
+
+@dataclass
+class ProfileComparisonReport:
+    """
+    Confronto recall/latenza tra due collection con gli stessi punti.
+
+    La recall@k è misurata rispetto a una ricerca esatta (brute force) sulla
+    collection baseline.
+    """
+    baseline: str
+    candidate: str
+    candidate_profile: str
+    top_k: int
+    num_queries: int
+    recall_at_k: float = 0.0
+    baseline_latency_ms: Dict[str, float] = field(default_factory=dict)
+    candidate_latency_ms: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "baseline": self.baseline,
+            "candidate": self.candidate,
+            "candidate_profile": self.candidate_profile,
+            "top_k": self.top_k,
+            "num_queries": self.num_queries,
+            "recall_at_k": round(self.recall_at_k, 4),
+            "baseline_latency_ms": self.baseline_latency_ms,
+            "candidate_latency_ms": self.candidate_latency_ms,
+        }
+
+    def summary(self) -> str:
+        return (
+            f"{self.candidate} ({self.candidate_profile}) vs {self.baseline}: "
+            f"recall@{self.top_k}={self.recall_at_k:.3f} over {self.num_queries} queries | "
+            f"p50 {self.baseline_latency_ms.get('p50', 0):.1f}ms -> "
+            f"{self.candidate_latency_ms.get('p50', 0):.1f}ms | "
+            f"p95 {self.baseline_latency_ms.get('p95', 0):.1f}ms -> "
+            f"{self.candidate_latency_ms.get('p95', 0):.1f}ms"
+        )
+
+
+def _latency_stats(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        "mean": round(statistics.fmean(ordered), 3),
+        "p50": round(statistics.median(ordered), 3),
+        "p95": round(ordered[p95_index], 3),
+    }
+
+
+def sample_query_vectors(
+    client: Any,
+    collection_name: str,
+    num_queries: int = 100,
+    seed: int = 42,
+) -> List[List[float]]:
+    """Campiona vettori già indicizzati da usare come query di benchmark."""
+    records, _ = client.scroll(
+        collection_name=collection_name,
+        limit=max(num_queries * 5, num_queries),
+        with_payload=False,
+        with_vectors=True,
+    )
+    vectors = [r.vector for r in records if r.vector is not None]
+    rng = random.Random(seed)
+    return rng.sample(vectors, min(num_queries, len(vectors)))
+
+
+def compare_collections(
+    client: Any,
+    baseline: str,
+    candidate: str,
+    candidate_profile: Union[str, QdrantCollectionProfile, None] = None,
+    query_vectors: Optional[Sequence[List[float]]] = None,
+    top_k: int = 10,
+    num_queries: int = 100,
+    baseline_profile: Union[str, QdrantCollectionProfile, None] = None,
+) -> ProfileComparisonReport:
+    """
+    Confronta recall@k e latenza di ricerca tra baseline e candidate.
+
+    Args:
+        client: QdrantClient
+        baseline: Collection di riferimento
+        candidate: Collection migrata
+        candidate_profile: Profilo della candidate (per i search params)
+        query_vectors: Query vector; se None vengono campionati da baseline
+        top_k: k per la recall
+        num_queries: Numero di query campionate se query_vectors è None
+        baseline_profile: Profilo della baseline (per i search params)
+
+    Returns:
+        ProfileComparisonReport
+    """
+    candidate_profile = get_collection_profile(candidate_profile)
+    baseline_profile = get_collection_profile(baseline_profile)
+
+    from qdrant_client.models import SearchParams
+
+    if query_vectors is None:
+        query_vectors = sample_query_vectors(client, baseline, num_queries)
+
+    report = ProfileComparisonReport(
+        baseline=baseline,
+        candidate=candidate,
+        candidate_profile=candidate_profile.name,
+        top_k=top_k,
+        num_queries=len(query_vectors),
+    )
+    if not query_vectors:
+        return report
+
+    def timed_ids(collection: str, vector: List[float], params: Any):
+        t0 = time.perf_counter()
+        response = client.query_points(
+            collection_name=collection,
+            query=vector,
+            limit=top_k,
+            search_params=params,
+            with_payload=False,
+        )
+        return [p.id for p in response.points], (time.perf_counter() - t0) * 1000
+
+    recalls: List[float] = []
+    baseline_times: List[float] = []
+    candidate_times: List[float] = []
+
+    for vector in query_vectors:
+        exact_ids, _ = timed_ids(baseline, vector, SearchParams(exact=True))
+        _, baseline_ms = timed_ids(baseline, vector, baseline_profile.search_params())
+        candidate_ids, candidate_ms = timed_ids(candidate, vector, candidate_profile.search_params())
+
+        if exact_ids:
+            recalls.append(len(set(exact_ids) & set(candidate_ids)) / len(exact_ids))
+        baseline_times.append(baseline_ms)
+        candidate_times.append(candidate_ms)
+
+    report.recall_at_k = statistics.fmean(recalls) if recalls else 0.0
+    report.baseline_latency_ms = _latency_stats(baseline_times)
+    report.candidate_latency_ms = _latency_stats(candidate_times)
+
+    log.info(report.summary())
+    return report
+
+
+__all__ = [
+    "QdrantCollectionProfile",
+    "COLLECTION_PROFILES",
+    "get_collection_profile",
+    "ensure_collection",
+    "ensure_payload_indexes",
+    "DEFAULT_PAYLOAD_INDEXES",
+    "migrate_collection",
+    "CollectionMigrationResult",
+    "compare_collections",
+    "sample_query_vectors",
+    "ProfileComparisonReport",
+]
@@ -0,0 +1,128 @@
+"""
+Chunk Content Store
+===================
+
+Store locale (SQLite) dei testi dei punti Qdrant, per la modalità
+"slim payload".
+
+In modalità slim il payload Qdrant contiene solo id e campi di filtro
+(article_urn, tipo_atto, source_type, ...): il testo (fino a 2000 caratteri
+per punto) viene salvato qui, indicizzato per point id, e recuperato on demand
+solo per i risultati effettivamente restituiti. Così le risposte di ricerca
+restano piccole e il payload su Qdrant non gonfia RAM/disco.
+
+Usage:
+    from merlt.storage.vectors.content_store import ChunkContentStore
+
+    store = ChunkContentStore("data/content_store/merl_t_prod_chunks.sqlite")
+    store.put_many({"123": "Art. 1321 - Il contratto è..."})
+    texts = store.get_many(["123", "456"])  # {"123": "..."}
+"""
+
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, Optional, Union
+
+import structlog
+
+log = structlog.get_logger()
+
+# Limite parametri per statement SQLite (SQLITE_MAX_VARIABLE_NUMBER storico: 999)
+_SQLITE_CHUNK = 900
+
+
+class ChunkContentStore:
+    """
+    Key-value store point_id -> testo, su file SQLite.
+
+    Thread-safe: una connessione condivisa protetta da lock (le operazioni sono
+    brevi e batch, il costo di contesa è trascurabile rispetto a Qdrant).
+
+    Args:
+        path: File SQLite (creato se non esiste); ":memory:" per test
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS chunk_content ("
+            "point_id TEXT PRIMARY KEY, text TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+        log.debug(f"ChunkContentStore opened: {self.path}")
+
+    def put_many(self, texts: Dict[str, str]) -> int:
+        """
+        Inserisce o sovrascrive testi per point id.
+
+        Returns:
+            Numero di righe scritte
+        """
+        if not texts:
+            return 0
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO chunk_content (point_id, text) VALUES (?, ?)",
+                [(str(k), v) for k, v in texts.items()],
+            )
+            self._conn.commit()
+        return len(texts)
+
+    def get_many(self, point_ids: Iterable[Union[str, int]]) -> Dict[str, str]:
+        """
+        Recupera i testi per una lista di point id.
+
+        Returns:
+            Dict point_id (str) -> testo; gli id mancanti sono omessi
+        """
+        ids = list(dict.fromkeys(str(i) for i in point_ids))
+        found: Dict[str, str] = {}
+        with self._lock:
+            for i in range(0, len(ids), _SQLITE_CHUNK):
+                chunk = ids[i:i + _SQLITE_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT point_id, text FROM chunk_content WHERE point_id IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                found.update(rows)
+        return found
+
+    def get(self, point_id: Union[str, int]) -> Optional[str]:
+        """Recupera il testo di un singolo punto."""
+        return self.get_many([point_id]).get(str(point_id))
+
+    def delete_many(self, point_ids: Iterable[Union[str, int]]) -> None:
+        """Rimuove i testi dei punti indicati."""
+        ids = [str(i) for i in point_ids]
+        with self._lock:
+            for i in range(0, len(ids), _SQLITE_CHUNK):
+                chunk = ids[i:i + _SQLITE_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                self._conn.execute(
+                    f"DELETE FROM chunk_content WHERE point_id IN ({placeholders})", chunk
+                )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM chunk_content").fetchone()[0]
+
+    def close(self) -> None:
+        """Chiude la connessione SQLite."""
+        with self._lock:
+            self._conn.close()
+
+    def __repr__(self) -> str:
+        return f"ChunkContentStore(path={self.path})"
+
+
+__all__ = ["ChunkContentStore"]
@@ -7,10 +7,12 @@ sentence-transformers/multilingual-e5-large model for legal document embedding.
 Key Features:
 - Singleton pattern (model loaded once and reused)
 - Lazy loading (model loaded on first use, not on import)
+- Deferred imports (torch / sentence-transformers imported only when needed)
 - E5 prefix handling ("query: " for queries, "passage: " for documents)
-- Batch encoding for efficiency
+- Batch encoding for efficiency (length-bucketed, token budget per batch)
 - Configurable device (CPU/CUDA)
 - Thread-safe initialization
+- Dedicated encode executor (bounded, CPU-pinned) for async wrappers
 
 E5 Model Requirements:
 The E5 models require specific prefixes for queries and passages:
@@ -22,22 +24,84 @@ Reference: https://huggingface.co/intfloat/multilingual-e5-large
 
 import structlog
 import os
-from typing import List, Optional, Union
-import asyncio
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, List, Optional, Sequence, Union
 from threading import Lock
 
-try:
+from merlt.storage.vectors.executor import EncodeExecutor
+
+if TYPE_CHECKING:
     from sentence_transformers import SentenceTransformer
-    import torch
-except ImportError:
-    raise ImportError(
-        "sentence-transformers and torch are required for EmbeddingService. "
-        "Install with: pip install sentence-transformers torch"
-    )
+
+# torch e sentence-transformers costano secondi e centinaia di MB all'import:
+# verifichiamo solo che siano installati e li importiamo al primo utilizzo.
+HAS_SENTENCE_TRANSFORMERS = (
+    find_spec("sentence_transformers") is not None and find_spec("torch") is not None
+)
 
 log = structlog.get_logger()
 
 
+def _require_sentence_transformers() -> None:
+    """Raise ImportError if the embedding backend is not installed."""
+    if not HAS_SENTENCE_TRANSFORMERS:
+        raise ImportError(
+            "sentence-transformers and torch are required for EmbeddingService. "
+            "Install with: pip install sentence-transformers torch"
+        )
+
+
+def _default_device() -> str:
+    """Auto-detect device (imports torch)."""
+    import torch
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def build_length_buckets(
+    lengths: Sequence[int],
+    max_batch_tokens: int,
+    max_batch_size: int,
+) -> List[List[int]]:
+    """
+    Group text indices into batches of similar token length.
+
+    Indices are sorted by length (longest first) and packed greedily so that
+    the padded size of each batch (len(batch) * longest member) stays within
+    max_batch_tokens, and no batch exceeds max_batch_size texts. A single text
+    longer than the budget gets a batch of its own.
+
+    Args:
+        lengths: Token length of each input text
+        max_batch_tokens: Padded-token budget per batch
+        max_batch_size: Maximum number of texts per batch
+
+    Returns:
+        List of batches, each a list of indices into `lengths`
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+
+    buckets: List[List[int]] = []
+    current: List[int] = []
+    current_max = 0
+
+    for idx in order:
+        length = max(lengths[idx], 1)
+        padded_max = max(current_max, length)
+        if current and (
+            len(current) >= max_batch_size
+            or padded_max * (len(current) + 1) > max_batch_tokens
+        ):
+            buckets.append(current)
+            current, padded_max = [], length
+        current.append(idx)
+        current_max = padded_max
+
+    if current:
+        buckets.append(current)
+
+    return buckets
+
+
 class EmbeddingService:
     """
     Singleton service for E5-large multilingual embeddings.
@@ -58,7 +122,7 @@ class EmbeddingService:
 
     _instance: Optional['EmbeddingService'] = None
     _lock: Lock = Lock()
-    _model: Optional[SentenceTransformer] = None
+    _model: Optional['SentenceTransformer'] = None
     _initialized: bool = False
 
     def __init__(
@@ -66,7 +130,11 @@ class EmbeddingService:
         model_name: Optional[str] = None,
         device: Optional[str] = None,
         batch_size: int = 32,
-        normalize_embeddings: bool = True
+        normalize_embeddings: bool = True,
+        encode_workers: int = 1,
+        threads_per_worker: Optional[int] = None,
+        max_pending_encodes: int = 64,
+        max_batch_tokens: int = 8192,
     ):
         """
         Initialize EmbeddingService.
@@ -77,7 +145,14 @@ class EmbeddingService:
             device: Device to use ('cpu', 'cuda', or None for auto-detect)
             batch_size: Batch size for encoding
             normalize_embeddings: Whether to normalize embeddings (for cosine similarity)
+            encode_workers: Worker threads of the dedicated encode executor
+            threads_per_worker: torch intra-op threads per worker (None = torch default)
+            max_pending_encodes: Max encode jobs in flight before async callers wait
+            max_batch_tokens: Padded-token budget per batch in encode_batch
+                              (0 disables length bucketing)
         """
+        _require_sentence_transformers()
+
         # Configuration from environment variables or defaults
         self.model_name = (
             model_name or
@@ -85,12 +160,22 @@ class EmbeddingService:
         )
         self.device = (
             device or
-            os.getenv("EMBEDDING_DEVICE", "cuda" if torch.cuda.is_available() else "cpu")
+            os.getenv("EMBEDDING_DEVICE") or
+            _default_device()
         )
         self.batch_size = int(os.getenv("EMBEDDING_BATCH_SIZE", str(batch_size)))
         self.normalize_embeddings = (
             os.getenv("EMBEDDING_NORMALIZE", str(normalize_embeddings)).lower() == "true"
         )
+        self.max_batch_tokens = int(os.getenv("EMBEDDING_MAX_BATCH_TOKENS", str(max_batch_tokens)))
+
+        # Dedicated executor for async wrappers (not the shared asyncio default)
+        threads_env = os.getenv("EMBEDDING_THREADS_PER_WORKER")
+        self._executor = EncodeExecutor(
+            max_workers=int(os.getenv("EMBEDDING_WORKERS", str(encode_workers))),
+            threads_per_worker=int(threads_env) if threads_env else threads_per_worker,
+            max_pending=int(os.getenv("EMBEDDING_MAX_PENDING", str(max_pending_encodes))),
+        )
 
         # Model will be loaded lazily on first use
         self._model = None
@@ -101,7 +186,10 @@ class EmbeddingService:
                 "model": self.model_name,
                 "device": self.device,
                 "batch_size": self.batch_size,
-                "normalize": self.normalize_embeddings
+                "normalize": self.normalize_embeddings,
+                "max_batch_tokens": self.max_batch_tokens,
+                "encode_workers": self._executor.max_workers,
+                "threads_per_worker": self._executor.threads_per_worker,
             }
         )
 
@@ -124,7 +212,7 @@ class EmbeddingService:
                     cls._instance = cls(**kwargs)
         return cls._instance
 
-    def _load_model(self) -> SentenceTransformer:
+    def _load_model(self) -> 'SentenceTransformer':
         """
         Lazy load the sentence-transformers model.
 
@@ -141,6 +229,8 @@ class EmbeddingService:
                     log.info("First-time download may take 2-3 minutes (~1.2GB for E5-large)")
 
                     try:
+                        from sentence_transformers import SentenceTransformer
+
                         self._model = SentenceTransformer(
                             self.model_name,
                             device=self.device
@@ -227,7 +317,10 @@ class EmbeddingService:
         """
         Encode a batch of texts with appropriate E5 prefixes.
 
-        More efficient than encoding one by one.
+        More efficient than encoding one by one. Texts are grouped by token
+        length into batches bounded by max_batch_tokens (padded tokens) and
+        batch_size, so short commi are not padded to the length of a long
+        Brocardi spiegazione. Output order matches the input order.
 
         Args:
             texts: List of texts to encode
@@ -248,21 +341,68 @@ class EmbeddingService:
 
         log.info(f"Batch encoding {len(texts)} {'queries' if is_query else 'documents'}")
 
-        embeddings = model.encode(
-            prefixed_texts,
-            batch_size=self.batch_size,
-            normalize_embeddings=self.normalize_embeddings,
-            show_progress_bar=show_progress_bar,
-            convert_to_numpy=True
+        if self.max_batch_tokens <= 0:
+            embeddings = model.encode(
+                prefixed_texts,
+                batch_size=self.batch_size,
+                normalize_embeddings=self.normalize_embeddings,
+                show_progress_bar=show_progress_bar,
+                convert_to_numpy=True
+            )
+            return embeddings.tolist()
+
+        buckets = build_length_buckets(
+            self._token_lengths(model, prefixed_texts),
+            max_batch_tokens=self.max_batch_tokens,
+            max_batch_size=self.batch_size,
         )
+        log.debug(f"Length bucketing: {len(texts)} texts -> {len(buckets)} batches")
+
+        if show_progress_bar:
+            from tqdm.auto import tqdm
+            buckets_iter = tqdm(buckets, desc="Batches")
+        else:
+            buckets_iter = buckets
+
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        for bucket in buckets_iter:
+            embeddings = model.encode(
+                [prefixed_texts[i] for i in bucket],
+                batch_size=len(bucket),
+                normalize_embeddings=self.normalize_embeddings,
+                show_progress_bar=False,
+                convert_to_numpy=True
+            )
+            for idx, vector in zip(bucket, embeddings.tolist()):
+                results[idx] = vector
+
+        return results
+
+    @staticmethod
+    def _token_lengths(model: 'SentenceTransformer', texts: List[str]) -> List[int]:
+        """
+        Token length of each text, truncated to the model max sequence length.
 
-        return embeddings.tolist()
+        Falls back to a character-based estimate (~4 chars per token) when the
+        model does not expose a tokenizer.
+        """
+        max_len = getattr(model, "max_seq_length", None) or 512
+        tokenizer = getattr(model, "tokenizer", None)
+        if tokenizer is not None:
+            try:
+                encoded = tokenizer(
+                    texts, add_special_tokens=True, truncation=True, max_length=max_len
+                )
+                return [len(ids) for ids in encoded["input_ids"]]
+            except Exception as e:
+                log.debug(f"Tokenizer length estimate failed, using chars: {e}")
+        return [min(len(text) // 4 + 2, max_len) for text in texts]
 
     async def encode_query_async(self, text: str) -> List[float]:
         """
         Async wrapper for encode_query.
 
-        Runs encoding in thread pool to avoid blocking event loop.
+        Runs encoding in the dedicated encode executor to avoid blocking event loop.
 
         Args:
             text: Query text
@@ -270,14 +410,13 @@ class EmbeddingService:
         Returns:
             Embedding vector
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.encode_query, text)
+        return await self._executor.run(self.encode_query, text)
 
     async def encode_document_async(self, text: str) -> List[float]:
         """
         Async wrapper for encode_document.
 
-        Runs encoding in thread pool to avoid blocking event loop.
+        Runs encoding in the dedicated encode executor to avoid blocking event loop.
 
         Args:
             text: Document text
@@ -285,8 +424,7 @@ class EmbeddingService:
         Returns:
             Embedding vector
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.encode_document, text)
+        return await self._executor.run(self.encode_document, text)
 
     async def encode_batch_async(
         self,
@@ -297,7 +435,8 @@ class EmbeddingService:
         """
         Async wrapper for encode_batch.
 
-        Runs encoding in thread pool to avoid blocking event loop.
+        Runs encoding in the dedicated encode executor to avoid blocking event loop.
+        Waits (backpressure) when the executor already has max_pending jobs.
 
         Args:
             texts: List of texts to encode
@@ -307,12 +446,19 @@ class EmbeddingService:
         Returns:
             List of embedding vectors
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self.encode_batch(texts, is_query, show_progress_bar)
+        return await self._executor.run(
+            self.encode_batch, texts, is_query, show_progress_bar
         )
 
+    @property
+    def executor_stats(self) -> dict:
+        """Queue-depth and latency metrics of the encode executor."""
+        return self._executor.stats.to_dict()
+
+    def shutdown_executor(self, wait: bool = True) -> None:
+        """Shut down the encode executor (recreated on next async call)."""
+        self._executor.shutdown(wait=wait)
+
     def __repr__(self) -> str:
         """String representation."""
         return (
@@ -0,0 +1,254 @@
+"""
+Encode Executor
+===============
+
+Pool dedicato alle chiamate del modello di embedding.
+
+`loop.run_in_executor(None, ...)` usa il default executor di asyncio, condiviso
+con query al grafo, scraper e qualsiasi altro codice bloccante del processo.
+Un batch di ingestion molto grande satura quel pool e affama le query
+interattive; inoltre ogni worker usa tutti i thread di torch, con
+oversubscription dei core.
+
+EncodeExecutor risolve entrambi i problemi:
+- ThreadPoolExecutor dedicato con numero di worker configurabile
+- `torch.set_num_threads` applicato all'avvio di ogni worker
+- Coda di sottomissione limitata (backpressure): oltre `max_pending` job
+  i chiamanti attendono invece di accodare lavoro senza limiti
+- Metriche di profondità coda e latenza (attesa + esecuzione)
+
+Usage:
+    from merlt.storage.vectors.executor import EncodeExecutor
+
+    executor = EncodeExecutor(max_workers=2, threads_per_worker=4, max_pending=32)
+    vector = await executor.run(model_encode, "testo")
+    print(executor.stats.to_dict())
+    executor.shutdown()
+
+Note:
+    Il modello è condiviso tra i worker (thread pool, non process pool): torch
+    rilascia il GIL durante l'inferenza e caricare E5-large in ogni processo
+    costerebbe ~1.2GB di RAM per worker. `torch.set_num_threads` agisce
+    sul pool intra-op del processo, quindi con thread_per_worker=N il totale
+    dei core usati dall'encoding resta limitato a N.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+import structlog
+
+log = structlog.get_logger()
+
+T = TypeVar("T")
+
+
+@dataclass
+class EncodeExecutorStats:
+    """
+    Metriche dell'EncodeExecutor.
+
+    Attributes:
+        submitted: Job ricevuti da run()
+        completed: Job completati con successo
+        failed: Job terminati con eccezione
+        waiting: Job in attesa di uno slot (bloccati dalla backpressure)
+        pending: Job sottomessi al pool e non ancora terminati
+        max_queue_depth: Massimo osservato di waiting + pending
+        total_wait_seconds: Tempo cumulato tra run() e inizio esecuzione
+        total_run_seconds: Tempo cumulato di esecuzione nei worker
+    """
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    waiting: int = 0
+    pending: int = 0
+    max_queue_depth: int = 0
+    total_wait_seconds: float = 0.0
+    total_run_seconds: float = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Job non ancora terminati (in attesa di slot o nel pool)."""
+        return self.waiting + self.pending
+
+    @property
+    def avg_wait_ms(self) -> float:
+        finished = self.completed + self.failed
+        return self.total_wait_seconds / finished * 1000 if finished else 0.0
+
+    @property
+    def avg_run_ms(self) -> float:
+        finished = self.completed + self.failed
+        return self.total_run_seconds / finished * 1000 if finished else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializza per logging/monitoring."""
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "waiting": self.waiting,
+            "pending": self.pending,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "avg_wait_ms": round(self.avg_wait_ms, 2),
+            "avg_run_ms": round(self.avg_run_ms, 2),
+        }
+
+
+def _init_worker(threads_per_worker: Optional[int]) -> None:
+    """Initializer dei thread worker: limita i thread intra-op di torch."""
+    if not threads_per_worker:
+        return
+    try:
+        import torch
+        torch.set_num_threads(threads_per_worker)
+    except ImportError:
+        pass
+
+
+def _timed_call(func: Callable[..., T], args: Tuple[Any, ...]) -> Tuple[T, float, float]:
+    """Esegue func nel worker ritornando (risultato, inizio, fine)."""
+    started = time.perf_counter()
+    result = func(*args)
+    return result, started, time.perf_counter()
+
+
+class EncodeExecutor:
+    """
+    Executor dedicato per l'encoding con backpressure e metriche.
+
+    Args:
+        max_workers: Numero di thread worker (default: 1)
+        threads_per_worker: Thread torch per worker (None = default torch)
+        max_pending: Job massimi sottomessi al pool contemporaneamente;
+                     i chiamanti oltre il limite attendono (default: 64)
+        thread_name_prefix: Prefisso nome thread (utile nei profiler)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 1,
+        threads_per_worker: Optional[int] = None,
+        max_pending: int = 64,
+        thread_name_prefix: str = "merlt-encode",
+    ):
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be >= 1, got {max_pending}")
+
+        self.max_workers = max_workers
+        self.threads_per_worker = threads_per_worker
+        self.max_pending = max_pending
+        self.thread_name_prefix = thread_name_prefix
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = Lock()
+
+        # Il semaforo è legato al loop: ricreato se il loop cambia (come HttpClient)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.stats = EncodeExecutorStats()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Crea il pool al primo utilizzo."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=self.thread_name_prefix,
+                        initializer=_init_worker,
+                        initargs=(self.threads_per_worker,),
+                    )
+                    log.info(
+                        "EncodeExecutor started",
+                        workers=self.max_workers,
+                        threads_per_worker=self.threads_per_worker,
+                        max_pending=self.max_pending,
+                    )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Semaforo di backpressure valido per il loop corrente."""
+        current_loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not current_loop:
+            self._semaphore = asyncio.Semaphore(self.max_pending)
+            self._semaphore_loop = current_loop
+        return self._semaphore
+
+    def _update_depth(self) -> None:
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.stats.queue_depth)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Esegue func(*args) nel pool dedicato.
+
+        Attende se ci sono già max_pending job in corso (backpressure).
+
+        Args:
+            func: Funzione sincrona da eseguire (es. model.encode)
+            *args: Argomenti posizionali
+
+        Returns:
+            Risultato di func
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._get_semaphore()
+        enqueued = time.perf_counter()
+
+        self.stats.submitted += 1
+        self.stats.waiting += 1
+        self._update_depth()
+
+        try:
+            await semaphore.acquire()
+        finally:
+            self.stats.waiting -= 1
+
+        self.stats.pending += 1
+        started = finished = None
+        try:
+            result, started, finished = await loop.run_in_executor(
+                self._get_executor(), _timed_call, func, args
+            )
+            self.stats.completed += 1
+            return result
+        except BaseException:
+            self.stats.failed += 1
+            raise
+        finally:
+            self.stats.pending -= 1
+            semaphore.release()
+            if started is None:
+                started = finished = time.perf_counter()
+            self.stats.total_wait_seconds += started - enqueued
+            self.stats.total_run_seconds += finished - started
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Termina il pool (ricreato automaticamente al prossimo run)."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+    def __repr__(self) -> str:
+        return (
+            f"EncodeExecutor(workers={self.max_workers}, "
+            f"threads_per_worker={self.threads_per_worker}, "
+            f"max_pending={self.max_pending}, "
+            f"queue_depth={self.stats.queue_depth})"
+        )
+
+
+__all__ = [
+    "EncodeExecutor",
+    "EncodeExecutorStats",
+]
@@ -0,0 +1,259 @@
+"""
+Point Ids e Content Hash
+========================
+
+Id deterministici per i punti Qdrant e upsert incrementali.
+
+Gli id sono UUIDv5 derivati da (article_urn, source_type, index): stabili tra
+processi e tra run, quindi un re-ingest sovrascrive i punti esistenti invece
+di crearne di nuovi (``hash()`` di Python è randomizzato per processo).
+
+Ogni punto porta nel payload un ``content_hash`` (sha256 di modello + testo):
+prima dell'upsert si leggono gli hash già presenti e si scartano i testi
+invariati, così un run incrementale paga encoding e upsert solo per il diff.
+
+Usage:
+    from merlt.storage.vectors.points import build_article_points, upsert_changed_points
+
+    candidates = build_article_points(urn, base_payload, article_text, brocardi_info)
+    upserted = await upsert_changed_points(
+        client, "merl_t_prod_chunks", embedding_service, candidates
+    )
+"""
+
+import hashlib
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+import structlog
+
+log = structlog.get_logger()
+
+# Namespace fisso per gli id dei chunk: NON modificare (cambierebbe tutti gli id)
+POINT_ID_NAMESPACE = uuid.UUID("5d0c6a4e-2f1b-5e8a-9c3d-7a4b1e6f0d21")
+
+CONTENT_HASH_FIELD = "content_hash"
+
+# Soglie minime di lunghezza per fonte (testo troppo corto = rumore)
+MIN_NORMA_CHARS = 20
+MIN_BROCARDI_CHARS = 50
+MAX_MASSIME = 5
+MAX_PAYLOAD_TEXT = 2000
+
+# Punti per chiamata retrieve
+_RETRIEVE_BATCH = 256
+
+
+def chunk_point_id(article_urn: str, source_type: str, index: int = 0) -> str:
+    """
+    Id deterministico (UUIDv5) di un punto.
+
+    Args:
+        article_urn: URN dell'articolo
+        source_type: norma, spiegazione, ratio, massima, ...
+        index: Posizione per fonti multiple (es. indice della massima)
+
+    Returns:
+        UUID in forma stringa, accettato da Qdrant come point id
+    """
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, f"{article_urn}|{source_type}|{index}"))
+
+
+def content_hash(text: str, model_name: str = "") -> str:
+    """
+    Hash del contenuto di un punto.
+
+    Il nome del modello fa parte dell'hash: cambiando modello di embedding
+    tutti i punti risultano modificati e vengono ricalcolati.
+    """
+    digest = hashlib.sha256()
+    digest.update(model_name.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass
+class PointCandidate:
+    """Testo da embeddare con id e payload del punto Qdrant."""
+    point_id: str
+    text: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+    def hash(self, model_name: str = "") -> str:
+        return content_hash(self.text, model_name)
+
+
+def _massima_text(massima: Any) -> Optional[str]:
+    # Formati Brocardi: stringa o dict (campo "massima" da BrocardiScraper._parse_massima)
+    if isinstance(massima, str):
+        return massima
+    if isinstance(massima, dict):
+        return massima.get("massima", massima.get("testo", massima.get("Testo", "")))
+    return None
+
+
+def build_article_points(
+    article_urn: str,
+    base_payload: Dict[str, Any],
+    article_text: Optional[str],
+    brocardi_info: Optional[Dict[str, Any]] = None,
+) -> List[PointCandidate]:
+    """
+    Punti multi-source di un articolo.
+
+    Fonti:
+    1. Testo normativo (norma) - sempre
+    2. Spiegazione Brocardi - se disponibile
+    3. Ratio legis - se disponibile
+    4. Massime (prime 5) - se disponibili
+
+    Args:
+        article_urn: URN dell'articolo
+        base_payload: Campi comuni (article_urn, tipo_atto, numero_articolo)
+        article_text: Testo dell'articolo
+        brocardi_info: Dati Brocardi (Spiegazione, Ratio, Massime)
+
+    Returns:
+        Lista di PointCandidate con id deterministici
+    """
+    candidates: List[PointCandidate] = []
+
+    def add(source_type: str, text: str, index: int = 0, **extra: Any) -> None:
+        candidates.append(PointCandidate(
+            point_id=chunk_point_id(article_urn, source_type, index),
+            text=text,
+            payload={
+                **base_payload,
+                "source_type": source_type,
+                **extra,
+                "text": text[:MAX_PAYLOAD_TEXT],
+            },
+        ))
+
+    if article_text and len(article_text.strip()) > MIN_NORMA_CHARS:
+        add("norma", article_text)
+
+    if brocardi_info:
+        spiegazione = brocardi_info.get("Spiegazione", "")
+        if spiegazione and len(spiegazione.strip()) > MIN_BROCARDI_CHARS:
+            add("spiegazione", spiegazione)
+
+        ratio = brocardi_info.get("Ratio", "")
+        if ratio and len(ratio.strip()) > MIN_BROCARDI_CHARS:
+            add("ratio", ratio)
+
+        massime = brocardi_info.get("Massime", [])
+        if isinstance(massime, list):
+            for i, massima in enumerate(massime[:MAX_MASSIME]):
+                testo = _massima_text(massima)
+                if testo and len(testo.strip()) > MIN_BROCARDI_CHARS:
+                    add("massima", testo, index=i, massima_index=i)
+
+    return candidates
+
+
+def find_unchanged_point_ids(
+    client: Any,
+    collection_name: str,
+    candidates: Iterable[PointCandidate],
+    model_name: str = "",
+) -> Set[str]:
+    """
+    Id dei candidati già presenti in Qdrant con lo stesso content hash.
+
+    Legge solo il campo content_hash dei punti esistenti (niente vettori),
+    a blocchi di 256 id.
+
+    Returns:
+        Set di point id (str) da non ri-encodare né ri-upsertare
+    """
+    expected = {c.point_id: c.hash(model_name) for c in candidates}
+    if not expected:
+        return set()
+
+    ids = list(expected)
+    unchanged: Set[str] = set()
+    for i in range(0, len(ids), _RETRIEVE_BATCH):
+        records = client.retrieve(
+            collection_name=collection_name,
+            ids=ids[i:i + _RETRIEVE_BATCH],
+            with_payload=[CONTENT_HASH_FIELD],
+            with_vectors=False,
+        )
+        for record in records:
+            stored = (record.payload or {}).get(CONTENT_HASH_FIELD)
+            if stored is not None and stored == expected.get(str(record.id)):
+                unchanged.add(str(record.id))
+
+    return unchanged
+
+
+async def upsert_changed_points(
+    client: Any,
+    collection_name: str,
+    embedding_service: Any,
+    candidates: List[PointCandidate],
+    before_upsert: Optional[Callable[[List[Any]], None]] = None,
+    show_progress_bar: bool = False,
+) -> int:
+    """
+    Encoda e upserta solo i candidati nuovi o modificati.
+
+    Args:
+        client: QdrantClient
+        collection_name: Collection di destinazione
+        embedding_service: EmbeddingService (encode_batch_async, model_name)
+        candidates: Punti da scrivere
+        before_upsert: Hook sui PointStruct prima dell'upsert
+            (es. LegalKnowledgeGraph._store_point_texts in modalità slim)
+        show_progress_bar: Progress bar durante l'encoding
+
+    Returns:
+        Numero di punti upsertati (i candidati invariati sono esclusi)
+    """
+    if not candidates:
+        return 0
+
+    from qdrant_client.models import PointStruct
+
+    model_name = embedding_service.model_name
+    unchanged = find_unchanged_point_ids(client, collection_name, candidates, model_name)
+    changed = [c for c in candidates if c.point_id not in unchanged]
+    if unchanged:
+        log.debug(f"Skipped {len(unchanged)} unchanged points")
+    if not changed:
+        return 0
+
+    embeddings = await embedding_service.encode_batch_async(
+        [c.text for c in changed],
+        is_query=False,
+        show_progress_bar=show_progress_bar,
+    )
+
+    points = [
+        PointStruct(
+            id=c.point_id,
+            vector=embedding,
+            payload={**c.payload, CONTENT_HASH_FIELD: c.hash(model_name)},
+        )
+        for c, embedding in zip(changed, embeddings)
+    ]
+
+    if before_upsert is not None:
+        before_upsert(points)
+    client.upsert(collection_name=collection_name, points=points)
+    return len(points)
+
+
+__all__ = [
+    "POINT_ID_NAMESPACE",
+    "CONTENT_HASH_FIELD",
+    "PointCandidate",
+    "chunk_point_id",
+    "content_hash",
+    "build_article_points",
+    "find_unchanged_point_ids",
+    "upsert_changed_points",
+]
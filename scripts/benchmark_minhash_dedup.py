@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Benchmark dedup near-duplicate: confronto a coppie vs MinHashLSH.
+
+Su un insieme sintetico di nomi di entità (default 100k) misura:
+1. Confronto a coppie con compute_similarity su un campione (O(n²)),
+   con stima del tempo sull'insieme completo
+2. Recall di MinHashLSH rispetto al confronto a coppie sullo stesso campione
+3. MinHashLSH sull'insieme completo: indicizzazione, tutte le coppie
+   near-duplicate, query singola
+
+I nomi sintetici combinano teste e complementi del lessico civilistico e
+parole inventate (per avere un lessico ampio come un insieme reale), più
+varianti di nomi già generati (qualificatori, maiuscole, accenti,
+punteggiatura, parole extra): una parte dei nomi ha near-duplicate reali.
+
+Usage:
+    python scripts/benchmark_minhash_dedup.py
+    python scripts/benchmark_minhash_dedup.py --count 100000 --sample 3000 --threshold 0.6
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from merlt.pipeline.enrichment.linkers.normalization import (
+    MinHashLSH,
+    compute_similarity,
+    normalize_name,
+)
+
+_HEADS = (
+    "buona fede", "responsabilità", "obbligazione", "contratto", "risoluzione", "rescissione",
+    "nullità", "annullabilità", "mora", "inadempimento", "risarcimento", "danno", "prescrizione",
+    "decadenza", "garanzia", "fideiussione", "pegno", "ipoteca", "usufrutto", "servitù", "mandato",
+    "deposito", "comodato", "mutuo", "locazione", "appalto", "vendita", "permuta", "donazione",
+    "transazione", "novazione", "compensazione", "confusione", "remissione", "surrogazione",
+    "cessione", "delegazione", "accollo", "espromissione", "simulazione", "rappresentanza",
+    "condizione", "termine", "clausola penale", "caparra", "recesso", "diffida", "eccezione",
+)
+_COMPLEMENTS = (
+    "del debitore", "del creditore", "del venditore", "del compratore", "del conduttore",
+    "del locatore", "del mandatario", "del terzo", "delle parti", "per fatto illecito",
+    "per inadempimento", "per eccessiva onerosità", "per impossibilità sopravvenuta",
+    "del contratto", "dell'obbligazione", "del credito", "del diritto", "della prestazione",
+    "in solido", "parziale", "totale", "a titolo gratuito", "a titolo oneroso", "di diritto",
+    "giudiziale", "stragiudiziale", "convenzionale", "legale", "reale", "personale",
+)
+_QUALIFIERS = (
+    "oggettiva", "soggettiva", "contrattuale", "extracontrattuale", "grave", "lieve",
+    "assoluta", "relativa", "originaria", "sopravvenuta", "precontrattuale",
+)
+_EXTRA = ("ex art", "nel codice civile", "secondo la dottrina", "in senso stretto", "generale")
+_SYLLABLES = "ca co de di fe la le li ma mo na ne no pa pe po ra re ri sa se so ta te ti to va ve vi zo".split()
+
+
+def _pseudo_word(rng: random.Random) -> str:
+    """Parola inventata: allarga il lessico come in un insieme reale di 100k concetti."""
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def synthetic_names(count: int, seed: int = 42) -> List[str]:
+    """
+    Nomi sintetici: ~25% sono varianti di un nome base già generato.
+
+    I nomi base sono distinti dopo normalize_name, come i node_id del grafo.
+    """
+    rng = random.Random(seed)
+    names: List[str] = []
+    bases: List[str] = []
+    seen = set()
+    while len(names) < count:
+        if bases and rng.random() < 0.25:
+            base = rng.choice(bases)
+            variant = rng.randint(0, 3)
+            if variant == 0:
+                name = f"{base} {rng.choice(_QUALIFIERS)}"
+            elif variant == 1:
+                name = base.upper() if rng.random() < 0.5 else base.title()
+            elif variant == 2:
+                name = f"{base} {rng.choice(_EXTRA)}"
+            else:
+                name = base.replace("à", "a'").replace(" ", "  ") + "."
+        else:
+            parts = [rng.choice(_HEADS)]
+            for _ in range(rng.randint(0, 2)):
+                parts.append(rng.choice(_COMPLEMENTS))
+            if rng.random() < 0.3:
+                parts.append(rng.choice(_QUALIFIERS))
+            while normalize_name(" ".join(parts)) in seen:
+                parts.insert(1, _pseudo_word(rng))
+            name = " ".join(parts)
+            seen.add(normalize_name(name))
+            bases.append(name)
+        names.append(name)
+    return names
+
+
+def pairwise(names: List[str], threshold: float) -> set:
+    pairs = set()
+    for i in range(len(names)):
+        for j in range(i + 1, len(names)):
+            if compute_similarity(names[i], names[j]) >= threshold:
+                pairs.add((i, j))
+    return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark near-duplicate: pairwise vs MinHashLSH")
+    parser.add_argument("--count", type=int, default=100_000, help="Nomi sintetici")
+    parser.add_argument("--sample", type=int, default=3000, help="Campione per il confronto a coppie")
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--num-perm", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=1000, help="Query singole da cronometrare")
+    parser.add_argument("--output", type=Path, help="Salva i risultati in JSON")
+    args = parser.parse_args()
+
+    names = synthetic_names(args.count)
+    sample = names[: args.sample]
+
+    print("=" * 70)
+    print("BENCHMARK NEAR-DUPLICATE: PAIRWISE vs MINHASH LSH")
+    print("=" * 70)
+    print(f"Nomi: {len(names)}  Campione: {len(sample)}  Soglia: {args.threshold}  Permutazioni: {args.num_perm}")
+
+    # 1. Confronto a coppie sul campione
+    start = time.perf_counter()
+    exact = pairwise(sample, args.threshold)
+    pairwise_s = time.perf_counter() - start
+    estimated_full_s = pairwise_s * (len(names) / len(sample)) ** 2
+
+    # 2. LSH sullo stesso campione
+    lsh = MinHashLSH(threshold=args.threshold, num_perm=args.num_perm)
+    start = time.perf_counter()
+    lsh.add_many(dict(enumerate(sample)))
+    found = {(a, b) for a, b, _ in lsh.duplicate_pairs()}
+    sample_lsh_s = time.perf_counter() - start
+    recall = len(found & exact) / len(exact) if exact else 1.0
+
+    # 3. LSH sull'insieme completo
+    lsh = MinHashLSH(threshold=args.threshold, num_perm=args.num_perm)
+    start = time.perf_counter()
+    lsh.add_many(dict(enumerate(names)))
+    index_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    full_pairs = lsh.duplicate_pairs()
+    pairs_s = time.perf_counter() - start
+
+    rng = random.Random(7)
+    probes = [rng.choice(names) for _ in range(args.queries)]
+    start = time.perf_counter()
+    for name in probes:
+        lsh.query(name)
+    query_ms = (time.perf_counter() - start) / len(probes) * 1000
+
+    print(f"\nBande: {lsh.bands} x {lsh.rows} righe")
+    print(f"\nCampione ({len(sample)} nomi):")
+    print(f"  pairwise:  {pairwise_s:8.2f}s  coppie: {len(exact)}")
+    print(f"  lsh:       {sample_lsh_s:8.2f}s  coppie: {len(found)}  recall: {recall:.3f}")
+    print(f"\nInsieme completo ({len(names)} nomi):")
+    print(f"  pairwise (stima):  {estimated_full_s:10.0f}s")
+    print(f"  lsh indicizzazione:{index_s:10.2f}s")
+    print(f"  lsh tutte coppie:  {pairs_s:10.2f}s  coppie: {len(full_pairs)}")
+    print(f"  lsh query singola: {query_ms:10.3f}ms")
+    print(f"\nSpeedup dedup completo: {estimated_full_s / (index_s + pairs_s):.0f}x")
+
+    if args.output:
+        args.output.write_text(json.dumps(
+            {"count": len(names), "sample": len(sample), "threshold": args.threshold,
+             "num_perm": args.num_perm, "bands": lsh.bands, "rows": lsh.rows,
+             "pairwise_sample_s": pairwise_s, "pairwise_full_estimated_s": estimated_full_s,
+             "lsh_sample_s": sample_lsh_s, "recall": recall,
+             "lsh_index_s": index_s, "lsh_pairs_s": pairs_s, "lsh_pairs": len(full_pairs),
+             "lsh_query_ms": query_ms},
+            indent=2,
+        ))
+        print(f"Risultati salvati in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
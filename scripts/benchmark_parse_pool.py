@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark parsing inline vs ParsePool su un codice intero.
+
+Misura parsing (CommaParser) + chunking (StructuralChunker) di tutti gli
+articoli di un codice:
+1. Inline, articolo per articolo (come IngestionPipelineV2.ingest_article)
+2. ParsePool con N worker e chunked submission
+
+Input:
+    --articles FILE   JSON con la lista degli articoli: stringhe article_text
+                      o dict con chiave "article_text" (es. export VisualexAPI)
+    senza --articles  codice sintetico di --count articoli (default 2969,
+                      come il codice civile)
+
+Usage:
+    python scripts/benchmark_parse_pool.py --workers 4
+    python scripts/benchmark_parse_pool.py --articles data/codice_civile.json --chunksize 64
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from merlt.pipeline.chunking import StructuralChunker
+from merlt.pipeline.parse_pool import DEFAULT_CHUNKSIZE, ParsePool
+from merlt.pipeline.parsing import CommaParser
+
+POSITION = "Libro IV - Delle obbligazioni, Titolo II - Dei contratti in generale, Capo XIV - Della risoluzione"
+
+_WORDS = (
+    "contratto obbligazione debitore creditore prestazione risoluzione inadempimento "
+    "termine parte diritto domanda giudice risarcimento danno buona fede esecuzione "
+    "legge norma effetto clausola condizione forma atto pubblico scrittura privata"
+).split()
+
+
+def synthetic_codice(count: int, seed: int = 42) -> List[str]:
+    """Articoli sintetici con rubrica, 1-6 commi e lettere (struttura VisualexAPI)."""
+    rng = random.Random(seed)
+    texts = []
+    for n in range(1, count + 1):
+        commi = []
+        for _ in range(rng.randint(1, 6)):
+            comma = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(20, 90))).capitalize() + "."
+            if rng.random() < 0.2:
+                lettere = "\n".join(
+                    f"{chr(97 + i)}) " + " ".join(rng.choice(_WORDS) for _ in range(12)) + ";"
+                    for i in range(rng.randint(2, 5))
+                )
+                comma = f"{comma}\n{lettere}"
+            commi.append(comma)
+        rubrica = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(2, 6))).capitalize()
+        texts.append(f"Articolo {n}\n{rubrica}\n\n" + "\n\n".join(commi))
+    return texts
+
+
+def load_articles(path: Path) -> List[str]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return [a["article_text"] if isinstance(a, dict) else a for a in data]
+
+
+def _articles_for_chunking(structures) -> List[dict]:
+    return [
+        {
+            "article_structure": s,
+            "article_urn": f"urn:benchmark~art{s.numero_articolo}",
+            "article_url": f"https://example.org/art{s.numero_articolo}",
+            "brocardi_position": POSITION,
+        }
+        for s in structures
+    ]
+
+
+def run_inline(texts: List[str]) -> dict:
+    parser = CommaParser()
+    chunker = StructuralChunker()
+
+    start = time.perf_counter()
+    structures = [parser.parse(t) for t in texts]
+    parse_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    chunks = chunker.chunk_batch(_articles_for_chunking(structures))
+    chunk_s = time.perf_counter() - start
+
+    return {"parse_s": parse_s, "chunk_s": chunk_s, "chunks": len(chunks)}
+
+
+async def run_pooled(texts: List[str], workers: int, chunksize: int) -> dict:
+    with ParsePool(max_workers=workers, chunksize=chunksize, min_batch=1) as pool:
+        # Avvio dei worker escluso dalla misura (pool riusato per tutto il run)
+        start = time.perf_counter()
+        await pool.parse_batch(texts[: workers * chunksize])
+        startup_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        structures = await pool.parse_batch(texts)
+        parse_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        chunks = await pool.chunk_batch(_articles_for_chunking(structures))
+        chunk_s = time.perf_counter() - start
+
+    return {"parse_s": parse_s, "chunk_s": chunk_s, "chunks": len(chunks), "startup_s": startup_s}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark inline vs ParsePool parsing")
+    parser.add_argument("--articles", type=Path, help="JSON con gli articoli del codice")
+    parser.add_argument("--count", type=int, default=2969, help="Articoli sintetici")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--output", type=Path, help="Salva i risultati in JSON")
+    args = parser.parse_args()
+
+    texts = load_articles(args.articles) if args.articles else synthetic_codice(args.count)
+
+    print("=" * 70)
+    print("BENCHMARK PARSING: INLINE vs PARSEPOOL")
+    print("=" * 70)
+    print(f"Articoli: {len(texts)}  Workers: {args.workers}  Chunksize: {args.chunksize}")
+
+    inline = run_inline(texts)
+    pooled = asyncio.run(run_pooled(texts, args.workers, args.chunksize))
+
+    print(f"\n{'':10} {'parse (s)':>10} {'chunk (s)':>10} {'totale (s)':>11} {'art/s':>9}")
+    for name, r in (("inline", inline), ("pool", pooled)):
+        total = r["parse_s"] + r["chunk_s"]
+        print(f"{name:10} {r['parse_s']:10.3f} {r['chunk_s']:10.3f} {total:11.3f} {len(texts) / total:9.0f}")
+    speedup = (inline["parse_s"] + inline["chunk_s"]) / (pooled["parse_s"] + pooled["chunk_s"])
+    print(f"\nSpeedup: {speedup:.2f}x  (avvio worker: {pooled['startup_s']:.2f}s, escluso)")
+    assert inline["chunks"] == pooled["chunks"], "chunk count mismatch"
+
+    if args.output:
+        args.output.write_text(json.dumps(
+            {"articles": len(texts), "workers": args.workers, "chunksize": args.chunksize,
+             "inline": inline, "pool": pooled, "speedup": speedup},
+            indent=2,
+        ))
+        print(f"Risultati salvati in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
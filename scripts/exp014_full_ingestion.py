@@ -121,6 +121,8 @@ async def run_backbone(
     dry_run: bool = False,
     batch_size: int = 10,
     max_concurrent: int = 5,
+    resume: bool = False,
+    parse_workers: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Esegue backbone ingestion: Normattiva + Brocardi strutturale.
@@ -138,6 +140,8 @@ async def run_backbone(
         dry_run: Se True, solo preview
         batch_size: Articoli per batch (default: 10)
         max_concurrent: Max fetch HTTP paralleli (default: 5)
+        resume: Riprende dal checkpoint journal (salta articoli completati)
+        parse_workers: Processi worker per il parsing (None = inline)
 
     Returns:
         Dizionario con risultati
@@ -174,10 +178,13 @@ async def run_backbone(
             max_concurrent_fetches=max_concurrent,
             include_brocardi=True,
             include_multivigenza=True,
+            resume=resume,
+            parse_workers=parse_workers,
         )
 
         results["ingested"] = batch_result.successful
         results["skipped"] = batch_result.failed
+        results["resumed_skipped"] = batch_result.skipped
         results["embeddings"] = batch_result.embeddings_created
         results["nodes"] = batch_result.graph_nodes_created
         results["bridge_mappings"] = batch_result.bridge_mappings_created
@@ -373,6 +380,8 @@ async def run_full_pipeline(
     dry_run: bool = False,
     batch_size: int = 10,
     max_concurrent: int = 5,
+    resume: bool = False,
+    parse_workers: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Esegue la pipeline completa o parziale.
@@ -383,6 +392,8 @@ async def run_full_pipeline(
         dry_run: Se True, solo preview
         batch_size: Articoli per batch (ottimizzazione)
         max_concurrent: Max fetch HTTP paralleli
+        resume: Riprende il backbone dal checkpoint journal
+        parse_workers: Processi worker per il parsing del backbone
 
     Returns:
         Dizionario con tutti i risultati
@@ -427,6 +438,8 @@ async def run_full_pipeline(
                 dry_run=dry_run,
                 batch_size=batch_size,
                 max_concurrent=max_concurrent,
+                resume=resume,
+                parse_workers=parse_workers,
             )
 
         # ENRICHMENT
@@ -480,6 +493,9 @@ Esempi:
   # Solo backbone
   python scripts/exp014_full_ingestion.py --backbone
 
+  # Riprende un backbone interrotto
+  python scripts/exp014_full_ingestion.py --backbone --resume
+
   # Solo enrichment (richiede backbone esistente)
   python scripts/exp014_full_ingestion.py --enrichment
 
@@ -527,6 +543,17 @@ Esempi:
         default=5,
         help="Max fetch HTTP paralleli (default: 5)"
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Riprende il backbone dal checkpoint (salta articoli già completati)"
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=None,
+        help="Processi worker per il parsing degli articoli (default: inline)"
+    )
 
     args = parser.parse_args()
 
@@ -558,6 +585,8 @@ Esempi:
         dry_run=args.dry_run,
         batch_size=args.batch_size,
         max_concurrent=args.max_concurrent,
+        resume=args.resume,
+        parse_workers=args.parse_workers,
     ))
 
     # Stampa summary
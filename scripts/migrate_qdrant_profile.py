@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Migrazione Collection Qdrant a un Profilo
+=========================================
+
+Ricostruisce una collection Qdrant esistente in una nuova collection con un
+profilo di storage diverso (quantizzazione int8, vettori/payload su disco,
+parametri HNSW) e produce un report di confronto recall/latenza.
+
+La collection sorgente non viene modificata. Dopo aver verificato il report,
+puntare MerltConfig.qdrant_collection alla nuova collection (e impostare
+MerltConfig.qdrant_profile) oppure usare --alias per spostare un alias.
+
+Usage:
+    # Elenca i profili disponibili
+    python scripts/migrate_qdrant_profile.py --list-profiles
+
+    # Migra e confronta
+    python scripts/migrate_qdrant_profile.py \\
+        --source merl_t_prod_chunks \\
+        --target merl_t_prod_chunks_q8 \\
+        --profile quantized_on_disk \\
+        --report reports/qdrant_q8.json
+
+    # Solo report (target già migrata)
+    python scripts/migrate_qdrant_profile.py \\
+        --source merl_t_prod_chunks --target merl_t_prod_chunks_q8 \\
+        --profile quantized_on_disk --compare-only
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Aggiungi root al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from merlt.storage.vectors.collections import (
+    COLLECTION_PROFILES,
+    compare_collections,
+    migrate_collection,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Migra una collection Qdrant a un profilo")
+    parser.add_argument("--host", default="localhost", help="Qdrant host")
+    parser.add_argument("--port", type=int, default=6333, help="Qdrant port")
+    parser.add_argument("--source", help="Collection esistente")
+    parser.add_argument("--target", help="Nuova collection")
+    parser.add_argument("--profile", default="quantized_on_disk", choices=sorted(COLLECTION_PROFILES))
+    parser.add_argument("--source-profile", default="default", choices=sorted(COLLECTION_PROFILES),
+                        help="Profilo della collection sorgente (per i search params)")
+    parser.add_argument("--batch-size", type=int, default=256, help="Punti per batch di copia")
+    parser.add_argument("--recreate", action="store_true", help="Elimina il target se esiste")
+    parser.add_argument("--compare-only", action="store_true", help="Salta la migrazione")
+    parser.add_argument("--queries", type=int, default=100, help="Query campionate per il report")
+    parser.add_argument("--top-k", type=int, default=10, help="k per recall@k")
+    parser.add_argument("--report", type=Path, help="Salva il report JSON in questo file")
+    parser.add_argument("--alias", help="Sposta questo alias sul target dopo la migrazione")
+    parser.add_argument("--list-profiles", action="store_true", help="Elenca i profili e esce")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    if args.list_profiles:
+        for name, profile in sorted(COLLECTION_PROFILES.items()):
+            print(f"  {name:20s} {profile.description}")
+        return 0
+
+    if not args.source or not args.target:
+        print("--source e --target sono obbligatori")
+        return 2
+
+    from qdrant_client import QdrantClient
+
+    client = QdrantClient(host=args.host, port=args.port)
+
+    print("=" * 60)
+    print(f"QDRANT PROFILE MIGRATION: {args.source} -> {args.target} ({args.profile})")
+    print("=" * 60)
+
+    output = {}
+    if not args.compare_only:
+        migration = migrate_collection(
+            client,
+            source=args.source,
+            target=args.target,
+            profile=args.profile,
+            batch_size=args.batch_size,
+            recreate=args.recreate,
+        )
+        print(f"  {migration.summary()}")
+        output["migration"] = {
+            "points_copied": migration.points_copied,
+            "duration_seconds": round(migration.duration_seconds, 2),
+        }
+
+    report = compare_collections(
+        client,
+        baseline=args.source,
+        candidate=args.target,
+        candidate_profile=args.profile,
+        baseline_profile=args.source_profile,
+        top_k=args.top_k,
+        num_queries=args.queries,
+    )
+    print(f"  {report.summary()}")
+    output["comparison"] = report.to_dict()
+
+    if args.alias:
+        from qdrant_client.models import CreateAlias, CreateAliasOperation
+
+        client.update_collection_aliases(
+            change_aliases_operations=[
+                CreateAliasOperation(
+                    create_alias=CreateAlias(collection_name=args.target, alias_name=args.alias)
+                )
+            ]
+        )
+        print(f"  Alias {args.alias} -> {args.target}")
+
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(output, indent=2))
+        print(f"  Report salvato: {args.report}")
+
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
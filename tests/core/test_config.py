@@ -101,6 +101,19 @@ class TestMerltConfig:
         assert "prod" in config.qdrant_collection
         assert "prod" in config.postgres_database
 
+    def test_qdrant_profile(self):
+        """Test Qdrant collection profile resolution and validation."""
+        from merlt import MerltConfig
+
+        assert MerltConfig().collection_profile.name == "default"
+
+        config = MerltConfig(qdrant_profile="quantized_on_disk")
+        assert config.collection_profile.scalar_quantization is True
+        assert config.collection_profile.vectors_on_disk is True
+
+        with pytest.raises(ValueError):
+            MerltConfig(qdrant_profile="unknown")
+
 
 class TestLegalKnowledgeGraphUnit:
     """Unit tests for LegalKnowledgeGraph (no external connections)."""
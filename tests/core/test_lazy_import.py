@@ -0,0 +1,72 @@
+"""
+Test Lazy Import
+================
+
+Regression test: `import merlt` must stay cheap.
+
+Each check runs in a fresh interpreter, since the test session itself
+has already imported torch and friends through other test modules.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+HEAVY_MODULES = ["torch", "sentence_transformers", "qdrant_client", "falkordb", "sqlalchemy"]
+
+
+def _loaded_modules(code: str) -> set:
+    """Run code in a subprocess and return the heavy modules it loaded."""
+    probe = (
+        f"{code}\n"
+        "import sys\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert completed.returncode == 0, completed.stderr
+    last_line = completed.stdout.strip().splitlines()[-1] if completed.stdout.strip() else ""
+    return {m for m in last_line.split(",") if m}
+
+
+class TestLazyImport:
+    """`import merlt` defers heavy dependencies."""
+
+    def test_import_merlt_does_not_load_heavy_modules(self):
+        """Plain `import merlt` loads none of the heavy backends."""
+        assert _loaded_modules("import merlt") == set()
+
+    def test_import_storage_does_not_load_torch(self):
+        """`import merlt.storage` does not load torch."""
+        assert "torch" not in _loaded_modules("import merlt.storage")
+
+    def test_core_api_does_not_load_torch(self):
+        """Accessing LegalKnowledgeGraph does not load the embedding model backend."""
+        loaded = _loaded_modules("from merlt import LegalKnowledgeGraph, MerltConfig")
+
+        assert "torch" not in loaded
+        assert "sentence_transformers" not in loaded
+
+    def test_lazy_attributes_resolve(self):
+        """Lazy exports resolve to the real classes."""
+        import merlt
+        from merlt.core.legal_knowledge_graph import LegalKnowledgeGraph
+
+        assert merlt.LegalKnowledgeGraph is LegalKnowledgeGraph
+        assert "EmbeddingService" in dir(merlt)
+
+    def test_unknown_attribute_raises(self):
+        """Unknown attributes still raise AttributeError."""
+        import merlt
+
+        with pytest.raises(AttributeError):
+            merlt.DoesNotExist
@@ -50,6 +50,7 @@ def mock_kg():
 
     # Embedding service
     kg._embedding_service = MagicMock()
+    kg._embedding_service.model_name = "test-model"
     kg._embedding_service.encode_batch_async = AsyncMock()
 
     # Qdrant
@@ -607,6 +608,34 @@ class TestFullBatchProcessing:
         assert result.failed == 1
         assert len(result.errors) == 1
 
+    @pytest.mark.asyncio
+    async def test_brocardi_auto_build_index_restored(self, mock_kg):
+        """auto_build_index vale solo durante il run batch."""
+        scraper = mock_kg._brocardi_scraper
+        scraper.auto_build_index = False
+        during_run = []
+
+        async def get_info(*args, **kwargs):
+            during_run.append(scraper.auto_build_index)
+            return ("Position", {}, "https://brocardi.it")
+
+        mock_kg._normattiva_scraper.get_document = AsyncMock(
+            return_value=("Testo 1173", "https://url/1173")
+        )
+        scraper.get_info = AsyncMock(side_effect=get_info)
+        mock_kg._ingestion_pipeline.ingest_article = AsyncMock(side_effect=Exception("graph down"))
+
+        pipeline = BatchIngestionPipeline(kg=mock_kg)
+        await pipeline.ingest_batch(
+            tipo_atto="codice civile",
+            article_numbers=["1173"],
+            include_brocardi=True,
+            include_multivigenza=False,
+        )
+
+        assert during_run == [True]
+        assert scraper.auto_build_index is False
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TEST: Concurrency Control
@@ -649,3 +678,131 @@ class TestConcurrencyControl:
         # Max concurrent should not exceed limit
         assert max_observed <= max_concurrent, \
             f"Max concurrent {max_observed} exceeded limit {max_concurrent}"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEST: Pipelined Execution
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _timed_stage_pipeline(mock_kg, pipelined: bool, delay: float = 0.05):
+    """Pipeline with every stage replaced by a fixed sleep per batch."""
+    pipeline = BatchIngestionPipeline(kg=mock_kg, batch_size=2, pipelined=pipelined)
+
+    async def fetch(tipo_atto, article_numbers, include_brocardi):
+        await asyncio.sleep(delay)
+        return [
+            ArticleFetchResult(
+                article_num=n,
+                norma_visitata=MagicMock(),
+                article_text=f"Testo {n}",
+            )
+            for n in article_numbers
+        ]
+
+    async def graph(fetch_results, tipo_atto):
+        await asyncio.sleep(delay)
+        return {f.article_num: MagicMock(nodes_created=["n"]) for f in fetch_results}
+
+    async def embed(fetch_results, ingestion_results):
+        await asyncio.sleep(delay)
+        return len(fetch_results)
+
+    async def bridge(ingestion_results):
+        await asyncio.sleep(delay)
+        return len(ingestion_results)
+
+    pipeline._fetch_articles_parallel = fetch
+    pipeline._ingest_to_graph_parallel = graph
+    pipeline._generate_embeddings_batch = embed
+    pipeline._insert_bridge_mappings_batch = bridge
+    return pipeline
+
+
+class TestPipelinedExecution:
+    """Test staged producer/consumer execution."""
+
+    ARTICLES = [str(n) for n in range(1, 13)]  # 6 batches
+
+    @pytest.mark.asyncio
+    async def test_pipelined_matches_sequential(self, mock_kg):
+        results = []
+        for pipelined in (False, True):
+            pipeline = _timed_stage_pipeline(mock_kg, pipelined, delay=0)
+            results.append(await pipeline.ingest_batch(
+                tipo_atto="codice civile",
+                article_numbers=self.ARTICLES,
+                include_multivigenza=False,
+            ))
+
+        sequential, pipelined = results
+        assert pipelined.successful == sequential.successful == 12
+        assert pipelined.embeddings_created == sequential.embeddings_created == 12
+        assert pipelined.graph_nodes_created == sequential.graph_nodes_created == 12
+        assert pipelined.bridge_mappings_created == sequential.bridge_mappings_created == 12
+        assert sorted(pipelined.articles_processed, key=int) == self.ARTICLES
+
+    @pytest.mark.asyncio
+    async def test_stages_overlap(self, mock_kg):
+        durations = {}
+        for pipelined in (False, True):
+            pipeline = _timed_stage_pipeline(mock_kg, pipelined)
+            result = await pipeline.ingest_batch(
+                tipo_atto="codice civile",
+                article_numbers=self.ARTICLES,
+                include_multivigenza=False,
+            )
+            durations[pipelined] = result.duration_seconds
+
+        # Sequential: 6 batches × 4 stages × 50ms ≈ 1.2s
+        # Pipelined: ≈ (6 + 3) × 50ms ≈ 0.45s
+        assert durations[True] < durations[False] * 0.6
+
+    @pytest.mark.asyncio
+    async def test_stage_metrics(self, mock_kg):
+        pipeline = _timed_stage_pipeline(mock_kg, pipelined=True, delay=0.01)
+        pipeline.queue_size = 1
+
+        result = await pipeline.ingest_batch(
+            tipo_atto="codice civile",
+            article_numbers=self.ARTICLES,
+            include_multivigenza=False,
+        )
+
+        assert set(result.stage_metrics) == {"fetch", "graph", "embed", "bridge"}
+        for metrics in result.stage_metrics.values():
+            assert metrics["batches"] == 6
+            assert metrics["articles"] == 12
+            assert metrics["max_queue_depth"] <= 1
+            assert metrics["articles_per_second"] > 0
+
+    @pytest.mark.asyncio
+    async def test_failing_stage_fails_only_its_batch(self, mock_kg):
+        pipeline = _timed_stage_pipeline(mock_kg, pipelined=True, delay=0)
+        embed = pipeline._generate_embeddings_batch
+
+        async def flaky_embed(fetch_results, ingestion_results):
+            if fetch_results[0].article_num == "3":
+                raise RuntimeError("encoder OOM")
+            return await embed(fetch_results, ingestion_results)
+
+        pipeline._generate_embeddings_batch = flaky_embed
+
+        result = await pipeline.ingest_batch(
+            tipo_atto="codice civile",
+            article_numbers=self.ARTICLES,
+            include_multivigenza=False,
+        )
+
+        assert result.successful == 10
+        assert result.failed == 2
+        assert result.errors == ["Batch 2: embed: encoder OOM"]
+        assert result.stage_metrics["embed"]["errors"] == 1
+        assert result.stage_metrics["bridge"]["batches"] == 5
+
+    def test_stage_concurrency_override(self, mock_kg):
+        pipeline = BatchIngestionPipeline(kg=mock_kg, stage_concurrency={"fetch": 4})
+        assert pipeline.stage_concurrency["fetch"] == 4
+        assert pipeline.stage_concurrency["embed"] == 1
+
+        with pytest.raises(ValueError, match="Unknown pipeline stages"):
+            BatchIngestionPipeline(kg=mock_kg, stage_concurrency={"parse": 2})
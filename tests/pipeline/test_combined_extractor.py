@@ -0,0 +1,130 @@
+"""
+Test Estrazione Combinata
+=========================
+
+Verifica CombinedExtractor: una chiamata LLM per contenuto per tutti i tipi,
+validazione e separazione per tipo con le regole degli estrattori per tipo.
+L'LLM è finto (nessuna chiamata OpenRouter).
+"""
+
+import pytest
+
+from merlt.pipeline.enrichment.config import EnrichmentConfig
+from merlt.pipeline.enrichment.extractors import CombinedExtractor
+from merlt.pipeline.enrichment.models import EnrichmentContent, EntityType
+from merlt.pipeline.enrichment.pipeline import EnrichmentPipeline
+
+TYPES = [EntityType.CONCETTO, EntityType.PRINCIPIO, EntityType.SOGGETTO]
+
+
+class FakeLLM:
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    async def generate_json_completion(self, prompt, json_schema, **kwargs):
+        self.calls.append({"prompt": prompt, "schema": json_schema, **kwargs})
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+@pytest.fixture
+def content():
+    return EnrichmentContent(
+        id="brocardi:1337:spiegazione",
+        text="Le parti, nello svolgimento delle trattative, devono comportarsi secondo buona fede.",
+        article_refs=["urn:nir:stato:regio.decreto:1942-03-16;262:2~art1337"],
+        source="brocardi",
+        content_type="spiegazione",
+    )
+
+
+RESPONSE = {
+    "concetto": [
+        {"nome": "buona fede oggettiva", "descrizione": "Correttezza", "articoli_correlati": ["1337"]},
+        {"nome": "contratto"},  # escluso dalla validazione dei concetti
+    ],
+    "principio": [{"nome": "principio di affidamento", "descrizione": "Tutela dell'affidamento"}],
+    "soggetto": None,
+    "definizione": [{"nome": "non richiesto"}],
+    "altro": [{"nome": "chiave sconosciuta"}],
+}
+
+
+class TestCombinedExtractor:
+    @pytest.mark.asyncio
+    async def test_single_call_split_by_type(self, content):
+        llm = FakeLLM(RESPONSE)
+        extractor = CombinedExtractor(llm, TYPES)
+
+        by_type = await extractor.extract_by_type(content)
+
+        assert len(llm.calls) == 1
+        assert [e.nome for e in by_type[EntityType.CONCETTO]] == ["buona fede oggettiva"]
+        assert by_type[EntityType.CONCETTO][0].articoli_correlati[0].endswith("~art1337")
+        assert [e.tipo for e in by_type[EntityType.PRINCIPIO]] == [EntityType.PRINCIPIO]
+        assert by_type[EntityType.SOGGETTO] == []
+        assert set(by_type) == set(TYPES)
+
+    @pytest.mark.asyncio
+    async def test_prompt_and_schema_cover_all_types(self, content):
+        llm = FakeLLM({})
+        extractor = CombinedExtractor(llm, TYPES)
+
+        assert await extractor.extract(content) == []
+
+        call = llm.calls[0]
+        assert call["schema"]["required"] == ["concetto", "principio", "soggetto"]
+        assert "nome" in call["schema"]["properties"]["concetto"]["items"]["properties"]
+        assert "- principio: principi giuridici" in call["prompt"]
+        assert content.text in call["prompt"]
+        assert call["max_tokens"] == 4000
+
+    @pytest.mark.asyncio
+    async def test_flat_list_in_type_order(self, content):
+        extractor = CombinedExtractor(FakeLLM(RESPONSE), TYPES)
+
+        entities = await extractor.extract(content)
+
+        assert [e.tipo for e in entities] == [EntityType.CONCETTO, EntityType.PRINCIPIO]
+
+    @pytest.mark.asyncio
+    async def test_invalid_lists_ignored(self, content):
+        response = {"concetto": "buona fede", "principio": [{"nome": "affidamento"}, "testo libero"]}
+        extractor = CombinedExtractor(FakeLLM(response), TYPES)
+
+        by_type = await extractor.extract_by_type(content)
+
+        assert by_type[EntityType.CONCETTO] == []
+        assert [e.nome for e in by_type[EntityType.PRINCIPIO]] == ["affidamento"]
+
+    @pytest.mark.asyncio
+    async def test_llm_error_returns_empty(self, content):
+        extractor = CombinedExtractor(FakeLLM(TimeoutError("timeout")), TYPES)
+
+        assert await extractor.extract_by_type(content) == {t: [] for t in TYPES}
+
+    def test_requires_types(self):
+        with pytest.raises(ValueError):
+            CombinedExtractor(FakeLLM({}), [])
+
+
+class TestPipelineCombinedExtraction:
+    @pytest.mark.asyncio
+    async def test_one_call_per_content(self, tmp_path, content):
+        llm = FakeLLM(RESPONSE)
+        config = EnrichmentConfig(
+            entity_types=TYPES,
+            checkpoint_dir=tmp_path / "checkpoints",
+            audit_log_path=tmp_path / "audit.jsonl",
+            combined_extraction=True,
+        )
+        pipeline = EnrichmentPipeline(None, None, llm, config)
+        await pipeline._init_components()
+
+        entities = await pipeline._extract_entities(content)
+
+        assert list(pipeline._extractors) == ["combined"]
+        assert len(llm.calls) == 1
+        assert len(entities) == 2
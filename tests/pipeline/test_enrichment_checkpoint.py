@@ -0,0 +1,119 @@
+"""
+Test Checkpoint Enrichment
+==========================
+
+Verifica CheckpointManager con journal append-only: resume da snapshot +
+journal, compattazione, righe troncate e snapshot del formato precedente.
+"""
+
+import json
+
+from merlt.pipeline.enrichment.checkpoint import CheckpointManager
+
+
+def manager(tmp_path, **kwargs):
+    return CheckpointManager(tmp_path, run_id="run", fsync=False, **kwargs)
+
+
+class TestCheckpointJournal:
+    def test_resume_from_journal_without_finalize(self, tmp_path):
+        checkpoint = manager(tmp_path)
+        checkpoint.start_run("abc")
+        checkpoint.mark_done("c1", {"concepts_created": 2})
+        checkpoint.mark_done("c2", {"concepts_created": 1})
+        checkpoint.mark_error("c3")
+
+        resumed = manager(tmp_path)
+
+        assert resumed.load() == {"c1", "c2"}
+        assert resumed.state.stats["concepts_created"] == 3
+        assert resumed.state.stats["errors"] == 1
+        assert resumed.state.config_hash == "abc"
+        assert not (tmp_path / "run.json").exists()
+
+    def test_append_only_until_compaction(self, tmp_path):
+        checkpoint = manager(tmp_path, compact_interval=5)
+        for i in range(4):
+            checkpoint.mark_done(f"c{i}")
+
+        journal = tmp_path / "run.journal.jsonl"
+        assert len(journal.read_text().splitlines()) == 4
+        assert not (tmp_path / "run.json").exists()
+
+        checkpoint.mark_done("c4")
+
+        assert not journal.exists()
+        snapshot = json.loads((tmp_path / "run.json").read_text())
+        assert len(snapshot["processed_ids"]) == 5
+        assert snapshot["journal_seq"] == 5
+
+        checkpoint.mark_done("c5")
+        assert manager(tmp_path).load() == {f"c{i}" for i in range(6)}
+
+    def test_interrupted_compaction_not_replayed(self, tmp_path):
+        checkpoint = manager(tmp_path)
+        checkpoint.mark_done("c1", {"concepts_created": 1})
+        journal = (tmp_path / "run.journal.jsonl").read_text()
+        checkpoint.compact()
+        # Snapshot scritto ma journal non ancora svuotato
+        (tmp_path / "run.journal.jsonl").write_text(journal)
+
+        resumed = manager(tmp_path)
+
+        assert resumed.load() == {"c1"}
+        assert resumed.state.stats["concepts_created"] == 1
+
+    def test_truncated_last_line_ignored(self, tmp_path):
+        checkpoint = manager(tmp_path)
+        checkpoint.mark_done("c1")
+        checkpoint.mark_done("c2")
+        with open(tmp_path / "run.journal.jsonl", "a", encoding="utf-8") as f:
+            f.write('{"op": "done", "id": "c3"')
+
+        assert manager(tmp_path).load() == {"c1", "c2"}
+
+    def test_append_after_truncated_line(self, tmp_path):
+        checkpoint = manager(tmp_path)
+        checkpoint.mark_done("a")
+        checkpoint.mark_done("b")
+        with open(tmp_path / "run.journal.jsonl", "a", encoding="utf-8") as f:
+            f.write('{"op": "done", "id": "c"')
+
+        resumed = manager(tmp_path)
+        resumed.mark_done("d")
+        resumed.mark_done("e")
+
+        assert manager(tmp_path).load() == {"a", "b", "d", "e"}
+
+    def test_legacy_snapshot(self, tmp_path):
+        (tmp_path / "run.json").write_text(json.dumps({
+            "run_id": "run",
+            "processed_ids": ["c1"],
+            "started_at": "2025-01-01T00:00:00",
+            "last_updated": "2025-01-01T00:00:00",
+            "config_hash": "",
+            "stats": {"errors": 0},
+        }))
+
+        checkpoint = manager(tmp_path)
+        checkpoint.mark_done("c2")
+
+        assert manager(tmp_path).load() == {"c1", "c2"}
+
+    def test_finalize_list_and_reset(self, tmp_path):
+        checkpoint = manager(tmp_path)
+        checkpoint.mark_done("c1")
+        other = CheckpointManager(tmp_path, run_id="other", fsync=False)
+        other.mark_done("x1")
+        other.mark_done("x2")
+
+        final = checkpoint.finalize()
+
+        assert final["processed_count"] == 1
+        assert not (tmp_path / "run.journal.jsonl").exists()
+        listed = {c["run_id"]: c["processed_count"] for c in CheckpointManager.list_checkpoints(tmp_path)}
+        assert listed == {"run": 1, "other": 2}
+
+        other.reset()
+        assert other.load() == set()
+        assert [c["run_id"] for c in CheckpointManager.list_checkpoints(tmp_path)] == ["run"]
@@ -0,0 +1,169 @@
+"""
+Test Enrichment Pipeline (worker paralleli)
+===========================================
+
+Verifica l'esecuzione con più content worker: estrazione parallela, commit
+(link, scrittura, checkpoint) nell'ordine della fonte, resume dal
+checkpoint e tempi per fase. Extractor, linker e writer sono finti (nessun
+LLM né FalkorDB).
+"""
+
+import asyncio
+
+import pytest
+
+from merlt.pipeline.enrichment.config import EnrichmentConfig
+from merlt.pipeline.enrichment.models import (
+    EnrichmentContent,
+    EntityType,
+    ExtractedEntity,
+    LinkedEntity,
+)
+from merlt.pipeline.enrichment.pipeline import EnrichmentPipeline
+from merlt.pipeline.enrichment.sources.base import BaseEnrichmentSource
+
+
+class ListSource(BaseEnrichmentSource):
+    def __init__(self, ids, fail_after=None):
+        super().__init__()
+        self.ids = ids
+        self.fail_after = fail_after
+
+    @property
+    def source_name(self) -> str:
+        return "lista"
+
+    async def fetch(self, scope=None):
+        for n, content_id in enumerate(self.ids):
+            if self.fail_after is not None and n == self.fail_after:
+                raise ConnectionError("fonte interrotta")
+            yield EnrichmentContent(
+                id=content_id, text=f"testo {content_id}", article_refs=[], source="lista"
+            )
+
+
+class SlowExtractor:
+    """I primi contenuti sono i più lenti: finiscono in ordine inverso."""
+
+    def __init__(self, ids):
+        self.delays = {cid: 0.002 * (len(ids) - n) for n, cid in enumerate(ids)}
+        self.active = 0
+        self.max_active = 0
+
+    async def extract(self, content):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delays[content.id])
+            return [ExtractedEntity(nome=content.id, tipo=EntityType.CONCETTO)]
+        finally:
+            self.active -= 1
+
+
+class RecordingLinker:
+    def __init__(self, fail=()):
+        self.order = []
+        self.fail = set(fail)
+
+    async def link_batch(self, entities):
+        if any(e.nome in self.fail for e in entities):
+            raise ValueError("linking fallito")
+        self.order.extend(e.nome for e in entities)
+        return [LinkedEntity(entity=e, node_id=e.node_id) for e in entities]
+
+    def register(self, written):
+        pass
+
+
+class RecordingWriter:
+    async def write_batch(self, linked, content):
+        await asyncio.sleep(0)
+        return linked
+
+
+IDS = [f"c{n}" for n in range(12)]
+
+
+def make_pipeline(tmp_path, source, extractor, workers):
+    config = EnrichmentConfig(
+        sources=[source],
+        checkpoint_dir=tmp_path / "checkpoints",
+        audit_log_path=tmp_path / "logs" / "audit.jsonl",
+        content_workers=workers,
+    )
+    pipeline = EnrichmentPipeline(None, None, None, config)
+    pipeline._extractors = {EntityType.CONCETTO: extractor}
+    pipeline._linker = RecordingLinker()
+    pipeline._writer = RecordingWriter()
+    return pipeline
+
+
+class TestContentWorkers:
+    @pytest.mark.asyncio
+    async def test_sequential_by_default(self, tmp_path):
+        extractor = SlowExtractor(IDS)
+        pipeline = make_pipeline(tmp_path, ListSource(IDS), extractor, workers=1)
+
+        result = await pipeline.run()
+
+        assert extractor.max_active == 1
+        assert result.contents_processed == len(IDS)
+        assert pipeline._linker.order == IDS
+
+    @pytest.mark.asyncio
+    async def test_parallel_extraction_ordered_commit(self, tmp_path):
+        extractor = SlowExtractor(IDS)
+        pipeline = make_pipeline(tmp_path, ListSource(IDS), extractor, workers=4)
+
+        result = await pipeline.run()
+
+        assert extractor.max_active == 4
+        assert pipeline._linker.order == IDS
+        assert result.entities_created == [f"concetto:{cid}" for cid in IDS]
+        assert pipeline.checkpoint.load() == set(IDS)
+        assert set(result.stage_seconds) == {"extract", "link", "write", "checkpoint"}
+        assert "Tempi per fase:" in result.summary()
+
+    @pytest.mark.asyncio
+    async def test_errors_not_checkpointed(self, tmp_path):
+        pipeline = make_pipeline(tmp_path, ListSource(IDS), SlowExtractor(IDS), workers=4)
+        pipeline._linker = RecordingLinker(fail=["c3"])
+
+        result = await pipeline.run()
+
+        assert [e.content_id for e in result.errors] == ["c3"]
+        assert pipeline.checkpoint.load() == set(IDS) - {"c3"}
+        assert result.contents_processed == len(IDS)
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_drains_started_contents(self, tmp_path):
+        extractor = SlowExtractor(IDS)
+        source = ListSource(IDS, fail_after=6)
+        pipeline = make_pipeline(tmp_path, source, extractor, workers=4)
+
+        result = await pipeline.run()
+
+        assert pipeline._linker.order == IDS[:6]
+        assert pipeline.checkpoint.load() == set(IDS[:6])
+        assert [e.phase for e in result.errors] == ["fetch"]
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_committed(self, tmp_path):
+        first = make_pipeline(tmp_path, ListSource(IDS, fail_after=5), SlowExtractor(IDS), workers=3)
+        await first.run()
+
+        extractor = SlowExtractor(IDS)
+        second = make_pipeline(tmp_path, ListSource(IDS), extractor, workers=3)
+        result = await second.run()
+
+        assert result.contents_skipped == 5
+        assert second._linker.order == IDS[5:]
+        assert second.checkpoint.load() == set(IDS)
+
+    def test_invalid_workers(self, tmp_path):
+        with pytest.raises(ValueError):
+            EnrichmentConfig(
+                checkpoint_dir=tmp_path / "checkpoints",
+                audit_log_path=tmp_path / "audit.jsonl",
+                content_workers=0,
+            )
@@ -0,0 +1,179 @@
+"""
+Test Entity Index
+=================
+
+Verifica EntityIndex (match esatti, candidati n-grammi, caricamento
+paginato) e il linking in memoria di EntityLinker, con un grafo finto
+(nessun FalkorDB).
+"""
+
+import pytest
+
+from merlt.pipeline.enrichment.linkers import EntityIndex, EntityLinker
+from merlt.pipeline.enrichment.models import EntityType, ExtractedEntity
+
+NODES = {
+    "ConcettoGiuridico": [
+        {"node_id": "concetto:buona_fede_oggettiva", "nome": "Buona fede oggettiva",
+         "nome_normalizzato": "buona_fede_oggettiva", "fonti": ["brocardi"]},
+        {"node_id": "concetto:inadempimento", "nome": "Inadempimento",
+         "nome_normalizzato": "inadempimento", "fonti": ["manuale"]},
+        {"node_id": "concetto:mora_del_debitore", "nome": "Mora del debitore",
+         "nome_normalizzato": None, "fonti": None},
+    ],
+    "PrincipioGiuridico": [
+        {"node_id": "principio:affidamento", "nome": "Affidamento",
+         "nome_normalizzato": "affidamento", "fonti": ["brocardi"]},
+    ],
+}
+
+
+class FakeGraph:
+    def __init__(self, nodes):
+        self.nodes = nodes
+        self.queries = []
+
+    async def query(self, query, params=None):
+        self.queries.append(query)
+        for label, rows in self.nodes.items():
+            if f"(n:{label})" in query:
+                return rows[params["skip"]:params["skip"] + params["limit"]]
+        if "MATCH (n:" in query:
+            return []
+        raise AssertionError("query per entità inattesa con indice caricato")
+
+
+def entity(nome, tipo=EntityType.CONCETTO, fonte="manuale"):
+    return ExtractedEntity(nome=nome, tipo=tipo, fonte=fonte)
+
+
+class TestEntityIndex:
+    @pytest.mark.asyncio
+    async def test_load_paginated(self):
+        graph = FakeGraph(NODES)
+        index = EntityIndex()
+
+        loaded = await index.load(graph, [EntityType.CONCETTO, EntityType.PRINCIPIO], page_size=2)
+
+        assert loaded == 4
+        assert index.loaded
+        # 2 pagine per i concetti, 1 per i principi
+        assert len(graph.queries) == 3
+        assert index.get(EntityType.CONCETTO, "mora_del_debitore").fonti == []
+        assert index.get(EntityType.PRINCIPIO, "inadempimento") is None
+
+    def test_candidates_by_ngram(self):
+        index = EntityIndex()
+        index.add(EntityType.CONCETTO, "concetto:buona_fede_oggettiva", "Buona fede oggettiva")
+        index.add(EntityType.CONCETTO, "concetto:inadempimento", "Inadempimento")
+        index.add(EntityType.PRINCIPIO, "principio:buona_fede", "Buona fede")
+
+        candidates = index.candidates("buona fede ogettiva", EntityType.CONCETTO)
+
+        assert [c.node_id for c, _ in candidates] == ["concetto:buona_fede_oggettiva"]
+        assert candidates[0][1] > 0.8
+        assert {c.node_id for c, _ in index.candidates("buona fede")} == {
+            "principio:buona_fede", "concetto:buona_fede_oggettiva",
+        }
+        assert index.candidates("buona fede", min_similarity=1.0)[0][0].node_id == "principio:buona_fede"
+
+    def test_add_merges_sources(self):
+        index = EntityIndex()
+        index.add(EntityType.CONCETTO, "concetto:dolo", "Dolo", fonti=["brocardi"])
+        index.add(EntityType.CONCETTO, "concetto:dolo", "dolo", fonti=["manuale", "brocardi"])
+
+        assert len(index) == 1
+        assert index.get(EntityType.CONCETTO, "dolo").fonti == ["brocardi", "manuale"]
+
+
+class TestLinkerWithIndex:
+    @pytest.mark.asyncio
+    async def test_link_in_memory(self):
+        graph = FakeGraph(NODES)
+        linker = EntityLinker(graph)
+        await linker.load_index()
+        queries = len(graph.queries)
+
+        linked = await linker.link_batch([
+            entity("Buona Fede Oggettiva"),
+            entity("Affidamento", tipo=EntityType.PRINCIPIO),
+            entity("Risoluzione del contratto"),
+        ])
+
+        assert len(graph.queries) == queries
+        by_id = {le.node_id: le for le in linked}
+        assert not by_id["concetto:buona_fede_oggettiva"].is_new
+        assert by_id["concetto:buona_fede_oggettiva"].merged_from == ["manuale", "brocardi"]
+        assert not by_id["principio:affidamento"].is_new
+        assert by_id["concetto:risoluzione_del_contratto"].is_new
+
+    @pytest.mark.asyncio
+    async def test_register_written(self):
+        linker = EntityLinker(FakeGraph({}))
+        await linker.load_index()
+
+        first = await linker.link_batch([entity("Diligenza")])
+        linker.register(first)
+        second = await linker.link_batch([entity("diligenza", fonte="brocardi")])
+
+        assert first[0].is_new
+        assert not second[0].is_new
+        assert second[0].node_id == "concetto:diligenza"
+
+    @pytest.mark.asyncio
+    async def test_fuzzy_linking(self):
+        linker = EntityLinker(FakeGraph(NODES))
+        await linker.load_index()
+        linker.fuzzy_linking = True
+
+        typo, variant = await linker.link_batch([
+            entity("Buona fede ogettiva"),
+            entity("Buona fede soggettiva"),
+        ])
+
+        assert typo.node_id == "concetto:buona_fede_oggettiva"
+        assert not typo.is_new
+        # Variante per qualificatore: entità distinta
+        assert variant.is_new
+
+    @pytest.mark.asyncio
+    async def test_fuzzy_linking_cached_across_batches(self):
+        linker = EntityLinker(FakeGraph(NODES))
+        await linker.load_index()
+        linker.fuzzy_linking = True
+
+        first = await linker.link_batch([entity("Buona fede ogettiva")])
+        second = await linker.link_batch([entity("Buona fede ogettiva", fonte="brocardi")])
+
+        assert first[0].node_id == "concetto:buona_fede_oggettiva"
+        assert second[0].node_id == "concetto:buona_fede_oggettiva"
+        assert not second[0].is_new
+
+    @pytest.mark.asyncio
+    async def test_find_similar_in_memory(self):
+        linker = EntityLinker(FakeGraph(NODES))
+        await linker.load_index()
+
+        similar = await linker.find_similar("mora debitore", limit=1)
+
+        assert similar[0]["node_id"] == "concetto:mora_del_debitore"
+        assert similar[0]["labels"] == ["ConcettoGiuridico"]
+
+    @pytest.mark.asyncio
+    async def test_without_index_queries_graph(self):
+        class QueryGraph:
+            def __init__(self):
+                self.calls = 0
+
+            async def query(self, query, params=None):
+                self.calls += 1
+                return [{"node_id": "concetto:dolo", "nome": "Dolo", "fonti": ["brocardi"]}]
+
+        graph = QueryGraph()
+        linker = EntityLinker(graph)
+
+        linked = await linker.link_batch([entity("Dolo")])
+
+        assert not linker.index_ready
+        assert graph.calls == 1
+        assert not linked[0].is_new
@@ -0,0 +1,212 @@
+"""
+Tests for IngestionJournal and resumable batch ingestion
+========================================================
+
+Verifica:
+1. Journal append-only persistente e stato ricostruito alla riapertura
+2. Content hash: un cambiamento a monte riapre gli stage a valle
+3. BatchIngestionPipeline(resume=True) salta articoli e stage completati
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from merlt.pipeline.batch_ingestion import ArticleFetchResult, BatchIngestionPipeline
+from merlt.pipeline.ingestion_journal import IngestionJournal, fetch_content_hash
+
+TIPO = "codice civile"
+STAGES = ["fetch", "graph", "embed", "bridge"]
+
+
+class TestIngestionJournal:
+    def test_state_survives_reopen(self, tmp_path):
+        path = tmp_path / "journal.sqlite"
+        journal = IngestionJournal(path)
+        journal.record(TIPO, "fetch", {"1": "h1", "2": "h2"})
+        journal.record(TIPO, "graph", {"1": "h1"})
+        journal.save_fetched(TIPO, {"1": ("h1", {"article_text": "Testo"})})
+        journal.close()
+
+        reopened = IngestionJournal(path)
+
+        assert reopened.content_hash(TIPO, "1") == "h1"
+        assert reopened.pending_stages(TIPO, "1", ["graph", "embed"]) == {"embed"}
+        assert reopened.load_fetched(TIPO, ["1", "2"]) == {"1": ("h1", {"article_text": "Testo"})}
+        assert reopened.stats(TIPO) == {"fetch": 2, "graph": 1}
+
+    def test_upstream_change_reopens_stages(self):
+        journal = IngestionJournal(":memory:")
+        journal.record(TIPO, "fetch", {"1": "old"})
+        journal.record(TIPO, "graph", {"1": "old"})
+
+        assert journal.completed_articles(TIPO, ["fetch", "graph"]) == {"1"}
+        assert journal.pending_stages(TIPO, "1", ["graph"], content_hash="new") == {"graph"}
+
+        journal.record(TIPO, "fetch", {"1": "new"})
+
+        assert journal.completed_articles(TIPO, ["fetch", "graph"]) == set()
+        # Payload salvato con un hash superato non viene riusato
+        journal.save_fetched(TIPO, {"1": ("old", {})})
+        assert journal.load_fetched(TIPO, ["1"]) == {}
+
+    def test_tipo_atto_isolation(self):
+        journal = IngestionJournal(":memory:")
+        journal.record(TIPO, "fetch", {"1": "h"})
+
+        assert journal.completed_articles("codice penale", ["fetch"]) == set()
+
+    def test_fetch_content_hash(self):
+        assert fetch_content_hash("a", {"Ratio": "x"}) == fetch_content_hash("a", {"Ratio": "x"})
+        assert fetch_content_hash("a", {"Ratio": "x"}) != fetch_content_hash("a", {"Ratio": "y"})
+        assert fetch_content_hash("a", None) == fetch_content_hash("a", {})
+
+
+class RecordingPipeline:
+    """BatchIngestionPipeline with recorded, fake stage implementations."""
+
+    def __init__(self, journal, texts, fail_embed_for=(), bridge_error=None, bridge_inserted=None):
+        kg = MagicMock()
+        self.pipeline = BatchIngestionPipeline(kg=kg, batch_size=2, journal=journal)
+        self.texts = texts
+        self.fail_embed_for = set(fail_embed_for)
+        self.bridge_error = bridge_error
+        self.bridge_inserted = bridge_inserted
+        self.calls = {stage: [] for stage in STAGES}
+
+        p = self.pipeline
+        p._fetch_articles_parallel = self.fetch
+        p._ingest_to_graph_parallel = self.graph
+        p._generate_embeddings_batch = self.embed
+        p._insert_bridge_mappings_batch = self.bridge
+
+    async def fetch(self, tipo_atto, article_numbers, include_brocardi):
+        self.calls["fetch"].extend(article_numbers)
+        return [
+            ArticleFetchResult(
+                article_num=n,
+                norma_visitata=MagicMock(),
+                article_text=self.texts[n],
+                brocardi_info={"Ratio": f"ratio {n}"},
+            )
+            for n in article_numbers
+        ]
+
+    async def graph(self, fetch_results, tipo_atto):
+        self.calls["graph"].extend(f.article_num for f in fetch_results)
+        return {
+            f.article_num: MagicMock(nodes_created=["n"], bridge_mappings=["m"])
+            for f in fetch_results
+        }
+
+    async def embed(self, fetch_results, ingestion_results):
+        nums = [f.article_num for f in fetch_results]
+        if self.fail_embed_for & set(nums):
+            raise RuntimeError("encoder crashed")
+        self.calls["embed"].extend(nums)
+        return len(nums)
+
+    async def bridge(self, ingestion_results):
+        self.calls["bridge"].extend(ingestion_results)
+        if self.bridge_error is not None:
+            raise self.bridge_error
+        if self.bridge_inserted is not None:
+            return self.bridge_inserted
+        return len(ingestion_results)
+
+    async def run(self, articles, **kwargs):
+        return await self.pipeline.ingest_batch(
+            tipo_atto=TIPO,
+            article_numbers=articles,
+            include_multivigenza=False,
+            **kwargs,
+        )
+
+
+ARTICLES = ["1", "2", "3", "4"]
+TEXTS = {n: f"Testo articolo {n}" for n in ARTICLES}
+
+
+class TestResume:
+    @pytest.mark.asyncio
+    async def test_resume_requires_journal(self):
+        pipeline = BatchIngestionPipeline(kg=MagicMock())
+        with pytest.raises(ValueError, match="IngestionJournal"):
+            await pipeline.ingest_batch(TIPO, ["1"], resume=True)
+
+    @pytest.mark.asyncio
+    async def test_resume_after_crash_redoes_only_missing_work(self):
+        journal = IngestionJournal(":memory:")
+
+        first = RecordingPipeline(journal, TEXTS, fail_embed_for={"3"})
+        result = await first.run(ARTICLES)
+        assert result.failed == 2  # batch 2 (articoli 3-4) fallito all'embed
+
+        second = RecordingPipeline(journal, TEXTS)
+        result = await second.run(ARTICLES, resume=True)
+
+        assert result.skipped == 2
+        assert result.successful == 2
+        assert second.calls["fetch"] == []  # testo già nel journal
+        assert second.calls["graph"] == ["3", "4"]
+        assert second.calls["embed"] == ["3", "4"]
+        assert second.calls["bridge"] == ["3", "4"]
+
+        third = RecordingPipeline(journal, TEXTS)
+        result = await third.run(ARTICLES, resume=True)
+
+        assert result.skipped == 4
+        assert all(not calls for calls in third.calls.values())
+
+    @pytest.mark.asyncio
+    async def test_bridge_recorded_when_resume_inserts_nothing(self):
+        journal = IngestionJournal(":memory:")
+        # Crash dopo il COPY, prima della registrazione nel journal
+        first = RecordingPipeline(journal, TEXTS, bridge_error=ConnectionError("connection lost"))
+        await first.run(ARTICLES)
+        assert journal.completed_articles(TIPO, STAGES) == set()
+
+        # Su resume ON CONFLICT DO NOTHING non inserisce nulla
+        second = RecordingPipeline(journal, TEXTS, bridge_inserted=0)
+        await second.run(ARTICLES, resume=True)
+
+        assert second.calls["bridge"] == ARTICLES
+        assert journal.completed_articles(TIPO, STAGES) == set(ARTICLES)
+
+        third = RecordingPipeline(journal, TEXTS)
+        result = await third.run(ARTICLES, resume=True)
+
+        assert result.skipped == 4
+        assert all(not calls for calls in third.calls.values())
+
+    @pytest.mark.asyncio
+    async def test_bridge_not_repeated_when_later_stage_pending(self):
+        journal = IngestionJournal(":memory:")
+        await RecordingPipeline(journal, TEXTS).run(ARTICLES)
+        # Simula embed perso per l'articolo 2 (es. collection ricreata)
+        journal.record(TIPO, "embed", {"2": "stale"})
+
+        rerun = RecordingPipeline(journal, TEXTS)
+        await rerun.run(ARTICLES, resume=True)
+
+        assert rerun.calls["graph"] == ["2"]
+        assert rerun.calls["embed"] == ["2"]
+        assert rerun.calls["bridge"] == []
+
+    @pytest.mark.asyncio
+    async def test_revalidate_reprocesses_only_changed_articles(self):
+        journal = IngestionJournal(":memory:")
+        await RecordingPipeline(journal, TEXTS).run(ARTICLES)
+
+        changed = dict(TEXTS, **{"3": "Testo articolo 3 modificato"})
+        rerun = RecordingPipeline(journal, changed)
+        result = await rerun.run(ARTICLES, resume=True, revalidate=True)
+
+        assert rerun.calls["fetch"] == ARTICLES
+        assert rerun.calls["graph"] == ["3"]
+        assert rerun.calls["embed"] == ["3"]
+        assert rerun.calls["bridge"] == ["3"]
+        assert result.successful == 4
+        assert journal.content_hash(TIPO, "3") == fetch_content_hash(
+            changed["3"], {"Ratio": "ratio 3"}
+        )
@@ -0,0 +1,109 @@
+"""
+Test MinHash / LSH
+==================
+
+Verifica firme MinHash, scelta delle bande e MinHashLSH: le coppie trovate
+devono coincidere con il confronto a coppie di compute_similarity.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from merlt.pipeline.enrichment.linkers import MinHashLSH, find_near_duplicates
+from merlt.pipeline.enrichment.linkers.normalization import (
+    _collision_probability,
+    compute_similarity,
+    minhash_signature,
+    optimal_bands,
+)
+
+WORDS = (
+    "buona fede oggettiva soggettiva responsabilità contrattuale mora debitore creditore "
+    "risoluzione contratto inadempimento danno risarcimento prescrizione garanzia vendita"
+).split()
+
+
+def random_names(count, seed=3):
+    rng = random.Random(seed)
+    return [" ".join(rng.sample(WORDS, rng.randint(1, 4))) for _ in range(count)]
+
+
+class TestSignature:
+    def test_estimates_token_jaccard(self):
+        a = minhash_signature("buona fede oggettiva", num_perm=512)
+        b = minhash_signature("Buona  fede", num_perm=512)
+
+        assert abs(float((a == b).mean()) - 2 / 3) < 0.1
+        assert (minhash_signature("Buona Fede") == minhash_signature("buona fede")).all()
+
+    def test_empty_name(self):
+        signature = minhash_signature("", num_perm=16)
+
+        assert signature.shape == (16,)
+        assert signature.dtype == np.uint64
+
+    def test_optimal_bands_meets_recall(self):
+        bands, rows = optimal_bands(0.5, 128)
+
+        assert bands * rows <= 128
+        assert _collision_probability(0.5, bands, rows) >= 0.95
+        assert _collision_probability(0.1, bands, rows) < 0.1
+
+
+class TestMinHashLSH:
+    def test_query_verified(self):
+        lsh = MinHashLSH(threshold=0.5)
+        lsh.add_many({
+            "c1": "buona fede oggettiva",
+            "c2": "inadempimento",
+            "c3": "buona fede",
+        })
+
+        matches = lsh.query("Buona fede")
+
+        assert [key for key, _ in matches] == ["c3", "c1"]
+        assert matches[0][1] == 1.0
+        assert matches[1][1] == pytest.approx(2 / 3)
+        assert lsh.query("") == []
+
+    def test_duplicate_pairs_match_pairwise(self):
+        names = random_names(300)
+        threshold = 0.5
+        exact = {
+            (i, j)
+            for i in range(len(names))
+            for j in range(i + 1, len(names))
+            if compute_similarity(names[i], names[j]) >= threshold
+        }
+
+        found = find_near_duplicates(names, threshold=threshold)
+
+        assert all(compute_similarity(names[i], names[j]) == sim for i, j, sim in found)
+        found_pairs = {(i, j) for i, j, _ in found}
+        assert found_pairs <= exact
+        assert len(found_pairs) / len(exact) >= 0.95
+
+    def test_custom_verify(self):
+        lsh = MinHashLSH(threshold=0.5, verify=lambda a, b: 1.0 if len(a) == len(b) else 0.0)
+        lsh.add_many({1: "buona fede", 2: "buona fede oggettiva"})
+
+        assert lsh.duplicate_pairs() == []
+
+    def test_add_rejects_duplicate_key_and_skips_empty(self):
+        lsh = MinHashLSH()
+        lsh.add("c1", "dolo")
+        lsh.add("vuoto", "  ")
+
+        assert "c1" in lsh
+        assert "vuoto" not in lsh
+        assert len(lsh) == 1
+        with pytest.raises(ValueError):
+            lsh.add("c1", "colpa")
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            MinHashLSH(threshold=0.0)
+        with pytest.raises(ValueError):
+            MinHashLSH(num_perm=64, bands=20, rows=4)
@@ -695,3 +695,124 @@ class TestNormaModificanteSchemaCompliance:
         assert "art.data_pubblicazione" in source, "Proprietà data_pubblicazione mancante per articolo modificante"
         assert "art.data_entrata_vigore" in source, "Proprietà data_entrata_vigore mancante per articolo modificante"
         assert "art.updated_at" in source, "Proprietà updated_at mancante per articolo modificante"
+
+
+class TestBatchedWrites:
+    """
+    Test per la scrittura batch delle modifiche e il fetch concorrente
+    delle versioni storiche (nessuna chiamata a Normattiva/FalkorDB).
+    """
+
+    @staticmethod
+    def _modifiche():
+        return [
+            Modifica(
+                tipo_modifica=TipoModifica.MODIFICA,
+                atto_modificante_urn="urn:nir:stato:legge:1997-05-15;127",
+                atto_modificante_estremi="LEGGE 15 maggio 1997, n. 127",
+                disposizione="art. 17, comma 2, lettera b",
+                data_efficacia="1997-05-17",
+                data_pubblicazione_gu="1997-05-17",
+            ),
+            Modifica(
+                tipo_modifica=TipoModifica.SOSTITUISCE,
+                atto_modificante_urn="urn:nir:stato:legge:2005-02-11;15",
+                atto_modificante_estremi="LEGGE 11 febbraio 2005, n. 15",
+                disposizione="art. 1, commi 1 e 2",
+                data_efficacia="2005-03-08",
+            ),
+            Modifica(
+                tipo_modifica=TipoModifica.MODIFICA,
+                atto_modificante_urn="urn:nir:stato:legge:1997-05-15;127",
+                atto_modificante_estremi="LEGGE 15 maggio 1997, n. 127",
+                disposizione="art. 17, comma 2, lettera c",
+                data_efficacia="1997-05-17",
+            ),
+        ]
+
+    @staticmethod
+    def _pipeline(batch_writes=True, **kwargs):
+        from merlt.pipeline.multivigenza import MultivigenzaPipeline
+
+        falkordb = AsyncMock()
+        scraper = AsyncMock()
+        scraper.get_amendment_history.return_value = TestBatchedWrites._modifiche()
+        pipeline = MultivigenzaPipeline(
+            falkordb_client=falkordb, scraper=scraper, batch_writes=batch_writes, **kwargs
+        )
+        return pipeline, falkordb, scraper
+
+    @staticmethod
+    def _nv():
+        return NormaVisitata(
+            norma=Norma(tipo_atto="legge", data="1990-08-07", numero_atto="241"),
+            numero_articolo="2",
+        )
+
+    @pytest.mark.asyncio
+    async def test_single_statement_per_article(self):
+        pipeline, falkordb, _ = self._pipeline()
+
+        result = await pipeline.ingest_with_history(self._nv())
+
+        assert not result.errors
+        # 1 update proprietà articolo + 1 statement per tutte le modifiche
+        assert falkordb.query.await_count == 2
+        query, params = falkordb.query.await_args_list[1].args
+        assert query.count("UNWIND") >= 5
+        assert len(params["atti"]) == 2  # atto L. 127/1997 deduplicato
+        assert {r["urn"] for r in params["lettere"]} == {
+            "urn:nir:stato:legge:1997-05-15;127~art17-com2-letb",
+            "urn:nir:stato:legge:1997-05-15;127~art17-com2-letc",
+        }
+        assert "MERGE (src)-[r:sostituisce]->(target)" in query
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_sequential_result(self):
+        batch, _, _ = self._pipeline(batch_writes=True)
+        sequential, _, _ = self._pipeline(batch_writes=False)
+
+        batch_result = await batch.ingest_with_history(self._nv())
+        sequential_result = await sequential.ingest_with_history(self._nv())
+
+        assert batch_result.relazioni_create == sequential_result.relazioni_create
+        assert batch_result.atti_modificanti_creati == sequential_result.atti_modificanti_creati
+
+    def test_batch_query_has_required_atto_properties(self):
+        from merlt.pipeline.multivigenza import _ModificationBatch
+
+        batch = _ModificationBatch("urn:target", "2025-01-01T00:00:00")
+        batch.add(self._modifiche()[0])
+        query, _ = batch.to_query()
+
+        for prop in ("url", "vigenza", "autorita_emanante", "data_entrata_vigore", "updated_at"):
+            assert f"atto.{prop} = " in query
+            assert f"art.{prop} = " in query
+
+    @pytest.mark.asyncio
+    async def test_versions_fetched_concurrently(self):
+        import asyncio
+
+        pipeline, falkordb, scraper = self._pipeline(version_concurrency=2)
+        in_flight = {"now": 0, "peak": 0}
+
+        async def fetch(nv, date=None):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            if date == "2005-03-08":
+                raise RuntimeError("boom")
+            return f"testo {date}", "urn"
+
+        scraper.get_original_version.side_effect = fetch
+        scraper.get_version_at_date.side_effect = fetch
+
+        result = await pipeline.ingest_with_history(self._nv(), fetch_all_versions=True)
+
+        assert in_flight["peak"] == 2
+        assert result.versioni_salvate == 2  # originale + 1997-05-17
+        assert result.errors == ["Could not fetch version at 2005-03-08: boom"]
+        query, params = falkordb.query.await_args_list[-1].args
+        assert "versione_di" in query
+        assert [v["label"] for v in params["versions"]] == ["originale", "v1"]
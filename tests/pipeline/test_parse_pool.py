@@ -0,0 +1,179 @@
+"""
+Tests for ParsePool
+===================
+
+Verifica:
+1. Parsing e chunking nei worker equivalenti al parsing inline, stesso ordine
+2. Batch piccoli processati inline, errori di parsing propagati o restituiti
+3. IngestionPipelineV2.parse_articles e BatchIngestionPipeline con parse_pool
+"""
+
+import pickle
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from merlt.core.legal_knowledge_graph import LegalKnowledgeGraph, MerltConfig
+from merlt.pipeline.batch_ingestion import ArticleFetchResult, BatchIngestionPipeline
+from merlt.pipeline.chunking import StructuralChunker
+from merlt.pipeline.ingestion import IngestionPipelineV2
+from merlt.pipeline.parse_pool import ParsePool
+from merlt.pipeline.parsing import ArticleStructure, CommaParser
+
+
+def _article_text(n: int) -> str:
+    return (
+        f"Articolo {n}\n"
+        f"Rubrica dell'articolo {n}\n\n"
+        f"Il primo comma dell'articolo {n} disciplina il caso generale.\n\n"
+        "Sono esclusi:\n"
+        "a) i contratti aleatori;\n"
+        "b) i contratti a titolo gratuito.\n\n"
+        f"Il terzo comma dell'articolo {n} rinvia alle leggi speciali."
+    )
+
+
+TEXTS = [_article_text(n) for n in range(1, 41)]
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ParsePool(max_workers=2, chunksize=8, min_batch=4) as p:
+        yield p
+
+
+def _shape(structure: ArticleStructure):
+    return (
+        structure.numero_articolo,
+        structure.rubrica,
+        [(c.numero, c.testo, c.token_count, [lett.lettera for lett in c.lettere]) for c in structure.commas],
+        structure.total_tokens,
+    )
+
+
+class TestParsePool:
+    def test_result_models_are_picklable(self):
+        structure = CommaParser().parse(TEXTS[0])
+        assert _shape(pickle.loads(pickle.dumps(structure))) == _shape(structure)
+
+    def test_parse_many_matches_inline(self, pool):
+        parser = CommaParser()
+        inline = [parser.parse(t) for t in TEXTS]
+
+        pooled = pool.parse_many(TEXTS)
+
+        assert [_shape(s) for s in pooled] == [_shape(s) for s in inline]
+        assert pool._executor is not None
+
+    @pytest.mark.asyncio
+    async def test_parse_batch_preserves_order(self, pool):
+        pooled = await pool.parse_batch(TEXTS)
+
+        assert [s.numero_articolo for s in pooled] == [str(n) for n in range(1, 41)]
+
+    @pytest.mark.asyncio
+    async def test_parse_errors(self, pool):
+        texts = TEXTS[:10] + ["   "] + TEXTS[10:20]
+
+        with pytest.raises(ValueError):
+            await pool.parse_batch(texts)
+
+        results = await pool.parse_batch(texts, return_exceptions=True)
+        assert isinstance(results[10], ValueError)
+        assert results[11].numero_articolo == "11"
+
+    def test_small_batch_runs_inline(self):
+        small = ParsePool(max_workers=2, min_batch=100)
+
+        structures = small.parse_many(TEXTS[:3])
+
+        assert len(structures) == 3
+        assert small._executor is None
+
+    @pytest.mark.asyncio
+    async def test_chunk_batch_matches_inline(self, pool):
+        parser = CommaParser()
+        articles = [
+            {
+                "article_structure": parser.parse(t),
+                "article_urn": f"urn:test~art{i}",
+                "article_url": f"https://example.org/art{i}",
+                "brocardi_position": "Libro IV - Delle obbligazioni, Titolo II - Dei contratti",
+            }
+            for i, t in enumerate(TEXTS, start=1)
+        ]
+        chunker = StructuralChunker()
+
+        inline = chunker.chunk_batch(articles)
+        pooled = await pool.chunk_batch(articles)
+        pooled_sync = chunker.chunk_batch(articles, pool=pool)
+
+        def key(c):
+            return (c.urn, c.text, c.token_count, c.metadata.libro, c.metadata.titolo)
+
+        assert [key(c) for c in pooled] == [key(c) for c in inline]
+        assert [key(c) for c in pooled_sync] == [key(c) for c in inline]
+
+
+class TestPipelineIntegration:
+    @pytest.mark.asyncio
+    async def test_parse_articles_inline_and_pooled(self, pool):
+        pipeline = IngestionPipelineV2()
+        texts = TEXTS[:20] + [""]
+
+        inline = await pipeline.parse_articles(texts)
+        pooled = await pipeline.parse_articles(texts, pool=pool)
+
+        assert isinstance(inline[-1], ValueError) and isinstance(pooled[-1], ValueError)
+        assert [_shape(s) for s in pooled[:-1]] == [_shape(s) for s in inline[:-1]]
+
+    @pytest.mark.asyncio
+    async def test_batch_ingestion_passes_parsed_structures(self, pool):
+        kg = MagicMock()
+        kg._ingestion_pipeline = IngestionPipelineV2()
+        kg._ingestion_pipeline.ingest_article = AsyncMock(return_value=MagicMock())
+        kg._get_cached_norm_tree = AsyncMock(return_value=None)
+        pipeline = BatchIngestionPipeline(kg, parse_pool=pool)
+
+        fetches = [
+            ArticleFetchResult(
+                article_num=str(n),
+                norma_visitata=MagicMock(),
+                article_text=_article_text(n),
+                article_url=f"https://example.org/art{n}",
+            )
+            for n in range(1, 9)
+        ]
+        fetches.append(ArticleFetchResult(
+            article_num="9", norma_visitata=MagicMock(), article_text="", article_url=""
+        ))
+
+        results = await pipeline._ingest_to_graph_parallel(fetches, "codice civile")
+
+        assert len(results) == 9
+        calls = {
+            c.kwargs["article"].metadata.numero_articolo: c.kwargs
+            for c in kg._ingestion_pipeline.ingest_article.call_args_list
+        }
+        assert calls["3"]["article_structure"].numero_articolo == "3"
+        # Testo non parsabile: nessuna struttura, ingest_article riparsa (e fallisce) inline
+        assert "article_structure" not in calls["9"]
+
+    @pytest.mark.asyncio
+    async def test_kg_ingest_batch_creates_and_closes_pool(self):
+        kg = LegalKnowledgeGraph(MerltConfig())
+        kg._connected = True
+        pools = []
+
+        async def ingest_batch(self, **kwargs):
+            pools.append(self.parse_pool)
+            return MagicMock()
+
+        with patch.object(BatchIngestionPipeline, "ingest_batch", ingest_batch), \
+                patch.object(ParsePool, "close", autospec=True) as close:
+            await kg.ingest_batch("codice civile", (1, 3), parse_workers=2)
+            await kg.ingest_batch("codice civile", (1, 3))
+
+        assert pools[0].max_workers == 2
+        assert pools[1] is None
+        close.assert_called_once_with(pools[0])
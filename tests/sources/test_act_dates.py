@@ -0,0 +1,201 @@
+"""
+Test Date degli Atti
+====================
+
+Verifica ActDateResolver (tabella inclusa, store SQLite, richiesta HTTP
+deduplicata, cache negativa) e il suo uso in urn.complete_date e
+generate_urn, con un fetch finto (nessuna chiamata a Normattiva).
+"""
+
+import asyncio
+
+import pytest
+
+from merlt.sources.utils import urn as urn_module
+from merlt.sources.utils.act_dates import (
+    BUNDLED_ACT_DATES,
+    ActDateResolver,
+    ActDateStore,
+    act_key,
+    extract_act_date,
+)
+
+PAGE_241 = """
+<html><head><title>LEGGE 7 agosto 1990, n. 241 - Normattiva</title></head>
+<body>
+  <div class="header">Aggiornamento al 12 marzo 2024</div>
+  <h2 class="titoloAtto">LEGGE 7 agosto 1990, n. 241</h2>
+  <h3>Nuove norme in materia di procedimento amministrativo.</h3>
+  <p>(GU n.192 del 18-8-1990)</p>
+</body></html>
+"""
+
+PAGE_CITAZIONE = """
+<div>Vedi anche il D.Lgs. 12 gennaio 2005, n. 3.</div>
+<h2>DECRETO LEGISLATIVO 1° febbraio 2005, n. 7</h2>
+"""
+
+
+class FakeFetch:
+    def __init__(self, pages, delay=0.0):
+        self.pages = pages
+        self.delay = delay
+        self.calls = []
+
+    async def __call__(self, url):
+        self.calls.append(url)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        page = self.pages[url]
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+
+URL_241 = "https://www.normattiva.it/uri-res/N2Ls?urn:nir:stato:legge:1990;241"
+
+
+def make_resolver(pages, **kwargs):
+    fetch = FakeFetch(pages, delay=kwargs.pop("delay", 0.0))
+    resolver = ActDateResolver(
+        store=ActDateStore(":memory:"), fetch=fetch, table={}, **kwargs
+    )
+    return resolver, fetch
+
+
+class TestActKey:
+    def test_aliases_share_key(self):
+        assert act_key("d.lgs.", 2005, 206) == "decreto.legislativo:2005;206"
+        assert act_key("decreto legislativo", "2005", "206") == "decreto.legislativo:2005;206"
+        assert act_key("decreto.legislativo", "2005", " 206 ") == "decreto.legislativo:2005;206"
+
+    def test_bundled_table_includes_codici(self):
+        assert BUNDLED_ACT_DATES["decreto.legislativo:2005;206"] == "2005-09-06"
+        assert BUNDLED_ACT_DATES["legge:1990;241"] == "1990-08-07"
+
+
+class TestExtractActDate:
+    def test_title_date(self):
+        assert extract_act_date(PAGE_241, "1990", "241") == "1990-08-07"
+
+    def test_prefers_date_followed_by_number(self):
+        assert extract_act_date(PAGE_CITAZIONE, 2005, 7) == "2005-02-01"
+        assert extract_act_date(PAGE_CITAZIONE, 2005) == "2005-01-12"
+
+    def test_year_mismatch(self):
+        assert extract_act_date(PAGE_241, "1991", "241") is None
+
+
+class TestActDateStore:
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "act_dates.sqlite"
+        store = ActDateStore(path)
+        store.put("legge:1990;241", "1990-08-07")
+        store.close()
+
+        reopened = ActDateStore(path)
+        assert reopened.get("legge:1990;241") == "1990-08-07"
+        assert reopened.get("legge:1990;242") is None
+        assert len(reopened) == 1
+
+    def test_load_table_from_json(self, tmp_path):
+        table = tmp_path / "dates.json"
+        table.write_text('{"legge:2012;190": "6 novembre 2012"}', encoding="utf-8")
+        store = ActDateStore(":memory:")
+
+        assert store.load_table(table) == 1
+        assert store.get("legge:2012;190") == "2012-11-06"
+
+
+class TestActDateResolver:
+    @pytest.mark.asyncio
+    async def test_http_lookup_is_persisted(self):
+        resolver, fetch = make_resolver({URL_241: PAGE_241})
+
+        assert await resolver.resolve("legge", "1990", "241") == "1990-08-07"
+        assert await resolver.resolve("legge", "1990", "241") == "1990-08-07"
+        assert fetch.calls == [URL_241]
+        assert resolver.store.get("legge:1990;241") == "1990-08-07"
+
+        # Nuovo processo: la data arriva dallo store, senza rete
+        fresh = ActDateResolver(store=resolver.store, fetch=FakeFetch({}), table={})
+        assert await fresh.resolve("legge", 1990, 241) == "1990-08-07"
+        assert fresh.stats["store"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bundled_table_skips_network(self):
+        fetch = FakeFetch({})
+        resolver = ActDateResolver(store=ActDateStore(":memory:"), fetch=fetch)
+
+        assert await resolver.resolve("d.lgs.", "2005", "206") == "2005-09-06"
+        assert fetch.calls == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_request(self):
+        resolver, fetch = make_resolver({URL_241: PAGE_241}, delay=0.01)
+
+        dates = await asyncio.gather(*[resolver.resolve("legge", "1990", "241") for _ in range(10)])
+
+        assert dates == ["1990-08-07"] * 10
+        assert len(fetch.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_negative_cache(self):
+        resolver, fetch = make_resolver({URL_241: "<html>Pagina non trovata</html>"})
+
+        assert await resolver.resolve("legge", "1990", "241") is None
+        assert await resolver.resolve("legge", "1990", "241") is None
+        assert len(fetch.calls) == 1
+
+        resolver.negative_ttl = 0
+        assert await resolver.resolve("legge", "1990", "241") is None
+        assert len(fetch.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_network_errors_not_cached(self):
+        resolver, fetch = make_resolver({URL_241: ConnectionError("down")})
+
+        with pytest.raises(ConnectionError):
+            await resolver.resolve("legge", "1990", "241")
+
+        fetch.pages[URL_241] = PAGE_241
+        assert await resolver.resolve("legge", "1990", "241") == "1990-08-07"
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_is_bounded(self):
+        resolver, _ = make_resolver({}, max_size=2)
+        resolver.store.put_many({
+            "legge:2001;1": "2001-01-01",
+            "legge:2001;2": "2001-01-02",
+            "legge:2001;3": "2001-01-03",
+        })
+
+        for number in (1, 2, 3):
+            await resolver.resolve("legge", 2001, number)
+
+        assert list(resolver._cache) == ["legge:2001;2", "legge:2001;3"]
+
+
+class TestCompleteDate:
+    @pytest.fixture
+    def resolver(self, monkeypatch):
+        resolver, _ = make_resolver({URL_241: PAGE_241})
+        monkeypatch.setattr(urn_module, "act_date_resolver", resolver)
+        return resolver
+
+    @pytest.mark.asyncio
+    async def test_complete_date(self, resolver):
+        assert await urn_module.complete_date("legge", "1990", "241") == "1990-08-07"
+
+    @pytest.mark.asyncio
+    async def test_not_found_keeps_error_contract(self, resolver):
+        resolver._fetch.pages[URL_241] = "<html></html>"
+        result = await urn_module.complete_date("legge", "1990", "241")
+        assert result.startswith("Timeout:")
+
+        assert await urn_module.complete_date_or_parse("1990", "legge", "241") == "1990-01-01"
+
+    def test_generate_urn_with_year(self, resolver):
+        assert urn_module.generate_urn("legge", date="1990", act_number="241", article="3") == (
+            "https://www.normattiva.it/uri-res/N2Ls?urn:nir:stato:legge:1990-08-07;241~art3"
+        )
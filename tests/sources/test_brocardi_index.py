@@ -0,0 +1,173 @@
+"""
+Test Indice Articoli Brocardi
+=============================
+
+Verifica BrocardiArticleIndex (crawl dell'albero delle sezioni, persistenza,
+scadenza) e il suo uso in BrocardiScraper.look_up, su un sito finto in
+memoria (nessuna chiamata a Brocardi.it).
+"""
+
+import json
+import time
+
+import pytest
+
+from merlt.sources import BrocardiScraper
+from merlt.sources.utils.brocardi_index import (
+    BrocardiArticleIndex,
+    extract_article_links,
+    extract_section_links,
+    normalize_article_number,
+)
+from merlt.sources.utils.norma import Norma, NormaVisitata
+
+ROOT = "https://www.brocardi.it/codice-civile/"
+
+SITE = {
+    ROOT: """
+        <div class="section-title"><a href="/codice-civile/libro-primo/">Libro I</a></div>
+        <div class="section-title"><a href="/codice-civile/libro-quarto/">Libro IV</a></div>
+        <a href="/codice-penale/">Codice penale</a>
+        <a href="/codice-penale/libro-secondo/titolo-xiii/capo-ii/art1453.html">Art. 1453 c.p. (rinvio)</a>
+        <a href="/codice-civile/disposizioni-preliminari/art1.html">Art. 1</a>
+    """,
+    ROOT + "libro-primo/": """
+        <a href="/codice-civile/libro-primo/titolo-i/">Titolo I</a>
+        <a href="/codice-civile/">Indice</a>
+    """,
+    ROOT + "libro-primo/titolo-i/": """
+        <a href="/codice-civile/libro-primo/titolo-i/art2.html">Art. 2</a>
+        <a href="/codice-civile/libro-primo/titolo-i/art2bis.html">Art. 2 bis</a>
+    """,
+    ROOT + "libro-quarto/": """
+        <a href="/codice-civile/libro-quarto/titolo-ii/capo-xiv/">Capo XIV</a>
+    """,
+    ROOT + "libro-quarto/titolo-ii/capo-xiv/": """
+        <a href='/codice-civile/libro-quarto/titolo-ii/capo-xiv/art1453.html'>Art. 1453</a>
+        <a href="/codice-civile/libro-primo/titolo-i/">Titolo I (già visitato)</a>
+    """,
+}
+
+
+class FakeSite:
+    """fetch(url) su SITE, con conteggio delle richieste."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def __call__(self, url):
+        self.requests.append(url)
+        return SITE.get(url)
+
+
+class TestExtraction:
+    def test_article_links(self):
+        links = extract_article_links(SITE[ROOT + "libro-primo/titolo-i/"], ROOT)
+
+        assert links == {
+            "2": "https://www.brocardi.it/codice-civile/libro-primo/titolo-i/art2.html",
+            "2bis": "https://www.brocardi.it/codice-civile/libro-primo/titolo-i/art2bis.html",
+        }
+
+    def test_article_links_stay_under_root(self):
+        links = extract_article_links(SITE[ROOT], ROOT, ROOT)
+
+        assert links == {"1": "https://www.brocardi.it/codice-civile/disposizioni-preliminari/art1.html"}
+
+    def test_section_links_stay_under_root(self):
+        sections = extract_section_links(SITE[ROOT], ROOT, ROOT)
+
+        assert sections == [ROOT + "libro-primo/", ROOT + "libro-quarto/"]
+
+    def test_normalize_article_number(self):
+        assert normalize_article_number("2645-bis") == "2645bis"
+        assert normalize_article_number("1453") == "1453"
+
+
+class TestBrocardiArticleIndex:
+    @pytest.mark.asyncio
+    async def test_build_crawls_tree_once(self, tmp_path):
+        index = BrocardiArticleIndex(tmp_path)
+        site = FakeSite()
+
+        articles = await index.build(ROOT, site)
+
+        assert set(articles) == {"1", "2", "2bis", "1453"}
+        assert len(site.requests) == len(SITE)  # ogni sezione una sola volta
+        assert index.is_complete(ROOT)
+        assert index.get(ROOT, "2-bis").endswith("/art2bis.html")
+        # Il rinvio al codice penale nella pagina principale non entra nell'indice
+        assert index.get(ROOT, "1453").startswith(ROOT)
+
+    @pytest.mark.asyncio
+    async def test_persisted_and_reloaded(self, tmp_path):
+        await BrocardiArticleIndex(tmp_path).build(ROOT, FakeSite())
+
+        reloaded = BrocardiArticleIndex(tmp_path)
+
+        assert reloaded.get(ROOT, "1453").endswith("/capo-xiv/art1453.html")
+        # www e senza www condividono l'indice
+        assert reloaded.get("https://brocardi.it/codice-civile/", "1") is not None
+
+    def test_expired_index_is_ignored(self, tmp_path):
+        index = BrocardiArticleIndex(tmp_path, max_age=60)
+        path = index.save(ROOT, {"1": ROOT + "art1.html"})
+        data = json.loads(path.read_text())
+        data["built_at"] = time.time() - 3600
+        path.write_text(json.dumps(data))
+
+        assert BrocardiArticleIndex(tmp_path, max_age=60).load(ROOT) is None
+
+    def test_add_creates_partial_index(self, tmp_path):
+        index = BrocardiArticleIndex(tmp_path)
+
+        index.add(ROOT, "1453", ROOT + "art1453.html")
+
+        assert index.get(ROOT, "1453") == ROOT + "art1453.html"
+        assert not BrocardiArticleIndex(tmp_path).is_complete(ROOT)
+
+
+class TestScraperLookUp:
+    @staticmethod
+    def _nv(numero):
+        return NormaVisitata(norma=Norma(tipo_atto="codice civile"), numero_articolo=numero)
+
+    @pytest.mark.asyncio
+    async def test_indexed_lookup_needs_no_request(self, tmp_path, monkeypatch):
+        index = BrocardiArticleIndex(tmp_path)
+        index.save(ROOT, {"2645bis": ROOT + "art2645bis.html"})
+        scraper = BrocardiScraper(article_index=index)
+        site = FakeSite()
+        monkeypatch.setattr(scraper, "_make_request_with_retry", lambda session, url: site(url))
+
+        link = await scraper.look_up(self._nv("2645-bis"))
+
+        assert link == ROOT + "art2645bis.html"
+        assert site.requests == []
+
+    @pytest.mark.asyncio
+    async def test_auto_build_on_first_lookup(self, tmp_path, monkeypatch):
+        scraper = BrocardiScraper(article_index=BrocardiArticleIndex(tmp_path), auto_build_index=True)
+        site = FakeSite()
+        monkeypatch.setattr(scraper, "_make_request_with_retry", lambda session, url: site(url))
+
+        first = await scraper.look_up(self._nv("1453"))
+        crawled = len(site.requests)
+        second = await scraper.look_up(self._nv("2"))
+
+        assert first.endswith("/art1453.html")
+        assert second.endswith("/titolo-i/art2.html")
+        assert crawled == len(SITE)
+        assert len(site.requests) == crawled  # secondo lookup: nessuna richiesta
+
+    @pytest.mark.asyncio
+    async def test_fallback_scan_populates_index(self, tmp_path, monkeypatch):
+        index = BrocardiArticleIndex(tmp_path)
+        scraper = BrocardiScraper(article_index=index)
+        site = FakeSite()
+        monkeypatch.setattr(scraper, "_make_request_with_retry", lambda session, url: site(url))
+
+        link = await scraper.look_up(self._nv("1"))
+
+        assert link.endswith("/art1.html")
+        assert index.get(ROOT, "1") == link
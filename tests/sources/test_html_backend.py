@@ -0,0 +1,151 @@
+"""
+Tests for the lxml HTML extraction backend
+==========================================
+
+Equivalenza tra backend "bs4" (riferimento) e "lxml" sulle pagine salvate in
+tests/sources/fixtures/html: stesso testo articolo, stessi commi e link per
+Normattiva, stesse sezioni e massime per Brocardi.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from merlt.sources.base import ScraperConfig
+from merlt.sources.brocardi import BrocardiScraper
+from merlt.sources.normattiva import NormattivaScraper
+from merlt.sources.utils.html_backend import (
+    default_html_backend,
+    element_string,
+    get_text,
+    parse_html,
+    resolve_html_backend,
+)
+
+pytest.importorskip("lxml")
+
+FIXTURES = Path(__file__).parent / "fixtures" / "html"
+
+NORMATTIVA_PAGES = sorted(p.name for p in FIXTURES.glob("normattiva_*.html"))
+BROCARDI_PAGES = sorted(p.name for p in FIXTURES.glob("brocardi_*.html"))
+
+
+def _html(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def normattiva():
+    return {
+        backend: NormattivaScraper(ScraperConfig(html_backend=backend))
+        for backend in ("bs4", "lxml")
+    }
+
+
+@pytest.fixture(scope="module")
+def brocardi(tmp_path_factory):
+    from merlt.sources.utils.brocardi_index import BrocardiArticleIndex
+
+    index = BrocardiArticleIndex(tmp_path_factory.mktemp("index"))
+    return {
+        backend: BrocardiScraper(article_index=index, html_backend=backend)
+        for backend in ("bs4", "lxml")
+    }
+
+
+class TestNormattivaEquivalence:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("page", NORMATTIVA_PAGES)
+    @pytest.mark.parametrize("link", [False, True])
+    async def test_same_article_text(self, normattiva, page, link):
+        html = _html(page)
+
+        expected = await normattiva["bs4"].estrai_da_html(html, get_link_dict=link)
+        actual = await normattiva["lxml"].estrai_da_html(html, get_link_dict=link)
+
+        assert actual == expected
+
+    @pytest.mark.asyncio
+    async def test_commi_and_links(self, normattiva):
+        result = await normattiva["lxml"].estrai_da_html(
+            _html("normattiva_akn_commi.html"), get_link_dict=True
+        )
+
+        testo = result["testo"]
+        assert testo.startswith("Art.\xa01453\n(Risolubilità del contratto")
+        assert len(testo.split("\n\n")) >= 5
+        assert "1. \nNei contratti con prestazioni corrispettive" in testo
+        assert " - alla restituzione della prestazione;" in testo
+        assert result["link"]["art.1454"].endswith("~art1454")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "html",
+        ["", "<html><body><p>Pagina senza corpo</p></body></html>",
+         "<div class='bodyTesto'><p>Formato sconosciuto</p></div>"],
+    )
+    async def test_missing_or_unknown_body(self, normattiva, html):
+        expected = await normattiva["bs4"].estrai_da_html(html)
+
+        assert await normattiva["lxml"].estrai_da_html(html) == expected
+
+
+class TestBrocardiEquivalence:
+    @pytest.mark.parametrize("page", BROCARDI_PAGES)
+    def test_same_sections(self, brocardi, page):
+        html = _html(page)
+
+        expected = brocardi["bs4"].extract_info(html)
+        actual = brocardi["lxml"].extract_info(html)
+
+        assert actual == expected
+
+    def test_sections_extracted(self, brocardi):
+        info, object_id = brocardi["lxml"].extract_info(_html("brocardi_art1453.html"))
+
+        assert object_id == "11873"
+        assert "Libro IV - Delle obbligazioni > Titolo II" in info["Position"]
+        assert info["Brocardi"] == [
+            "Inadimplenti non est adimplendum",
+            "Frangenti fidem, fides frangatur eidem",
+        ]
+        assert "googletag" not in info["Ratio"]
+        assert [m["numero"] for m in info["Massime"]] == ["36918", "123", None, None]
+        assert info["Massime"][0]["autorita"] == "Cass. civ."
+        assert "Note" not in info
+
+    def test_costituzione_relazione(self, brocardi):
+        info, object_id = brocardi["lxml"].extract_info(_html("brocardi_costituzione_art1.html"))
+
+        assert object_id == "900412"
+        assert "Ratio" not in info
+        assert info["RelazioneCostituzione"]["testo"].startswith("La Repubblica è fondata sul lavoro")
+
+
+class TestHelpers:
+    def test_get_text_matches_beautifulsoup(self):
+        from bs4 import BeautifulSoup
+
+        html = "<div> a<!-- c --> <b>b</b><script>x=1</script>\n<style>p{}</style> c&nbsp;</div>"
+        soup_div = BeautifulSoup(html, "html.parser").find("div")
+        lxml_div = parse_html(html).find(".//div")
+
+        assert get_text(lxml_div) == soup_div.get_text()
+        assert get_text(lxml_div, strip=True) == soup_div.get_text(strip=True)
+
+    def test_element_string(self):
+        root = parse_html("<h3>Titolo</h3><h3><span>Interno</span></h3><h3>a <b>b</b></h3>")
+        h3s = root.findall(".//h3")
+
+        assert [element_string(h) for h in h3s] == ["Titolo", "Interno", None]
+
+    def test_backend_selection(self, monkeypatch):
+        monkeypatch.delenv("HTML_PARSER_BACKEND", raising=False)
+        assert default_html_backend() == "lxml"
+
+        monkeypatch.setenv("HTML_PARSER_BACKEND", "bs4")
+        assert default_html_backend() == "bs4"
+        assert NormattivaScraper().html_backend == "bs4"
+
+        with pytest.raises(ValueError):
+            resolve_html_backend("html5lib")
@@ -0,0 +1,218 @@
+"""
+Test HTTP Response Cache
+========================
+
+Verifica la cache persistente di merlt.sources.utils.http contro un server
+aiohttp locale (nessuna chiamata esterna):
+- Hit entro il TTL, GET condizionale (ETag) dopo il TTL
+- Persistenza tra istanze, limite di dimensione, modalità offline
+"""
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from merlt.sources.utils.http import (
+    HttpCacheConfig,
+    HttpClient,
+    HttpResponseCache,
+    OfflineCacheMiss,
+    cache_key,
+)
+
+BODY = "<html><body>Art. 1453 - Risolubilità del contratto</body></html>"
+ETAG = '"v1"'
+
+
+@pytest_asyncio.fixture
+async def server():
+    """Server locale: /doc con ETag, /missing 404. Conta le richieste ricevute."""
+    state = {"requests": 0, "not_modified": 0}
+
+    async def doc(request):
+        state["requests"] += 1
+        if request.headers.get("If-None-Match") == ETAG:
+            state["not_modified"] += 1
+            return web.Response(status=304)
+        return web.Response(text=BODY, headers={"ETag": ETAG})
+
+    async def missing(request):
+        state["requests"] += 1
+        return web.Response(status=404)
+
+    app = web.Application()
+    app.router.add_get("/doc", doc)
+    app.router.add_get("/missing", missing)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}", state
+
+    await runner.cleanup()
+
+
+def make_client(tmp_path, **overrides) -> HttpClient:
+    client = HttpClient()
+    client.configure_cache(HttpCacheConfig(path=str(tmp_path / "http.sqlite"), **overrides))
+    return client
+
+
+class TestCacheKey:
+    def test_normalizes_host_query_and_fragment(self):
+        assert cache_key("HTTPS://Example.org/a?b=2&a=1#frag") == "https://example.org/a?a=1&b=2"
+
+    def test_params_are_part_of_key(self):
+        assert cache_key("https://x.it/a", {"b": 2, "a": 1}) == cache_key("https://x.it/a?a=1&b=2")
+        assert cache_key("https://x.it/a", {"a": 1}) != cache_key("https://x.it/a", {"a": 2})
+
+
+class TestHttpClientCache:
+    @pytest.mark.asyncio
+    async def test_hit_within_ttl(self, server, tmp_path):
+        base, state = server
+        client = make_client(tmp_path)
+
+        first = await client.get_text(f"{base}/doc", source="normattiva")
+        second = await client.get_text(f"{base}/doc", source="normattiva")
+
+        assert first == second == BODY
+        assert state["requests"] == 1
+        assert client.response_cache.stats.hits == 1
+        await client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_revalidates_with_etag_after_ttl(self, server, tmp_path):
+        base, state = server
+        client = make_client(tmp_path, default_ttl=0, source_ttls={})
+
+        await client.get_text(f"{base}/doc")
+        body = await client.get_text(f"{base}/doc")
+
+        assert body == BODY
+        assert state["requests"] == 2
+        assert state["not_modified"] == 1
+        assert client.response_cache.stats.revalidated == 1
+        await client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_persists_across_clients_and_offline_mode(self, server, tmp_path):
+        base, state = server
+        online = make_client(tmp_path)
+        await online.get_text(f"{base}/doc")
+        await online.close_session()
+
+        offline = make_client(tmp_path, offline=True, default_ttl=0, source_ttls={})
+
+        assert await offline.get_text(f"{base}/doc") == BODY
+        with pytest.raises(OfflineCacheMiss):
+            await offline.get_text(f"{base}/other")
+        assert state["requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, server, tmp_path):
+        import aiohttp
+
+        base, state = server
+        client = make_client(tmp_path)
+
+        for _ in range(2):
+            with pytest.raises(aiohttp.ClientResponseError) as exc:
+                await client.get_text(f"{base}/missing")
+            assert exc.value.status == 404
+
+        assert state["requests"] == 2
+        assert len(client.response_cache) == 0
+        await client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_serves_stale_on_network_error(self, server, tmp_path):
+        base, _ = server
+        client = make_client(tmp_path, default_ttl=0, source_ttls={})
+        await client.get_text(f"{base}/doc")
+
+        # Stessa chiave, server irraggiungibile
+        cache = client.response_cache
+        cache.put(cache_key("http://127.0.0.1:9/doc"), "http://127.0.0.1:9/doc", BODY)
+
+        assert await client.get_text("http://127.0.0.1:9/doc", timeout=2) == BODY
+        assert cache.stats.stale_served == 1
+        await client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_fetches(self, server, tmp_path):
+        base, state = server
+        client = make_client(tmp_path, enabled=False)
+
+        await client.get_text(f"{base}/doc")
+        await client.get_text(f"{base}/doc")
+
+        assert client.response_cache is None
+        assert state["requests"] == 2
+        await client.close_session()
+
+
+class TestHttpResponseCache:
+    def test_size_cap_evicts_least_recently_used(self):
+        cache = HttpResponseCache(":memory:", max_size_mb=1)
+        cache.max_size_bytes = 3000
+        # Corpi poco comprimibili (~1KB compressi ciascuno)
+        import random
+        rng = random.Random(0)
+        bodies = {f"k{i}": "".join(rng.choice("abcdefghij0123456789") for _ in range(1800)) for i in range(4)}
+
+        for key in ("k0", "k1"):
+            cache.put(key, key, bodies[key])
+        cache.get("k0")  # k1 diventa la meno usata di recente
+        cache.put("k2", "k2", bodies["k2"])
+        cache.put("k3", "k3", bodies["k3"])
+
+        assert cache.size_bytes <= 3000
+        assert cache.get("k1") is None
+        assert cache.get("k3").body == bodies["k3"]
+        assert cache.stats.evicted >= 1
+
+    def test_get_is_read_only_until_flush(self, tmp_path):
+        path = tmp_path / "responses.sqlite"
+        cache = HttpResponseCache(path, access_flush_size=3)
+        for key in ("a", "b", "c"):
+            cache.put(key, key, key)
+        changes = cache._conn.total_changes
+
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        assert cache._conn.total_changes == changes
+
+        cache.get("c")  # terza voce in sospeso: scrittura a blocco
+        assert cache._conn.total_changes == changes + 3
+
+        cache.get("a")
+        cache.close()
+        reopened = HttpResponseCache(path)
+        (accessed_a,), (accessed_b,), _ = reopened._conn.execute(
+            "SELECT accessed_at FROM responses ORDER BY key"
+        ).fetchall()
+        assert accessed_a >= accessed_b  # accesso in sospeso scritto alla chiusura
+
+    def test_clear_by_source(self):
+        cache = HttpResponseCache(":memory:")
+        cache.put("a", "a", "x", source="brocardi")
+        cache.put("b", "b", "y", source="normattiva")
+
+        cache.clear(source="brocardi")
+
+        assert cache.get("a") is None
+        assert cache.get("b").body == "y"
+
+    def test_source_ttls_from_env(self, monkeypatch):
+        monkeypatch.setenv("HTTP_CACHE_TTL_BROCARDI", "60")
+        monkeypatch.setenv("HTTP_CACHE_OFFLINE", "1")
+
+        config = HttpCacheConfig.from_env()
+
+        assert config.ttl_for("brocardi") == 60
+        assert config.ttl_for("unknown") == config.default_ttl
+        assert config.offline is True
@@ -0,0 +1,136 @@
+"""
+Test NormTree persistito
+========================
+
+Verifica serializzazione di NormTree, mappa articolo -> posizione e
+NormTreeStore / get_cached_hierarchical_tree (nessuna chiamata a Normattiva).
+"""
+
+import os
+import time
+
+import pytest
+
+from merlt.sources.utils import tree as tree_module
+from merlt.sources.utils.tree import (
+    NormLevel,
+    NormNode,
+    NormTree,
+    NormTreeStore,
+    get_article_position,
+    get_cached_hierarchical_tree,
+)
+
+URN = "https://www.normattiva.it/uri-res/N2Ls?urn:nir:stato:regio.decreto:1942-03-16;262"
+
+
+def make_tree() -> NormTree:
+    def art(n):
+        return NormNode(level=NormLevel.ARTICOLO, number=n, url=f"{URN}~art{n}")
+
+    capo = NormNode(
+        level=NormLevel.CAPO, number="XIV", title="Della risoluzione del contratto",
+        children=[art("1453"), art("1454")],
+    )
+    titolo = NormNode(level=NormLevel.TITOLO, number="II", title="Dei contratti in generale", children=[capo])
+    libro = NormNode(level=NormLevel.LIBRO, number="IV", title="Delle obbligazioni", children=[titolo])
+    allegato = NormNode(level=NormLevel.ALLEGATO, number="1", children=[art("1453")], attachment_number=1)
+    return NormTree(base_urn=URN, children=[art("1"), libro, allegato, art("2645-bis")], article_count=5)
+
+
+class TestPositions:
+    def test_position_lookup(self):
+        tree = make_tree()
+
+        assert get_article_position(tree, "1453") == (
+            "Libro IV - Delle obbligazioni, Titolo II - Dei contratti in generale, "
+            "Capo XIV - Della risoluzione del contratto"
+        )
+        assert get_article_position(tree, "2645bis") == ""
+        assert get_article_position(tree, "9999") is None
+
+    def test_invalidate_after_mutation(self):
+        tree = make_tree()
+        assert tree.position_of("7") is None
+
+        tree.children.append(NormNode(level=NormLevel.ARTICOLO, number="7"))
+        tree.invalidate_positions()
+
+        assert tree.position_of("7") == ""
+
+
+class TestSerialization:
+    def test_round_trip(self):
+        tree = make_tree()
+
+        restored = NormTree.from_dict(tree.to_dict())
+
+        assert restored == tree
+        assert restored.article_positions() == tree.article_positions()
+        assert restored.children[2].attachment_number == 1
+
+    def test_positions_are_precomputed(self):
+        data = make_tree().to_dict()
+        data["children"] = []  # la mappa non viene ricalcolata dai figli
+
+        restored = NormTree.from_dict(data)
+
+        assert restored.position_of("1454").startswith("Libro IV")
+
+
+class TestNormTreeStore:
+    def test_keyed_by_urn_and_version(self, tmp_path):
+        store = NormTreeStore(tmp_path)
+        store.save(URN, make_tree())
+
+        assert store.load(URN) == make_tree()
+        assert store.load(URN, "2000-01-01") is None
+        assert store.load(URN + "~art1") is None
+
+    def test_current_tree_expires_but_dated_does_not(self, tmp_path):
+        store = NormTreeStore(tmp_path, max_age=60)
+        current = store.save(URN, make_tree())
+        dated = store.save(URN, make_tree(), version_date="2000-01-01")
+        old = time.time() - 3600
+        os.utime(current, (old, old))
+        os.utime(dated, (old, old))
+
+        assert store.load(URN) is None
+        assert store.load(URN, "2000-01-01") is not None
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            NormTreeStore(tmp_path, fmt="xml")
+
+    @pytest.mark.asyncio
+    async def test_cached_fetch_skips_download(self, tmp_path, monkeypatch):
+        calls = []
+
+        async def fake_get_hierarchical_tree(url):
+            calls.append(url)
+            return make_tree(), 5
+
+        monkeypatch.setattr(tree_module, "get_hierarchical_tree", fake_get_hierarchical_tree)
+        store = NormTreeStore(tmp_path)
+
+        first, count = await get_cached_hierarchical_tree(URN, store=store)
+        second, _ = await get_cached_hierarchical_tree(URN, store=store)
+        dated, _ = await get_cached_hierarchical_tree(URN, version_date="2000-01-01", store=store)
+
+        assert count == 5
+        assert second == first
+        assert dated.version_date == "2000-01-01"
+        assert calls == [URN, f"{URN}!vig=2000-01-01"]
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_persisted(self, tmp_path, monkeypatch):
+        async def failing(url):
+            return "Request timed out", 0
+
+        monkeypatch.setattr(tree_module, "get_hierarchical_tree", failing)
+        store = NormTreeStore(tmp_path)
+
+        result, count = await get_cached_hierarchical_tree(URN, store=store)
+
+        assert (result, count) == ("Request timed out", 0)
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,195 @@
+"""
+Test Rate Limiter per Host
+==========================
+
+Verifica token bucket, limite di concorrenza e adattamento AIMD di
+merlt.sources.utils.rate_limit, e l'integrazione con http_client/with_retry
+contro un server aiohttp locale.
+"""
+
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from merlt.sources.utils.http import HttpCacheConfig, HttpClient
+from merlt.sources.utils.rate_limit import (
+    HostLimit,
+    RateLimiter,
+    ThrottledError,
+    parse_retry_after,
+)
+from merlt.sources.utils.retry import RetryConfig, with_retry
+
+URL = "https://www.normattiva.it/uri-res/N2Ls?urn:nir:stato:legge:1990;241"
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("12") == 12.0
+
+    def test_http_date(self):
+        now = 1_700_000_000.0
+        value = "Tue, 14 Nov 2023 22:13:40 GMT"  # now + 20s
+        assert parse_retry_after(value, now=now) == pytest.approx(20.0)
+
+    def test_invalid_or_missing(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestRateLimiter:
+    def test_hosts_match_by_suffix(self):
+        limiter = RateLimiter()
+
+        assert limiter.host_of(URL) == "normattiva.it"
+        assert limiter.limit_for("brocardi.it").max_in_flight == 3
+        assert limiter.limit_for("example.org") is limiter.default_limit
+
+    def test_aimd_adaptation(self):
+        limiter = RateLimiter(limits={}, default_limit=HostLimit(rate=2.0, increase_step=0.5, max_rate=3.0))
+
+        limiter.record_response(URL, 200)
+        limiter.record_response(URL, 200)
+        limiter.record_response(URL, 200)
+        assert limiter.current_rate(URL) == 3.0
+
+        retry_after = limiter.record_response(URL, 429, {"Retry-After": "5"})
+        assert retry_after == 5.0
+        assert limiter.current_rate(URL) == 1.5
+
+        metrics = limiter.metrics()["normattiva.it"]
+        assert metrics["throttled"] == 1
+        assert metrics["blocked_for"] > 4
+
+    def test_rate_never_below_min(self):
+        limiter = RateLimiter(limits={}, default_limit=HostLimit(rate=1.0, min_rate=0.4))
+        for _ in range(5):
+            limiter.record_response(URL, 503)
+        assert limiter.current_rate(URL) == 0.4
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_paces_requests(self):
+        limiter = RateLimiter(limits={}, default_limit=HostLimit(rate=20.0, burst=2, max_in_flight=10))
+
+        start = time.monotonic()
+        for _ in range(6):
+            async with limiter.slot(URL):
+                pass
+        elapsed = time.monotonic() - start
+
+        # 2 in burst, 4 a 20 req/s
+        assert elapsed >= 0.18
+        metrics = limiter.metrics()["normattiva.it"]
+        assert metrics["requests"] == 6
+        assert metrics["delayed"] == 4
+
+    @pytest.mark.asyncio
+    async def test_max_in_flight(self):
+        limiter = RateLimiter(limits={}, default_limit=HostLimit(rate=1000.0, burst=100, max_in_flight=2))
+
+        async def request():
+            async with limiter.slot(URL):
+                await asyncio.sleep(0.02)
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        metrics = limiter.metrics()["normattiva.it"]
+        assert metrics["peak_in_flight"] == 2
+        assert metrics["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_hosts_are_independent(self):
+        limiter = RateLimiter(limits={}, default_limit=HostLimit(rate=1.0, burst=1))
+
+        start = time.monotonic()
+        async with limiter.slot("https://a.example/x"):
+            pass
+        async with limiter.slot("https://b.example/x"):
+            pass
+
+        assert time.monotonic() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_disabled_never_waits(self):
+        limiter = RateLimiter(default_limit=HostLimit(rate=0.5, burst=1), enabled=False)
+
+        start = time.monotonic()
+        for _ in range(3):
+            async with limiter.slot(URL):
+                pass
+
+        assert time.monotonic() - start < 0.5
+        assert limiter.metrics() == {}
+
+
+class TestRetryAfter:
+    def test_delay_honours_retry_after(self):
+        config = RetryConfig(min_wait=0.1, max_wait=3.0, jitter=False)
+        error = ThrottledError("normattiva.it", 429, retry_after=2.0)
+
+        assert config.delay_for(0, error) == 2.0
+        assert config.delay_for(0, ThrottledError("x", 429, retry_after=60)) == 3.0
+        assert config.delay_for(0, ConnectionError()) == 0.1
+
+
+@pytest_asyncio.fixture
+async def throttling_server():
+    """Server locale che risponde 429 (Retry-After: 0) alle prime due richieste."""
+    state = {"requests": 0}
+
+    async def doc(request):
+        state["requests"] += 1
+        if state["requests"] <= 2:
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_get("/doc", doc)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}/doc", state
+
+    await runner.cleanup()
+
+
+class TestHttpClientIntegration:
+    @pytest.mark.asyncio
+    async def test_throttled_response_is_retried(self, throttling_server, tmp_path):
+        url, state = throttling_server
+        client = HttpClient()
+        client.configure_cache(HttpCacheConfig(path=str(tmp_path / "http.sqlite")))
+        client.rate_limiter = RateLimiter(limits={}, default_limit=HostLimit(rate=50.0, burst=5))
+
+        @with_retry(RetryConfig(max_attempts=3, min_wait=0.01, jitter=False))
+        async def fetch():
+            return await client.get_text(url)
+
+        assert await fetch() == "ok"
+        assert state["requests"] == 3
+
+        metrics = client.rate_limiter.metrics()["127.0.0.1"]
+        assert metrics["throttled"] == 2
+        assert metrics["requests"] == 3
+        assert client.rate_limiter.current_rate(url) < 50.0
+        await client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_throttled_error_carries_status(self, throttling_server, tmp_path):
+        url, _ = throttling_server
+        client = HttpClient()
+        client.configure_cache(HttpCacheConfig(enabled=False))
+        client.rate_limiter = RateLimiter(limits={}, default_limit=HostLimit(rate=50.0, burst=5))
+
+        with pytest.raises(ThrottledError) as exc:
+            await client.get_text(url)
+
+        assert exc.value.status == 429
+        assert exc.value.host == "127.0.0.1"
+        await client.close_session()
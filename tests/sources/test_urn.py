@@ -0,0 +1,98 @@
+"""
+Test Generazione URN in Batch
+=============================
+
+Verifica che generate_urns produca gli stessi URN di generate_urn e che il
+lavoro a livello di atto (data, tipo atto) venga svolto una sola volta per
+atto distinto. Le date sono risolte con un fetch finto (nessuna chiamata a
+Normattiva).
+"""
+
+import asyncio
+
+import pytest
+
+from merlt.sources.utils import urn as urn_module
+from merlt.sources.utils.act_dates import ActDateResolver, ActDateStore
+
+PAGES = {
+    "https://www.normattiva.it/uri-res/N2Ls?urn:nir:stato:legge:1990;241":
+        "<h2>LEGGE 7 agosto 1990, n. 241</h2>",
+    "https://www.normattiva.it/uri-res/N2Ls?urn:nir:stato:decreto.legislativo:2001;231":
+        "<h2>DECRETO LEGISLATIVO 8 giugno 2001, n. 231</h2>",
+}
+
+
+class CountingFetch:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, url):
+        self.calls.append(url)
+        await asyncio.sleep(0.01)
+        return PAGES.get(url, "<html></html>")
+
+
+@pytest.fixture
+def fetch(monkeypatch):
+    fetch = CountingFetch()
+    resolver = ActDateResolver(store=ActDateStore(":memory:"), fetch=fetch, table={})
+    monkeypatch.setattr(urn_module, "act_date_resolver", resolver)
+    return fetch
+
+
+REQUESTS = [
+    {"act_type": "codice civile", "article": "1453"},
+    {"act_type": "codice civile", "article": "2645-bis"},
+    {"act_type": "codice civile", "article": "art. 12"},
+    {"act_type": "codice civile", "article": "1453", "urn_flag": False},
+    {"act_type": "legge", "date": "1990", "act_number": "241", "article": "2"},
+    {"act_type": "legge", "date": "1990", "act_number": "241", "article": "3", "version": "originale"},
+    {"act_type": "legge", "date": "1990-08-07", "act_number": "241", "annex": "1"},
+    {"act_type": "d.lgs.", "date": "2001", "act_number": "231", "article": "5",
+     "version": "vigente", "version_date": "2020-01-01"},
+    {"act_type": "legge", "date": "1990", "act_number": "999"},
+    {"act_type": "legge", "date": None, "act_number": "1"},
+]
+
+
+class TestGenerateUrns:
+    def test_matches_generate_urn(self, fetch):
+        expected = [urn_module.generate_urn(**request) for request in REQUESTS]
+        urn_module.act_date_resolver.clear_cache()
+
+        assert urn_module.generate_urns(REQUESTS) == expected
+        assert expected[0] == (
+            "https://www.normattiva.it/uri-res/N2Ls?urn:nir:stato:regio.decreto:1942-03-16;262:2~art1453"
+        )
+        assert expected[4].endswith("legge:1990-08-07;241~art2")
+        # Data non risolvibile: fallback all'anno; data assente: None
+        assert expected[8].endswith("legge:1990-01-01;999")
+        assert expected[9] is None
+
+    def test_act_level_work_done_once(self, fetch):
+        requests = [
+            {"act_type": "legge", "date": "1990", "act_number": "241", "article": str(n)}
+            for n in range(1, 500)
+        ]
+        requests += [
+            {"act_type": "d.lgs.", "date": "2001", "act_number": "231", "article": str(n)}
+            for n in range(1, 100)
+        ]
+
+        urns = urn_module.generate_urns(requests)
+
+        assert len(urns) == len(requests)
+        assert urns[0].endswith("legge:1990-08-07;241~art1")
+        assert urns[-1].endswith("decreto.legislativo:2001-06-08;231~art99")
+        assert sorted(fetch.calls) == sorted(PAGES)
+
+    @pytest.mark.asyncio
+    async def test_inside_running_loop(self, fetch):
+        urns = urn_module.generate_urns(
+            [{"act_type": "legge", "date": "1990", "act_number": "241", "article": "1"}]
+        )
+        assert urns == ["https://www.normattiva.it/uri-res/N2Ls?urn:nir:stato:legge:1990-08-07;241~art1"]
+
+    def test_empty(self):
+        assert urn_module.generate_urns([]) == []
@@ -0,0 +1,266 @@
+"""
+Test Bridge Table Bulk Operations
+=================================
+
+Test the COPY-based bulk path of BridgeTable.add_mappings_batch and the
+batched lookups (= ANY) against in-memory stand-ins for the asyncpg
+connection and the SQLAlchemy session (no PostgreSQL required).
+"""
+
+import json
+from contextlib import asynccontextmanager
+from uuid import UUID, uuid4
+
+import pytest
+
+from merlt.models import BridgeMapping
+from merlt.storage.bridge import BridgeBuilder, BridgeTable, BridgeTableConfig, BulkInsertStats
+from merlt.storage.bridge.bridge_table import _inserted_count, mapping_record
+from merlt.storage.retriever import GraphAwareRetriever
+from merlt.storage.retriever.models import VectorSearchResult
+
+
+class FakePgConnection:
+    """Minimal asyncpg connection: staging COPY + INSERT ON CONFLICT."""
+
+    def __init__(self):
+        self.rows = {}
+        self.staged = []
+        self.copies = 0
+        self.transactions = 0
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.transactions += 1
+        yield
+
+    async def copy_records_to_table(self, table, records, columns):
+        assert table.endswith("_staging")
+        assert columns[:2] == ["chunk_id", "graph_node_urn"]
+        self.copies += 1
+        self.staged.extend(records)
+
+    async def execute(self, sql):
+        if sql.startswith("INSERT"):
+            inserted = 0
+            for record in self.staged:
+                key = (record[0], record[1])
+                if key not in self.rows:
+                    self.rows[key] = record
+                    inserted += 1
+            return f"INSERT 0 {inserted}"
+        if sql.startswith("TRUNCATE"):
+            self.staged = []
+        return "OK"
+
+
+class FakeEngine:
+    def __init__(self, pg):
+        self.pg = pg
+
+    @asynccontextmanager
+    async def connect(self):
+        pg = self.pg
+
+        class Conn:
+            async def get_raw_connection(self):
+                class Raw:
+                    driver_connection = pg
+                return Raw()
+
+        yield Conn()
+
+
+@pytest.fixture
+def bridge():
+    bridge = BridgeTable(BridgeTableConfig(table_name="bridge_table_test", bulk_chunk_size=4, cache_size=0))
+    bridge._engine = FakeEngine(FakePgConnection())
+    bridge._connected = True
+    return bridge
+
+
+def make_mappings(chunk_id, n):
+    return [
+        {
+            "chunk_id": chunk_id,
+            "graph_node_urn": f"urn:test:norma:{i}",
+            "node_type": "Norma",
+            "metadata": {"i": i},
+        }
+        for i in range(n)
+    ]
+
+
+def test_mapping_record():
+    chunk_id = uuid4()
+    record = mapping_record({
+        "chunk_id": str(chunk_id),
+        "graph_node_urn": "urn:test",
+        "node_type": "Norma",
+        "extra_metadata": {"a": 1},
+    })
+
+    assert record[0] == chunk_id and isinstance(record[0], UUID)
+    assert record[1:3] == ("urn:test", "Norma")
+    assert json.loads(record[7]) == {"a": 1}
+    assert mapping_record({"chunk_id": chunk_id, "graph_node_urn": "u", "node_type": "N"})[7] is None
+
+
+def test_inserted_count():
+    assert _inserted_count("INSERT 0 42") == 42
+    assert _inserted_count("") == 0
+
+
+def test_stats_rows_per_second():
+    stats = BulkInsertStats(method="copy", rows=1000, inserted=900, chunks=1, seconds=0.5)
+    assert stats.rows_per_second == 2000
+    assert stats.to_dict()["rows_per_second"] == 2000.0
+    assert BulkInsertStats(method="copy").rows_per_second == 0.0
+
+
+@pytest.mark.asyncio
+async def test_copy_chunks_and_skips_existing(bridge):
+    chunk_id = uuid4()
+    pg = bridge._engine.pg
+
+    assert await bridge.add_mappings_batch(make_mappings(chunk_id, 3)) == 3
+    assert await bridge.add_mappings_batch(make_mappings(chunk_id, 10)) == 7
+
+    assert len(pg.rows) == 10
+    assert pg.copies == 1 + 3
+    assert pg.transactions == 2
+    stats = bridge.last_bulk_stats
+    assert (stats.method, stats.rows, stats.inserted, stats.chunks) == ("copy", 10, 7, 3)
+
+
+@pytest.mark.asyncio
+async def test_unknown_method(bridge):
+    with pytest.raises(ValueError):
+        await bridge.add_mappings_batch(make_mappings(uuid4(), 1), method="values")
+
+
+@pytest.mark.asyncio
+async def test_builder_uses_bulk_path(bridge):
+    chunk_id = uuid4()
+    mappings = [
+        BridgeMapping(chunk_id=chunk_id, graph_node_urn=f"urn:test:{i}", mapping_type="PRIMARY", confidence=1.0)
+        for i in range(9)
+    ]
+
+    total = await BridgeBuilder(bridge).insert_mappings(mappings)
+
+    assert total == 9
+    assert bridge._engine.pg.copies == 3
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeSession:
+    """SQLAlchemy session returning canned rows, recording each query."""
+
+    def __init__(self, rows, queries):
+        self.rows = rows
+        self.queries = queries
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params=None):
+        self.queries.append((str(statement), params))
+        return FakeResult(self.rows)
+
+
+def lookup_bridge(rows, cache_size=0):
+    bridge = BridgeTable(BridgeTableConfig(table_name="bridge_table_test", cache_size=cache_size))
+    bridge.queries = []
+    bridge._session_maker = lambda: FakeSession(rows, bridge.queries)
+    bridge._connected = True
+    return bridge
+
+
+@pytest.mark.asyncio
+async def test_get_nodes_for_chunks_groups_rows():
+    chunk_1, chunk_2, chunk_3 = uuid4(), uuid4(), uuid4()
+    bridge = lookup_bridge([
+        (chunk_1, "urn:a", "Norma", "contained_in", 1.0, None),
+        (chunk_1, "urn:b", "ConcettoGiuridico", "relates_to", 0.8, {"x": 1}),
+        (chunk_2, "urn:a", "Norma", "contained_in", 1.0, None),
+    ])
+
+    grouped = await bridge.get_nodes_for_chunks([chunk_1, chunk_2, chunk_3, chunk_1])
+
+    assert list(grouped) == [str(chunk_1), str(chunk_2), str(chunk_3)]
+    assert [n["graph_node_urn"] for n in grouped[str(chunk_1)]] == ["urn:a", "urn:b"]
+    assert grouped[str(chunk_3)] == []
+
+    sql, params = bridge.queries[0]
+    assert len(bridge.queries) == 1
+    assert "ANY(" in sql
+    assert params["chunk_ids"] == [str(chunk_1), str(chunk_2), str(chunk_3)]
+
+
+@pytest.mark.asyncio
+async def test_node_type_filter_in_sql_without_cache():
+    bridge = lookup_bridge([])
+
+    await bridge.get_nodes_for_chunks([uuid4()], node_type="Norma")
+
+    sql, params = bridge.queries[0]
+    assert "node_type = :node_type" in sql
+    assert params["node_type"] == "Norma"
+
+
+@pytest.mark.asyncio
+async def test_get_chunks_for_nodes_groups_rows():
+    chunk_id = uuid4()
+    bridge = lookup_bridge([("urn:a", chunk_id, "testo", "contained_in", 1.0)])
+
+    grouped = await bridge.get_chunks_for_nodes(["urn:a", "urn:b"])
+
+    assert grouped == {
+        "urn:a": [{"chunk_id": str(chunk_id), "chunk_text": "testo", "relation_type": "contained_in", "confidence": 1.0}],
+        "urn:b": [],
+    }
+
+
+@pytest.mark.asyncio
+async def test_empty_lookup_skips_query():
+    bridge = lookup_bridge([])
+
+    assert await bridge.get_nodes_for_chunks([]) == {}
+    assert await bridge.get_chunks_for_nodes([]) == {}
+    assert bridge.queries == []
+
+
+@pytest.mark.asyncio
+async def test_retriever_resolves_bridge_in_one_query():
+    chunk_ids = [uuid4() for _ in range(5)]
+    bridge = lookup_bridge([(chunk_ids[0], "urn:a", "Norma", "contained_in", 1.0, None)])
+    retriever = GraphAwareRetriever(vector_db=None, graph_db=None, bridge_table=bridge)
+
+    async def vector_search(query_embedding, limit, source_types=None):
+        return [
+            VectorSearchResult(chunk_id=chunk_id, text=f"chunk {i}", similarity_score=0.9 - i / 10, metadata={})
+            for i, chunk_id in enumerate(chunk_ids)
+        ]
+
+    async def graph_score(chunk_nodes, context_nodes, expert_type):
+        return 1.0 if chunk_nodes else 0.0
+
+    retriever._vector_search = vector_search
+    retriever._compute_graph_score = graph_score
+
+    results = await retriever.retrieve([0.1, 0.2], top_k=5)
+
+    assert len(bridge.queries) == 1
+    top = next(r for r in results if r.chunk_id == chunk_ids[0])
+    assert top.linked_nodes[0]["graph_node_urn"] == "urn:a"
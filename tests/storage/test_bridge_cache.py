@@ -0,0 +1,235 @@
+"""
+Test Bridge Table Cache
+=======================
+
+Test BridgeCache (LRU, TTL, invalidation) and the read-through lookups of
+BridgeTable against an in-memory stand-in for the SQLAlchemy session
+(no PostgreSQL required).
+"""
+
+import time
+from uuid import uuid4
+
+import pytest
+
+from merlt.storage.bridge import BridgeCache, BridgeTable, BridgeTableConfig
+
+CC = "urn:nir:stato:regio.decreto:1942-03-16;262:2"
+CP = "urn:nir:stato:regio.decreto:1930-10-19;1398:1"
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+        self.rowcount = len(rows)
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeTable:
+    """Rows (chunk_id, urn, node_type, relation_type, confidence, metadata, chunk_text)."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def session(self):
+        table = self
+
+        class Session:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def execute(self, statement, params=None):
+                table.queries.append(params)
+                return FakeResult(table.select(params))
+
+            async def commit(self):
+                pass
+
+        return Session()
+
+    def select(self, params):
+        if "chunk_id" in params:
+            deleted = [r for r in self.rows if str(r[0]) == params["chunk_id"]]
+            self.rows = [r for r in self.rows if r not in deleted]
+            return deleted
+        if "chunk_ids" in params:
+            return [
+                (r[0], r[1], r[2], r[3], r[4], r[5]) for r in self.rows
+                if str(r[0]) in params["chunk_ids"]
+                and params.get("node_type") in (None, r[2])
+            ]
+        if "graph_node_urns" in params:
+            return [(r[1], r[0], r[6], r[3], r[4]) for r in self.rows if r[1] in params["graph_node_urns"]]
+        if "patterns" in params:
+            prefixes = [p.rstrip("%") for p in params["patterns"]]
+            chunks = {r[0] for r in self.rows if r[1].startswith(tuple(prefixes))}
+            return [r for r in self.rows if r[0] in chunks]
+        raise AssertionError(f"unexpected query {params}")
+
+
+def make_bridge(rows, **config):
+    config.setdefault("table_name", "bridge_table_test")
+    bridge = BridgeTable(BridgeTableConfig(**config))
+    table = FakeTable(rows)
+    bridge._session_maker = table.session
+    bridge._connected = True
+    return bridge, table
+
+
+@pytest.fixture
+def chunks():
+    return [uuid4() for _ in range(3)]
+
+
+@pytest.fixture
+def rows(chunks):
+    return [
+        (chunks[0], f"{CC}~art1453", "Norma", "contained_in", 1.0, None, "testo 1453"),
+        (chunks[0], "urn:concetto:risoluzione", "ConcettoGiuridico", "relates_to", 0.8, None, "testo 1453"),
+        (chunks[1], f"{CC}~art1454", "Norma", "contained_in", 1.0, None, "testo 1454"),
+        (chunks[2], f"{CP}~art52", "Norma", "contained_in", 1.0, None, "testo 52"),
+    ]
+
+
+class TestBridgeCache:
+    def test_lru_bound(self):
+        cache = BridgeCache(max_size=2)
+        cache.put_nodes({"a": [], "b": [], "c": []})
+
+        found, missing = cache.get_nodes(["a", "b", "c"])
+
+        assert set(found) == {"b", "c"}
+        assert missing == ["a"]
+        assert cache.stats.evictions == 1
+
+    def test_ttl(self, monkeypatch):
+        cache = BridgeCache(ttl=10)
+        cache.put_nodes({"a": [{"graph_node_urn": "u"}]})
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+
+        assert cache.get_nodes(["a"]) == ({}, ["a"])
+
+    def test_returns_copies(self):
+        cache = BridgeCache()
+        cache.put_nodes({"a": [{"graph_node_urn": "u"}]})
+
+        cache.get_nodes(["a"])[0]["a"][0]["graph_node_urn"] = "changed"
+
+        assert cache.get_nodes(["a"])[0]["a"] == [{"graph_node_urn": "u"}]
+
+    def test_invalidate_chunk_drops_nodes_containing_it(self):
+        cache = BridgeCache()
+        cache.put_nodes({"c1": [{"graph_node_urn": "u1"}]})
+        cache.put_chunks({
+            "u1": [{"chunk_id": "c1"}],
+            "u2": [{"chunk_id": "c2"}],
+        })
+
+        assert cache.invalidate(["c1"]) == 2
+        assert cache.get_chunks(["u1", "u2"])[1] == ["u1"]
+
+
+class TestBridgeTableReadThrough:
+    @pytest.mark.asyncio
+    async def test_hits_skip_queries(self, chunks, rows):
+        bridge, table = make_bridge(rows)
+
+        first = await bridge.get_nodes_for_chunks(chunks[:2])
+        second = await bridge.get_nodes_for_chunks(chunks[:2])
+        await bridge.get_nodes_for_chunks(chunks)
+
+        assert first == second
+        assert len(table.queries) == 2
+        # Solo il chunk mancante viene interrogato
+        assert table.queries[1]["chunk_ids"] == [str(chunks[2])]
+
+    @pytest.mark.asyncio
+    async def test_node_type_filtered_in_memory(self, chunks, rows):
+        bridge, table = make_bridge(rows)
+
+        norme = await bridge.get_nodes_for_chunk(chunks[0], node_type="Norma")
+        tutti = await bridge.get_nodes_for_chunk(chunks[0])
+
+        assert [n["graph_node_urn"] for n in norme] == [f"{CC}~art1453"]
+        assert len(tutti) == 2
+        assert len(table.queries) == 1
+        assert "node_type" not in table.queries[0]
+
+    @pytest.mark.asyncio
+    async def test_chunks_for_nodes_cached(self, chunks, rows):
+        bridge, table = make_bridge(rows)
+
+        await bridge.get_chunks_for_node(f"{CC}~art1453")
+        result = await bridge.get_chunks_for_nodes([f"{CC}~art1453"])
+
+        assert result[f"{CC}~art1453"][0]["chunk_id"] == str(chunks[0])
+        assert len(table.queries) == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self, chunks, rows):
+        bridge, table = make_bridge(rows, cache_size=0)
+
+        await bridge.get_nodes_for_chunk(chunks[0])
+        await bridge.get_nodes_for_chunk(chunks[0])
+
+        assert bridge.cache is None
+        assert len(table.queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_warm_cache(self, chunks, rows):
+        bridge, table = make_bridge(rows)
+
+        assert await bridge.warm_cache([CC]) == 3
+        nodes = await bridge.get_nodes_for_chunks(chunks[:2])
+        node_chunks = await bridge.get_chunks_for_nodes([f"{CC}~art1453", f"{CC}~art1454"])
+
+        assert len(table.queries) == 1
+        assert len(nodes[str(chunks[0])]) == 2
+        assert node_chunks[f"{CC}~art1454"][0]["chunk_text"] == "testo 1454"
+
+        # Nodi fuori dal codice non sono completi: non in cache
+        await bridge.get_chunks_for_node("urn:concetto:risoluzione")
+        assert len(table.queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates(self, chunks, rows):
+        bridge, table = make_bridge(rows)
+        await bridge.get_nodes_for_chunk(chunks[0])
+        await bridge.get_chunks_for_node(f"{CC}~art1453")
+
+        await bridge.get_chunks_for_node(f"{CC}~art1454")
+
+        assert await bridge.delete_mappings_for_chunk(chunks[0]) == 2
+
+        assert await bridge.get_nodes_for_chunk(chunks[0]) == []
+        assert await bridge.get_chunks_for_node(f"{CC}~art1453") == []
+        # Voci non toccate restano in cache
+        queries = len(table.queries)
+        await bridge.get_chunks_for_node(f"{CC}~art1454")
+        assert len(table.queries) == queries
+
+    @pytest.mark.asyncio
+    async def test_batch_write_invalidates(self, chunks, rows):
+        bridge, table = make_bridge(rows)
+        await bridge.get_nodes_for_chunks(chunks)
+        await bridge.get_chunks_for_nodes([f"{CC}~art1453", f"{CP}~art52"])
+
+        async def copy_records(records, chunk_size):
+            return len(records), 1
+
+        bridge._copy_records = copy_records
+        await bridge.add_mappings_batch([
+            {"chunk_id": chunks[1], "graph_node_urn": f"{CC}~art1453", "node_type": "Norma"},
+        ])
+
+        found, missing = bridge.cache.get_nodes([str(c) for c in chunks])
+        assert missing == [str(chunks[1])]
+        found, missing = bridge.cache.get_chunks([f"{CC}~art1453", f"{CP}~art52"])
+        assert missing == [f"{CC}~art1453"]
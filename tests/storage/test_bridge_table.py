@@ -186,3 +186,63 @@ async def test_filter_by_node_type(bridge_table):
 
     # Cleanup
     await bridge_table.delete_mappings_for_chunk(chunk_id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["copy", "executemany"])
+async def test_batch_insert_skips_existing(bridge_table, method):
+    """Test bulk insert methods skip mappings already present."""
+    chunk_id = uuid4()
+    mappings = [
+        {
+            "chunk_id": chunk_id,
+            "graph_node_urn": f"urn:test:norma:{i}",
+            "node_type": "Norma",
+            "metadata": {"i": i},
+            "source": "test"
+        }
+        for i in range(50)
+    ]
+
+    await bridge_table.add_mappings_batch(mappings[:10], method=method)
+    await bridge_table.add_mappings_batch(mappings, method=method, chunk_size=7)
+
+    nodes = await bridge_table.get_nodes_for_chunk(chunk_id)
+    assert len(nodes) == 50
+    assert bridge_table.last_bulk_stats.rows == 50
+    assert bridge_table.last_bulk_stats.chunks == 8
+    if method == "copy":
+        assert bridge_table.last_bulk_stats.inserted == 40
+
+    # Cleanup
+    await bridge_table.delete_mappings_for_chunk(chunk_id)
+
+
+@pytest.mark.asyncio
+async def test_batched_lookups(bridge_table):
+    """Test resolving many chunks/nodes with one query each."""
+    chunk_id_1 = uuid4()
+    chunk_id_2 = uuid4()
+    missing = uuid4()
+
+    await bridge_table.add_mappings_batch([
+        {"chunk_id": chunk_id_1, "graph_node_urn": "urn:test:norma:1", "node_type": "Norma", "source": "test"},
+        {"chunk_id": chunk_id_1, "graph_node_urn": "urn:test:concetto:1", "node_type": "ConcettoGiuridico", "source": "test"},
+        {"chunk_id": chunk_id_2, "graph_node_urn": "urn:test:norma:1", "node_type": "Norma", "source": "test"},
+    ])
+
+    nodes = await bridge_table.get_nodes_for_chunks([chunk_id_1, chunk_id_2, missing])
+    assert len(nodes[str(chunk_id_1)]) == 2
+    assert len(nodes[str(chunk_id_2)]) == 1
+    assert nodes[str(missing)] == []
+
+    norme = await bridge_table.get_nodes_for_chunks([chunk_id_1], node_type="Norma")
+    assert [n["graph_node_urn"] for n in norme[str(chunk_id_1)]] == ["urn:test:norma:1"]
+
+    chunks = await bridge_table.get_chunks_for_nodes(["urn:test:norma:1", "urn:test:concetto:1"])
+    assert {c["chunk_id"] for c in chunks["urn:test:norma:1"]} >= {str(chunk_id_1), str(chunk_id_2)}
+    assert str(chunk_id_1) in {c["chunk_id"] for c in chunks["urn:test:concetto:1"]}
+
+    # Cleanup
+    await bridge_table.delete_mappings_for_chunk(chunk_id_1)
+    await bridge_table.delete_mappings_for_chunk(chunk_id_2)
@@ -0,0 +1,150 @@
+"""
+Tests for Qdrant collection profiles
+
+Tests profile resolution, generated Qdrant configs, payload index setup,
+and migration / comparison against an in-memory Qdrant client (no server
+required).
+"""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from merlt.storage.vectors.collections import (
+    COLLECTION_PROFILES,
+    DEFAULT_PAYLOAD_INDEXES,
+    QdrantCollectionProfile,
+    compare_collections,
+    ensure_collection,
+    ensure_payload_indexes,
+    get_collection_profile,
+    migrate_collection,
+)
+
+qdrant_client = pytest.importorskip("qdrant_client")
+
+DIM = 16
+
+
+@pytest.fixture
+def client():
+    return qdrant_client.QdrantClient(":memory:")
+
+
+@pytest.fixture
+def populated(client):
+    """Collection 'source' with 60 random normalized vectors."""
+    from qdrant_client.models import PointStruct
+
+    ensure_collection(client, "source", DIM, "default")
+    rng = random.Random(0)
+    points = []
+    for i in range(60):
+        vec = [rng.uniform(-1, 1) for _ in range(DIM)]
+        norm = sum(x * x for x in vec) ** 0.5
+        points.append(PointStruct(
+            id=i,
+            vector=[x / norm for x in vec],
+            payload={"article_urn": f"urn:{i}", "source_type": "norma"},
+        ))
+    client.upsert(collection_name="source", points=points)
+    return client
+
+
+class TestProfiles:
+    def test_builtin_profiles_resolve(self):
+        for name in COLLECTION_PROFILES:
+            assert get_collection_profile(name).name == name
+
+    def test_none_is_default(self):
+        assert get_collection_profile(None).name == "default"
+
+    def test_instance_passthrough(self):
+        custom = QdrantCollectionProfile(name="custom", hnsw_m=32)
+        assert get_collection_profile(custom) is custom
+
+    def test_unknown_profile_raises(self):
+        with pytest.raises(ValueError, match="Unknown Qdrant collection profile"):
+            get_collection_profile("nope")
+
+    def test_default_profile_has_no_search_params(self):
+        profile = get_collection_profile("default")
+
+        assert profile.quantization_config() is None
+        assert profile.search_params() is None
+
+    def test_quantized_on_disk_configs(self):
+        profile = get_collection_profile("quantized_on_disk")
+        kwargs = profile.create_collection_kwargs(1024)
+
+        assert kwargs["vectors_config"].size == 1024
+        assert kwargs["vectors_config"].on_disk is True
+        assert kwargs["on_disk_payload"] is True
+        assert kwargs["quantization_config"].scalar.type.value == "int8"
+        assert kwargs["hnsw_config"].ef_construct == 200
+
+        params = profile.search_params()
+        assert params.hnsw_ef == 128
+        assert params.quantization.rescore is True
+
+
+class TestMigration:
+    def test_ensure_collection_is_idempotent(self, client):
+        assert ensure_collection(client, "c", DIM, "quantized") is True
+        assert ensure_collection(client, "c", DIM, "quantized") is False
+
+    def test_migrate_copies_all_points(self, populated):
+        result = migrate_collection(
+            populated, "source", "target", "quantized_on_disk", batch_size=16
+        )
+
+        assert result.points_copied == 60
+        assert populated.count("target").count == 60
+        record = populated.retrieve("target", ids=[7], with_payload=True)[0]
+        assert record.payload["article_urn"] == "urn:7"
+
+    def test_migrate_recreate(self, populated):
+        migrate_collection(populated, "source", "target", "on_disk")
+        result = migrate_collection(populated, "source", "target", "on_disk", recreate=True)
+
+        assert result.points_copied == 60
+        assert populated.count("target").count == 60
+
+    def test_compare_report(self, populated):
+        migrate_collection(populated, "source", "target", "quantized")
+
+        report = compare_collections(
+            populated, "source", "target", "quantized", top_k=5, num_queries=10
+        )
+
+        assert report.num_queries == 10
+        assert 0.0 <= report.recall_at_k <= 1.0
+        assert set(report.candidate_latency_ms) == {"mean", "p50", "p95"}
+        assert report.to_dict()["candidate_profile"] == "quantized"
+        assert "recall@5" in report.summary()
+
+
+class TestPayloadIndexes:
+    def test_creates_missing_indexes(self):
+        from unittest.mock import MagicMock
+
+        client = MagicMock()
+        client.get_collection.return_value.payload_schema = {"source_type": object()}
+
+        created = ensure_payload_indexes(client, "chunks")
+
+        assert created == ["article_urn", "tipo_atto"]
+        fields = [c.kwargs["field_name"] for c in client.create_payload_index.call_args_list]
+        assert fields == ["article_urn", "tipo_atto"]
+
+    def test_ensure_collection_indexes_existing_collection(self):
+        from unittest.mock import MagicMock
+
+        client = MagicMock()
+        client.get_collections.return_value.collections = [SimpleNamespace(name="chunks")]
+        client.get_collection.return_value.payload_schema = {}
+
+        assert ensure_collection(client, "chunks", DIM, "default") is False
+        client.create_collection.assert_not_called()
+        assert client.create_payload_index.call_count == len(DEFAULT_PAYLOAD_INDEXES)
@@ -0,0 +1,105 @@
+"""
+Tests for ChunkContentStore and slim payload mode
+
+Tests the SQLite content store used when Qdrant payloads are slim
+(ids and filter fields only), and the LegalKnowledgeGraph helpers that
+move texts out of the payload on upsert and back in on search.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from merlt.storage.vectors.content_store import ChunkContentStore
+
+
+@pytest.fixture
+def store():
+    s = ChunkContentStore(":memory:")
+    yield s
+    s.close()
+
+
+class TestChunkContentStore:
+    def test_put_and_get(self, store):
+        assert store.put_many({"1": "Art. 1321", "2": "Art. 1325"}) == 2
+
+        assert store.get("1") == "Art. 1321"
+        assert store.get(2) == "Art. 1325"
+        assert store.get("3") is None
+        assert len(store) == 2
+
+    def test_get_many_omits_missing(self, store):
+        store.put_many({"a": "x"})
+
+        assert store.get_many(["a", "b", "a"]) == {"a": "x"}
+
+    def test_overwrite(self, store):
+        store.put_many({"a": "old"})
+        store.put_many({"a": "new"})
+
+        assert store.get("a") == "new"
+        assert len(store) == 1
+
+    def test_get_many_large_batch(self, store):
+        store.put_many({str(i): f"t{i}" for i in range(2000)})
+
+        assert len(store.get_many(str(i) for i in range(2000))) == 2000
+
+    def test_delete_many(self, store):
+        store.put_many({"a": "x", "b": "y"})
+        store.delete_many(["a"])
+
+        assert store.get_many(["a", "b"]) == {"b": "y"}
+
+    def test_persists_on_disk(self, tmp_path):
+        path = tmp_path / "nested" / "chunks.sqlite"
+        store = ChunkContentStore(path)
+        store.put_many({"a": "x"})
+        store.close()
+
+        reopened = ChunkContentStore(path)
+        assert reopened.get("a") == "x"
+        reopened.close()
+
+
+class TestSlimPayloadHelpers:
+    @pytest.fixture
+    def kg(self, store):
+        from merlt import LegalKnowledgeGraph, MerltConfig
+
+        kg = LegalKnowledgeGraph(MerltConfig(qdrant_slim_payload=True))
+        kg._content_store = store
+        return kg
+
+    def test_store_point_texts_strips_payload(self, kg, store):
+        from qdrant_client.models import PointStruct
+
+        point = PointStruct(
+            id=42,
+            vector=[0.1, 0.2],
+            payload={"article_urn": "urn:x", "source_type": "norma", "text": "testo"},
+        )
+        kg._store_point_texts([point])
+
+        assert "text" not in point.payload
+        assert point.payload["source_type"] == "norma"
+        assert store.get("42") == "testo"
+
+    def test_resolve_point_texts(self, kg, store):
+        store.put_many({"1": "dal content store"})
+        hits = [
+            SimpleNamespace(id=1, payload={"article_urn": "urn:a"}),
+            SimpleNamespace(id=2, payload={"text": "dal payload"}),
+        ]
+
+        assert kg._resolve_point_texts(hits) == {"1": "dal content store", "2": "dal payload"}
+
+    def test_store_point_texts_noop_without_store(self):
+        from merlt import LegalKnowledgeGraph
+
+        kg = LegalKnowledgeGraph()
+        point = SimpleNamespace(id=1, payload={"text": "resta"})
+        kg._store_point_texts([point])
+
+        assert point.payload["text"] == "resta"
@@ -14,7 +14,7 @@ import pytest
 import os
 from typing import List
 
-from merlt.storage.vectors.embeddings import EmbeddingService
+from merlt.storage.vectors.embeddings import EmbeddingService, build_length_buckets
 
 
 # ============================================================================
@@ -368,6 +368,73 @@ def test_repr(embedding_service):
     assert embedding_service.device in repr_str
 
 
+# ============================================================================
+# Test Length Bucketing (no model download)
+# ============================================================================
+
+class _FakeModel:
+    """Minimal stand-in for SentenceTransformer: vector = [len(text)]."""
+
+    max_seq_length = 512
+    tokenizer = None
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def encode(self, texts, batch_size, **kwargs):
+        import numpy as np
+        self.batch_sizes.append(len(texts))
+        return np.array([[float(len(t))] for t in texts])
+
+
+def test_build_length_buckets_respects_token_budget():
+    """Padded size (count * longest) of each bucket stays within budget."""
+    lengths = [10, 500, 12, 480, 11, 9, 300]
+
+    buckets = build_length_buckets(lengths, max_batch_tokens=1000, max_batch_size=32)
+
+    assert sorted(i for b in buckets for i in b) == list(range(len(lengths)))
+    for bucket in buckets:
+        assert len(bucket) * max(lengths[i] for i in bucket) <= 1000
+
+
+def test_build_length_buckets_groups_similar_lengths():
+    """Long texts are not batched together with short ones."""
+    lengths = [5, 400, 6, 7, 410]
+
+    buckets = build_length_buckets(lengths, max_batch_tokens=820, max_batch_size=32)
+
+    assert buckets[0] == [4, 1]
+    assert sorted(buckets[1]) == [0, 2, 3]
+
+
+def test_build_length_buckets_respects_batch_size():
+    """Bucket count is capped by max_batch_size even for tiny texts."""
+    buckets = build_length_buckets([1] * 10, max_batch_tokens=10_000, max_batch_size=4)
+
+    assert [len(b) for b in buckets] == [4, 4, 2]
+
+
+def test_build_length_buckets_oversized_text():
+    """A text longer than the budget gets its own bucket."""
+    buckets = build_length_buckets([2000, 10], max_batch_tokens=512, max_batch_size=8)
+
+    assert buckets == [[0], [1]]
+
+
+def test_encode_batch_bucketed_preserves_order():
+    """Bucketed encoding returns vectors in input order."""
+    service = EmbeddingService(device="cpu", batch_size=2)
+    service.max_batch_tokens = 64
+    service._model = _FakeModel()
+
+    texts = ["a" * 200, "bb", "c" * 120, "dddd", "e" * 10]
+    vectors = service.encode_batch(texts, is_query=False)
+
+    assert [v[0] for v in vectors] == [float(len("passage: " + t)) for t in texts]
+    assert all(size <= 2 for size in service._model.batch_sizes)
+
+
 # ============================================================================
 # Integration Test
 # ============================================================================
@@ -0,0 +1,102 @@
+"""
+Tests for EncodeExecutor
+
+Tests the dedicated encode pool used by EmbeddingService async wrappers:
+- Execution on dedicated threads (not the asyncio default executor)
+- Backpressure via max_pending
+- Queue-depth and latency metrics
+- Error accounting
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from merlt.storage.vectors.executor import EncodeExecutor, EncodeExecutorStats
+
+
+@pytest.fixture
+def executor():
+    ex = EncodeExecutor(max_workers=2, max_pending=2, thread_name_prefix="test-encode")
+    yield ex
+    ex.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_runs_on_dedicated_threads(executor):
+    """Jobs run on threads named after the executor prefix."""
+    name = await executor.run(lambda: threading.current_thread().name)
+
+    assert name.startswith("test-encode")
+
+
+@pytest.mark.asyncio
+async def test_returns_result_with_args(executor):
+    """Positional args are forwarded to the function."""
+    result = await executor.run(lambda a, b: a + b, 2, 3)
+
+    assert result == 5
+    assert executor.stats.completed == 1
+
+
+@pytest.mark.asyncio
+async def test_backpressure_limits_in_flight(executor):
+    """No more than max_pending jobs are submitted to the pool at once."""
+    lock = threading.Lock()
+    state = {"current": 0, "peak": 0}
+
+    def job():
+        with lock:
+            state["current"] += 1
+            state["peak"] = max(state["peak"], state["current"])
+        time.sleep(0.02)
+        with lock:
+            state["current"] -= 1
+
+    await asyncio.gather(*(executor.run(job) for _ in range(6)))
+
+    assert state["peak"] <= executor.max_pending
+    assert executor.stats.completed == 6
+    assert executor.stats.max_queue_depth == 6
+    assert executor.stats.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_jobs_are_counted(executor):
+    """Exceptions propagate and are recorded in the stats."""
+    def boom():
+        raise ValueError("encode failed")
+
+    with pytest.raises(ValueError):
+        await executor.run(boom)
+
+    assert executor.stats.failed == 1
+    assert executor.stats.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_latency_metrics(executor):
+    """Run time is accumulated and exposed in milliseconds."""
+    await executor.run(time.sleep, 0.01)
+
+    stats = executor.stats.to_dict()
+    assert stats["avg_run_ms"] >= 10
+    assert stats["submitted"] == 1
+
+
+def test_invalid_configuration():
+    """Workers and pending limits must be positive."""
+    with pytest.raises(ValueError):
+        EncodeExecutor(max_workers=0)
+    with pytest.raises(ValueError):
+        EncodeExecutor(max_pending=0)
+
+
+def test_empty_stats():
+    """Averages are zero before any job completes."""
+    stats = EncodeExecutorStats()
+
+    assert stats.avg_wait_ms == 0.0
+    assert stats.avg_run_ms == 0.0
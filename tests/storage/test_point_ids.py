@@ -0,0 +1,147 @@
+"""
+Tests for deterministic point ids and skip-unchanged upserts
+
+Runs against an in-memory Qdrant client with a fake embedding service
+(no model download required).
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from merlt.storage.vectors.points import (
+    CONTENT_HASH_FIELD,
+    build_article_points,
+    chunk_point_id,
+    content_hash,
+    find_unchanged_point_ids,
+    upsert_changed_points,
+)
+
+qdrant_client = pytest.importorskip("qdrant_client")
+
+DIM = 8
+URN = "urn:nir:stato:regio.decreto:1942-03-16;262~art1453"
+BASE = {"article_urn": URN, "tipo_atto": "codice civile", "numero_articolo": "1453"}
+ARTICLE = "Nei contratti con prestazioni corrispettive, quando uno dei contraenti non adempie..."
+BROCARDI = {
+    "Spiegazione": "La norma disciplina la risoluzione del contratto per inadempimento. " * 2,
+    "Ratio": "Il legislatore tutela il contraente fedele consentendogli di sciogliersi. " * 2,
+    "Massime": [
+        {"massima": "In tema di risoluzione, il giudice deve valutare la gravità dell'inadempimento."},
+        "Breve",
+        "La domanda di risoluzione preclude la successiva domanda di adempimento del contratto.",
+    ],
+}
+
+
+class FakeEmbeddingService:
+    model_name = "fake-model"
+
+    def __init__(self):
+        self.encoded = []
+
+    async def encode_batch_async(self, texts, is_query=False, show_progress_bar=False):
+        self.encoded.extend(texts)
+        return [[float(len(t) % 7 + 1)] * DIM for t in texts]
+
+
+@pytest.fixture
+def client():
+    from qdrant_client.models import Distance, VectorParams
+
+    client = qdrant_client.QdrantClient(":memory:")
+    client.create_collection(
+        "chunks", vectors_config=VectorParams(size=DIM, distance=Distance.COSINE)
+    )
+    return client
+
+
+class TestPointIds:
+    def test_ids_are_stable_across_processes(self):
+        code = (
+            "from merlt.storage.vectors.points import chunk_point_id;"
+            f"print(chunk_point_id({URN!r}, 'norma'))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+        assert out == chunk_point_id(URN, "norma")
+
+    def test_ids_differ_by_source_and_index(self):
+        ids = {
+            chunk_point_id(URN, "norma"),
+            chunk_point_id(URN, "massima", 0),
+            chunk_point_id(URN, "massima", 1),
+            chunk_point_id(URN + "bis", "norma"),
+        }
+        assert len(ids) == 4
+
+    def test_content_hash_depends_on_model(self):
+        assert content_hash("testo", "a") == content_hash("testo", "a")
+        assert content_hash("testo", "a") != content_hash("testo", "b")
+
+    def test_build_article_points(self):
+        candidates = build_article_points(URN, BASE, ARTICLE, BROCARDI)
+
+        sources = [(c.payload["source_type"], c.payload.get("massima_index")) for c in candidates]
+        assert sources == [
+            ("norma", None), ("spiegazione", None), ("ratio", None),
+            ("massima", 0), ("massima", 2),
+        ]
+        assert candidates[-1].point_id == chunk_point_id(URN, "massima", 2)
+        assert all(c.payload["article_urn"] == URN for c in candidates)
+
+
+class TestSkipUnchanged:
+    @pytest.mark.asyncio
+    async def test_rerun_skips_everything(self, client):
+        service = FakeEmbeddingService()
+        candidates = build_article_points(URN, BASE, ARTICLE, BROCARDI)
+
+        first = await upsert_changed_points(client, "chunks", service, candidates)
+        second = await upsert_changed_points(
+            client, "chunks", service, build_article_points(URN, BASE, ARTICLE, BROCARDI)
+        )
+
+        assert first == 5
+        assert second == 0
+        assert len(service.encoded) == 5
+        assert client.count("chunks").count == 5
+
+    @pytest.mark.asyncio
+    async def test_only_changed_text_is_reencoded(self, client):
+        service = FakeEmbeddingService()
+        await upsert_changed_points(
+            client, "chunks", service, build_article_points(URN, BASE, ARTICLE, BROCARDI)
+        )
+        service.encoded.clear()
+
+        updated = dict(BROCARDI, Ratio="Nuova ratio: tutela dell'equilibrio sinallagmatico. " * 2)
+        upserted = await upsert_changed_points(
+            client, "chunks", service, build_article_points(URN, BASE, ARTICLE, updated)
+        )
+
+        assert upserted == 1
+        assert service.encoded == [updated["Ratio"]]
+        assert client.count("chunks").count == 5
+
+        record = client.retrieve("chunks", ids=[chunk_point_id(URN, "ratio")], with_payload=True)[0]
+        assert record.payload[CONTENT_HASH_FIELD] == content_hash(updated["Ratio"], "fake-model")
+
+    @pytest.mark.asyncio
+    async def test_before_upsert_hook_sees_points(self, client):
+        seen = []
+        await upsert_changed_points(
+            client, "chunks", FakeEmbeddingService(),
+            build_article_points(URN, BASE, ARTICLE),
+            before_upsert=seen.extend,
+        )
+
+        assert [str(p.id) for p in seen] == [chunk_point_id(URN, "norma")]
+
+    def test_find_unchanged_ignores_missing_points(self, client):
+        candidates = build_article_points(URN, BASE, ARTICLE)
+        assert find_unchanged_point_ids(client, "chunks", candidates) == set()